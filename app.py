@@ -1,8 +1,9 @@
-from flask import Flask, request, jsonify, send_file, send_from_directory
+from flask import Flask, Response, request, jsonify, send_file, send_from_directory
 from flask_cors import CORS
-import asyncio
+import hmac
 import os
 import json
+import time
 from graphqlpredictor import LightningPredictor
 from run import format_prediction_output
 from prediction_validator import PredictionValidator, apply_prediction_fixes
@@ -11,8 +12,19 @@ from game_media_service import get_game_media_service
 from real_data_props_generator import RealDataPlayerPropsEngine
 from dataclasses import asdict
 from rivalry_config import is_rivalry_game, get_rivalry_info
-from batch_rivalry_analyzer import BatchRivalryAnalyzer
+from rivalry_store import rivalry_series
 from espn_player_service import ESPNPlayerService
+from async_runtime import get_async_runtime, run_async, iterate_async
+from query_cache import get_query_cache
+from prediction_cache import CachedPrediction, get_prediction_cache
+from data_reloader import get_data_reloader
+from team_directory import get_team_directory
+from power_rankings import get_power_rankings, etag_matches, accepts_gzip, week_data_dir
+from log_config import LOG_LEVEL_ENV, configure_logging, get_logger, lazy_format
+
+# Quiet by default - CFB_LOG_LEVEL=DEBUG brings back the per-prediction diagnostics
+configure_logging()
+logger = get_logger('app')
 
 app = Flask(__name__)
 # Configure CORS - allow same origin and local development
@@ -23,47 +35,20 @@ CORS(app, origins=[
 ], methods=['GET', 'POST', 'OPTIONS'], allow_headers=['Content-Type', 'Authorization'])
 
 def get_team_id(team_name):
-    """Convert team name to team ID using fbs.json data"""
-    if isinstance(team_name, int):
-        return team_name  # Already an ID
-    
-    team_name_lower = team_name.lower().strip()
-    
-    # Load teams from fbs.json
+    """Convert team name to team ID using the shared fbs.json team directory"""
     try:
-        with open('fbs.json', 'r') as f:
-            teams_data = json.load(f)
-        
-        # First pass: Look for exact matches
-        for team in teams_data:
-            # Check exact school name match
-            if team['school'].lower() == team_name_lower:
-                return team['id']
-            # Check exact mascot name match
-            if team['mascot'].lower() == team_name_lower:
-                return team['id']
-        
-        # Second pass: Look for exact word matches
-        for team in teams_data:
-            school_words = team['school'].lower().split()
-            if team_name_lower in school_words:
-                return team['id']
-        
-        # Third pass: Look for partial matches (most permissive)
-        for team in teams_data:
-            if team_name_lower in team['school'].lower():
-                return team['id']
-            
+        directory = get_team_directory()
     except Exception as e:
-        print(f"Error loading fbs.json: {e}")
+        logger.error("Error loading fbs.json: %s", e)
         raise ValueError(f"Could not load team data from fbs.json: {e}")
-    
+
+    team_id = directory.resolve(team_name)
+    if team_id is not None:
+        return team_id
+
     # Generate helpful error message with available teams
-    try:
-        available_teams = [team['school'] for team in sorted(teams_data, key=lambda x: x['school'])]
-        raise ValueError(f"Team '{team_name}' not found. Try using the full school name like 'Washington State' or 'Ole Miss'. Available teams: {', '.join(available_teams[:20])}... (see /teams endpoint for full list)")
-    except:
-        raise ValueError(f"Team '{team_name}' not found. Please use the /teams endpoint to see all available teams.")
+    available_teams = directory.school_names
+    raise ValueError(f"Team '{team_name}' not found. Try using the full school name like 'Washington State' or 'Ole Miss'. Available teams: {', '.join(available_teams[:20])}... (see /teams endpoint for full list)")
 
 def extract_team_season_games(details, games_key, team_id_key, team_name, team_data):
     """Extract and format season game records for a team"""
@@ -330,10 +315,10 @@ def enrich_players_with_headshots(player_analysis, home_team, away_team):
         if away_players:
             espn.enrich_player_data(away_players, away_team)
         
-        print(f"✅ Added ESPN headshots for {home_team} vs {away_team}")
+        logger.debug("✅ Added ESPN headshots for %s vs %s", home_team, away_team)
         
     except Exception as e:
-        print(f"⚠️  Could not fetch ESPN headshots: {e}")
+        logger.warning("⚠️  Could not fetch ESPN headshots: %s", e)
     
     return player_analysis
 
@@ -444,86 +429,21 @@ def generate_confidence_explanation(prediction, details, home_team_name, away_te
     
     return explanations
 
-def load_comprehensive_power_rankings():
-    """Load the comprehensive power rankings data"""
-    try:
-        rankings_path = os.path.join(os.path.dirname(__file__), 'weekly_updates', 'week_15', 'comprehensive_power_rankings_20251203_053934.json')
-        with open(rankings_path, 'r') as f:
-            power_rankings = json.load(f)
-        return power_rankings.get('rankings', [])
-    except Exception as e:
-        print(f"❌ Error loading comprehensive power rankings: {e}")
-        return []
+def build_matchup_power_rankings(predictor, away_team, home_team):
+    """The two teams' power rankings entries plus the version of the full table (GET /rankings/power)"""
+    store = get_power_rankings(predictor.static_data_dir)
+    if not store:
+        return {'version': None, 'away_team': None, 'home_team': None}
+    return store.matchup_entries(away_team, home_team)
 
 def extract_team_ratings(predictor, team_name):
-    """Extract comprehensive ratings for a specific team from comprehensive_power_rankings.json"""
-    try:
-        print(f"🔍 DEBUG: Looking for team '{team_name}'")
-        # Load from comprehensive power rankings JSON in weekly_updates/week_15
-        rankings_path = os.path.join(os.path.dirname(__file__), 'weekly_updates', 'week_15', 'comprehensive_power_rankings_20251203_053934.json')
-        print(f"🔍 DEBUG: Loading from path: {rankings_path}")
-        with open(rankings_path, 'r') as f:
-            power_rankings = json.load(f)
-        
-        print(f"🔍 DEBUG: Found {len(power_rankings.get('rankings', []))} teams in rankings")
-        
-        # Find team in the rankings array
-        team_data = None
-        for team in power_rankings.get('rankings', []):
-            team_name_in_file = team.get('team', '')
-            print(f"🔍 DEBUG: Comparing '{team_name.lower()}' with '{team_name_in_file.lower()}'")
-            if team_name_in_file.lower() == team_name.lower():
-                team_data = team
-                print(f"✅ DEBUG: Found match for {team_name}!")
-                break
-        
-        if not team_data:
-            print(f"⚠️  No ratings found for {team_name} in power rankings")
-            return get_default_ratings()
-        
-        # Extract ratings from team data - using actual field names from the JSON
-        team_ratings = {
-            'team': team_data.get('team', team_name),
-            'conference': team_data.get('conference', ''),
-            'ratings_available': True,
-            'elo': 1500 + (team_data.get('overall_score', 50) - 50) * 10,  # Convert overall score to ELO scale
-            'fpi': team_data.get('overall_score', 50) - 50,  # Use overall score as FPI
-            'sp_overall': team_data.get('defensive_score', 50) - team_data.get('offensive_score', 50),  # SP+ style diff
-            'srs': (team_data.get('overall_score', 50) - 50) * 0.8,  # Scaled overall score
-            'composite_rating': team_data.get('overall_score', 50),
-            'offensive_efficiency': team_data.get('offensive_score', 50),
-            'defensive_efficiency': team_data.get('defensive_score', 50),
-            'special_teams_efficiency': 50.0,  # Default since not in this data
-            'fpi_components': {
-                'offensive_efficiency': team_data.get('offensive_score', 50),
-                'defensive_efficiency': team_data.get('defensive_score', 50),
-                'special_teams_efficiency': 50.0,
-                'overall_efficiency': team_data.get('overall_score', 50)
-            },
-            'sp_components': {
-                'offense': team_data.get('offensive_score', 50),
-                'defense': team_data.get('defensive_score', 50),
-                'special_teams': 50.0
-            },
-            'fpi_rankings': {
-                'sos_rank': team_data.get('rank', 65),
-                'remaining_sos_rank': team_data.get('rank', 65),
-                'strength_of_record_rank': team_data.get('rank', 65),
-                'resume_rank': team_data.get('rank', 65),
-                'game_control_rank': team_data.get('rank', 65),
-                'avg_win_probability_rank': team_data.get('rank', 65)
-            },
-            'rating_consistency': 85.0,  # Default high consistency
-            'elite_tier': team_data.get('rank', 65) <= 10,
-            'struggling_tier': team_data.get('rank', 65) >= 100
-        }
-        
-        print(f"✅ Extracted ratings for {team_name}: ELO={team_ratings['elo']}, FPI={team_ratings['fpi']}, SP+={team_ratings['sp_overall']}")
-        return team_ratings
-        
-    except Exception as e:
-        print(f"❌ Error loading ratings for {team_name}: {e}")
+    """Comprehensive ratings for a team from the shared power rankings store"""
+    store = get_power_rankings(predictor.static_data_dir)
+    team_ratings = store.team_ratings(team_name) if store else None
+    if team_ratings is None:
+        logger.warning("⚠️  No ratings found for %s in power rankings", team_name)
         return get_default_ratings()
+    return team_ratings
 
 def get_default_ratings():
     """Return default ratings when no data is available"""
@@ -564,10 +484,10 @@ def get_default_ratings():
         "ratings_available": False
     }
 
-def calculate_ratings_comparison(predictor, away_team, home_team):
-    """Calculate comprehensive comparison between team ratings"""
-    away_ratings = extract_team_ratings(predictor, away_team)
-    home_ratings = extract_team_ratings(predictor, home_team)
+def calculate_ratings_comparison(predictor, away_team, home_team, away_ratings=None, home_ratings=None):
+    """Calculate comprehensive comparison between team ratings (pass ratings already extracted to reuse them)"""
+    away_ratings = away_ratings or extract_team_ratings(predictor, away_team)
+    home_ratings = home_ratings or extract_team_ratings(predictor, home_team)
     
     if not away_ratings.get("ratings_available") or not home_ratings.get("ratings_available"):
         return {
@@ -1099,7 +1019,7 @@ def generate_arbitrage_analysis(sportsbooks, model_spread, model_total, confiden
         )
         return analysis
     except Exception as e:
-        print(f"⚠️ Error generating arbitrage analysis: {e}")
+        logger.warning("⚠️ Error generating arbitrage analysis: %s", e)
         return {
             'opportunities': [],
             'total_opportunities': 0,
@@ -1132,19 +1052,23 @@ def format_prediction_for_api(prediction, home_team_data, away_team_data, predic
     
     # Debug: Check if we got all 18 sections
     section_count = formatted_analysis.count('[1') + formatted_analysis.count('[2')
-    print(f"🔍 DEBUG: Captured {section_count} sections in formatted analysis")
-    print(f"🔍 DEBUG: Total analysis length: {len(formatted_analysis)} characters")
+    logger.debug("🔍 DEBUG: Captured %s sections in formatted analysis", section_count)
+    logger.debug("🔍 DEBUG: Total analysis length: %s characters", len(formatted_analysis))
     
     # If we don't have enough sections, there might be an issue
     if section_count < 18:
-        print(f"⚠️  WARNING: Only {section_count} sections captured, expected 18")
+        logger.warning("⚠️  WARNING: Only %s sections captured, expected 18", section_count)
     else:
-        print(f"✅ SUCCESS: All {section_count} sections captured!")
+        logger.debug("✅ SUCCESS: All %s sections captured!", section_count)
     
     # Also build a structured UI components object for the React frontend
     # This uses the actual prediction data, not hardcoded values
     details = getattr(prediction, 'detailed_analysis', {}) or {}
     
+    # Power ratings come from the shared rankings store - extract once, reuse for the comparison
+    away_ratings = extract_team_ratings(predictor, prediction.away_team)
+    home_ratings = extract_team_ratings(predictor, prediction.home_team)
+    
     # Inject real betting analysis from week8.json data
     home_team_name = home_team_data.get('name', prediction.home_team)
     away_team_name = away_team_data.get('name', prediction.away_team)
@@ -1153,11 +1077,11 @@ def format_prediction_for_api(prediction, home_team_data, away_team_data, predic
     model_spread = getattr(prediction, 'predicted_spread', None)
     model_total = getattr(prediction, 'predicted_total', None)
     
-    print(f"🎯 Integrating betting lines for {home_team_name} vs {away_team_name}")
-    print(f"🔍 Model spread: {model_spread}, Model total: {model_total}")
-    print(f"🔍 DEBUG: home_team_data.get('school') = '{home_team_data.get('school')}'")
-    print(f"🔍 DEBUG: away_team_data.get('school') = '{away_team_data.get('school')}'")
-    print(f"🔍 DEBUG: Calling betting_manager.get_betting_analysis('{home_team_name}', '{away_team_name}', {model_spread}, {model_total})")
+    logger.debug("🎯 Integrating betting lines for %s vs %s", home_team_name, away_team_name)
+    logger.debug("🔍 Model spread: %s, Model total: %s", model_spread, model_total)
+    logger.debug("🔍 DEBUG: home_team_data.get('school') = '%s'", home_team_data.get('school'))
+    logger.debug("🔍 DEBUG: away_team_data.get('school') = '%s'", away_team_data.get('school'))
+    logger.debug("🔍 DEBUG: Calling betting_manager.get_betting_analysis('%s', '%s', %s, %s)", home_team_name, away_team_name, model_spread, model_total)
     
     betting_analysis = betting_manager.get_betting_analysis(
         home_team_name, away_team_name, model_spread, model_total
@@ -1165,8 +1089,8 @@ def format_prediction_for_api(prediction, home_team_data, away_team_data, predic
     
     # Update details with real betting analysis
     details['betting_analysis'] = betting_analysis
-    print(f"📊 Betting analysis integrated: {betting_analysis.get('data_source', 'No data')}")
-    print(f"🔍 DEBUG: betting_analysis keys: {list(betting_analysis.keys()) if betting_analysis else 'Empty'}")
+    logger.debug("📊 Betting analysis integrated: %s", betting_analysis.get('data_source', 'No data'))
+    logger.debug("🔍 DEBUG: betting_analysis keys: %s", list(betting_analysis.keys()) if betting_analysis else 'Empty')
     
     def get_val(d, *keys, default=0):
         """Helper to safely get nested values"""
@@ -1210,8 +1134,8 @@ def format_prediction_for_api(prediction, home_team_data, away_team_data, predic
     
     # Get weather data
     weather_data = get_val(details, 'weather', default={})
-    print(f"🔍 DEBUG: Flask weather_data keys: {list(weather_data.keys()) if weather_data else 'None'}")
-    print(f"🔍 DEBUG: Flask weather_data values: {weather_data}")
+    logger.debug("🔍 DEBUG: Flask weather_data keys: %s", list(weather_data.keys()) if weather_data else 'None')
+    logger.debug("🔍 DEBUG: Flask weather_data values: %s", weather_data)
     
     # Get game metadata from Week 9 media service
     media_service = get_game_media_service()
@@ -1222,7 +1146,7 @@ def format_prediction_for_api(prediction, home_team_data, away_team_data, predic
     
     # Override with actual game media data if available
     if game_media_info:
-        print(f"✅ Found game media for {prediction.home_team} vs {prediction.away_team}")
+        logger.debug("✅ Found game media for %s vs %s", prediction.home_team, prediction.away_team)
         game_metadata['date'] = game_media_info.get('date', game_metadata.get('date', 'TBD'))
         game_metadata['time'] = game_media_info.get('time', game_metadata.get('time', 'TBD'))
         game_metadata['network'] = game_media_info.get('network', game_metadata.get('network', 'TBD'))
@@ -1368,11 +1292,13 @@ def format_prediction_for_api(prediction, home_team_data, away_team_data, predic
             }
         },
         "comprehensive_ratings": {
-            "away_team": extract_team_ratings(predictor, prediction.away_team),
-            "home_team": extract_team_ratings(predictor, prediction.home_team),
-            "comparison": calculate_ratings_comparison(predictor, prediction.away_team, prediction.home_team)
+            "away_team": away_ratings,
+            "home_team": home_ratings,
+            "comparison": calculate_ratings_comparison(
+                predictor, prediction.away_team, prediction.home_team, away_ratings, home_ratings
+            )
         },
-        "comprehensive_power_rankings": load_comprehensive_power_rankings(),
+        "comprehensive_power_rankings": build_matchup_power_rankings(predictor, prediction.away_team, prediction.home_team),
         "season_records": {
             "away": extract_team_season_games(details, 'awaySeasonGames', 'awayTeamId', prediction.away_team, away_team_data),
             "home": extract_team_season_games(details, 'homeSeasonGames', 'homeTeamId', prediction.home_team, home_team_data)
@@ -1431,6 +1357,420 @@ def format_prediction_for_api(prediction, home_team_data, away_team_data, predic
         "ui_components": ui_components
     }
 
+def load_rivalry_history(home_team, away_team):
+    """Build the rivalry history block for a matchup, or None when it is not a rivalry game"""
+    logger.debug("🔍 Checking rivalry for: '%s' vs '%s'", home_team, away_team)
+    if not is_rivalry_game(home_team, away_team):
+        logger.debug("   ℹ️  Not a rivalry game")
+        return None
+    
+    rivalry_info = get_rivalry_info(home_team, away_team)
+    logger.debug("🏆 RIVALRY DETECTED: %s", rivalry_info['name'])
+    if rivalry_info.get('trophy'):
+        logger.debug("   Trophy: %s", rivalry_info['trophy'])
+    
+    # Precomputed history (rivalry_store.py) - no upstream calls on the request path
+    # NOTE: For display, away_team is team1 and home_team is team2 to match UI order
+    try:
+        series = rivalry_series(away_team, home_team)
+        if not series:
+            logger.debug("   ℹ️  Rivalry history not in the store yet (refreshing in the background)")
+            return None
+        stats = series['stats']
+        
+        # Use the formatted display name from rivalry_info
+        display_name = rivalry_info.get('name_display', f"{home_team} vs {away_team}")
+        
+        logger.debug("   ✓ Loaded %s historical games (%s-%s series)", stats['total_games'], stats['team1_wins'], stats['team2_wins'])
+        return {
+            'name': display_name,
+            'trophy': rivalry_info.get('trophy'),
+            'established': series['established'] or rivalry_info.get('established'),
+            'stats': stats,
+            'recent_games': series['recent_games']  # Most recent first
+        }
+    except Exception as e:
+        logger.warning("   ⚠️ Could not load rivalry history: %s", e)
+        return None
+
+def build_team_data(team_id, fallback_name):
+    """Team display data (name, logos, colors) for the formatter, from fbs.json"""
+    try:
+        team_fbs = get_team_directory().get(team_id)
+    except Exception as e:
+        logger.warning("Warning: Could not load team data from fbs.json: %s", e)
+        team_fbs = None
+    
+    if not team_fbs:
+        return {
+            'id': team_id,
+            'name': fallback_name,
+            'logo_url': f'https://logos.api.collegefootballdata.com/{team_id}.png',
+            'logo_dark_url': f'https://logos.api.collegefootballdata.com/{team_id}.png',
+            'primary_color': '#000000',
+            'alt_color': '#ffffff'
+        }
+    
+    return {
+        'id': team_id,
+        'name': team_fbs['school'],
+        'logo_url': team_fbs['logos'][0] if team_fbs['logos'] else f'https://logos.api.collegefootballdata.com/{team_id}.png',
+        'logo_dark_url': team_fbs['logos'][1] if len(team_fbs['logos']) > 1 else f'https://logos.api.collegefootballdata.com/{team_id}.png',
+        'primary_color': team_fbs['primary_color'],
+        'alt_color': team_fbs['alt_color']
+    }
+
+def build_prediction_response(prediction, home_team_id, away_team_id, predictor, rivalry_history=None):
+    """Turn a raw GamePrediction into the full /predict response payload"""
+    # Apply consistency fixes
+    prediction = apply_prediction_fixes(prediction)
+    
+    # Print the same detailed output as run.py to terminal
+    logger.debug("\n🏈 %s @ %s", prediction.away_team, prediction.home_team)
+    logger.debug("🎯 Home Win Probability: %s", lazy_format(prediction.home_win_prob, '.1%'))
+    logger.debug("📊 Predicted Spread: %s %+.1f", prediction.home_team, prediction.predicted_spread)
+    logger.debug("🔢 Predicted Total: %.1f", prediction.predicted_total)
+    logger.debug("🎪 Confidence: %s", lazy_format(prediction.confidence, '.1%'))
+    
+    # Display value picks if available
+    if hasattr(prediction, 'value_spread_pick') and prediction.value_spread_pick:
+        logger.debug("\n💰 VALUE PICK (Spread): %s (%.1f-point edge)", prediction.value_spread_pick, getattr(prediction, 'spread_edge', 0))
+    if hasattr(prediction, 'value_total_pick') and prediction.value_total_pick:
+        logger.debug("💰 VALUE PICK (Total): %s (%.1f-point edge)", prediction.value_total_pick, getattr(prediction, 'total_edge', 0))
+    
+    logger.debug("\n🔑 Key Factors: %s", ', '.join(getattr(prediction, 'key_factors', [])))
+    
+    # Get team data for comprehensive formatting
+    home_team_data = build_team_data(home_team_id, prediction.home_team)
+    away_team_data = build_team_data(away_team_id, prediction.away_team)
+    
+    logger.debug("🎨 TEAM LOGOS:")
+    logger.debug("   🏠 %s: %s (light), %s (dark)", prediction.home_team, home_team_data['logo_url'], home_team_data['logo_dark_url'])
+    logger.debug("   ✈️  %s: %s (light), %s (dark)", prediction.away_team, away_team_data['logo_url'], away_team_data['logo_dark_url'])
+    
+    # Generate comprehensive analysis using the working logic from run.py
+    logger.debug('\n' + '=' * 80)
+    logger.debug("🎯 GENERATING COMPREHENSIVE 18-SECTION ANALYSIS...")
+    logger.debug('=' * 80)
+    
+    comprehensive_analysis = format_prediction_for_api(prediction, home_team_data, away_team_data, predictor)
+    
+    # Validate prediction consistency
+    validation_results = PredictionValidator.validate_full_prediction({
+        'predicted_spread': prediction.predicted_spread,
+        'predicted_total': prediction.predicted_total,
+        'home_win_prob': prediction.home_win_prob,
+        'ui_components': comprehensive_analysis.get('ui_components', {})
+    })
+    
+    # Log validation results
+    if not validation_results['is_valid']:
+        logger.warning("⚠️ VALIDATION ERRORS: %s", validation_results['errors'])
+    if validation_results['warnings']:
+        logger.debug("🔍 VALIDATION WARNINGS: %s", validation_results['warnings'])
+    if validation_results['consistency_checks']:
+        logger.debug("✅ CONSISTENCY CHECKS: %s", validation_results['consistency_checks'])
+    
+    # The formatted analysis is already printed by format_prediction_output
+    
+    logger.debug('\n' + '=' * 80)
+    logger.debug("🎯 ANALYSIS COMPLETE - RETURNING STRUCTURED JSON")
+    logger.debug('=' * 80)
+    
+    # Return the comprehensive analysis from formatter
+    response_data = {
+        "success": True,
+        **comprehensive_analysis
+    }
+    
+    # Add rivalry history if available
+    if rivalry_history:
+        response_data['rivalry_history'] = rivalry_history
+        logger.debug("\n🏆 Added rivalry history to response")
+    
+    return response_data
+
+def predict_cached(predictor, home_team_id, away_team_id):
+    """CachedPrediction for a matchup - repeat requests (any predict route) reuse one prediction + payload"""
+    def compute():
+        prediction = run_async(predictor.predict_game(home_team_id, away_team_id))
+        return CachedPrediction(prediction, build_prediction_response(prediction, home_team_id, away_team_id, predictor))
+
+    cache = get_prediction_cache()
+    if not cache.enabled:
+        return compute()
+    # Fresh lines fingerprint -> key built locally, so a repeat view never leaves the process
+    key = (predictor.cached_prediction_key(home_team_id, away_team_id)
+           or run_async(predictor.prediction_cache_key(home_team_id, away_team_id)))
+    return cache.get_or_compute(key, compute)
+
+def with_rivalry_history(response_data, rivalry_history):
+    """Copy of a cached /predict payload with this request's rivalry history attached"""
+    if not rivalry_history:
+        return response_data
+    logger.debug("\n🏆 Added rivalry history to response")
+    return {**response_data, 'rivalry_history': rivalry_history}
+
+def build_simple_prediction(prediction):
+    """Compact prediction summary used by the GET prediction endpoints"""
+    # Calculate predicted winner based on home win probability
+    predicted_winner = prediction.home_team if prediction.home_win_prob > 0.5 else prediction.away_team
+    
+    # Calculate implied scores from spread and total
+    home_score = round((prediction.predicted_total + prediction.predicted_spread) / 2)
+    away_score = round((prediction.predicted_total - prediction.predicted_spread) / 2)
+    
+    return {
+        "home_team": prediction.home_team,
+        "away_team": prediction.away_team,
+        "predicted_winner": predicted_winner,
+        "home_score": home_score,
+        "away_score": away_score,
+        "spread": prediction.predicted_spread,
+        "total": prediction.predicted_total,
+        "home_win_probability": prediction.home_win_prob,
+        "confidence": prediction.confidence,
+        "key_factors": prediction.key_factors
+    }
+
+def load_team_logos():
+    """Map team ID -> {id, name, logo} from the local fbs.json file"""
+    teams_data = {}
+    try:
+        # Create lookup dictionary from the shared fbs.json directory
+        for team in get_team_directory().teams:
+            teams_data[team['id']] = {
+                'id': team['id'],
+                'name': team['school'],
+                'logo': team['logos'][0]  # Use working ESPN CDN logo
+            }
+        
+    except Exception as e:
+        logger.warning("Warning: Could not fetch team logos: %s", e)
+    return teams_data
+
+def build_detailed_prediction_response(prediction, home_team_id, away_team_id, teams_data):
+    """Response payload for /predict-detailed, printing the same summary as run.py"""
+    # Print the same detailed output as run.py
+    logger.debug("\n🏈 %s @ %s", prediction.away_team, prediction.home_team)
+    logger.debug("🎯 Home Win Probability: %s", lazy_format(prediction.home_win_prob, '.1%'))
+    logger.debug("📊 Predicted Spread: %s %+.1f", prediction.home_team, prediction.predicted_spread)
+    logger.debug("🔢 Predicted Total: %.1f", prediction.predicted_total)
+    logger.debug("🎪 Confidence: %s", lazy_format(prediction.confidence, '.1%'))
+    logger.debug("🔑 Key Factors: %s", ', '.join(prediction.key_factors))
+    
+    # Display team logos
+    if home_team_id in teams_data and away_team_id in teams_data:
+        logger.debug("\n🏈 Team Logos (for future UI integration):")
+        logger.debug("🏠 %s: %s", teams_data[home_team_id]['name'], teams_data[home_team_id]['logo'])
+        logger.debug("✈️  %s: %s", teams_data[away_team_id]['name'], teams_data[away_team_id]['logo'])
+    
+    # Return comprehensive JSON response
+    response_data = {
+        "success": True,
+        "prediction": build_simple_prediction(prediction)
+    }
+    
+    # Add team logos if available
+    if home_team_id in teams_data and away_team_id in teams_data:
+        response_data["team_data"] = {
+            "home_team": teams_data[home_team_id],
+            "away_team": teams_data[away_team_id]
+        }
+    
+    return response_data
+
+def list_teams():
+    """FBS teams for dropdowns, sorted by school name"""
+    # Sort teams by school name and format for frontend
+    sorted_teams = get_team_directory().list_teams()
+    formatted_teams = []
+    
+    for team in sorted_teams:
+        formatted_teams.append({
+            'id': team['id'], 
+            'name': team['school'],
+            'logo': team['logos'][0],  # Regular logo (light mode)
+            'logo_dark': team['logos'][1],  # Dark logo (dark mode)
+            'mascot': team['mascot'],
+            'conference': team['conference'],
+            'primary_color': team['primary_color'],
+            'alt_color': team['alt_color']
+        })
+    return formatted_teams
+
+def format_player_props(props):
+    """Serialize PlayerProp objects for the player props endpoint"""
+    return [
+        {
+            'player_name': prop.player_name,
+            'player_team': prop.player_team,
+            'position': prop.position,
+            'prop_type': prop.prop_type,
+            'line': prop.over_under_line,
+            'over_under_line': prop.over_under_line,
+            'confidence': prop.confidence,
+            'recommendation': prop.recommendation,
+            'reasoning': prop.reasoning,
+            'season_average': prop.season_average,
+            'weather_impact': prop.weather_impact,
+            'game_logs': [asdict(log) for log in prop.game_logs],
+            'trend_analysis': asdict(prop.trend_analysis),
+            'defensive_matchup': asdict(prop.defensive_matchup),
+            'key_insights': prop.key_insights
+        }
+        for prop in props
+    ]
+
+def build_player_props_response(team1, team2, team1_props, team2_props):
+    """Response payload for the player props endpoint"""
+    return {
+        'matchup': {
+            'team1': team1,
+            'team2': team2
+        },
+        'team1_props': format_player_props(team1_props),
+        'team2_props': format_player_props(team2_props),
+        'total_props': len(team1_props) + len(team2_props)
+    }
+
+MAX_BATCH_CONCURRENCY = 32
+
+def parse_batch_request(data, predictor):
+    """Validate a /predict/batch body -> (matchups, positions, rejected lines, concurrency)
+
+    Accepts {"games": [{"home_team": ..., "away_team": ...}, ...]} or {"week": "current"},
+    plus an optional "concurrency". Raises ValueError for a malformed body.
+    """
+    if not data or ('games' not in data and data.get('week') != 'current'):
+        raise ValueError('Provide "games": [{"home_team", "away_team"}, ...] or "week": "current"')
+
+    concurrency = data.get('concurrency')
+    if concurrency is not None:
+        if not isinstance(concurrency, int) or concurrency < 1:
+            raise ValueError('"concurrency" must be a positive integer')
+        concurrency = min(concurrency, MAX_BATCH_CONCURRENCY)
+
+    if data.get('week') == 'current' and 'games' not in data:
+        matchups = predictor.current_week_matchups()
+        return matchups, list(range(len(matchups))), [], concurrency
+
+    if not isinstance(data['games'], list):
+        raise ValueError('"games" must be a list')
+
+    matchups, positions, rejected = [], [], []
+    for position, game in enumerate(data['games']):
+        try:
+            if not isinstance(game, dict) or 'home_team' not in game or 'away_team' not in game:
+                raise ValueError("Missing required fields: home_team, away_team")
+            matchups.append((get_team_id(game['home_team']), get_team_id(game['away_team'])))
+            positions.append(position)
+        except ValueError as e:
+            rejected.append({"index": position, "success": False, "error": str(e)})
+    return matchups, positions, rejected, concurrency
+
+def build_batch_result(position, home_team_id, away_team_id, prediction, error):
+    """One NDJSON line of a batch response"""
+    line = {"index": position, "home_team_id": home_team_id, "away_team_id": away_team_id}
+    if error is not None:
+        line.update({"success": False, "error": f"Prediction failed: {str(error)}"})
+    else:
+        line.update({"success": True, "prediction": build_simple_prediction(prediction)})
+    return line
+
+def build_batch_summary(total, failed, started):
+    """Trailing NDJSON line of a batch response"""
+    return {"done": True, "games": total, "failed": failed, "elapsed_seconds": round(time.time() - started, 2)}
+
+WEBHOOK_SECRET_ENV = 'CFB_WEBHOOK_SECRET'
+WEBHOOK_SECRET_HEADER = 'X-Webhook-Secret'
+
+def webhook_authorized(secret_header):
+    """True when the request carries the shared CFB_WEBHOOK_SECRET (never when none is configured)"""
+    secret = os.environ.get(WEBHOOK_SECRET_ENV, '')
+    return bool(secret) and hmac.compare_digest((secret_header or '').encode('utf-8'), secret.encode('utf-8'))
+
+def handle_data_update(data, predictor, secret_header=None):
+    """Validate an n8n data-update payload and schedule a hot reload -> (payload, status)
+
+    Requires the X-Webhook-Secret header to match CFB_WEBHOOK_SECRET. A week older
+    than the one being served is refused unless the payload sets "force": true,
+    since reloading it rolls the live predictor back.
+    """
+    if not webhook_authorized(secret_header):
+        return {'status': 'error', 'message': f'Missing or invalid {WEBHOOK_SECRET_HEADER} header'}, 401
+    
+    data = data if isinstance(data, dict) else {}
+    week = data.get('week')
+    games_count = data.get('games_count')
+    timestamp = data.get('timestamp')
+    
+    # Log the update
+    logger.debug("n8n Data Update Received - Week %s: %s games at %s", week, games_count, timestamp)
+    
+    if week is not None and (not isinstance(week, int) or isinstance(week, bool)):
+        return {'status': 'error', 'message': '"week" must be an integer'}, 400
+    
+    if week is not None and week < predictor.current_week and data.get('force') is not True:
+        return {
+            'status': 'error',
+            'message': f'Week {week} is older than the week being served ({predictor.current_week}) - '
+                       f'send "force": true to roll back'
+        }, 409
+    
+    # Don't swap in a suspicious data drop - verify games_count is reasonable (20-60)
+    if games_count and (games_count < 20 or games_count > 60):
+        return {
+            'status': 'warning',
+            'message': f'Unusual game count: {games_count} - data reload skipped'
+        }, 200
+    
+    reloader = get_data_reloader(predictor)
+    reloader.request_reload(week, reason='n8n data update')
+    return {
+        'status': 'success',
+        'message': f'Week {week if week is not None else "latest"} data update acknowledged - reloading in background',
+        'data': reloader.status()
+    }, 202
+
+def build_power_rankings_response(predictor, week, if_none_match=None, accept_encoding=None):
+    """Full power rankings table for GET /rankings/power -> (body, status, headers)
+
+    The body is encoded once per data version; clients revalidate with
+    If-None-Match against the version ETag and get gzip when they accept it.
+    The gzip body carries its own ETag (version + '-gz'), as strong validators
+    must differ between content-codings.
+    """
+    if week is not None:
+        try:
+            data_dir = week_data_dir(int(week))
+        except (TypeError, ValueError):
+            return json.dumps({'error': '"week" must be an integer'}).encode('utf-8'), 400, {'Content-Type': 'application/json'}
+    else:
+        data_dir = predictor.static_data_dir
+
+    store = get_power_rankings(data_dir)
+    if not store:
+        message = f'No power rankings available for week {week}' if week is not None else 'No power rankings available'
+        return json.dumps({'error': message}).encode('utf-8'), 404, {'Content-Type': 'application/json'}
+
+    use_gzip = accepts_gzip(accept_encoding)
+    etag = store.gzip_etag if use_gzip else store.etag
+    headers = {
+        'ETag': etag,
+        'Cache-Control': 'public, max-age=300',
+        'Vary': 'Accept-Encoding'
+    }
+    if etag_matches(if_none_match, etag):
+        return b'', 304, headers
+
+    body, gzipped = store.encoded()
+    headers['Content-Type'] = 'application/json'
+    if use_gzip:
+        headers['Content-Encoding'] = 'gzip'
+        return gzipped, 200, headers
+    return body, 200, headers
+
 # Predictor will be initialized lazily within the endpoint
 api_key = os.environ.get('CFB_API_KEY', 'T0iV2bfp8UKCf8rTV12qsS26USzyDYiVNA7x6WbaV3NOvewuDQnJlv3NfPzr3f/p')
 predictor = None
@@ -1441,13 +1781,17 @@ def get_predictor():
     global predictor
     if predictor is None:
         predictor = LightningPredictor(api_key)
+        runtime = get_async_runtime()
+        predictor.use_shared_session(runtime.session, runtime.loop)
+        get_data_reloader(predictor, float(os.environ.get('CFB_DATA_WATCH_INTERVAL', 60)))
     return predictor
 
 def get_espn_service():
     """Initializes and returns a single instance of ESPN player service."""
     global espn_service
     if espn_service is None:
-        espn_service = ESPNPlayerService()
+        # Rosters come from the shared store; stale ones refresh off the request path
+        espn_service = ESPNPlayerService(background_refresh=True)
     return espn_service
 
 @app.route('/health', methods=['GET'])
@@ -1456,7 +1800,9 @@ def health_check():
         "status": "healthy",
         "service": "Gameday GraphQL Predictor",
         "version": "1.0.0",
-        "accepts": "team names or IDs"
+        "accepts": "team names or IDs",
+        "query_cache": get_query_cache().stats(),
+        "prediction_cache": get_prediction_cache().stats()
     })
 
 @app.route('/test.html', methods=['GET'])
@@ -1503,221 +1849,56 @@ def predict_game():
             }), 400
         
         # Print the same detailed analysis as run.py to terminal
-        print(f"🔍 Looking up teams: {data['home_team']} (home) vs {data['away_team']} (away)")
-        print(f"✅ {data['home_team']} (ID: {home_team_id})")
-        print(f"✅ {data['away_team']} (ID: {away_team_id})")
-        print(f"\nPredicting game: {data['home_team']} vs {data['away_team']}")
+        logger.debug("🔍 Looking up teams: %s (home) vs %s (away)", data['home_team'], data['away_team'])
+        logger.debug("✅ %s (ID: %s)", data['home_team'], home_team_id)
+        logger.debug("✅ %s (ID: %s)", data['away_team'], away_team_id)
+        logger.debug("\nPredicting game: %s vs %s", data['home_team'], data['away_team'])
         
         # Check if this is a rivalry game
-        rivalry_history = None
-        print(f"🔍 Checking rivalry for: '{data['home_team']}' vs '{data['away_team']}'")
-        if is_rivalry_game(data['home_team'], data['away_team']):
-            rivalry_info = get_rivalry_info(data['home_team'], data['away_team'])
-            print(f"🏆 RIVALRY DETECTED: {rivalry_info['name']}")
-            if rivalry_info.get('trophy'):
-                print(f"   Trophy: {rivalry_info['trophy']}")
-            
-            # Fetch rivalry history
-            try:
-                analyzer = BatchRivalryAnalyzer()
-                
-                # Get all-time series record from REST API
-                # NOTE: For display, away_team is team1 and home_team is team2 to match UI order
-                alltime_record = analyzer.get_alltime_series_record(data['away_team'], data['home_team'])
-                
-                # Get detailed recent games from GraphQL  
-                games = analyzer.get_rivalry_games(data['away_team'], data['home_team'])
-                if games:
-                    # Sort games by season and week (most recent first)
-                    games = sorted(games, key=lambda g: (g['season'], g['week']), reverse=True)
-                    
-                    rankings = analyzer.get_rankings_for_games(games)
-                    stats = analyzer.analyze_rivalry(data['away_team'], data['home_team'], games, rankings)
-                    
-                    # Merge all-time stats with recent game stats
-                    if alltime_record:
-                        stats['total_games_alltime'] = alltime_record.get('total_games_alltime', stats['total_games'])
-                        stats['team1_wins_alltime'] = alltime_record.get('team1_wins_alltime', stats['team1_wins'])
-                        stats['team2_wins_alltime'] = alltime_record.get('team2_wins_alltime', stats['team2_wins'])
-                        stats['ties_alltime'] = alltime_record.get('ties_alltime', 0)
-                        stats['series_record_alltime'] = alltime_record.get('series_record_alltime', f"{stats['team1_wins']}-{stats['team2_wins']}")
-                        if alltime_record.get('established'):
-                            rivalry_info['established'] = alltime_record['established']
-                    
-                    # Make stats JSON serializable
-                    stats_serializable = {k: v for k, v in stats.items() if k not in ['closest_game', 'biggest_blowout']}
-                    if stats.get('closest_game'):
-                        stats_serializable['closest_game'] = {
-                            'season': stats['closest_game']['season'],
-                            'week': stats['closest_game']['week'],
-                            'homeTeam': stats['closest_game']['homeTeam'],
-                            'awayTeam': stats['closest_game']['awayTeam'],
-                            'homePoints': stats['closest_game']['homePoints'],
-                            'awayPoints': stats['closest_game']['awayPoints']
-                        }
-                    if stats.get('biggest_blowout'):
-                        stats_serializable['biggest_blowout'] = {
-                            'season': stats['biggest_blowout']['season'],
-                            'week': stats['biggest_blowout']['week'],
-                            'homeTeam': stats['biggest_blowout']['homeTeam'],
-                            'awayTeam': stats['biggest_blowout']['awayTeam'],
-                            'homePoints': stats['biggest_blowout']['homePoints'],
-                            'awayPoints': stats['biggest_blowout']['awayPoints']
-                        }
-                    
-                    # Use the formatted display name from rivalry_info
-                    display_name = rivalry_info.get('name_display', f"{data['home_team']} vs {data['away_team']}")
-                    
-                    rivalry_history = {
-                        'name': display_name,
-                        'trophy': rivalry_info.get('trophy'),
-                        'established': rivalry_info.get('established'),
-                        'stats': stats_serializable,
-                        'recent_games': games[:10]  # First 10 games (now sorted most recent first)
-                    }
-                    print(f"   ✓ Loaded {stats['total_games']} historical games ({stats['team1_wins']}-{stats['team2_wins']} series)")
-            except Exception as e:
-                print(f"   ⚠️ Could not load rivalry history: {e}")
-                import traceback
-                traceback.print_exc()
-        else:
-            print(f"   ℹ️  Not a rivalry game")
+        rivalry_history = load_rivalry_history(data['home_team'], data['away_team'])
         
-        # Run async prediction
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+        # Run async prediction on the worker's shared event loop
+        predictor = get_predictor()
+        logger.debug("🔍 Debug: Calling predict_game with IDs: %s, %s", home_team_id, away_team_id)
+        logger.debug("🔍 Debug: Team names in request: '%s', '%s'", data['home_team'], data['away_team'])
+        cached = predict_cached(predictor, home_team_id, away_team_id)
         
-        try:
-            predictor = get_predictor()
-            print(f"🔍 Debug: Calling predict_game with IDs: {home_team_id}, {away_team_id}")
-            print(f"🔍 Debug: Team names in request: '{data['home_team']}', '{data['away_team']}'")
-            prediction = loop.run_until_complete(
-                predictor.predict_game(home_team_id, away_team_id)
-            )
-            
-            # Apply consistency fixes
-            prediction = apply_prediction_fixes(prediction)
-            
-            # Print the same detailed output as run.py to terminal
-            print(f"\n🏈 {prediction.away_team} @ {prediction.home_team}")
-            print(f"🎯 Home Win Probability: {prediction.home_win_prob:.1%}")
-            print(f"📊 Predicted Spread: {prediction.home_team} {prediction.predicted_spread:+.1f}")
-            print(f"🔢 Predicted Total: {prediction.predicted_total:.1f}")
-            print(f"🎪 Confidence: {prediction.confidence:.1%}")
-            
-            # Display value picks if available
-            if hasattr(prediction, 'value_spread_pick') and prediction.value_spread_pick:
-                print(f"\n💰 VALUE PICK (Spread): {prediction.value_spread_pick} ({getattr(prediction, 'spread_edge', 0):.1f}-point edge)")
-            if hasattr(prediction, 'value_total_pick') and prediction.value_total_pick:
-                print(f"💰 VALUE PICK (Total): {prediction.value_total_pick} ({getattr(prediction, 'total_edge', 0):.1f}-point edge)")
-            
-            print(f"\n🔑 Key Factors: {', '.join(getattr(prediction, 'key_factors', []))}")
-            
-            # Get team data for comprehensive formatting
-            try:
-                import json
-                with open('fbs.json', 'r') as f:
-                    teams_list = json.load(f)
-                
-                # Find team data for both teams
-                home_team_fbs = next((team for team in teams_list if team['id'] == home_team_id), None)
-                away_team_fbs = next((team for team in teams_list if team['id'] == away_team_id), None)
-                
-                home_team_data = {
-                    'id': home_team_id,
-                    'name': home_team_fbs['school'] if home_team_fbs else prediction.home_team,
-                    'logo_url': home_team_fbs['logos'][0] if home_team_fbs and home_team_fbs['logos'] else f'https://logos.api.collegefootballdata.com/{home_team_id}.png',
-                    'logo_dark_url': home_team_fbs['logos'][1] if home_team_fbs and len(home_team_fbs['logos']) > 1 else f'https://logos.api.collegefootballdata.com/{home_team_id}.png',
-                    'primary_color': home_team_fbs['primary_color'] if home_team_fbs else '#000000',
-                    'alt_color': home_team_fbs['alt_color'] if home_team_fbs else '#ffffff'
-                }
-                
-                away_team_data = {
-                    'id': away_team_id,
-                    'name': away_team_fbs['school'] if away_team_fbs else prediction.away_team,
-                    'logo_url': away_team_fbs['logos'][0] if away_team_fbs and away_team_fbs['logos'] else f'https://logos.api.collegefootballdata.com/{away_team_id}.png',
-                    'logo_dark_url': away_team_fbs['logos'][1] if away_team_fbs and len(away_team_fbs['logos']) > 1 else f'https://logos.api.collegefootballdata.com/{away_team_id}.png',
-                    'primary_color': away_team_fbs['primary_color'] if away_team_fbs else '#000000',
-                    'alt_color': away_team_fbs['alt_color'] if away_team_fbs else '#ffffff'
-                }
-                
-            except Exception as e:
-                print(f"Warning: Could not load team data from fbs.json: {e}")
-                # Create fallback team data
-                home_team_data = {
-                    'id': home_team_id,
-                    'name': prediction.home_team,
-                    'logo_url': f'https://logos.api.collegefootballdata.com/{home_team_id}.png',
-                    'logo_dark_url': f'https://logos.api.collegefootballdata.com/{home_team_id}.png',
-                    'primary_color': '#000000',
-                    'alt_color': '#ffffff'
-                }
-                away_team_data = {
-                    'id': away_team_id,
-                    'name': prediction.away_team,
-                    'logo_url': f'https://logos.api.collegefootballdata.com/{away_team_id}.png',
-                    'logo_dark_url': f'https://logos.api.collegefootballdata.com/{away_team_id}.png',
-                    'primary_color': '#000000',
-                    'alt_color': '#ffffff'
-                }
-            
-            print(f"🎨 TEAM LOGOS:")
-            print(f"   🏠 {prediction.home_team}: {home_team_data['logo_url']} (light), {home_team_data['logo_dark_url']} (dark)")
-            print(f"   ✈️  {prediction.away_team}: {away_team_data['logo_url']} (light), {away_team_data['logo_dark_url']} (dark)")
-            
-            # Generate comprehensive analysis using the working logic from run.py
-            print("\n" + "=" * 80)
-            print("🎯 GENERATING COMPREHENSIVE 18-SECTION ANALYSIS...")
-            print("=" * 80)
-            
-            comprehensive_analysis = format_prediction_for_api(prediction, home_team_data, away_team_data, predictor)
-            
-            # Validate prediction consistency
-            validation_results = PredictionValidator.validate_full_prediction({
-                'predicted_spread': prediction.predicted_spread,
-                'predicted_total': prediction.predicted_total,
-                'home_win_prob': prediction.home_win_prob,
-                'ui_components': comprehensive_analysis.get('ui_components', {})
-            })
-            
-            # Log validation results
-            if not validation_results['is_valid']:
-                print(f"⚠️ VALIDATION ERRORS: {validation_results['errors']}")
-            if validation_results['warnings']:
-                print(f"🔍 VALIDATION WARNINGS: {validation_results['warnings']}")
-            if validation_results['consistency_checks']:
-                print(f"✅ CONSISTENCY CHECKS: {validation_results['consistency_checks']}")
-            
-            # The formatted analysis is already printed by format_prediction_output
-            
-            print("\n" + "=" * 80)
-            print("🎯 ANALYSIS COMPLETE - RETURNING STRUCTURED JSON")
-            print("=" * 80)
-            
-            # Return the comprehensive analysis from formatter
-            response_data = {
-                "success": True,
-                **comprehensive_analysis
-            }
-            
-            # Add rivalry history if available
-            if rivalry_history:
-                response_data['rivalry_history'] = rivalry_history
-                print(f"\n🏆 Added rivalry history to response")
-            
-            return jsonify(response_data)
-            
-        finally:
-            loop.close()
+        return jsonify(with_rivalry_history(cached.response, rivalry_history))
             
     except Exception as e:
-        print(f"Error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error: %s", e)
         return jsonify({
             "error": f"Prediction failed: {str(e)}"
         }), 500
 
+@app.route('/predict/batch', methods=['POST', 'OPTIONS'])
+def predict_batch():
+    """Predict many games at once, streaming one NDJSON line per game as it completes"""
+    if request.method == 'OPTIONS':
+        return '', 200
+
+    predictor = get_predictor()
+    try:
+        matchups, positions, rejected, concurrency = parse_batch_request(request.get_json(silent=True), predictor)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    logger.debug("📦 Batch prediction: %s games (%s rejected)", len(matchups), len(rejected))
+
+    def stream():
+        started = time.time()
+        failed = len(rejected)
+        for line in rejected:
+            yield json.dumps(line) + '\n'
+        for index, home_team_id, away_team_id, prediction, error in iterate_async(
+                predictor.predict_games(matchups, concurrency)):
+            line = build_batch_result(positions[index], home_team_id, away_team_id, prediction, error)
+            failed += not line['success']
+            yield json.dumps(line) + '\n'
+        yield json.dumps(build_batch_summary(len(matchups) + len(rejected), failed, started)) + '\n'
+
+    return Response(stream(), mimetype='application/x-ndjson')
+
 @app.route('/predict/<home_team>/<away_team>', methods=['GET'])
 def predict_game_get(home_team, away_team):
     """GET endpoint for easy testing - accepts team names or IDs"""
@@ -1730,41 +1911,14 @@ def predict_game_get(home_team, away_team):
             return jsonify({
                 "error": str(e)
             }), 400
-        # Run async prediction
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+        # Run async prediction on the worker's shared event loop
+        predictor = get_predictor()
+        prediction = predict_cached(predictor, home_team_id, away_team_id).prediction
         
-        try:
-            predictor = get_predictor()
-            prediction = loop.run_until_complete(
-                predictor.predict_game(home_team_id, away_team_id)
-            )
-            
-            # Calculate predicted winner based on home win probability
-            predicted_winner = prediction.home_team if prediction.home_win_prob > 0.5 else prediction.away_team
-            
-            # Calculate implied scores from spread and total
-            home_score = round((prediction.predicted_total + prediction.predicted_spread) / 2)
-            away_score = round((prediction.predicted_total - prediction.predicted_spread) / 2)
-            
-            return jsonify({
-                "success": True,
-                "prediction": {
-                    "home_team": prediction.home_team,
-                    "away_team": prediction.away_team,
-                    "predicted_winner": predicted_winner,
-                    "home_score": home_score,
-                    "away_score": away_score,
-                    "spread": prediction.predicted_spread,
-                    "total": prediction.predicted_total,
-                    "home_win_probability": prediction.home_win_prob,
-                    "confidence": prediction.confidence,
-                    "key_factors": prediction.key_factors
-                }
-            })
-            
-        finally:
-            loop.close()
+        return jsonify({
+            "success": True,
+            "prediction": build_simple_prediction(prediction)
+        })
             
     except Exception as e:
         return jsonify({
@@ -1785,97 +1939,24 @@ def predict_game_detailed(home_team, away_team):
             }), 400
         
         # Get team data for logos
-        teams_data = {}
-        try:
-            import json
-            
-            # Load teams from local fbs.json file
-            with open('fbs.json', 'r') as f:
-                teams_list = json.load(f)
-            
-            # Create lookup dictionary
-            for team in teams_list:
-                teams_data[team['id']] = {
-                    'id': team['id'],
-                    'name': team['school'],
-                    'logo': team['logos'][0]  # Use working ESPN CDN logo
-                }
-            
-        except Exception as e:
-            print(f"Warning: Could not fetch team logos: {e}")
+        teams_data = load_team_logos()
         
-        print(f"🔍 Looking up teams: {home_team} (home) vs {away_team} (away)")
+        logger.debug("🔍 Looking up teams: %s (home) vs %s (away)", home_team, away_team)
         if home_team_id in teams_data:
-            print(f"✅ {teams_data[home_team_id]['name']} (ID: {home_team_id}) - Logo: {teams_data[home_team_id]['logo']}")
+            logger.debug("✅ %s (ID: %s) - Logo: %s", teams_data[home_team_id]['name'], home_team_id, teams_data[home_team_id]['logo'])
         if away_team_id in teams_data:
-            print(f"✅ {teams_data[away_team_id]['name']} (ID: {away_team_id}) - Logo: {teams_data[away_team_id]['logo']}")
+            logger.debug("✅ %s (ID: %s) - Logo: %s", teams_data[away_team_id]['name'], away_team_id, teams_data[away_team_id]['logo'])
         
-        print(f"\nPredicting game: {home_team} vs {away_team}")
+        logger.debug("\nPredicting game: %s vs %s", home_team, away_team)
         
-        # Run async prediction with detailed output (same as run.py)
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+        # Run async prediction with detailed output (same as run.py) on the shared event loop
+        predictor = get_predictor()
+        prediction = predict_cached(predictor, home_team_id, away_team_id).prediction
         
-        try:
-            predictor = get_predictor()
-            prediction = loop.run_until_complete(
-                predictor.predict_game(home_team_id, away_team_id)
-            )
-            
-            # Print the same detailed output as run.py
-            print(f"\n🏈 {prediction.away_team} @ {prediction.home_team}")
-            print(f"🎯 Home Win Probability: {prediction.home_win_prob:.1%}")
-            print(f"📊 Predicted Spread: {prediction.home_team} {prediction.predicted_spread:+.1f}")
-            print(f"🔢 Predicted Total: {prediction.predicted_total:.1f}")
-            print(f"🎪 Confidence: {prediction.confidence:.1%}")
-            print(f"🔑 Key Factors: {', '.join(prediction.key_factors)}")
-            
-            # Display team logos
-            if home_team_id in teams_data and away_team_id in teams_data:
-                print(f"\n🏈 Team Logos (for future UI integration):")
-                print(f"🏠 {teams_data[home_team_id]['name']}: {teams_data[home_team_id]['logo']}")
-                print(f"✈️  {teams_data[away_team_id]['name']}: {teams_data[away_team_id]['logo']}")
-            
-            # Calculate predicted winner based on home win probability
-            predicted_winner = prediction.home_team if prediction.home_win_prob > 0.5 else prediction.away_team
-            
-            # Calculate implied scores from spread and total
-            home_score = round((prediction.predicted_total + prediction.predicted_spread) / 2)
-            away_score = round((prediction.predicted_total - prediction.predicted_spread) / 2)
-            
-            # Return comprehensive JSON response
-            response_data = {
-                "success": True,
-                "prediction": {
-                    "home_team": prediction.home_team,
-                    "away_team": prediction.away_team,
-                    "predicted_winner": predicted_winner,
-                    "home_score": home_score,
-                    "away_score": away_score,
-                    "spread": prediction.predicted_spread,
-                    "total": prediction.predicted_total,
-                    "home_win_probability": prediction.home_win_prob,
-                    "confidence": prediction.confidence,
-                    "key_factors": prediction.key_factors
-                }
-            }
-            
-            # Add team logos if available
-            if home_team_id in teams_data and away_team_id in teams_data:
-                response_data["team_data"] = {
-                    "home_team": teams_data[home_team_id],
-                    "away_team": teams_data[away_team_id]
-                }
-            
-            return jsonify(response_data)
-            
-        finally:
-            loop.close()
+        return jsonify(build_detailed_prediction_response(prediction, home_team_id, away_team_id, teams_data))
             
     except Exception as e:
-        print(f"Error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error: %s", e)
         return jsonify({
             "error": f"Prediction failed: {str(e)}"
         }), 500
@@ -1904,9 +1985,7 @@ def get_live_game():
         }), 503
         
     except Exception as e:
-        print(f"Error fetching live game data: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error fetching live game data: %s", e)
         return jsonify({
             'error': f'Failed to fetch live game data: {str(e)}'
         }), 500
@@ -1915,101 +1994,40 @@ def get_live_game():
 def get_teams():
     """Get list of FBS teams for dropdowns from local fbs.json file"""
     try:
-        import json
-        
-        # Load teams from local fbs.json file
-        with open('fbs.json', 'r') as f:
-            teams_data = json.load(f)
-        
-        # Sort teams by school name and format for frontend
-        sorted_teams = sorted(teams_data, key=lambda x: x['school'])
-        formatted_teams = []
-        
-        for team in sorted_teams:
-            formatted_teams.append({
-                'id': team['id'], 
-                'name': team['school'],
-                'logo': team['logos'][0],  # Regular logo (light mode)
-                'logo_dark': team['logos'][1],  # Dark logo (dark mode)
-                'mascot': team['mascot'],
-                'conference': team['conference'],
-                'primary_color': team['primary_color'],
-                'alt_color': team['alt_color']
-            })
-        
-        return jsonify({'success': True, 'teams': formatted_teams})
+        return jsonify({'success': True, 'teams': list_teams()})
             
     except Exception as e:
         return jsonify({'error': f'Failed to load teams: {str(e)}'}), 500
 
+@app.route('/rankings/power', methods=['GET'])
+def get_power_rankings_table():
+    """Full comprehensive power rankings (?week=N, defaults to the serving week) with ETag + gzip"""
+    body, status, headers = build_power_rankings_response(
+        get_predictor(),
+        request.args.get('week'),
+        request.headers.get('If-None-Match'),
+        request.headers.get('Accept-Encoding')
+    )
+    return Response(body, status=status, headers=headers)
+
 @app.route('/api/player-props/<team1>/<team2>', methods=['GET'])
 def get_player_props(team1, team2):
     """Get player props for any matchup"""
     try:
-        print(f"\n🎯 Player Props Request: {team1} vs {team2}")
+        logger.debug("\n🎯 Player Props Request: %s vs %s", team1, team2)
         
         # Initialize props engine
         props_engine = RealDataPlayerPropsEngine()
         
-        # Generate props for both teams
-        team1_props = props_engine.generate_enhanced_props(team1, team2)
-        team2_props = props_engine.generate_enhanced_props(team2, team1)
-        
-        # Format response
-        response = {
-            'matchup': {
-                'team1': team1,
-                'team2': team2
-            },
-            'team1_props': [
-                {
-                    'player_name': prop.player_name,
-                    'player_team': prop.player_team,
-                    'position': prop.position,
-                    'prop_type': prop.prop_type,
-                    'line': prop.over_under_line,
-                    'over_under_line': prop.over_under_line,
-                    'confidence': prop.confidence,
-                    'recommendation': prop.recommendation,
-                    'reasoning': prop.reasoning,
-                    'season_average': prop.season_average,
-                    'weather_impact': prop.weather_impact,
-                    'game_logs': [asdict(log) for log in prop.game_logs],
-                    'trend_analysis': asdict(prop.trend_analysis),
-                    'defensive_matchup': asdict(prop.defensive_matchup),
-                    'key_insights': prop.key_insights
-                }
-                for prop in team1_props
-            ],
-            'team2_props': [
-                {
-                    'player_name': prop.player_name,
-                    'player_team': prop.player_team,
-                    'position': prop.position,
-                    'prop_type': prop.prop_type,
-                    'line': prop.over_under_line,
-                    'over_under_line': prop.over_under_line,
-                    'confidence': prop.confidence,
-                    'recommendation': prop.recommendation,
-                    'reasoning': prop.reasoning,
-                    'season_average': prop.season_average,
-                    'weather_impact': prop.weather_impact,
-                    'game_logs': [asdict(log) for log in prop.game_logs],
-                    'trend_analysis': asdict(prop.trend_analysis),
-                    'defensive_matchup': asdict(prop.defensive_matchup),
-                    'key_insights': prop.key_insights
-                }
-                for prop in team2_props
-            ],
-            'total_props': len(team1_props) + len(team2_props)
-        }
+        # Generate props for both teams concurrently on the worker's pooled aiohttp session
+        team1_props, team2_props = run_async(
+            props_engine.generate_matchup_props_async(team1, team2, get_async_runtime().session)
+        )
         
-        return jsonify(response)
+        return jsonify(build_player_props_response(team1, team2, team1_props, team2_props))
         
     except Exception as e:
-        print(f"❌ Error generating player props: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ Error generating player props: %s", e)
         return jsonify({'error': str(e)}), 500
 
 # n8n Integration Endpoints
@@ -2059,28 +2077,15 @@ def n8n_data_update_webhook():
         "games_count": 51,
         "timestamp": "2025-12-02T06:00:00Z"
     }
+    
+    Authenticated with the X-Webhook-Secret header (CFB_WEBHOOK_SECRET).
+    Schedules a background rebuild of the static data for that week; the
+    predictor switches over once it is loaded, without a restart.
     """
     try:
-        data = request.get_json()
-        week = data.get('week')
-        games_count = data.get('games_count')
-        timestamp = data.get('timestamp')
-        
-        # Log the update
-        print(f"n8n Data Update Received - Week {week}: {games_count} games at {timestamp}")
-        
-        # You could add validation logic here
-        # For example, verify games_count is reasonable (20-60)
-        if games_count and (games_count < 20 or games_count > 60):
-            return jsonify({
-                'status': 'warning',
-                'message': f'Unusual game count: {games_count}'
-            }), 200
-        
-        return jsonify({
-            'status': 'success',
-            'message': f'Week {week} data update acknowledged'
-        }), 200
+        payload, status = handle_data_update(request.get_json(silent=True), get_predictor(),
+                                             request.headers.get(WEBHOOK_SECRET_HEADER))
+        return jsonify(payload), status
         
     except Exception as e:
         return jsonify({
@@ -2106,15 +2111,17 @@ def serve_react_app(path):
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5002))  # Changed from 5001 to 5002
     debug = os.environ.get('FLASK_DEBUG', 'True').lower() == 'true'
+    # The dev server reports startup and loads; production workers stay at WARNING
+    configure_logging(level=os.environ.get(LOG_LEVEL_ENV) or 'INFO')
 
-    print(f"\n{'='*60}")
-    print(f"🚀 Starting Flask Backend Server")
-    print(f"{'='*60}")
-    print(f"   Host: 0.0.0.0 (all interfaces)")
-    print(f"   Port: {port}")
-    print(f"   Debug: {debug}")
-    print(f"   CORS: Enabled for localhost:5173, localhost:3000")
-    print(f"{'='*60}\n")
+    logger.info("\n%s", '=' * 60)
+    logger.info("🚀 Starting Flask Backend Server")
+    logger.info('=' * 60)
+    logger.info("   Host: 0.0.0.0 (all interfaces)")
+    logger.info("   Port: %s", port)
+    logger.info("   Debug: %s", debug)
+    logger.info("   CORS: Enabled for localhost:5173, localhost:3000")
+    logger.info("%s\n", '=' * 60)
 
     app.run(
         host='0.0.0.0',
@@ -0,0 +1,273 @@
+"""
+ASGI entry point - native async serving mode for the prediction API
+
+Serves the prediction endpoints as coroutines on a single event loop, so one
+worker can keep dozens of upstream GraphQL calls in flight instead of blocking
+on each one like the sync Flask worker does. The Flask `app` in app.py remains
+the default; run this mode with:
+
+    uvicorn asgi:app --host 0.0.0.0 --port $PORT
+"""
+import asyncio
+import json
+import os
+import time
+from contextlib import asynccontextmanager
+
+from starlette.applications import Starlette
+from starlette.concurrency import run_in_threadpool
+from starlette.middleware import Middleware
+from starlette.middleware.cors import CORSMiddleware
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.routing import Route
+
+from app import (
+    api_key,
+    get_team_id,
+    load_rivalry_history,
+    build_prediction_response,
+    with_rivalry_history,
+    build_simple_prediction,
+    build_detailed_prediction_response,
+    load_team_logos,
+    list_teams,
+    build_player_props_response,
+    parse_batch_request,
+    build_batch_result,
+    build_batch_summary,
+    handle_data_update,
+    WEBHOOK_SECRET_HEADER,
+    build_power_rankings_response,
+)
+from async_runtime import create_pooled_session
+from data_reloader import get_data_reloader
+from query_cache import get_query_cache
+from prediction_cache import CachedPrediction, get_prediction_cache
+from graphqlpredictor import LightningPredictor
+from log_config import get_logger
+from real_data_props_generator import RealDataPlayerPropsEngine
+
+logger = get_logger('asgi')
+
+predictor = None
+
+async def startup():
+    """Build the predictor off-loop and attach a pooled session owned by the server loop"""
+    global predictor
+    predictor = await run_in_threadpool(LightningPredictor, api_key)
+    session = create_pooled_session(
+        connection_limit=int(os.environ.get('CFB_HTTP_POOL_LIMIT', 64)),
+        limit_per_host=int(os.environ.get('CFB_HTTP_POOL_PER_HOST', 32))
+    )
+    predictor.use_shared_session(session, asyncio.get_running_loop())
+    get_data_reloader(predictor, float(os.environ.get('CFB_DATA_WATCH_INTERVAL', 60)))
+    logger.info("✅ ASGI predictor ready")
+
+async def shutdown():
+    if predictor is not None and predictor.shared_session is not None:
+        await predictor.shared_session.close()
+
+@asynccontextmanager
+async def lifespan(app):
+    await startup()
+    yield
+    await shutdown()
+
+async def predict_cached(home_team_id, away_team_id):
+    """CachedPrediction for a matchup; concurrent requests for it await one computation"""
+    async def compute():
+        prediction = await predictor.predict_game(home_team_id, away_team_id)
+        # Formatting enriches players with ESPN headshots (blocking HTTP), keep it off the loop
+        response_data = await run_in_threadpool(
+            build_prediction_response, prediction, home_team_id, away_team_id, predictor
+        )
+        return CachedPrediction(prediction, response_data)
+
+    cache = get_prediction_cache()
+    if not cache.enabled:
+        return await compute()
+    key = (predictor.cached_prediction_key(home_team_id, away_team_id)
+           or await predictor.prediction_cache_key(home_team_id, away_team_id))
+    return await cache.get_or_compute_async(key, compute)
+
+def resolve_teams(home_team, away_team):
+    """Team names/IDs -> (home_id, away_id); raises ValueError for unknown teams"""
+    return get_team_id(home_team), get_team_id(away_team)
+
+async def predict(request: Request):
+    if request.method == 'OPTIONS':
+        return Response(status_code=200)
+
+    try:
+        data = await request.json()
+    except Exception:
+        data = None
+
+    if not data or 'home_team' not in data or 'away_team' not in data:
+        return JSONResponse({
+            "error": "Missing required fields: home_team, away_team"
+        }, status_code=400)
+
+    try:
+        home_team_id, away_team_id = resolve_teams(data['home_team'], data['away_team'])
+    except ValueError as e:
+        return JSONResponse({"error": str(e)}, status_code=400)
+
+    try:
+        logger.debug("\nPredicting game: %s vs %s", data['home_team'], data['away_team'])
+
+        # Rivalry history comes from the in-memory rivalry store
+        rivalry_history = load_rivalry_history(data['home_team'], data['away_team'])
+        cached = await predict_cached(home_team_id, away_team_id)
+        return JSONResponse(with_rivalry_history(cached.response, rivalry_history))
+
+    except Exception as e:
+        logger.exception("Error: %s", e)
+        return JSONResponse({
+            "error": f"Prediction failed: {str(e)}"
+        }, status_code=500)
+
+async def predict_batch(request: Request):
+    """Predict many games at once, streaming one NDJSON line per game as it completes"""
+    if request.method == 'OPTIONS':
+        return Response(status_code=200)
+
+    try:
+        data = await request.json()
+    except Exception:
+        data = None
+
+    try:
+        matchups, positions, rejected, concurrency = parse_batch_request(data, predictor)
+    except ValueError as e:
+        return JSONResponse({"error": str(e)}, status_code=400)
+
+    logger.debug("📦 Batch prediction: %s games (%s rejected)", len(matchups), len(rejected))
+
+    async def stream():
+        started = time.time()
+        failed = len(rejected)
+        for line in rejected:
+            yield json.dumps(line) + '\n'
+        async for index, home_team_id, away_team_id, prediction, error in predictor.predict_games(matchups, concurrency):
+            line = build_batch_result(positions[index], home_team_id, away_team_id, prediction, error)
+            failed += not line['success']
+            yield json.dumps(line) + '\n'
+        yield json.dumps(build_batch_summary(len(matchups) + len(rejected), failed, started)) + '\n'
+
+    return StreamingResponse(stream(), media_type='application/x-ndjson')
+
+async def predict_get(request: Request):
+    try:
+        home_team_id, away_team_id = resolve_teams(
+            request.path_params['home_team'], request.path_params['away_team']
+        )
+    except ValueError as e:
+        return JSONResponse({"error": str(e)}, status_code=400)
+
+    try:
+        prediction = (await predict_cached(home_team_id, away_team_id)).prediction
+        return JSONResponse({
+            "success": True,
+            "prediction": build_simple_prediction(prediction)
+        })
+    except Exception as e:
+        return JSONResponse({
+            "error": f"Prediction failed: {str(e)}"
+        }, status_code=500)
+
+async def predict_detailed(request: Request):
+    try:
+        home_team_id, away_team_id = resolve_teams(
+            request.path_params['home_team'], request.path_params['away_team']
+        )
+    except ValueError as e:
+        return JSONResponse({"error": str(e)}, status_code=400)
+
+    try:
+        teams_data = load_team_logos()
+        prediction = (await predict_cached(home_team_id, away_team_id)).prediction
+        return JSONResponse(build_detailed_prediction_response(prediction, home_team_id, away_team_id, teams_data))
+    except Exception as e:
+        logger.exception("Error: %s", e)
+        return JSONResponse({
+            "error": f"Prediction failed: {str(e)}"
+        }, status_code=500)
+
+async def teams(request: Request):
+    try:
+        return JSONResponse({'success': True, 'teams': list_teams()})
+    except Exception as e:
+        return JSONResponse({'error': f'Failed to load teams: {str(e)}'}, status_code=500)
+
+async def power_rankings(request: Request):
+    body, status, headers = build_power_rankings_response(
+        predictor,
+        request.query_params.get('week'),
+        request.headers.get('if-none-match'),
+        request.headers.get('accept-encoding')
+    )
+    return Response(content=body, status_code=status, headers=headers)
+
+async def player_props(request: Request):
+    team1 = request.path_params['team1']
+    team2 = request.path_params['team2']
+    try:
+        logger.debug("\n🎯 Player Props Request: %s vs %s", team1, team2)
+        props_engine = RealDataPlayerPropsEngine()
+
+        # Both teams' REST payloads download concurrently on the server's pooled session
+        team1_props, team2_props = await props_engine.generate_matchup_props_async(
+            team1, team2, predictor.shared_session
+        )
+        return JSONResponse(build_player_props_response(team1, team2, team1_props, team2_props))
+
+    except Exception as e:
+        logger.exception("❌ Error generating player props: %s", e)
+        return JSONResponse({'error': str(e)}, status_code=500)
+
+async def data_update(request: Request):
+    try:
+        payload, status = handle_data_update(await request.json(), predictor,
+                                             request.headers.get(WEBHOOK_SECRET_HEADER))
+        return JSONResponse(payload, status_code=status)
+    except Exception as e:
+        return JSONResponse({'status': 'error', 'message': str(e)}, status_code=400)
+
+async def health(request: Request):
+    return JSONResponse({
+        "status": "healthy",
+        "service": "Gameday GraphQL Predictor (ASGI)",
+        "version": "1.0.0",
+        "accepts": "team names or IDs",
+        "query_cache": get_query_cache().stats(),
+        "prediction_cache": get_prediction_cache().stats()
+    })
+
+routes = [
+    Route('/health', health, methods=['GET']),
+    Route('/predict', predict, methods=['POST', 'OPTIONS']),
+    Route('/predict/batch', predict_batch, methods=['POST', 'OPTIONS']),
+    Route('/predict/{home_team}/{away_team}', predict_get, methods=['GET']),
+    Route('/predict-detailed/{home_team}/{away_team}', predict_detailed, methods=['GET']),
+    Route('/teams', teams, methods=['GET']),
+    Route('/rankings/power', power_rankings, methods=['GET']),
+    Route('/api/player-props/{team1}/{team2}', player_props, methods=['GET']),
+    Route('/webhooks/n8n/data-update', data_update, methods=['POST']),
+]
+
+middleware = [
+    Middleware(
+        CORSMiddleware,
+        allow_origins=[
+            "https://graphqlmodel-production.up.railway.app",
+            "http://localhost:5173",
+            "http://localhost:3000"
+        ],
+        allow_methods=['GET', 'POST', 'OPTIONS'],
+        allow_headers=['Content-Type', 'Authorization']
+    )
+]
+
+app = Starlette(routes=routes, middleware=middleware, lifespan=lifespan)
@@ -0,0 +1,180 @@
+"""
+Async Runtime - one long-lived event loop thread per worker process
+
+Flask handlers are synchronous, so every prediction used to spin up a fresh
+event loop and a fresh aiohttp session (new TCP + TLS handshake to the GraphQL
+API each time). The runtime keeps a single background loop alive and owns a
+pooled aiohttp connector (keep-alive, DNS cache, connection limit) that every
+request thread shares via run_coroutine_threadsafe.
+"""
+import asyncio
+import os
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Any, AsyncIterator, Coroutine, Iterator, Optional
+
+import aiohttp
+
+from log_config import get_logger
+
+logger = get_logger('async_runtime')
+
+
+def create_pooled_session(connection_limit: int = 32, limit_per_host: int = 16,
+                          dns_cache_ttl: int = 300, keepalive_timeout: float = 60.0,
+                          request_timeout: float = 60.0) -> aiohttp.ClientSession:
+    """Create a keep-alive aiohttp session; must be called on the loop that will use it"""
+    connector = aiohttp.TCPConnector(
+        limit=connection_limit,
+        limit_per_host=limit_per_host,
+        ttl_dns_cache=dns_cache_ttl,
+        keepalive_timeout=keepalive_timeout
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=request_timeout)
+    )
+
+
+class AsyncRuntime:
+    """Background event loop thread with a shared, pooled aiohttp session"""
+
+    def __init__(self, connection_limit: int = 32, limit_per_host: int = 16,
+                 dns_cache_ttl: int = 300, keepalive_timeout: float = 60.0,
+                 request_timeout: float = 60.0):
+        self.connection_limit = connection_limit
+        self.limit_per_host = limit_per_host
+        self.dns_cache_ttl = dns_cache_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self.request_timeout = request_timeout
+
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.pid = os.getpid()
+        self._thread: Optional[threading.Thread] = None
+        self._started = threading.Event()
+
+    def start(self) -> 'AsyncRuntime':
+        """Start the loop thread and open the pooled session on it"""
+        if self._thread is not None:
+            return self
+
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run_loop, name='async-runtime', daemon=True)
+        self._thread.start()
+        self._started.wait()
+
+        self.session = asyncio.run_coroutine_threadsafe(self._create_session(), self.loop).result()
+        logger.info("✅ Async runtime started (pid %s, pool limit %s)", self.pid, self.connection_limit)
+        return self
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.call_soon(self._started.set)
+        self.loop.run_forever()
+
+    async def _create_session(self) -> aiohttp.ClientSession:
+        return create_pooled_session(
+            connection_limit=self.connection_limit,
+            limit_per_host=self.limit_per_host,
+            dns_cache_ttl=self.dns_cache_ttl,
+            keepalive_timeout=self.keepalive_timeout,
+            request_timeout=self.request_timeout
+        )
+
+    def submit(self, coro: Coroutine) -> Future:
+        """Schedule a coroutine on the runtime loop from any thread"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Coroutine, timeout: Optional[float] = None) -> Any:
+        """Run a coroutine on the runtime loop and block the calling thread for its result"""
+        future = self.submit(coro)
+        try:
+            return future.result(timeout=timeout)
+        except Exception:
+            future.cancel()
+            raise
+
+    def iterate(self, agen: AsyncIterator, timeout: Optional[float] = None) -> Iterator:
+        """Drive an async generator on the runtime loop, yielding its items to the calling thread"""
+        items = queue.Queue()
+
+        async def pump():
+            try:
+                async for item in agen:
+                    items.put(('item', item))
+                items.put(('done', None))
+            except Exception as e:
+                items.put(('error', e))
+            except asyncio.CancelledError:
+                # Never leave the consumer blocked on the queue until its timeout
+                items.put(('error', RuntimeError('async generator was cancelled')))
+                raise
+            finally:
+                await agen.aclose()
+
+        future = self.submit(pump())
+        try:
+            while True:
+                kind, value = items.get(timeout=timeout)
+                if kind == 'done':
+                    return
+                if kind == 'error':
+                    raise value
+                yield value
+        finally:
+            # Consumer stopped early (client disconnect, timeout) - stop the producer too
+            future.cancel()
+
+    def shutdown(self):
+        """Close the pooled session and stop the loop thread"""
+        if self.loop is None or not self.loop.is_running():
+            return
+        if self.session is not None and not self.session.closed:
+            asyncio.run_coroutine_threadsafe(self.session.close(), self.loop).result(timeout=5)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout=5)
+
+
+# Singleton instance (one per worker process)
+_async_runtime = None
+_async_runtime_lock = threading.Lock()
+
+def get_async_runtime() -> AsyncRuntime:
+    """Get or create the async runtime for the current process
+
+    A runtime inherited across a fork (e.g. gunicorn --preload) is discarded,
+    since its loop thread does not survive in the child.
+    """
+    global _async_runtime
+    with _async_runtime_lock:
+        if _async_runtime is None or _async_runtime.pid != os.getpid():
+            _async_runtime = AsyncRuntime(
+                connection_limit=int(os.environ.get('CFB_HTTP_POOL_LIMIT', 32)),
+                limit_per_host=int(os.environ.get('CFB_HTTP_POOL_PER_HOST', 16))
+            ).start()
+    return _async_runtime
+
+def run_async(coro: Coroutine, timeout: Optional[float] = 120) -> Any:
+    """Run a coroutine on this worker's shared event loop from synchronous code"""
+    return get_async_runtime().run(coro, timeout=timeout)
+
+def iterate_async(agen: AsyncIterator, timeout: Optional[float] = 120) -> Iterator:
+    """Consume an async generator on this worker's shared event loop from synchronous code"""
+    return get_async_runtime().iterate(agen, timeout=timeout)
+
+async def gather_or_cancel(*aws) -> list:
+    """asyncio.gather that cancels the other awaitables once one fails, re-raising the original error
+
+    Plain gather leaves the remaining legs running (and holding pooled connections) after
+    the first exception or timeout; this stops them and lets them unwind before returning.
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    except Exception:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
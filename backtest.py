@@ -0,0 +1,492 @@
+#!/usr/bin/env python3
+"""
+Backtest - replay a recorded season through the prediction pipeline offline
+
+Running the model across a season used to mean hitting the live API game by
+game (test_backtest_single.py). This runner splits it into two steps:
+
+    record  fetch every completed FBS game of the given weeks once, cut each
+            matchup payload down to what predict_game would have seen that
+            week (games before it only) and write a gzip JSON fixture per
+            week under backtest_fixtures/<season>/
+    run     replay the fixtures across a process pool - each worker pins the
+            newest weekly_updates/week_N release not after the game's week and
+            extracts feature rows - then score every game at once with
+            score_features and report ATS / total / ML accuracy, Brier score
+            and calibration
+
+The extracted feature matrix can be saved (--save) and re-scored with `score`,
+so a weight or calibration change is evaluated without re-extracting.
+
+Usage:
+    python backtest.py record --season 2025 --weeks 1-14
+    python backtest.py run --season 2025 --workers 8 --save backtest_2025.npz
+    python backtest.py score backtest_2025.npz
+
+Team metrics, talent and ratings come from season-level API tables, so they
+are as of recording time; season games, polls, lines and weekly static data
+are point-in-time.
+"""
+import argparse
+import asyncio
+import gzip
+import json
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, replace
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from log_config import configure_logging, get_logger
+from player_index import PlayerIndex
+from prediction_pipeline import FEATURE_NAMES, ScoringParams, score_features, temporal_performance
+from team_directory import get_team_directory
+from team_season import TeamSeason
+
+logger = get_logger('backtest')
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backtest_fixtures')
+FIXTURE_FORMAT = 1
+MANIFEST_FILENAME = 'manifest.json'
+CHUNK_SIZE = 16  # games per worker task
+CALIBRATION_BINS = 10
+
+WEEK_GAMES_QUERY = """
+query WeekGames($season: smallint!, $week: smallint!) {
+    game(where: {season: {_eq: $season}, week: {_eq: $week}, seasonType: {_eq: "regular"}, homePoints: {_isNull: false}}) {
+        id season week homeTeamId homeTeam awayTeamId awayTeam homePoints awayPoints
+    }
+}
+"""
+
+
+def fixture_dir(season: int, root: Optional[str] = None) -> str:
+    return os.path.join(root or FIXTURES_DIR, str(season))
+
+
+def fixture_path(directory: str, week: int) -> str:
+    return os.path.join(directory, f'week_{week:02d}.json.gz')
+
+
+def parse_weeks(spec: str) -> List[int]:
+    """'1-14' or '3,5,7-9' -> sorted week numbers"""
+    weeks = set()
+    for part in spec.split(','):
+        if '-' in part:
+            first, last = part.split('-', 1)
+            weeks.update(range(int(first), int(last) + 1))
+        elif part.strip():
+            weeks.add(int(part))
+    return sorted(weeks)
+
+
+def point_in_time(data: Dict, week: int) -> Dict:
+    """Matchup payload as predict_game would have seen it in `week` (season games before it only)"""
+    data = dict(data)  # fragment lists may be shared with the query cache - never mutate them
+    for side in ('home', 'away'):
+        played = [game for game in data.get(f'{side}SeasonGames', [])
+                  if game.get('week') is not None and game['week'] < week]
+        data[f'{side}SeasonGames'] = played
+        data[f'{side}RecentGames'] = sorted(played, key=lambda game: game['week'], reverse=True)[:4]
+    return data
+
+
+def market_consensus(lines: Sequence[Dict]) -> Tuple[float, float]:
+    """Average (spread, total) across books; NaN when no book posted one"""
+    spreads = [line['spread'] for line in lines if line.get('spread') is not None]
+    totals = [line['overUnder'] for line in lines if line.get('overUnder') is not None]
+    return (sum(spreads) / len(spreads) if spreads else math.nan,
+            sum(totals) / len(totals) if totals else math.nan)
+
+
+# ==============================================================================
+# RECORDING
+# ==============================================================================
+
+async def record_week(predictor, season: int, week: int) -> List[Dict]:
+    """Point-in-time fixtures for every completed FBS-vs-FBS game of one week"""
+    directory = get_team_directory()
+    predictor.current_year = season
+    predictor.current_week = week
+    async with predictor._session_scope() as session:
+        result = await predictor._execute_query(session, WEEK_GAMES_QUERY, {'season': season, 'week': week})
+        games = [game for game in result.get('data', {}).get('game', [])
+                 if game['homeTeamId'] in directory.by_id and game['awayTeamId'] in directory.by_id]
+        semaphore = asyncio.Semaphore(predictor.BATCH_CONCURRENCY)
+
+        async def record_game(game: Dict) -> Optional[Dict]:
+            async with semaphore:
+                try:
+                    result, lines = await asyncio.gather(
+                        predictor._fetch_matchup_data(session, game['homeTeamId'], game['awayTeamId']),
+                        predictor._fetch_game_lines(session, game['id'])
+                    )
+                except Exception as e:
+                    logger.warning("⚠️ Skipping %s @ %s (week %s): %s", game['awayTeam'], game['homeTeam'], week, e)
+                    return None
+            data = point_in_time(result['data'], week)
+            data['marketLines'] = lines
+            data['gameMedia'] = []
+            return {
+                'game_id': game['id'],
+                'week': week,
+                'home_team_id': game['homeTeamId'],
+                'away_team_id': game['awayTeamId'],
+                'home_points': game['homePoints'],
+                'away_points': game['awayPoints'],
+                'data': data
+            }
+
+        recorded = await asyncio.gather(*(record_game(game) for game in games))
+    return [fixture for fixture in recorded if fixture is not None]
+
+
+def write_fixtures(directory: str, season: int, week: int, fixtures: List[Dict]):
+    os.makedirs(directory, exist_ok=True)
+    path = fixture_path(directory, week)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+        json.dump({'format': FIXTURE_FORMAT, 'season': season, 'week': week, 'recorded_at': time.time(),
+                   'games': fixtures}, f, separators=(',', ':'))
+    os.replace(tmp_path, path)
+
+    manifest = read_manifest(directory) or {'season': season, 'weeks': {}}
+    manifest['weeks'][str(week)] = len(fixtures)
+    with open(os.path.join(directory, MANIFEST_FILENAME), 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+
+def read_manifest(directory: str) -> Optional[Dict]:
+    try:
+        with open(os.path.join(directory, MANIFEST_FILENAME), 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def read_fixtures(path: str) -> Dict:
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        fixtures = json.load(f)
+    if fixtures.get('format') != FIXTURE_FORMAT:
+        raise ValueError(f"Unsupported fixture format in {path}: {fixtures.get('format')}")
+    return fixtures
+
+
+async def record_season(api_key: str, season: int, weeks: Sequence[int], directory: str) -> int:
+    from graphqlpredictor import LightningPredictor
+
+    predictor = LightningPredictor(api_key)
+    recorded = 0
+    for week in weeks:
+        fixtures = await record_week(predictor, season, week)
+        write_fixtures(directory, season, week, fixtures)
+        recorded += len(fixtures)
+        logger.info("✅ Week %s: recorded %s games", week, len(fixtures))
+    return recorded
+
+
+# ==============================================================================
+# REPLAY (feature extraction in worker processes)
+# ==============================================================================
+
+_worker_predictor = None
+_worker_releases: Dict[int, object] = {}  # by weekly_updates data week
+_worker_fixtures: Dict[str, Dict] = {}
+
+
+def _init_worker(api_key: str, log_level: str):
+    global _worker_predictor
+    configure_logging(level=log_level)
+    from graphqlpredictor import LightningPredictor
+    _worker_predictor = LightningPredictor(api_key)
+
+
+def backtest_release(predictor, week: int):
+    """Newest weekly_updates release not after `week`; no static data (rather than future data) if none"""
+    data_weeks = [data_week for data_week in predictor.available_data_weeks() if data_week <= week]
+    if not data_weeks:
+        from graphqlpredictor import DataRelease
+        return DataRelease(week=week, data_dir=predictor._weekly_data_dir(week), static_data={},
+                           schedule_index={}, player_index=PlayerIndex({}))
+    release = _worker_releases.get(data_weeks[-1])
+    if release is None:
+        release = _worker_releases[data_weeks[-1]] = predictor.build_data_release(data_weeks[-1])
+    return replace(release, week=week, schedule_index={})
+
+
+def season_form(games: List[Dict], team_id: int, week: int) -> List[List[float]]:
+    """[days ago, postgame win prob] pairs Dixon-Coles weighting counts for one team"""
+    days, probs = TeamSeason.from_games(games, team_id).form(week)
+    return np.column_stack([days, probs]).tolist()
+
+
+def extract_chunk(path: str, start: int, stop: int) -> Tuple[List[Dict], np.ndarray]:
+    """Worker task: feature rows and outcomes for games[start:stop] of one week's fixtures"""
+    fixtures = _worker_fixtures.get(path)
+    if fixtures is None:
+        _worker_fixtures.clear()
+        fixtures = _worker_fixtures[path] = read_fixtures(path)
+
+    predictor = _worker_predictor
+    token = predictor._pinned_release.set(backtest_release(predictor, fixtures['week']))
+    games, rows = [], []
+    try:
+        for fixture in fixtures['games'][start:stop]:
+            random.seed(fixture['game_id'])  # generated weather is random; keep replays reproducible
+            try:
+                features = predictor._extract_game_features(fixture['data'], fixture['home_team_id'],
+                                                            fixture['away_team_id'])
+            except Exception as e:
+                logger.warning("⚠️ Could not extract game %s: %r", fixture['game_id'], e)
+                continue
+            market_spread, market_total = market_consensus(fixture['data'].get('marketLines', []))
+            games.append({
+                'game_id': fixture['game_id'],
+                'week': fixture['week'],
+                'home_team_id': fixture['home_team_id'],
+                'away_team_id': fixture['away_team_id'],
+                'home_points': fixture['home_points'],
+                'away_points': fixture['away_points'],
+                'market_spread': market_spread,
+                'market_total': market_total,
+                # Dixon-Coles inputs, so calibration can re-derive temporal_diff for other decay rates
+                'home_form': season_form(fixture['data'].get('homeSeasonGames', []), fixture['home_team_id'],
+                                         predictor.current_week),
+                'away_form': season_form(fixture['data'].get('awaySeasonGames', []), fixture['away_team_id'],
+                                         predictor.current_week)
+            })
+            rows.append(features.values)
+    finally:
+        predictor._pinned_release.reset(token)
+    return games, np.vstack(rows) if rows else np.empty((0, len(FEATURE_NAMES)))
+
+
+@dataclass
+class BacktestSet:
+    """Extracted feature rows with each game's outcome and closing market"""
+    games: List[Dict]
+    features: np.ndarray
+
+    def column(self, key: str) -> np.ndarray:
+        return np.array([game[key] for game in self.games], dtype=float)
+
+    def form_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """(days ago, postgame win prob) per game and side, NaN-padded to (n_games, 2, max games)"""
+        if any('home_form' not in game for game in self.games):
+            raise ValueError("backtest has no Dixon-Coles inputs - re-run `backtest.py run --save`")
+        depth = max((len(game[f'{side}_form']) for game in self.games for side in ('home', 'away')), default=0)
+        days = np.zeros((len(self.games), 2, depth))
+        probs = np.full((len(self.games), 2, depth), np.nan)
+        for i, game in enumerate(self.games):
+            for j, side in enumerate(('home', 'away')):
+                form = np.array(game[f'{side}_form'], dtype=float).reshape(-1, 2)
+                days[i, j, :len(form)], probs[i, j, :len(form)] = form[:, 0], form[:, 1]
+        return days, probs
+
+    def with_decay(self, decay_xi: float) -> 'BacktestSet':
+        """Copy with temporal_diff re-derived for another Dixon-Coles decay rate"""
+        days, probs = self.form_arrays()
+        performance = temporal_performance(days, probs, decay_xi)
+        features = self.features.copy()
+        features[:, FEATURE_NAMES.index('temporal_diff')] = (performance[:, 0] - performance[:, 1]) * 10
+        return BacktestSet(games=self.games, features=features)
+
+    def save(self, path: str):
+        np.savez_compressed(path, features=self.features, feature_names=np.array(FEATURE_NAMES),
+                            games=np.array(json.dumps(self.games)))
+
+    @classmethod
+    def load(cls, path: str) -> 'BacktestSet':
+        with np.load(path) as saved:
+            if tuple(saved['feature_names']) != FEATURE_NAMES:
+                raise ValueError(f"{path} was extracted with a different feature layout - re-run the backtest")
+            return cls(games=json.loads(str(saved['games'])), features=saved['features'])
+
+
+def replay(directory: str, api_key: str, workers: Optional[int] = None, log_level: str = 'ERROR') -> BacktestSet:
+    """Extract feature rows for every recorded game across a process pool"""
+    manifest = read_manifest(directory) or {}
+    tasks = []
+    for name in sorted(os.listdir(directory)):
+        if not (name.startswith('week_') and name.endswith('.json.gz')):
+            continue
+        path = os.path.join(directory, name)
+        count = manifest.get('weeks', {}).get(str(int(name[5:-8])))
+        if count is None:
+            tasks.append((path, 0, None))
+        else:
+            tasks.extend((path, start, start + CHUNK_SIZE) for start in range(0, count, CHUNK_SIZE))
+    if not tasks:
+        raise ValueError(f"No fixtures in {directory} - run `python backtest.py record` first")
+
+    games, blocks = [], []
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count(), initializer=_init_worker,
+                             initargs=(api_key, log_level)) as pool:
+        futures = [pool.submit(extract_chunk, *task) for task in tasks]
+        for future in as_completed(futures):
+            chunk_games, chunk_rows = future.result()
+            games.extend(chunk_games)
+            blocks.append(chunk_rows)
+
+    features = np.vstack(blocks)
+    order = sorted(range(len(games)), key=lambda i: (games[i]['week'], games[i]['game_id']))
+    return BacktestSet(games=[games[i] for i in order], features=features[order])
+
+
+# ==============================================================================
+# EVALUATION (vectorized over every game)
+# ==============================================================================
+
+def pick_record(picks: np.ndarray, results: np.ndarray) -> Dict:
+    """W/L/push for +1/-1 picks against signed results (0 = push); games without a pick are skipped"""
+    mask = picks != 0
+    wins = int(np.sum(mask & (np.sign(results) == picks)))
+    losses = int(np.sum(mask & (np.sign(results) == -picks)))
+    pushes = int(np.sum(mask & (results == 0)))
+    return {'wins': wins, 'losses': losses, 'pushes': pushes,
+            'accuracy': wins / (wins + losses) if wins + losses else None}
+
+
+def evaluate(backtest: BacktestSet, params: ScoringParams) -> Dict:
+    """Score every game at once and summarize accuracy, Brier score and calibration"""
+    scores = score_features(backtest.features, params)
+    home_points, away_points = backtest.column('home_points'), backtest.column('away_points')
+    margin = home_points - away_points
+    total = home_points + away_points
+    spread = scores['predicted_spread']  # home margin (positive = home favored)
+    prob = scores['home_win_prob']
+
+    decided = margin != 0
+    home_won = (margin > 0).astype(float)
+    clipped = np.clip(prob[decided], 1e-12, 1 - 1e-12)
+
+    # Market spreads follow the CFBD convention: negative = home favored
+    market_margin = -backtest.column('market_spread')
+    has_spread = ~np.isnan(market_margin)
+    ats_picks = np.where(has_spread, np.sign(spread - np.nan_to_num(market_margin)), 0)
+    ats = pick_record(ats_picks, np.where(has_spread, margin - np.nan_to_num(market_margin), 0))
+
+    market_total = backtest.column('market_total')
+    has_total = ~np.isnan(market_total)
+    total_picks = np.where(has_total, np.sign(scores['predicted_total'] - np.nan_to_num(market_total)), 0)
+    totals = pick_record(total_picks, np.where(has_total, total - np.nan_to_num(market_total), 0))
+
+    edges = np.linspace(0, 1, CALIBRATION_BINS + 1)
+    bins = np.clip(np.digitize(prob[decided], edges) - 1, 0, CALIBRATION_BINS - 1)
+    calibration = []
+    for index in range(CALIBRATION_BINS):
+        in_bin = bins == index
+        if in_bin.any():
+            calibration.append({
+                'bin': f"{edges[index]:.1f}-{edges[index + 1]:.1f}",
+                'games': int(in_bin.sum()),
+                'predicted': float(prob[decided][in_bin].mean()),
+                'observed': float(home_won[decided][in_bin].mean())
+            })
+
+    return {
+        'games': len(backtest.games),
+        'weeks': sorted({game['week'] for game in backtest.games}),
+        'moneyline': pick_record(np.where(decided, np.sign(prob - 0.5), 0), np.where(decided, margin, 0)),
+        'ats': ats,
+        'totals': totals,
+        'brier': float(np.mean((prob[decided] - home_won[decided]) ** 2)) if decided.any() else None,
+        'log_loss': float(-np.mean(home_won[decided] * np.log(clipped) + (1 - home_won[decided]) * np.log(1 - clipped)))
+                    if decided.any() else None,
+        'spread_mae': float(np.mean(np.abs(spread - margin))) if len(margin) else None,
+        'total_mae': float(np.mean(np.abs(scores['predicted_total'] - total))) if len(total) else None,
+        'calibration': calibration
+    }
+
+
+def format_report(report: Dict) -> str:
+    def record(name: str, result: Dict) -> str:
+        accuracy = f"{result['accuracy']:.1%}" if result['accuracy'] is not None else "n/a"
+        return f"   {name:<12} {result['wins']}-{result['losses']}-{result['pushes']}  ({accuracy})"
+
+    def number(value, spec: str) -> str:
+        return format(value, spec) if value is not None else "n/a"
+
+    weeks = report['weeks']
+    lines = [
+        '=' * 60,
+        f"🏈 BACKTEST: {report['games']} games, weeks {weeks[0]}-{weeks[-1]}" if weeks else "🏈 BACKTEST: no games",
+        '=' * 60,
+        "🎯 Accuracy (W-L-P):",
+        record('Moneyline', report['moneyline']),
+        record('ATS', report['ats']),
+        record('Totals O/U', report['totals']),
+        "📊 Probability quality:",
+        f"   Brier score  {number(report['brier'], '.4f')}",
+        f"   Log loss     {number(report['log_loss'], '.4f')}",
+        "📏 Point errors:",
+        f"   Spread MAE   {number(report['spread_mae'], '.2f')}",
+        f"   Total MAE    {number(report['total_mae'], '.2f')}",
+        "🎲 Calibration (home win probability):",
+        "   Bin        Games  Predicted  Observed"
+    ]
+    for row in report['calibration']:
+        lines.append(f"   {row['bin']:<10} {row['games']:>5}  {row['predicted']:>9.1%}  {row['observed']:>8.1%}")
+    lines.append('=' * 60)
+    return '\n'.join(lines)
+
+
+def current_model(api_key: str) -> Tuple[ScoringParams, float]:
+    """Scoring parameters and Dixon-Coles decay of a freshly constructed predictor (model_params.json applied)"""
+    from graphqlpredictor import LightningPredictor
+    predictor = LightningPredictor(api_key)
+    return predictor._scoring_params(), predictor.decay_xi
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--api-key', default=os.environ.get('CFB_API_KEY', ''))
+    parser.add_argument('--fixtures', help=f'fixture root (default {FIXTURES_DIR})')
+    parser.add_argument('-v', '--verbose', action='store_true')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    record_cmd = commands.add_parser('record', help='record point-in-time fixtures from the API')
+    record_cmd.add_argument('--season', type=int, required=True)
+    record_cmd.add_argument('--weeks', required=True, help="e.g. '1-14' or '5,7,9-12'")
+
+    run_cmd = commands.add_parser('run', help='replay fixtures through the model and report')
+    run_cmd.add_argument('--season', type=int, required=True)
+    run_cmd.add_argument('--workers', type=int, default=None, help='worker processes (default: all cores)')
+    run_cmd.add_argument('--save', help='write the extracted feature matrix (.npz) for `score`')
+    run_cmd.add_argument('--json', action='store_true', help='print the report as JSON')
+
+    score_cmd = commands.add_parser('score', help='re-score a saved feature matrix with current parameters')
+    score_cmd.add_argument('features', help='.npz written by `run --save`')
+    score_cmd.add_argument('--json', action='store_true', help='print the report as JSON')
+
+    args = parser.parse_args()
+    configure_logging(verbose=args.verbose, level=None if args.verbose else 'INFO')
+
+    if args.command == 'record':
+        started = time.perf_counter()
+        recorded = asyncio.run(record_season(args.api_key, args.season, parse_weeks(args.weeks),
+                                             fixture_dir(args.season, args.fixtures)))
+        logger.info("✅ Recorded %s games in %.1fs", recorded, time.perf_counter() - started)
+        return
+
+    params, decay_xi = current_model(args.api_key)
+    started = time.perf_counter()
+    if args.command == 'run':
+        backtest = replay(fixture_dir(args.season, args.fixtures), args.api_key, args.workers,
+                          log_level='DEBUG' if args.verbose else 'ERROR')
+        logger.info("✅ Extracted %s games in %.1fs", len(backtest.games), time.perf_counter() - started)
+        if args.save:
+            backtest.save(args.save)
+    else:
+        backtest = BacktestSet.load(args.features).with_decay(decay_xi)  # saved rows may predate the decay
+
+    report = evaluate(backtest, params)
+    print(json.dumps(report, indent=2) if args.json else format_report(report))
+
+
+if __name__ == '__main__':
+    main()
@@ -156,62 +156,70 @@ class BatchRivalryAnalyzer:
             return []
     
     def get_rankings_for_games(self, games: List[Dict]) -> Dict:
-        """Get AP Poll rankings for all games"""
+        """Get AP Poll rankings for all games - (season, week, teamId) -> rank for the teams that played"""
         if not games:
             return {}
         
         # Get unique year-week combinations
         year_weeks = set()
+        team_ids = set()
         for game in games:
             year_weeks.add((game['season'], game['week']))
+            team_ids.update((game['homeTeamId'], game['awayTeamId']))
         
-        rankings = {}
+        # One query for every season instead of one per (season, week)
+        season_ranks = self.get_rankings_for_teams(sorted(team_ids), sorted({year for year, _ in year_weeks}))
+        if season_ranks is None:
+            return {}
+        return {key: rank for key, rank in season_ranks.items() if key[:2] in year_weeks}
+    
+    def get_rankings_for_teams(self, team_ids: List[int], seasons: List[int]) -> Optional[Dict]:
+        """AP Poll ranks of the given teams in every week of the given seasons; None when the query fails"""
+        query = """
+        query GetTeamRankings($teamIds: [Int!], $seasons: [Int!]) {
+          pollRank(
+            where: {
+              teamId: {_in: $teamIds},
+              poll: {season: {_in: $seasons}, name: {_eq: "AP Top 25"}}
+            }
+          ) {
+            rank
+            teamId
+            poll {
+              name
+              season
+            }
+            week
+          }
+        }
+        """
         
-        for year, week in year_weeks:
-            query = """
-            query GetRankings($yearInt: Int!, $week: Int!) {
-              pollRank(
-                where: {
-                  poll: {season: {_eq: $yearInt}},
-                  week: {_eq: $week},
-                  poll: {name: {_eq: "AP Top 25"}}
-                }
-              ) {
-                rank
-                teamId
-                poll {
-                  name
-                  season
+        try:
+            response = requests.post(
+                self.graphql_url,
+                headers=self.headers,
+                json={
+                    "query": query,
+                    "variables": {
+                        "teamIds": [int(team_id) for team_id in team_ids],
+                        "seasons": [int(season) for season in seasons]
+                    }
                 }
-                week
-              }
-            }
-            """
+            )
             
-            try:
-                response = requests.post(
-                    self.graphql_url,
-                    headers=self.headers,
-                    json={
-                        "query": query,
-                        "variables": {
-                            "yearInt": int(year),
-                            "week": int(week)
-                        }
+            if response.status_code == 200:
+                data = response.json()
+                if 'data' in data:
+                    return {
+                        (rank['poll']['season'], rank['week'], rank['teamId']): rank['rank']
+                        for rank in data['data'].get('pollRank', [])
                     }
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    if 'data' in data:
-                        poll_ranks = data['data'].get('pollRank', [])
-                        for rank in poll_ranks:
-                            key = (year, week, rank['teamId'])
-                            rankings[key] = rank['rank']
-            except Exception as e:
-                print(f"⚠️  Error fetching rankings for {year} Week {week}: {e}")
-        
-        return rankings
+                print(f"⚠️  GraphQL errors fetching rankings: {data.get('errors')}")
+            else:
+                print(f"⚠️  Rankings request failed: {response.status_code}")
+        except Exception as e:
+            print(f"⚠️  Error fetching rankings for {len(seasons)} seasons: {e}")
+        return None
     
     def analyze_rivalry(self, team1_name: str, team2_name: str, games: List[Dict], rankings: Dict) -> Dict:
         """Analyze rivalry statistics"""
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Build the player game-log store (game_log_store.py) from the CFBD REST API
+
+Run nightly (and after each game week) so the props engines read box-score
+game logs locally instead of downloading and scanning games/players per prop:
+
+    python build_game_log_store.py [--year 2025] [--teams "Ohio State,Michigan"] [--output path.npz]
+
+Every FBS team's games + games/players payloads are fetched concurrently
+through the props data loader (token-bucket rate limited), flattened into one
+row per (player, team game), and written atomically.
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import time
+
+from async_runtime import create_pooled_session
+from game_log_store import GameLogStore, game_log_store_path, team_game_log_rows
+from real_data_props_generator import RealDataPlayerPropsEngine
+from team_directory import get_team_directory
+
+
+async def fetch_team_rows(engine: RealDataPlayerPropsEngine, teams, year: int):
+    """(rows, teams with data) for every team, downloading two payloads per team concurrently"""
+    session = create_pooled_session()
+    try:
+        async def team_rows(team):
+            params = {'year': year, 'team': team, 'seasonType': 'regular'}
+            schedule, player_games = await asyncio.gather(
+                engine.data_loader.fetch_async('games', params, session),
+                engine.data_loader.fetch_async('games/players', params, session)
+            )
+            return team, team_game_log_rows(team, schedule, player_games) if schedule and player_games else []
+
+        results = await asyncio.gather(*[team_rows(team) for team in teams])
+    finally:
+        await session.close()
+    rows = [row for _, logs in results for row in logs]
+    return rows, [team for team, logs in results if logs]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--year', type=int, help='season (default: the props engine season)')
+    parser.add_argument('--teams', help='comma-separated school names (default: every FBS team in fbs.json)')
+    parser.add_argument('--output', help='store path (default: $CFB_GAME_LOG_STORE or data/player_game_logs.npz)')
+    args = parser.parse_args()
+
+    with contextlib.redirect_stdout(io.StringIO()):  # the engine reports its database loads
+        engine = RealDataPlayerPropsEngine()
+    year = args.year or engine.year
+    teams = ([team.strip() for team in args.teams.split(',') if team.strip()] if args.teams
+             else [team['school'] for team in get_team_directory().teams])
+    output = args.output or game_log_store_path()
+    if not output:
+        print("⚠️  Game log store disabled (CFB_GAME_LOG_STORE=none) - nothing to write")
+        return
+
+    started = time.perf_counter()
+    rows, covered = asyncio.run(fetch_team_rows(engine, teams, year))
+    store = GameLogStore.from_rows(rows, {'year': year, 'built_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                                          'teams': len(covered)})
+    size = store.save(output)
+    missing = sorted(set(teams) - set(covered))
+    print(f"✅ Wrote {output} ({size / 1024:.0f} KB): {len(store)} rows, {len(store.index)} players, "
+          f"{len(covered)}/{len(teams)} teams in {time.perf_counter() - started:.1f}s "
+          f"({engine.data_loader.stats()['requests']} API calls)")
+    if missing:
+        print(f"⚠️  No game logs for {len(missing)} teams: {', '.join(missing[:10])}{' ...' if len(missing) > 10 else ''}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Calibration - fit decay, tier weights and Platt scaling against a backtest
+
+decay_xi, the per-tier component weights and the Platt coefficients in
+LightningPredictor.__init__ were set by hand. This fits them on the games
+extracted by `backtest.py run --save`:
+
+    1. temporal_diff is re-derived for every candidate decay rate in one
+       array operation from the recorded (days ago, win prob) inputs
+    2. tier-weight candidates are drawn around the current tables (random
+       search, re-centred on the best candidate and narrowed each round)
+    3. every (decay, weights) candidate is scored over all games with
+       score_features, and Platt (a, b) is fitted by maximum likelihood for
+       a whole block of candidates at once; blocks run on a process pool
+    4. the lowest fitted log loss on the training weeks wins; the last
+       --holdout-weeks weeks are reported out of sample
+
+The result is written to model_params.json (see model_params.py), which
+every LightningPredictor loads at startup.
+
+Usage:
+    python backtest.py run --season 2025 --save backtest_2025.npz
+    python calibration.py backtest_2025.npz --candidates 256 --rounds 2 --workers 8
+    python calibration.py backtest_2025.npz --dry-run    # report only, keep the current file
+
+The file is only written when the calibrated log loss, Brier score and
+moneyline accuracy are no worse than the baseline on the holdout weeks
+(--force overrides).
+
+ELO tier thresholds are kept as they are: they move games between tiers in
+steps, which this search cannot fit smoothly.
+"""
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy.special import expit, logit
+
+from backtest import BacktestSet, current_model, evaluate
+from log_config import configure_logging, get_logger
+from model_params import MODEL_PARAMS_PATH, write_model_params
+from prediction_pipeline import (FEATURE_INDEX, PROBABILITY_EPSILON, WEIGHT_KEYS, WEIGHT_TIERS, ScoringParams,
+                                 score_features, temporal_performance)
+
+logger = get_logger('calibration')
+
+DEFAULT_DECAYS = (0.002, 0.003, 0.004, 0.005, 0.0065, 0.008, 0.01, 0.0125, 0.015, 0.02, 0.03)
+DEFAULT_CANDIDATES = 256  # tier-weight tables per round (each tried with every decay)
+DEFAULT_ROUNDS = 2
+DEFAULT_HOLDOUT_WEEKS = 2
+CONCENTRATION = 200.0     # Dirichlet concentration of first-round weight draws (x4 per later round)
+CANDIDATE_BLOCK = 32      # weight tables per worker task
+PLATT_ITERATIONS = 50
+PLATT_TOLERANCE = 1e-10
+PLATT_MIN_A = 1e-3        # Platt slope floor - a <= 0 would flatten or invert every probability
+
+# Holdout (or train, without a holdout) metrics a calibration may not worsen before it is written
+# (True = higher is better)
+GUARDED_METRICS = {'log_loss': False, 'brier': False, 'moneyline_accuracy': True}
+
+
+def log_loss(probs: np.ndarray, outcomes: np.ndarray) -> np.ndarray:
+    """Mean log loss along the last axis"""
+    p = np.clip(probs, PROBABILITY_EPSILON, 1 - PROBABILITY_EPSILON)
+    return -np.mean(outcomes * np.log(p) + (1 - outcomes) * np.log(1 - p), axis=-1)
+
+
+def fit_platt(raw_probs: np.ndarray, outcomes: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Maximum-likelihood Platt (a, b) for each row of raw_probs (k, n); returns a, b and fitted log loss
+
+    Newton-Raphson, batched over rows. Targets are Platt's smoothed labels
+    ((N+ + 1) / (N+ + 2), 1 / (N- + 2)) so separable data keeps finite coefficients.
+    """
+    x = logit(np.clip(np.atleast_2d(raw_probs), PROBABILITY_EPSILON, 1 - PROBABILITY_EPSILON))
+    positives = outcomes.sum()
+    negatives = len(outcomes) - positives
+    targets = np.where(outcomes > 0, (positives + 1) / (positives + 2), 1 / (negatives + 2))
+
+    a, b = np.ones(len(x)), np.zeros(len(x))
+    hessian = np.empty((len(x), 2, 2))
+    for _ in range(PLATT_ITERATIONS):
+        p = expit(a[:, None] * x + b[:, None])
+        residual = p - targets
+        curvature = p * (1 - p)
+        gradient = np.stack([(residual * x).sum(axis=1), residual.sum(axis=1)], axis=1)
+        hessian[:, 0, 0] = (curvature * x * x).sum(axis=1) + 1e-9
+        hessian[:, 0, 1] = hessian[:, 1, 0] = (curvature * x).sum(axis=1)
+        hessian[:, 1, 1] = curvature.sum(axis=1) + 1e-9
+        step = np.linalg.solve(hessian, gradient[..., None])[..., 0]
+        a -= step[:, 0]
+        b -= step[:, 1]
+        if np.abs(step).max() < PLATT_TOLERANCE:
+            break
+
+    # The loss is convex in (a, b), so rows whose optimum has a below the floor are
+    # optimal on the boundary: pin a there and refit b alone
+    pinned = a < PLATT_MIN_A
+    if pinned.any():
+        a[pinned] = PLATT_MIN_A
+        xp = x[pinned]
+        bp = b[pinned]
+        for _ in range(PLATT_ITERATIONS):
+            p = expit(PLATT_MIN_A * xp + bp[:, None])
+            step = (p - targets).sum(axis=1) / ((p * (1 - p)).sum(axis=1) + 1e-9)
+            bp -= step
+            if np.abs(step).max() < PLATT_TOLERANCE:
+                break
+        b[pinned] = bp
+    return a, b, log_loss(expit(a[:, None] * x + b[:, None]), outcomes)
+
+
+def weight_candidates(center: np.ndarray, count: int, concentration: float,
+                      rng: np.random.Generator) -> np.ndarray:
+    """(count, tiers, keys) tier tables drawn around center; candidate 0 is center itself"""
+    tables = np.stack([rng.dirichlet(center[tier] * concentration, size=count)
+                       for tier in range(len(WEIGHT_TIERS))], axis=1)
+    tables[0] = center
+    return tables
+
+
+def decay_temporal_diffs(backtest: BacktestSet, decays: np.ndarray) -> np.ndarray:
+    """(len(decays), n_games) temporal_diff column for every candidate decay rate"""
+    days, probs = backtest.form_arrays()
+    performance = temporal_performance(days[np.newaxis], probs[np.newaxis], decays[:, None, None, None])
+    return (performance[..., 0] - performance[..., 1]) * 10
+
+
+# ==============================================================================
+# PARALLEL CANDIDATE EVALUATION (worker processes)
+# ==============================================================================
+
+_worker_state: Dict[str, np.ndarray] = {}
+
+
+def _init_worker(features: np.ndarray, outcomes: np.ndarray, temporal: np.ndarray, elo_thresholds: np.ndarray):
+    _worker_state.update(features=features, outcomes=outcomes, temporal=temporal, elo_thresholds=elo_thresholds)
+
+
+def evaluate_block(decay_index: int, tables: np.ndarray) -> np.ndarray:
+    """Worker task: (len(tables), 3) fitted Platt a, b and log loss for one decay and a block of tier tables"""
+    X = _worker_state['features'].copy()
+    X[:, FEATURE_INDEX['temporal_diff']] = _worker_state['temporal'][decay_index]
+    raw = np.stack([score_features(X, ScoringParams(_worker_state['elo_thresholds'], table))['raw_home_win_prob']
+                    for table in tables])
+    return np.stack(fit_platt(raw, _worker_state['outcomes']), axis=1)
+
+
+def search(train: BacktestSet, base: ScoringParams, decays: Sequence[float], candidates: int, rounds: int,
+           workers: Optional[int] = None, seed: int = 0) -> Dict:
+    """Best (decay, tier weights, Platt a/b) by fitted log loss over the decided training games"""
+    margin = train.column('home_points') - train.column('away_points')
+    decided = margin != 0
+    decays = np.asarray(decays, dtype=float)
+    temporal = decay_temporal_diffs(train, decays)[:, decided]
+    outcomes = (margin[decided] > 0).astype(float)
+
+    rng = np.random.default_rng(seed)
+    center, concentration = base.tier_weights, CONCENTRATION
+    best = None
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count(), initializer=_init_worker,
+                             initargs=(train.features[decided], outcomes, temporal, base.elo_thresholds)) as pool:
+        for round_number in range(1, rounds + 1):
+            started = time.perf_counter()
+            tables = weight_candidates(center, candidates, concentration, rng)
+            tasks = [(decay_index, start) for decay_index in range(len(decays))
+                     for start in range(0, candidates, CANDIDATE_BLOCK)]
+            futures = [pool.submit(evaluate_block, decay_index, tables[start:start + CANDIDATE_BLOCK])
+                       for decay_index, start in tasks]
+            for (decay_index, start), future in zip(tasks, futures):  # submission order keeps ties deterministic
+                results = future.result()
+                i = int(np.argmin(results[:, 2]))
+                if best is None or results[i, 2] < best['log_loss']:
+                    best = {'decay_xi': float(decays[decay_index]), 'tier_weights': tables[start + i],
+                            'platt_a': float(results[i, 0]), 'platt_b': float(results[i, 1]),
+                            'log_loss': float(results[i, 2])}
+            logger.info("   Round %s: %s candidates in %.1fs, best log loss %.4f (decay_xi=%.4f)",
+                        round_number, len(decays) * candidates, time.perf_counter() - started,
+                        best['log_loss'], best['decay_xi'])
+            center, concentration = best['tier_weights'], concentration * 4
+    best['evaluated'] = len(decays) * candidates * rounds
+    return best
+
+
+# ==============================================================================
+# REPORTING
+# ==============================================================================
+
+def week_subset(backtest: BacktestSet, weeks: Sequence[int]) -> BacktestSet:
+    weeks = set(weeks)
+    keep = [i for i, game in enumerate(backtest.games) if game['week'] in weeks]
+    return BacktestSet(games=[backtest.games[i] for i in keep], features=backtest.features[keep])
+
+
+def summary(report: Dict) -> Dict:
+    return {
+        'games': report['games'],
+        'brier': report['brier'],
+        'log_loss': report['log_loss'],
+        'spread_mae': report['spread_mae'],
+        'moneyline_accuracy': report['moneyline']['accuracy'],
+        'ats_accuracy': report['ats']['accuracy']
+    }
+
+
+def format_comparison(metrics: Dict) -> str:
+    def number(value, spec: str) -> str:
+        return format(value, spec) if value is not None else "n/a"
+
+    lines = ['=' * 60, "🎛️  CALIBRATION: baseline -> calibrated", '=' * 60]
+    for split, result in metrics.items():
+        baseline, calibrated = result['baseline'], result['calibrated']
+        lines.append(f"📊 {split.title()} ({baseline['games']} games):")
+        for key, label, spec in (('log_loss', 'Log loss', '.4f'), ('brier', 'Brier score', '.4f'),
+                                 ('moneyline_accuracy', 'Moneyline', '.1%'), ('ats_accuracy', 'ATS', '.1%'),
+                                 ('spread_mae', 'Spread MAE', '.2f')):
+            lines.append(f"   {label:<12} {number(baseline[key], spec):>8} -> {number(calibrated[key], spec)}")
+    lines.append('=' * 60)
+    return '\n'.join(lines)
+
+
+def calibration_regressions(metrics: Dict) -> List[str]:
+    """Guarded metrics the calibrated parameters make worse than the baseline (holdout split when there is one)"""
+    split = 'holdout' if 'holdout' in metrics else 'train'
+    baseline, calibrated = metrics[split]['baseline'], metrics[split]['calibrated']
+    regressions = []
+    for key, higher_is_better in GUARDED_METRICS.items():
+        before, after = baseline[key], calibrated[key]
+        if before is None or after is None:
+            continue
+        if (after < before) if higher_is_better else (after > before):
+            regressions.append(f"{split} {key} {before:.4f} -> {after:.4f}")
+    return regressions
+
+
+def tier_table(tier_weights: np.ndarray) -> Dict[str, Dict[str, float]]:
+    return {tier: {key: round(float(tier_weights[i, j]), 4) for j, key in enumerate(WEIGHT_KEYS)}
+            for i, tier in enumerate(WEIGHT_TIERS)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('features', help='.npz written by `backtest.py run --save`')
+    parser.add_argument('--api-key', default=os.environ.get('CFB_API_KEY', ''))
+    parser.add_argument('--decays', default=','.join(str(decay) for decay in DEFAULT_DECAYS),
+                        help='comma-separated Dixon-Coles decay rates to try')
+    parser.add_argument('--candidates', type=int, default=DEFAULT_CANDIDATES, help='tier-weight tables per round')
+    parser.add_argument('--rounds', type=int, default=DEFAULT_ROUNDS)
+    parser.add_argument('--holdout-weeks', type=int, default=DEFAULT_HOLDOUT_WEEKS,
+                        help='latest weeks kept out of the fit and reported out of sample')
+    parser.add_argument('--workers', type=int, default=None, help='worker processes (default: all cores)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default=MODEL_PARAMS_PATH, help=f'parameter file (default {MODEL_PARAMS_PATH})')
+    parser.add_argument('--dry-run', action='store_true', help='report without writing the parameter file')
+    parser.add_argument('--force', action='store_true',
+                        help='write the parameter file even when it scores worse than the baseline')
+    parser.add_argument('--json', action='store_true', help='print the fitted parameters as JSON')
+    parser.add_argument('-v', '--verbose', action='store_true')
+    args = parser.parse_args()
+    configure_logging(verbose=args.verbose, level=None if args.verbose else 'INFO')
+
+    backtest = BacktestSet.load(args.features)
+    base, base_decay = current_model(args.api_key)
+    weeks = sorted({game['week'] for game in backtest.games})
+    holdout_weeks = weeks[-args.holdout_weeks:] if 0 < args.holdout_weeks < len(weeks) else []
+    train_weeks = [week for week in weeks if week not in holdout_weeks]
+    train = week_subset(backtest, train_weeks)
+    decays = sorted({float(decay) for decay in args.decays.split(',')} | {base_decay})
+
+    started = time.perf_counter()
+    logger.info("🎛️  Calibrating on %s games (weeks %s), holding out weeks %s",
+                len(train.games), train_weeks, holdout_weeks or 'none')
+    best = search(train, base, decays, args.candidates, args.rounds, args.workers, args.seed)
+    logger.info("✅ Evaluated %s candidates in %.1fs", best['evaluated'], time.perf_counter() - started)
+
+    params = {
+        'fitted_at': datetime.now().isoformat(timespec='seconds'),
+        'decay_xi': best['decay_xi'],
+        'platt_a': round(best['platt_a'], 6),
+        'platt_b': round(best['platt_b'], 6),
+        'elo_thresholds': {tier: float(value) for tier, value in zip(WEIGHT_TIERS, base.elo_thresholds)},
+        'tier_weights': tier_table(best['tier_weights'])
+    }
+    fitted = ScoringParams.from_tables(params['elo_thresholds'], params['tier_weights'],
+                                       params['platt_a'], params['platt_b'])
+    splits: List[Tuple[str, List[int]]] = [('train', train_weeks)] + ([('holdout', holdout_weeks)] if holdout_weeks else [])
+    params['metrics'] = {
+        split: {
+            'baseline': summary(evaluate(week_subset(backtest, split_weeks).with_decay(base_decay), base)),
+            'calibrated': summary(evaluate(week_subset(backtest, split_weeks).with_decay(params['decay_xi']), fitted))
+        }
+        for split, split_weeks in splits
+    }
+    params['source'] = {'backtest': os.path.basename(args.features), 'train_weeks': train_weeks,
+                        'holdout_weeks': holdout_weeks, 'candidates': best['evaluated'], 'seed': args.seed}
+
+    print(format_comparison(params['metrics']))
+    if args.json:
+        print(json.dumps(params, indent=2))
+    if args.dry_run:
+        return
+    regressions = calibration_regressions(params['metrics'])
+    if regressions and not args.force:
+        logger.error("❌ Not writing %s - calibration is worse than the baseline: %s (--force to write anyway)",
+                     args.output, '; '.join(regressions))
+        raise SystemExit(1)
+    if regressions:
+        logger.warning("⚠️ Writing despite regressions (--force): %s", '; '.join(regressions))
+    version = write_model_params(params, args.output)
+    logger.info("✅ Wrote %s (version %s) - predictors load it on next start", args.output, version)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Compile the weekly static data into a memory-mapped snapshot
+
+Run after updating the files in weekly_updates/ (and at image build time) so
+workers map one pre-processed file instead of parsing ~15 JSON files on boot:
+
+    python compile_static_snapshot.py [--output path/to/static_snapshot.bin] [--workers N]
+
+--workers splits the drive aggregation (drive_analytics.py) across N processes.
+"""
+import argparse
+import os
+import time
+
+# Build from the JSON sources, never from a previous snapshot
+os.environ['CFB_STATIC_SNAPSHOT'] = 'off'
+
+from drive_analytics import DRIVE_WORKERS_ENV
+from graphqlpredictor import LightningPredictor
+from static_snapshot import SNAPSHOT_FILENAME
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--output', help='snapshot path (default: <static data dir>/static_snapshot.bin)')
+    parser.add_argument('--workers', type=int, help=f'drive aggregation processes (default: ${DRIVE_WORKERS_ENV} or 1)')
+    args = parser.parse_args()
+    if args.workers:
+        os.environ[DRIVE_WORKERS_ENV] = str(args.workers)
+
+    api_key = os.environ.get('CFB_API_KEY', '')
+    started = time.perf_counter()
+    predictor = LightningPredictor(api_key)
+    output = args.output or os.path.join(predictor.static_data_dir, SNAPSHOT_FILENAME)
+
+    size = predictor.compile_static_snapshot(output, predictor.static_data)
+    if not size:
+        print("⚠️  No static data loaded - snapshot not written (predictor will read JSON files)")
+        return
+    print(f"✅ Wrote {output} ({size / 1024:.0f} KB, {len(predictor.static_data)} sections) "
+          f"in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Data Reloader - hot reload of weekly static data without restarting workers
+
+A single background thread rebuilds the static data for a week (recompiling
+its snapshot and prewarming every section) and then flips the predictor onto
+the new DataRelease with one reference assignment. Predictions already in
+flight keep the release they pinned; new ones see the new week. Reloads are
+triggered by the n8n data-update webhook or by polling weekly_updates/ for new
+week folders and changed source files.
+"""
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+from log_config import get_logger
+from static_snapshot import source_fingerprint
+
+logger = get_logger('data_reloader')
+
+
+class DataReloader:
+    """Background rebuild + atomic swap of a LightningPredictor's weekly data"""
+
+    def __init__(self, predictor, watch_interval: float = 60.0):
+        self.predictor = predictor
+        self.watch_interval = watch_interval
+        self.last_reload: Optional[Dict] = None
+        self.last_error: Optional[str] = None
+
+        self._pending: Optional[Tuple[Optional[int], str]] = None
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._watch_signature = None
+
+    def start(self) -> 'DataReloader':
+        """Start the reload thread (polls for data changes when watch_interval > 0)"""
+        if self._thread is not None:
+            return self
+        self._watch_signature = self._signature()
+        self._thread = threading.Thread(target=self._run, name='data-reloader', daemon=True)
+        self._thread.start()
+        # A week folder may have landed between predictor boot and now - don't wait for it to change again
+        weeks = self._watch_signature[0] if self._watch_signature else ()
+        if weeks and weeks[-1] != self.predictor.current_week:
+            self.request_reload(weeks[-1], reason=f"newer week {weeks[-1]} available at startup")
+        watching = f"watching every {self.watch_interval:.0f}s" if self.watch_interval > 0 else "webhook only"
+        logger.info("✅ Data reloader started (%s)", watching)
+        return self
+
+    def request_reload(self, week: Optional[int] = None, reason: str = 'manual'):
+        """Schedule a rebuild for `week` (newest data folder if None); repeated requests coalesce"""
+        with self._lock:
+            self._pending = (week, reason)
+        self._wakeup.set()
+
+    def _run(self):
+        while True:
+            self._wakeup.wait(timeout=self.watch_interval if self.watch_interval > 0 else None)
+            self._wakeup.clear()
+
+            with self._lock:
+                pending, self._pending = self._pending, None
+
+            if pending is None:
+                signature = self._signature()
+                if signature == self._watch_signature:
+                    continue
+                pending = (None, 'data files changed')
+
+            self._reload(*pending)
+            self._watch_signature = self._signature()
+
+    def _signature(self):
+        """Known week folders plus size/mtime of the newest week's source files"""
+        try:
+            weeks = self.predictor.available_data_weeks()
+            if not weeks:
+                return ()
+            newest_dir = self.predictor._weekly_data_dir(weeks[-1])
+            fingerprint = source_fingerprint(self.predictor._static_source_paths(newest_dir).values())
+            return tuple(weeks), tuple(sorted((name, tuple(stat or ())) for name, stat in fingerprint.items()))
+        except OSError as e:
+            logger.warning("⚠️  Data watcher could not scan weekly_updates: %s", e)
+            return self._watch_signature
+
+    def _reload(self, week: Optional[int], reason: str):
+        started = time.perf_counter()
+        logger.info("🔄 Rebuilding static data (%s, week %s)...", reason, week if week is not None else 'latest')
+        try:
+            release = self.predictor.build_data_release(week)
+            previous = self.predictor.activate_data_release(release)
+        except Exception as e:
+            self.last_error = f"{reason}: {e}"
+            logger.error("❌ Static data reload failed - still serving week %s: %s", self.predictor.current_week, e)
+            return
+
+        self.last_error = None
+        self.last_reload = {
+            'week': release.week,
+            'previous_week': previous.week,
+            'reason': reason,
+            'seconds': round(time.perf_counter() - started, 2),
+            'completed_at': datetime.now().isoformat(timespec='seconds')
+        }
+
+    def status(self) -> Dict:
+        return {
+            'current_week': self.predictor.current_week,
+            'data_dir': self.predictor.static_data_dir,
+            'reload_pending': self._pending is not None,
+            'last_reload': self.last_reload,
+            'last_error': self.last_error
+        }
+
+
+# Singleton instance (one reloader per predictor process)
+_data_reloader = None
+_data_reloader_lock = threading.Lock()
+
+def get_data_reloader(predictor, watch_interval: float = 60.0) -> DataReloader:
+    """Get or create (and start) the reloader for the process-wide predictor"""
+    global _data_reloader
+    with _data_reloader_lock:
+        if _data_reloader is None or _data_reloader.predictor is not predictor:
+            _data_reloader = DataReloader(predictor, watch_interval).start()
+    return _data_reloader
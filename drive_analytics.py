@@ -0,0 +1,306 @@
+"""
+Drive Analytics - columnar group-by aggregation of the season drive files
+
+_process_drive_data built a ~50-counter dict per team by walking every Power 5
+drive (power5_drives_only.json) through a chain of Python branches, and
+_process_team_drives walked react_power5_teams.json the same way. Both now
+read the drives once into NumPy columns (team code, yards, plays, result,
+start yard line, ...) and aggregate them as a group-by on the team code:
+every counter is an np.bincount over a boolean mask, and the scoring / stop
+streaks are run lengths over the team-sorted rows.
+
+Aggregation runs when the static data is processed - normally once, by
+compile_static_snapshot.py, which can partition teams across a process pool
+(--workers, or CFB_DRIVE_WORKERS). The resulting DriveMetrics are stored as a
+columnar table in the snapshot, so predictors map them instead of
+re-aggregating drives on startup.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+import numpy as np
+
+DRIVE_WORKERS_ENV = 'CFB_DRIVE_WORKERS'
+
+# Results that move the scoring / stop streaks (anything else - end of half, etc. - leaves them alone)
+DRIVE_RESULTS = ('TD', 'FG', 'PUNT', 'INT', 'FUMBLE', 'DOWNS', 'MISSED FG', 'SAFETY')
+RESULT_CODES = {result: code for code, result in enumerate(DRIVE_RESULTS)}
+OTHER_RESULT = -1
+SCORING_RESULT_CODES = (RESULT_CODES['TD'], RESULT_CODES['FG'])
+
+# Numeric column -> (drive key, default when the drive doesn't have it)
+DRIVE_FIELDS = {
+    'yards': ('yards', 0),
+    'plays': ('plays', 0),
+    'start_yard': ('startYardline', 50),
+    'start_period': ('startPeriod', 1),
+    'offense_score': ('startOffenseScore', 0),
+    'defense_score': ('startDefenseScore', 0)
+}
+DERIVED_COLUMNS = ('result', 'scoring', 'seconds', 'start_minutes')
+
+
+def _column_values(name: str, drives: List[Dict]) -> np.ndarray:
+    """One column for every drive (a plain comprehension per column - the JSON walk is the expensive part)"""
+    if name in DRIVE_FIELDS:
+        key, default = DRIVE_FIELDS[name]
+        return np.array([drive.get(key, default) for drive in drives], dtype=float)
+    if name == 'result':
+        return np.array([RESULT_CODES.get(drive.get('driveResult', '').upper(), OTHER_RESULT) for drive in drives],
+                        dtype=np.int8)
+    if name == 'scoring':
+        return np.array([bool(drive.get('scoring', False)) for drive in drives], dtype=bool)
+    if name == 'seconds':
+        elapsed = [drive.get('elapsed', {}) for drive in drives]
+        return np.array([e.get('minutes', 0) * 60 + e.get('seconds', 0) for e in elapsed], dtype=float)
+    if name == 'start_minutes':
+        return np.array([drive.get('startTime', {}).get('minutes', 15) for drive in drives], dtype=float)
+    raise KeyError(name)
+
+
+# Columns each aggregation reads
+DRIVE_METRIC_COLUMNS = tuple(DRIVE_FIELDS) + DERIVED_COLUMNS
+TEAM_SUMMARY_COLUMNS = ('scoring', 'yards', 'plays', 'start_yard')
+
+
+@dataclass
+class DriveColumns:
+    """Drives as parallel arrays; team holds codes into teams (first-appearance order)"""
+    teams: List[str]
+    team: np.ndarray
+    columns: Dict[str, np.ndarray]
+
+    @classmethod
+    def from_drives(cls, team_names: List[str], drives: List[Dict],
+                    columns: Iterable[str] = DRIVE_METRIC_COLUMNS) -> 'DriveColumns':
+        """Columns for drives[i] run by team_names[i]"""
+        codes = {}
+        team_codes = [codes.setdefault(team, len(codes)) for team in team_names]
+        return cls(
+            teams=list(codes),
+            team=np.array(team_codes, dtype=np.intp),
+            columns={name: _column_values(name, drives) for name in columns}
+        )
+
+    @classmethod
+    def from_team_drives(cls, teams: List[str], team_drives: List[List[Dict]],
+                         columns: Iterable[str] = DRIVE_METRIC_COLUMNS) -> 'DriveColumns':
+        """Columns for drives already grouped by team (team_drives[i] run by teams[i])"""
+        drives = [drive for drives in team_drives for drive in drives]
+        return cls(
+            teams=list(teams),
+            team=np.repeat(np.arange(len(teams), dtype=np.intp), [len(drives) for drives in team_drives]),
+            columns={name: _column_values(name, drives) for name in columns}
+        )
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+    def partition(self, start: int, stop: int) -> 'DriveColumns':
+        """Teams [start, stop) and their drives, re-coded from 0"""
+        rows = (self.team >= start) & (self.team < stop)
+        return DriveColumns(teams=self.teams[start:stop], team=self.team[rows] - start,
+                            columns={name: values[rows] for name, values in self.columns.items()})
+
+
+def _team_counter(columns: DriveColumns) -> Callable:
+    """count(mask) -> drives per team code matching mask; count(mask, values) -> their per-team sum"""
+    def count(mask=None, values=None) -> np.ndarray:
+        team = columns.team if mask is None else columns.team[mask]
+        weights = None if values is None else (values if mask is None else values[mask])
+        return np.bincount(team, weights=weights, minlength=len(columns.teams))
+    return count
+
+
+def _streaks(columns: DriveColumns) -> Tuple[np.ndarray, np.ndarray]:
+    """Per team: longest run of TD/FG drives, and the stop run (punt, turnover, ...) it ended the season on"""
+    longest_scoring = np.zeros(len(columns.teams), dtype=np.int64)
+    final_stops = np.zeros(len(columns.teams), dtype=np.int64)
+    counted = columns['result'] != OTHER_RESULT
+    order = np.argsort(columns.team[counted], kind='stable')  # drive order within each team
+    team = columns.team[counted][order]
+    scored = np.isin(columns['result'][counted][order], SCORING_RESULT_CODES)
+    if not len(team):
+        return longest_scoring, final_stops
+
+    run_starts = np.flatnonzero(np.r_[True, (team[1:] != team[:-1]) | (scored[1:] != scored[:-1])])
+    run_lengths = np.diff(np.r_[run_starts, len(team)])
+    run_team, run_scored = team[run_starts], scored[run_starts]
+    np.maximum.at(longest_scoring, run_team[run_scored], run_lengths[run_scored])
+    last_run = np.r_[run_team[1:] != run_team[:-1], True]
+    final_stops[run_team[last_run & ~run_scored]] = run_lengths[last_run & ~run_scored]
+    return longest_scoring, final_stops
+
+
+def drive_metric_fields(columns: DriveColumns) -> Dict[str, Dict[str, Any]]:
+    """DriveMetrics keyword arguments per team (power5_drives_only.json)"""
+    count = _team_counter(columns)
+    result, scoring = columns['result'], columns['scoring']
+    yards, plays, seconds, start_yard = columns['yards'], columns['plays'], columns['seconds'], columns['start_yard']
+    is_result = {name: result == code for name, code in RESULT_CODES.items()}
+
+    # Quarter breakdown only covers explosive (50+ yard) drives; period 0 counts as Q1, overtime as Q4
+    explosive = yards >= 50
+    quarter = np.clip(columns['start_period'], 1, 4)
+    two_minute = ((columns['start_period'] == 2) | (columns['start_period'] == 4)) & (columns['start_minutes'] <= 2)
+    field_position = {
+        'own_1_20': start_yard >= 80,
+        'own_21_40': (start_yard >= 60) & (start_yard < 80),
+        'own_41_midfield': (start_yard >= 50) & (start_yard < 60),
+        'opp_territory': start_yard < 50
+    }
+    longest_scoring, final_stops = _streaks(columns)
+
+    counters = {
+        'drives': count(),
+        'total_yards': count(values=yards),
+        'total_plays': count(values=plays),
+        'total_time': count(values=seconds),
+        'touchdowns': count(is_result['TD']),
+        'field_goals': count(is_result['FG']),
+        'punts': count(is_result['PUNT']),
+        'turnovers': count(is_result['INT'] | is_result['FUMBLE']),
+        'turnover_on_downs': count(is_result['DOWNS']),
+        'missed_field_goals': count(is_result['MISSED FG']),
+        'safeties': count(is_result['SAFETY']),
+        'three_and_outs': count((plays <= 3) & ~scoring),
+        'explosive_drives': count(explosive),
+        'quick_scores': count(scoring & (plays <= 6)),
+        'quick_drives': count((seconds > 0) & (seconds < 120)),
+        'sustained_drives': count(seconds > 300),
+        'two_minute_drill_attempts': count(two_minute),
+        'two_minute_drill_scores': count(two_minute & scoring),
+        'red_zone_attempts': count(start_yard <= 20),
+        'red_zone_scores': count((start_yard <= 20) & scoring),
+        'goal_line_attempts': count(start_yard <= 5),
+        'goal_line_scores': count((start_yard <= 5) & is_result['TD']),
+        'comeback_drives': count(scoring & (columns['offense_score'] < columns['defense_score'])),
+        'consecutive_scoring_drives': longest_scoring,
+        'consecutive_stops': final_stops
+    }
+    for q in range(1, 5):
+        in_quarter = explosive & (quarter == q)
+        counters[f'q{q}_drives'] = count(in_quarter)
+        counters[f'q{q}_scoring_drives'] = count(in_quarter & scoring)
+        counters[f'q{q}_yards'] = count(in_quarter, yards)
+    for zone, mask in field_position.items():
+        counters[f'{zone}_drives'] = count(mask)
+        counters[f'{zone}_scoring'] = count(mask & scoring)
+    counters = {name: values.tolist() for name, values in counters.items()}
+
+    metrics = {}
+    for i, team in enumerate(columns.teams):
+        c = {name: values[i] for name, values in counters.items()}
+        total_drives = c['drives']
+        if total_drives == 0:
+            continue
+        scoring_drives = c['touchdowns'] + c['field_goals']
+        metrics[team] = {
+            # Basic metrics
+            'avg_drive_length': c['total_yards'] / total_drives,
+            'avg_time_per_drive': c['total_time'] / total_drives if c['total_time'] > 0 else 0,
+            'three_and_outs': c['three_and_outs'],
+            'explosive_drives': c['explosive_drives'],
+            'red_zone_attempts': c['red_zone_attempts'],
+            'red_zone_scores': c['red_zone_scores'],
+            'fourth_down_attempts': 0,
+            'fourth_down_conversions': 0,
+            'big_play_drives': c['explosive_drives'],
+            'methodical_drives': total_drives - c['explosive_drives'] - c['three_and_outs'],
+            'quick_scores': c['quick_scores'],
+
+            # Drive outcomes
+            **{name: c[name] for name in ('touchdowns', 'field_goals', 'punts', 'turnovers', 'turnover_on_downs',
+                                          'missed_field_goals', 'safeties')},
+
+            # Quarter performance
+            **{key: value for q in range(1, 5) for key, value in (
+                (f'q{q}_drives', c[f'q{q}_drives']),
+                (f'q{q}_scoring_drives', c[f'q{q}_scoring_drives']),
+                (f'q{q}_avg_yards', c[f'q{q}_yards'] / max(c[f'q{q}_drives'], 1))
+            )},
+
+            # Time management
+            **{name: c[name] for name in ('quick_drives', 'sustained_drives', 'two_minute_drill_attempts',
+                                          'two_minute_drill_scores')},
+
+            # Field position intelligence
+            **{f'{zone}_{kind}': c[f'{zone}_{kind}'] for zone in field_position for kind in ('drives', 'scoring')},
+
+            # Advanced efficiency
+            'plays_per_drive': c['total_plays'] / total_drives,
+            'yards_per_play': c['total_yards'] / max(c['total_plays'], 1),
+            'scoring_percentage': scoring_drives / total_drives * 100,
+            'red_zone_efficiency': c['red_zone_scores'] / max(c['red_zone_attempts'], 1) * 100,
+            'goal_line_efficiency': c['goal_line_scores'],
+            'goal_line_attempts': c['goal_line_attempts'],
+
+            # Momentum tracking
+            'momentum_swings': 0,
+            'consecutive_scoring_drives': c['consecutive_scoring_drives'],
+            'consecutive_stops': c['consecutive_stops'],
+            'comeback_drives': c['comeback_drives']
+        }
+    return metrics
+
+
+def team_drive_summaries(columns: DriveColumns) -> Dict[str, Dict[str, float]]:
+    """Per-team drive summary (react_power5_teams.json offensive drives)"""
+    count = _team_counter(columns)
+    scoring, yards, plays, start_yard = columns['scoring'], columns['yards'], columns['plays'], columns['start_yard']
+    red_zone = start_yard >= 80
+    goal_line = ~red_zone & (start_yard >= 95)  # Checked after the red zone start, as before - never matches
+    counters = {name: values.tolist() for name, values in {
+        'drives': count(),
+        'scoring': count(scoring),
+        'yards': count(values=yards),
+        'plays': count(values=plays),
+        'red_zone': count(red_zone),
+        'red_zone_scoring': count(red_zone & scoring),
+        'goal_line': count(goal_line),
+        'goal_line_scoring': count(goal_line & scoring),
+        'long': count(yards >= 75),
+        'short': count(yards <= 20),
+        'quick_scores': count((plays <= 4) & scoring)
+    }.items()}
+
+    summaries = {}
+    for i, team in enumerate(columns.teams):
+        c = {name: values[i] for name, values in counters.items()}
+        total_drives = c['drives']
+        summaries[team] = {
+            'total_drives': total_drives,
+            'scoring_drives': c['scoring'],
+            'scoring_percentage': c['scoring'] / max(total_drives, 1),
+            'avg_yards_per_drive': c['yards'] / max(total_drives, 1),
+            'avg_plays_per_drive': c['plays'] / max(total_drives, 1),
+            'red_zone_drives': c['red_zone'],
+            'red_zone_scoring_pct': c['red_zone_scoring'] / max(c['red_zone'], 1),
+            'goal_line_drives': c['goal_line'],
+            'goal_line_scoring_pct': c['goal_line_scoring'] / max(c['goal_line'], 1),
+            'long_drive_pct': c['long'] / max(total_drives, 1),
+            'quick_score_pct': c['quick_scores'] / max(total_drives, 1),
+            'drive_consistency': 1.0 - (c['short'] / max(total_drives, 1))
+        }
+    return summaries
+
+
+def drive_workers() -> int:
+    return max(1, int(os.environ.get(DRIVE_WORKERS_ENV, 1)))
+
+
+def aggregate_by_team(columns: DriveColumns, aggregate: Callable[[DriveColumns], Dict],
+                      workers: int = None) -> Dict[str, Dict]:
+    """aggregate(columns), with teams partitioned across a process pool when workers > 1"""
+    workers = min(workers or drive_workers(), len(columns.teams))
+    if workers <= 1:
+        return aggregate(columns)
+    bounds = np.linspace(0, len(columns.teams), workers + 1).astype(int)
+    partitions = [columns.partition(start, stop) for start, stop in zip(bounds[:-1], bounds[1:])]
+    results = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for partial in pool.map(aggregate, partitions):  # partition order keeps team order
+            results.update(partial)
+    return results
@@ -11,6 +11,15 @@ from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, asdict
 from datetime import datetime
 
+from game_log_store import get_game_log_store
+
+# Game log store columns each position's props and insights read
+POSITION_STATS = {
+    'QB': ('passing_yards', 'passing_tds', 'rushing_yards', 'completions', 'attempts', 'interceptions'),
+    'WR': ('receptions', 'receiving_yards', 'receiving_tds'),
+    'RB': ('rushing_yards', 'rushing_attempts', 'rushing_tds', 'receptions', 'receiving_yards')
+}
+
 @dataclass
 class GameLog:
     week: int
@@ -81,8 +90,35 @@ class EnhancedPlayerPropsEngine:
             print(f"❌ API Error: {e}")
             return None
 
+    def _stored_game_logs(self, player_name: str, team: str, position: str) -> Optional[List[GameLog]]:
+        """Real box-score logs from the game log store, most recent first (None when it doesn't cover the player)"""
+        store = get_game_log_store()
+        logs = store.player_logs(player_name, team) if store is not None and store.year == self.year else None
+        if logs is None or position not in POSITION_STATS:
+            return None
+        
+        columns = POSITION_STATS[position]
+        game_logs = [
+            GameLog(
+                week=week,
+                opponent=opponent,
+                home_away='home' if home else 'away',
+                result='W' if win else 'L',
+                stats=dict(zip(columns, values))
+            )
+            for week, opponent, home, win, *values in zip(
+                logs['week'].tolist(), store.opponent_names(logs), logs['home'].tolist(), logs['win'].tolist(),
+                *[logs[column].tolist() for column in columns])
+        ]
+        game_logs.reverse()
+        return game_logs[:10]  # Return last 10 games
+
     def get_player_game_logs(self, player_name: str, team: str, position: str) -> List[GameLog]:
-        """Get detailed game-by-game logs for a player"""
+        """Get detailed game-by-game logs for a player (game log store, else synthesized from season totals)"""
+        game_logs = self._stored_game_logs(player_name, team, position)
+        if game_logs is not None:
+            return game_logs
+        
         print(f"📊 Fetching game logs for {player_name} ({team})...")
         
         # Get season stats first to establish baseline
@@ -1,13 +1,181 @@
 """
 ESPN Player Headshot Service
 Fetches player IDs and headshot URLs from ESPN API
+
+Rosters used to live in a per-instance dict with no TTL, so every worker
+fetched each team's roster over HTTP inside /predict, and every player not
+matched by exact name was fuzz.ratio-compared against the whole roster.
+Rosters are now kept on disk (data/espn_rosters/<espn id>.json, or
+CFB_ESPN_ROSTER_DIR) and shared by every worker; stale ones are refreshed
+on a background thread while the old copy keeps serving, and a team with no
+stored roster yet is fetched inline so its first response has headshots.
+Each roster carries a normalized-name index (accents, punctuation, Jr./III
+suffixes and common nicknames folded) plus an alias map, so resolving a
+headshot is usually a dict lookup. Names the index misses are fuzzy-matched
+once at request time and memoized as aliases (written back on the roster's
+next refresh); `python espn_player_service.py --refresh` pre-builds aliases
+for every player in our analysis files.
 """
 
-import requests
+import argparse
 import json
-from typing import Dict, Optional, List
+import os
+import re
+import threading
+import time
+import unicodedata
+import requests
+from collections import Counter
+from typing import Dict, Iterable, Optional, List
 from fuzzywuzzy import fuzz
 
+from log_config import get_logger
+from player_index import load_player_data, team_key
+from team_directory import get_team_directory
+
+logger = get_logger('espn_player_service')
+
+ROSTER_STORE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'espn_rosters')
+ROSTER_STORE_ENV = 'CFB_ESPN_ROSTER_DIR'
+ROSTER_TTL = 24 * 3600        # CFB_ESPN_ROSTER_TTL overrides (seconds)
+ROSTER_RETRY_AFTER = 5 * 60   # after a failed refresh, keep serving what we have this long
+ALIAS_FUZZY_CUTOFF = 85       # the old request-time fuzz.ratio threshold
+
+NAME_SUFFIXES = {'jr', 'sr', 'ii', 'iii', 'iv', 'v'}
+
+# Short first name -> the form rosters usually list (either side may use either). True diminutives
+# only: 'jack'/'johnny' are given names in their own right and would fold distinct players into 'john'
+NICKNAMES = {
+    'will': 'william', 'bill': 'william', 'billy': 'william', 'mike': 'michael', 'chris': 'christopher',
+    'matt': 'matthew', 'nick': 'nicholas', 'tony': 'anthony', 'jake': 'jacob', 'josh': 'joshua',
+    'dan': 'daniel', 'danny': 'daniel', 'dave': 'david', 'tom': 'thomas', 'tommy': 'thomas',
+    'jim': 'james', 'jimmy': 'james', 'joe': 'joseph', 'joey': 'joseph', 'bob': 'robert',
+    'rob': 'robert', 'bobby': 'robert', 'alex': 'alexander', 'andy': 'andrew', 'drew': 'andrew',
+    'ben': 'benjamin', 'sam': 'samuel', 'zach': 'zachary', 'zack': 'zachary', 'nate': 'nathan',
+    'jon': 'jonathan', 'ed': 'edward', 'eddie': 'edward', 'greg': 'gregory',
+    'jeff': 'jeffrey', 'steve': 'steven', 'tim': 'timothy', 'ken': 'kenneth', 'kenny': 'kenneth',
+    'rick': 'richard', 'ricky': 'richard', 'rich': 'richard', 'pat': 'patrick', 'gabe': 'gabriel',
+    'max': 'maxwell', 'cam': 'cameron', 'tre': 'trey',
+}
+
+
+def normalize_player_name(name: str) -> str:
+    """Lowercase, accent-free, punctuation-free form of a player name without Jr./III suffixes"""
+    name = unicodedata.normalize('NFKD', str(name or ''))
+    name = ''.join(ch for ch in name if not unicodedata.combining(ch)).lower()
+    name = re.sub(r"['’.]", '', name)
+    tokens = re.sub(r'[^a-z0-9]+', ' ', name).split()
+    while len(tokens) > 1 and tokens[-1] in NAME_SUFFIXES:
+        tokens.pop()
+    return ' '.join(tokens)
+
+
+def player_name_keys(name: str) -> List[str]:
+    """Index keys for a name - the normalized form, then the form with a nickname expanded"""
+    key = normalize_player_name(name)
+    keys = [key] if key else []
+    first, _, rest = key.partition(' ')
+    if rest and first in NICKNAMES:
+        keys.append(f"{NICKNAMES[first]} {rest}")
+    return keys
+
+
+class TeamRoster:
+    """One team's ESPN roster with its name index"""
+
+    def __init__(self, team: str, espn_id: int, players: Dict[str, Dict], aliases: Optional[Dict[str, str]] = None,
+                 fetched_at: float = 0.0, mtime: Optional[float] = None):
+        self.team = team
+        self.espn_id = espn_id
+        self.players = players
+        self.fetched_at = fetched_at
+        self.mtime = mtime
+        # Only keep aliases whose roster entry still exists
+        self.aliases = {alias: name for alias, name in (aliases or {}).items() if name in players}
+
+        # First name claiming a key wins; aliases never shadow a real roster name
+        self.index: Dict[str, str] = {}
+        self.nickname_index: Dict[str, str] = {}
+        self.surnames = Counter(normalize_player_name(player_name).partition(' ')[2] for player_name in players)
+        for player_name in players:
+            keys = player_name_keys(player_name)
+            if not keys:
+                continue
+            self.index.setdefault(keys[0], player_name)
+            if self.surnames[keys[0].partition(' ')[2]] == 1:
+                for key in keys[1:]:
+                    self.nickname_index.setdefault(key, player_name)
+        for alias, player_name in self.aliases.items():
+            self.index.setdefault(alias, player_name)
+        self._roster_keys = [(normalize_player_name(player_name), player_name) for player_name in players]
+        self._fuzzy_misses = set()
+
+    def find(self, player_name: str) -> Optional[Dict]:
+        """Roster entry for a player name (exact, normalized, nickname, alias or fuzzy match), or None"""
+        entry = self.players.get(player_name)
+        if entry is not None:
+            return entry
+        keys = player_name_keys(player_name)
+        if not keys:
+            return None
+        roster_name = self.index.get(keys[0])
+        # Nicknames only bridge names when one player has that last name - 'Mike Smith' is nobody with two Smiths
+        if roster_name is None and self.surnames[keys[0].partition(' ')[2]] == 1:
+            for key in keys:
+                roster_name = self.index.get(key) or self.nickname_index.get(key)
+                if roster_name is not None:
+                    break
+        if roster_name is None:
+            roster_name = self.fuzzy_match(keys[0])
+        return self.players[roster_name] if roster_name is not None else None
+
+    def fuzzy_match(self, key: str, cutoff: int = ALIAS_FUZZY_CUTOFF) -> Optional[str]:
+        """Roster name scoring best above `cutoff` for a normalized name, memoized as an alias (misses too)
+
+        Skipped when several players share the last name - a fuzzy score can't tell them apart.
+        """
+        if key in self._fuzzy_misses:
+            return None
+        best_name, best_score = None, cutoff
+        if self.surnames[key.partition(' ')[2]] <= 1:
+            for roster_key, roster_name in self._roster_keys:
+                score = fuzz.ratio(key, roster_key)
+                if score > best_score:
+                    best_name, best_score = roster_name, score
+        if best_name is None:
+            self._fuzzy_misses.add(key)
+            return None
+        self.aliases[key] = best_name
+        self.index.setdefault(key, best_name)
+        return best_name
+
+    def unmatched(self, player_names: Iterable[str]) -> List[str]:
+        return [name for name in player_names if name and self.find(name) is None]
+
+    def build_aliases(self, player_names: Iterable[str]) -> int:
+        """Resolve names up front so their fuzzy matches land in the saved alias map; returns aliases added"""
+        before = len(self.aliases)
+        self.unmatched(player_names)
+        return len(self.aliases) - before
+
+    def is_stale(self, ttl: float) -> bool:
+        return time.time() - self.fetched_at > ttl
+
+    def to_json(self) -> Dict:
+        return {
+            'team': self.team,
+            'espn_id': self.espn_id,
+            'fetched_at': self.fetched_at,
+            'players': self.players,
+            'aliases': self.aliases
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict, mtime: Optional[float] = None) -> 'TeamRoster':
+        return cls(data.get('team', ''), data.get('espn_id'), data.get('players', {}), data.get('aliases', {}),
+                   data.get('fetched_at', 0.0), mtime)
+
+
 class ESPNPlayerService:
     """Service to fetch player headshots from ESPN API"""
     
@@ -15,10 +183,16 @@ class ESPNPlayerService:
     HEADSHOT_URL = "https://a.espncdn.com/i/headshots/college-football/players/full/{player_id}.png"
     HEADSHOT_FALLBACK = "https://a.espncdn.com/i/teamlogos/default-team-logo-500.png"
     
-    def __init__(self):
+    def __init__(self, store_dir: Optional[str] = None, background_refresh: bool = False):
         """Initialize with team ID mapping from fbs.json"""
         self.team_to_espn_id = {}
-        self.player_cache = {}
+        self.player_cache: Dict[int, TeamRoster] = {}
+        self.store_dir = store_dir or os.environ.get(ROSTER_STORE_ENV) or ROSTER_STORE_DIR
+        self.ttl = float(os.environ.get('CFB_ESPN_ROSTER_TTL', ROSTER_TTL))
+        self.background_refresh = background_refresh
+        self._refreshing = set()
+        self._retry_after: Dict[int, float] = {}
+        self._lock = threading.Lock()
         self._load_team_mapping()
     
     def _load_team_mapping(self):
@@ -107,38 +281,100 @@ class ESPNPlayerService:
     def get_espn_team_id(self, team_name: str) -> Optional[int]:
         """
         Get ESPN team ID for a given team name
-        Uses fuzzy matching to handle variations
+        Falls back to the team directory (CFBD team ids are ESPN ids) to handle variations
         """
         # Direct match
         if team_name in self.team_to_espn_id:
             return self.team_to_espn_id[team_name]
         
-        # Fuzzy match
-        best_match = None
-        best_score = 0
-        for espn_team, espn_id in self.team_to_espn_id.items():
-            score = fuzz.ratio(team_name.lower(), espn_team.lower())
-            if score > best_score and score > 80:
-                best_score = score
-                best_match = espn_id
-        
-        return best_match
+        return get_team_directory().resolve(team_name)
+    
+    def roster_path(self, espn_id: int) -> str:
+        return os.path.join(self.store_dir, f"{espn_id}.json")
     
     def fetch_team_roster(self, team_name: str) -> Dict:
         """
         Fetch full roster for a team from ESPN
         Returns: {player_name: {id, position, headshot_url}}
         """
+        roster = self.get_team_roster(team_name)
+        return roster.players if roster else {}
+    
+    def get_team_roster(self, team_name: str) -> Optional[TeamRoster]:
+        """
+        Team roster from memory, else the shared disk store, refreshed when older than the TTL
+        With background_refresh a stale roster keeps serving while a thread refreshes it; a team
+        with no roster at all is still fetched inline, so its first response isn't cached headshot-less
+        """
         espn_id = self.get_espn_team_id(team_name)
         if not espn_id:
-            print(f"⚠️  No ESPN ID found for {team_name}")
-            return {}
+            logger.warning("⚠️  No ESPN ID found for %s", team_name)
+            return None
         
-        # Check cache
-        cache_key = f"roster_{espn_id}"
-        if cache_key in self.player_cache:
-            return self.player_cache[cache_key]
+        # Check cache (another worker may have rewritten the file since we read it)
+        roster = self.player_cache.get(espn_id)
+        path = self.roster_path(espn_id)
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError:
+            mtime = None
+        if mtime is not None and (roster is None or roster.mtime != mtime):
+            roster = self._load_roster(path, mtime) or roster
         
+        if roster is not None and not roster.is_stale(self.ttl):
+            return roster
+        if time.time() < self._retry_after.get(espn_id, 0):
+            return roster
+        if self.background_refresh and roster is not None:
+            self._refresh_in_background(team_name, espn_id)
+            return roster
+        return self.refresh_team_roster(team_name, espn_id) or roster
+    
+    def _load_roster(self, path: str, mtime: float) -> Optional[TeamRoster]:
+        try:
+            with open(path, 'r') as f:
+                roster = TeamRoster.from_json(json.load(f), mtime)
+        except (OSError, ValueError) as e:
+            logger.warning("⚠️  Ignoring cached roster %s: %s", path, e)
+            return None
+        self.player_cache[roster.espn_id] = roster
+        return roster
+    
+    def _refresh_in_background(self, team_name: str, espn_id: int):
+        with self._lock:
+            if espn_id in self._refreshing:
+                return
+            self._refreshing.add(espn_id)
+        threading.Thread(target=self.refresh_team_roster, args=(team_name, espn_id),
+                         name=f"espn-roster-{espn_id}", daemon=True).start()
+    
+    def refresh_team_roster(self, team_name: str, espn_id: Optional[int] = None,
+                            player_names: Optional[Iterable[str]] = None) -> Optional[TeamRoster]:
+        """
+        Download a roster and write it to the shared store, keeping its known aliases
+        player_names (offline refresh only) are fuzzy-matched into new aliases
+        """
+        espn_id = espn_id or self.get_espn_team_id(team_name)
+        if not espn_id:
+            logger.warning("⚠️  No ESPN ID found for %s", team_name)
+            return None
+        try:
+            players = self._download_roster(team_name, espn_id)
+            if players is None:
+                self._retry_after[espn_id] = time.time() + ROSTER_RETRY_AFTER
+                return None
+            previous = self.player_cache.get(espn_id)
+            roster = TeamRoster(team_name, espn_id, players, previous.aliases if previous else {}, time.time())
+            if player_names:
+                roster.build_aliases(player_names)
+            self._save_roster(roster)
+            self.player_cache[espn_id] = roster
+            return roster
+        finally:
+            with self._lock:
+                self._refreshing.discard(espn_id)
+    
+    def _download_roster(self, team_name: str, espn_id: int) -> Optional[Dict[str, Dict]]:
         try:
             url = f"{self.BASE_URL}/teams/{espn_id}/roster"
             response = requests.get(url, timeout=10)
@@ -163,36 +399,34 @@ class ESPNPlayerService:
                             'short_name': player.get('shortName', player_name)
                         }
             
-            # Cache the result
-            self.player_cache[cache_key] = roster
-            print(f"✅ Fetched {len(roster)} players for {team_name} (ESPN ID: {espn_id})")
+            logger.info("✅ Fetched %s players for %s (ESPN ID: %s)", len(roster), team_name, espn_id)
             return roster
             
         except Exception as e:
-            print(f"❌ Error fetching roster for {team_name}: {e}")
-            return {}
+            logger.error("❌ Error fetching roster for %s: %s", team_name, e)
+            return None
+    
+    def _save_roster(self, roster: TeamRoster):
+        """Atomic write, so other workers never read a half-written roster"""
+        path = self.roster_path(roster.espn_id)
+        try:
+            os.makedirs(self.store_dir, exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(roster.to_json(), f)
+            os.replace(tmp_path, path)
+            roster.mtime = os.stat(path).st_mtime
+        except OSError as e:
+            logger.warning("⚠️  Could not save roster for %s: %s", roster.team, e)
     
     def get_player_headshot(self, player_name: str, team_name: str) -> str:
         """
         Get headshot URL for a specific player
         Returns headshot URL or fallback image
         """
-        roster = self.fetch_team_roster(team_name)
-        
-        # Direct name match
-        if player_name in roster:
-            return roster[player_name]['headshot_url']
-        
-        # Fuzzy name match
-        best_match = None
-        best_score = 0
-        for roster_name, player_data in roster.items():
-            score = fuzz.ratio(player_name.lower(), roster_name.lower())
-            if score > best_score and score > 85:
-                best_score = score
-                best_match = player_data['headshot_url']
-        
-        return best_match if best_match else self.HEADSHOT_FALLBACK
+        roster = self.get_team_roster(team_name)
+        entry = roster.find(player_name) if roster else None
+        return entry['headshot_url'] if entry else self.HEADSHOT_FALLBACK
     
     def enrich_player_data(self, players_data: Dict, team_name: str) -> Dict:
         """
@@ -200,52 +434,74 @@ class ESPNPlayerService:
         Input: {position: [player_data_dicts]}
         Output: Same structure with headshot_url added to each player
         """
-        roster = self.fetch_team_roster(team_name)
+        roster = self.get_team_roster(team_name)
         
         for position, players in players_data.items():
             if isinstance(players, list):
                 for player in players:
                     if isinstance(player, dict) and 'name' in player:
-                        player_name = player['name']
-                        
-                        # Find matching player in roster
-                        if player_name in roster:
-                            player['headshot_url'] = roster[player_name]['headshot_url']
-                            player['espn_player_id'] = roster[player_name]['id']
-                        else:
-                            # Fuzzy match
-                            best_match = None
-                            best_score = 0
-                            for roster_name, player_data in roster.items():
-                                score = fuzz.ratio(player_name.lower(), roster_name.lower())
-                                if score > best_score and score > 85:
-                                    best_score = score
-                                    best_match = player_data
-                            
-                            if best_match:
-                                player['headshot_url'] = best_match['headshot_url']
-                                player['espn_player_id'] = best_match['id']
-                            else:
-                                player['headshot_url'] = self.HEADSHOT_FALLBACK
-                                player['espn_player_id'] = None
+                        self._add_headshot(player, roster)
             
             elif isinstance(players, dict) and 'name' in players:
                 # Single player (like QB)
-                player_name = players['name']
-                if player_name in roster:
-                    players['headshot_url'] = roster[player_name]['headshot_url']
-                    players['espn_player_id'] = roster[player_name]['id']
-                else:
-                    players['headshot_url'] = self.HEADSHOT_FALLBACK
-                    players['espn_player_id'] = None
+                self._add_headshot(players, roster)
         
         return players_data
+    
+    def _add_headshot(self, player: Dict, roster: Optional[TeamRoster]):
+        entry = roster.find(player['name']) if roster else None
+        if entry:
+            player['headshot_url'] = entry['headshot_url']
+            player['espn_player_id'] = entry['id']
+        else:
+            player['headshot_url'] = self.HEADSHOT_FALLBACK
+            player['espn_player_id'] = None
+
+
+def known_player_names() -> Dict[object, List[str]]:
+    """Player names our analysis files use, bucketed by team key - the names headshots get resolved for"""
+    player_data, _ = load_player_data()
+    names: Dict[object, List[str]] = {}
+    for players in player_data.values():
+        for player in players:
+            if player.get('name'):
+                names.setdefault(team_key(player.get('team', '')), []).append(player['name'])
+    return names
 
 
-# Test function
+def refresh_rosters(service: ESPNPlayerService, teams: List[str]):
+    """Offline refresh: download rosters and fuzzy-match our player names into each roster's alias map"""
+    names = known_player_names()
+    started = time.perf_counter()
+    refreshed, unmatched = 0, 0
+    for team in teams:
+        team_names = names.get(team_key(team), [])
+        roster = service.refresh_team_roster(team, player_names=team_names)
+        if roster is None:
+            continue
+        refreshed += 1
+        missing = roster.unmatched(team_names)
+        unmatched += len(missing)
+        print(f"   {team}: {len(roster.players)} players, {len(roster.aliases)} aliases, "
+              f"{len(team_names) - len(missing)}/{len(team_names)} known players matched")
+    print(f"✅ Refreshed {refreshed}/{len(teams)} rosters into {service.store_dir} "
+          f"in {time.perf_counter() - started:.1f}s ({unmatched} known players without a headshot)")
+
+
+# Test function (--refresh rebuilds the shared roster store; run it nightly)
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='ESPN roster store / headshot lookup test')
+    parser.add_argument('--refresh', action='store_true', help='download rosters and rebuild their alias maps')
+    parser.add_argument('--teams', help='comma-separated teams to refresh (default: every FBS team)')
+    args = parser.parse_args()
     service = ESPNPlayerService()
     
+    if args.refresh:
+        teams = ([team.strip() for team in args.teams.split(',') if team.strip()] if args.teams
+                 else [team['school'] for team in get_team_directory().teams])
+        refresh_rosters(service, teams)
+        raise SystemExit(0)
+    
     # Test with Ohio State
     print("\n🏈 Testing ESPN Player Service")
     print("=" * 60)
@@ -0,0 +1,253 @@
+"""
+Game Log Store - precomputed per-player game logs for the props engines
+
+get_real_player_game_logs downloaded a team's whole games/players payload and
+walked every game, category, stat type and athlete to find one player's one
+stat, once per prop; enhanced_player_props_generator had no game-level data at
+all and synthesized logs from season totals. build_game_log_store.py now runs
+nightly, flattens every FBS team's box scores once, and writes this store: one
+row per (player, team game) with the game context (week, opponent, home/away,
+result) and one int column per stat in GAME_LOG_STATS. Rows are grouped by
+team and player in week order, so a player's log is a pair of array slices
+found through a dict index; the props engines read it locally and only fall
+back to the REST path for players the store doesn't know.
+
+The file is a plain .npz (numpy arrays only, no pickles) at
+data/player_game_logs.npz; CFB_GAME_LOG_STORE points elsewhere, 'none'
+disables it. A rebuilt file is picked up by running workers on their next
+lookup.
+"""
+import json
+import os
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from log_config import get_logger
+
+logger = get_logger('game_log_store')
+
+GAME_LOG_STORE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'player_game_logs.npz')
+GAME_LOG_STORE_ENV = 'CFB_GAME_LOG_STORE'
+STORE_FORMAT = 1
+
+# (games/players category, stat type) -> stat column; C/ATT feeds completions and attempts
+GAME_LOG_STATS = {
+    ('passing', 'YDS'): 'passing_yards',
+    ('passing', 'TD'): 'passing_tds',
+    ('passing', 'INT'): 'interceptions',
+    ('rushing', 'YDS'): 'rushing_yards',
+    ('rushing', 'TD'): 'rushing_tds',
+    ('rushing', 'CAR'): 'rushing_attempts',
+    ('receiving', 'YDS'): 'receiving_yards',
+    ('receiving', 'TD'): 'receiving_tds',
+    ('receiving', 'REC'): 'receptions',
+}
+COMPLETIONS_ATTEMPTS = ('passing', 'C/ATT')
+STAT_COLUMNS = tuple(GAME_LOG_STATS.values()) + ('completions', 'attempts')
+
+# String columns are stored as codes into one shared string table
+STRING_COLUMNS = ('team', 'player', 'opponent')
+CONTEXT_COLUMNS = ('player_id', 'game_id', 'week', 'opponent_id', 'home', 'win')
+
+
+def _stat_int(value) -> int:
+    """Box score stat as an int, the way the props engine parsed it ('12/20' -> 12, unparseable -> 0)"""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        if '/' in str(value):
+            try:
+                return int(str(value).split('/')[0])
+            except ValueError:
+                return 0
+        return 0
+
+
+def _game_context(team: str, sched: Dict) -> Optional[Dict]:
+    """Week/opponent/home/result of one scheduled game from `team`'s side (None if it wasn't played)"""
+    home = sched.get('home_team', sched.get('homeTeam', ''))
+    away = sched.get('away_team', sched.get('awayTeam', ''))
+    if home == team:
+        opponent, opponent_id, is_home = away, sched.get('away_id', sched.get('awayId')), True
+        our_points = sched.get('home_points', sched.get('homePoints', 0)) or 0
+        opp_points = sched.get('away_points', sched.get('awayPoints', 0)) or 0
+    else:
+        opponent, opponent_id, is_home = home, sched.get('home_id', sched.get('homeId')), False
+        our_points = sched.get('away_points', sched.get('awayPoints', 0)) or 0
+        opp_points = sched.get('home_points', sched.get('homePoints', 0)) or 0
+    if our_points == 0 and opp_points == 0:
+        return None
+    return {
+        'week': sched.get('week', 0),
+        'opponent': opponent,
+        'opponent_id': opponent_id if opponent_id is not None else -1,
+        'home': is_home,
+        'win': our_points > opp_points
+    }
+
+
+def team_game_log_rows(team: str, schedule: List[Dict], player_games: List[Dict]) -> List[Dict]:
+    """Flatten one team's games/players payload into rows - every player gets a row for every played game
+
+    Games the player has no line in get zeros, as get_real_player_game_logs always did.
+    """
+    schedule_by_id = {game.get('id'): game for game in schedule or []}
+    games, players, lines = [], {}, {}
+    for game in player_games or []:
+        context = _game_context(team, schedule_by_id.get(game.get('id'), {}))
+        if context is None:
+            continue
+        context['game_id'] = game.get('id') or -1
+        games.append(context)
+        for team_data in game.get('teams', []):
+            if team_data.get('team') != team:
+                continue
+            for category in team_data.get('categories', []):
+                category_name = category.get('name', '')
+                for stat_type in category.get('types', []):
+                    source = (category_name, stat_type.get('name'))
+                    if source not in GAME_LOG_STATS and source != COMPLETIONS_ATTEMPTS:
+                        continue
+                    for athlete in stat_type.get('athletes', []):
+                        name = athlete.get('name')
+                        if not name:
+                            continue
+                        players.setdefault(name, _stat_int(athlete.get('id')) or -1)
+                        line = lines.setdefault((name, len(games) - 1), {})
+                        if source == COMPLETIONS_ATTEMPTS:
+                            parts = str(athlete.get('stat', '0')).split('/')
+                            line['completions'] = _stat_int(parts[0])
+                            line['attempts'] = _stat_int(parts[1]) if len(parts) > 1 else 0
+                        else:
+                            line[GAME_LOG_STATS[source]] = _stat_int(athlete.get('stat', '0'))
+
+    # Week order, ties in payload order (the engine's stable sort by week)
+    order = sorted(range(len(games)), key=lambda index: games[index]['week'])
+    rows = []
+    for name in sorted(players):
+        for index in order:
+            line = lines.get((name, index), {})
+            rows.append(dict(games[index], team=team, player=name, player_id=players[name],
+                             **{column: line.get(column, 0) for column in STAT_COLUMNS}))
+    return rows
+
+
+class GameLogStore:
+    """Columnar player game logs with (team, player) and player id indexes"""
+
+    def __init__(self, columns: Dict[str, np.ndarray], strings: np.ndarray, meta: Dict):
+        self.columns = columns
+        self.strings = strings.tolist()
+        self.meta = meta
+        self.year = meta.get('year')
+        team, player = columns['team'], columns['player']
+
+        # Rows are grouped by (team, player): index each run's [start, stop)
+        self.index: Dict[Tuple[str, str], Tuple[int, int]] = {}
+        self.players_by_id: Dict[int, List[Tuple[str, str]]] = {}
+        self.teams: Dict[str, List[str]] = {}
+        if len(team):
+            starts = np.flatnonzero(np.r_[True, (team[1:] != team[:-1]) | (player[1:] != player[:-1])])
+            stops = np.r_[starts[1:], len(team)]
+            for start, stop in zip(starts.tolist(), stops.tolist()):
+                key = (self.strings[team[start]], self.strings[player[start]])
+                self.index[key] = (start, stop)
+                self.teams.setdefault(key[0], []).append(key[1])
+                self.players_by_id.setdefault(int(columns['player_id'][start]), []).append(key)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Dict], meta: Dict) -> 'GameLogStore':
+        rows = list(rows)
+        codes: Dict[str, int] = {}
+        columns = {
+            name: np.array([codes.setdefault(str(row[name]), len(codes)) for row in rows], dtype=np.int32)
+            for name in STRING_COLUMNS
+        }
+        columns['player_id'] = np.array([row['player_id'] for row in rows], dtype=np.int64)
+        columns['game_id'] = np.array([row['game_id'] for row in rows], dtype=np.int64)
+        columns['week'] = np.array([row['week'] for row in rows], dtype=np.int16)
+        columns['opponent_id'] = np.array([row['opponent_id'] for row in rows], dtype=np.int64)
+        columns['home'] = np.array([row['home'] for row in rows], dtype=bool)
+        columns['win'] = np.array([row['win'] for row in rows], dtype=bool)
+        for name in STAT_COLUMNS:
+            columns[name] = np.array([row[name] for row in rows], dtype=np.int32)
+        strings = np.array(list(codes), dtype=str) if codes else np.array([], dtype='U1')
+        return cls(columns, strings, dict(meta, format=STORE_FORMAT, rows=len(rows)))
+
+    def save(self, path: str) -> int:
+        """Write the store atomically; returns bytes written"""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, strings=np.array(self.strings, dtype=str), meta=np.array(json.dumps(self.meta)),
+                     **self.columns)
+        os.replace(tmp_path, path)
+        return os.path.getsize(path)
+
+    @classmethod
+    def load(cls, path: str) -> 'GameLogStore':
+        with np.load(path, allow_pickle=False) as data:
+            meta = json.loads(str(data['meta']))
+            if meta.get('format') != STORE_FORMAT:
+                raise ValueError(f"unsupported game log store format {meta.get('format')!r}")
+            columns = {name: data[name] for name in STRING_COLUMNS + CONTEXT_COLUMNS + STAT_COLUMNS}
+            return cls(columns, data['strings'], meta)
+
+    def __len__(self) -> int:
+        return len(self.columns['week'])
+
+    def __contains__(self, key: Tuple[str, str]) -> bool:
+        return key in self.index
+
+    def has_team(self, team: str) -> bool:
+        return team in self.teams
+
+    def player_logs(self, player: str, team: str) -> Optional[Dict[str, np.ndarray]]:
+        """The player's rows in week order (column name -> array slice), or None if not in the store"""
+        span = self.index.get((team, player))
+        if span is None:
+            return None
+        start, stop = span
+        return {name: values[start:stop] for name, values in self.columns.items()}
+
+    def opponent_names(self, logs: Dict[str, np.ndarray]) -> List[str]:
+        return [self.strings[code] for code in logs['opponent'].tolist()]
+
+
+def game_log_store_path(path: Optional[str] = None) -> Optional[str]:
+    """Explicit path, else CFB_GAME_LOG_STORE, else data/player_game_logs.npz (None = disabled)"""
+    path = path or os.environ.get(GAME_LOG_STORE_ENV) or GAME_LOG_STORE_PATH
+    return None if path.lower() == 'none' else path
+
+
+# Singleton instance, reloaded when the nightly job replaces the file
+_game_log_store = None
+_game_log_store_mtime = None
+_game_log_store_lock = threading.Lock()
+
+def get_game_log_store() -> Optional[GameLogStore]:
+    """The process-wide store, or None when there is no (valid) store file"""
+    global _game_log_store, _game_log_store_mtime
+    path = game_log_store_path()
+    try:
+        mtime = os.stat(path).st_mtime if path else None
+    except OSError:
+        mtime = None
+    if mtime == _game_log_store_mtime:
+        return _game_log_store
+    with _game_log_store_lock:
+        if mtime != _game_log_store_mtime:
+            store = None
+            if mtime is not None:
+                started = time.perf_counter()
+                try:
+                    store = GameLogStore.load(path)
+                    logger.info("✅ Game log store loaded: %s rows, %s players (%.2fs)",
+                                len(store), len(store.index), time.perf_counter() - started)
+                except (OSError, ValueError, KeyError) as e:
+                    logger.warning("⚠️ Ignoring game log store %s: %s", path, e)
+            _game_log_store, _game_log_store_mtime = store, mtime
+    return _game_log_store
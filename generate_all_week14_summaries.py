@@ -7,44 +7,14 @@ import json
 import asyncio
 import os
 from graphqlpredictor import LightningPredictor
+from team_directory import get_team_directory
 
 def get_team_id(team_name):
-    """Convert team name to team ID using fbs.json data"""
-    if isinstance(team_name, int):
-        return team_name  # Already an ID
-    
-    team_name_lower = team_name.lower().strip()
-    
-    # Load teams from fbs.json
-    try:
-        with open('fbs.json', 'r') as f:
-            teams_data = json.load(f)
-        
-        # First pass: Look for exact matches
-        for team in teams_data:
-            # Check exact school name match
-            if team['school'].lower() == team_name_lower:
-                return team['id']
-            # Check exact mascot name match
-            if team['mascot'].lower() == team_name_lower:
-                return team['id']
-        
-        # Second pass: Look for exact word matches
-        for team in teams_data:
-            school_words = team['school'].lower().split()
-            if team_name_lower in school_words:
-                return team['id']
-        
-        # Third pass: Look for partial matches (most permissive)
-        for team in teams_data:
-            if team_name_lower in team['school'].lower():
-                return team['id']
-            
-    except Exception as e:
-        print(f"Error loading fbs.json: {e}")
-        raise ValueError(f"Could not load team data from fbs.json: {e}")
-    
-    raise ValueError(f"Team '{team_name}' not found in fbs.json")
+    """Convert team name to team ID using the shared fbs.json team directory"""
+    team_id = get_team_directory().resolve(team_name)
+    if team_id is None:
+        raise ValueError(f"Team '{team_name}' not found in fbs.json")
+    return team_id
 
 async def generate_all_summaries():
     """Generate summaries for all games in current week"""
@@ -65,6 +35,20 @@ async def generate_all_summaries():
     # Store game results for sorting
     game_results = []
     
+    # Predict the whole slate concurrently up front (shared team data is fetched once)
+    matchups, slate_positions, lookup_errors = [], {}, {}
+    for idx, game in enumerate(all_games, 1):
+        try:
+            matchups.append((get_team_id(game['homeTeam']['name']), get_team_id(game['awayTeam']['name'])))
+            slate_positions[len(matchups) - 1] = idx
+        except ValueError as e:
+            lookup_errors[idx] = e
+    
+    print(f"🚀 Predicting {len(matchups)} games concurrently...")
+    slate_results = dict(lookup_errors)
+    async for index, _, _, prediction, error in predictor.predict_games(matchups):
+        slate_results[slate_positions[index]] = error if error is not None else prediction
+    
     # Process each game
     for idx, game in enumerate(all_games, 1):
         home_team = game['homeTeam']['name']
@@ -73,12 +57,10 @@ async def generate_all_summaries():
         print(f"\n[{idx}/{len(all_games)}] Analyzing {away_team} @ {home_team}...")
         
         try:
-            # Convert team names to IDs
-            home_team_id = get_team_id(home_team)
-            away_team_id = get_team_id(away_team)
-            
-            # Run prediction
-            prediction = await predictor.predict_game(home_team_id, away_team_id)
+            # Prediction (or the error it raised) from the concurrent slate run
+            prediction = slate_results[idx]
+            if isinstance(prediction, Exception):
+                raise prediction
             
             # Extract key data
             home_win_prob = prediction.home_win_prob * 100
@@ -463,6 +445,7 @@ async def generate_all_summaries():
     
     print(f"\n✅ Complete! Output saved to {output_file}")
     print(f"📊 Total games analyzed: {len(all_games)}")
+    print(predictor.query_cache.summary())
 
 if __name__ == "__main__":
     asyncio.run(generate_all_summaries())
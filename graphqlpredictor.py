@@ -1,20 +1,42 @@
 import asyncio
 import aiohttp
+import contextvars
+import copy
+import glob
 import json
 import os
-from typing import Dict, List, Tuple, Optional, Any
-from dataclasses import dataclass
+import re
+import threading
+import time
+from typing import AsyncIterator, Callable, Dict, List, Mapping, Tuple, Optional, Any
+from dataclasses import dataclass, field, replace
+from contextlib import asynccontextmanager
 from datetime import datetime
 import math
 import warnings
 import statistics
 import logging
-# import numpy as np  # Available if needed for future enhancements
+import numpy as np
+from async_runtime import gather_or_cancel
+from query_cache import get_query_cache
+from prediction_cache import lines_fingerprint
+from static_snapshot import SNAPSHOT_FILENAME, open_snapshot, source_fingerprint, write_snapshot
+from lazy_static_data import LazyStaticData
+from drive_analytics import (TEAM_SUMMARY_COLUMNS, DriveColumns, aggregate_by_team, drive_metric_fields,
+                             team_drive_summaries)
+from log_config import get_logger, lazy_format
+from team_directory import get_team_directory
+from team_season import TeamSeason
+from model_params import load_model_params
+from player_index import PlayerIndex, load_player_data, player_source_paths
+from prediction_pipeline import (GameFeatures, ScoringParams, feature_matrix, feature_vector,
+                                 platt_calibrate, score_features, score_row)
 # from scipy.optimize import minimize  # For future parameter optimization
 # from scipy.special import expit  # logistic sigmoid function
 
 # Configure logging for betting analysis
 betting_logger = logging.getLogger('betting_analysis')
+logger = get_logger('predictor')
 
 class DataIntegrityWarning(UserWarning):
     """Warning for spread/moneyline inconsistencies"""
@@ -24,6 +46,9 @@ class DataSanityWarning(UserWarning):
     """Warning for extreme value discrepancies"""
     pass
 
+class QueryAbandoned(Exception):
+    """The caller posting a shared query was cancelled - waiters retry instead of being cancelled too"""
+
 @dataclass
 class ArbitrageOpportunity:
     """Represents a detected arbitrage betting opportunity"""
@@ -47,6 +72,7 @@ class TeamMetrics:
     sos_rating: float
     consistency_score: float
     recent_vs_early_differential: float
+    temporal_performance: float = 0.5  # Dixon-Coles weighted postgame win probability
 
 @dataclass
 class ComprehensiveTeamStats:
@@ -413,6 +439,22 @@ class GamePrediction:
     game_date: Optional[str] = None
     game_time: Optional[str] = None
 
+@dataclass
+class DataRelease:
+    """One generation of weekly data; each prediction pins the release it started on"""
+    week: int
+    data_dir: str
+    static_data: Mapping = field(default_factory=dict)
+    schedule_index: Optional[Dict[Tuple[int, int], int]] = None
+    player_index: Optional[PlayerIndex] = None
+    loaded_at: float = field(default_factory=time.time)
+
+# Week served when weekly_updates/ has no week_N folders
+DEFAULT_DATA_WEEK = 15
+
+# Dataclasses stored column-wise in the compiled static snapshot
+STATIC_DATACLASSES = {cls.__name__: cls for cls in (ComprehensiveTeamStats, CoachingMetrics, DriveMetrics)}
+
 class FixedBettingAnalyzer:
     """Fixed betting analysis with proper normalization and edge calculations"""
     
@@ -1281,8 +1323,14 @@ class LightningPredictor:
     
     def __init__(self, api_key: str):
         self.api_key = api_key
-        self.base_url = "https://graphql.collegefootballdata.com/v1/graphql"
-        self.current_week = 15
+        self.base_url = os.environ.get('CFB_GRAPHQL_URL', "https://graphql.collegefootballdata.com/v1/graphql")
+        
+        # Weekly data generation (week, data dir, static data) - swapped as a whole on hot reload
+        # Boot on the newest weekly_updates/week_N folder so restarted workers don't fall back a week
+        week = self._newest_data_week()
+        self._release = DataRelease(week=week, data_dir=self._weekly_data_dir(week))
+        self._pinned_release = contextvars.ContextVar(f'pinned_release_{id(self)}', default=None)
+        self._player_index_lock = threading.Lock()
         self.current_year = 2025
         
         # Dixon-Coles decay parameter (tuned via cross-validation)
@@ -1312,222 +1360,275 @@ class LightningPredictor:
             'balanced_game': 200       # 50% composite, 25% EPA
         }
         
-        self.WEIGHTS = self.BASE_WEIGHTS.copy()  # Will be overridden per prediction
+        # Component weights per ELO tier (prediction_pipeline.dynamic_weights then applies
+        # the consensus/SOS adjustments and renormalizes per game)
+        self.TIER_WEIGHTS = {
+            'extreme_mismatch': {'composite_ratings': 0.65, 'opponent_adjusted_metrics': 0.15, 'defensive_metrics': 0.12,
+                                 'key_player_impact': 0.05, 'market_consensus': 0.02, 'contextual_factors': 0.01},
+            'large_mismatch': {'composite_ratings': 0.60, 'opponent_adjusted_metrics': 0.18, 'defensive_metrics': 0.11,
+                               'key_player_impact': 0.07, 'market_consensus': 0.03, 'contextual_factors': 0.01},
+            'moderate_mismatch': {'composite_ratings': 0.55, 'opponent_adjusted_metrics': 0.20, 'defensive_metrics': 0.10,
+                                  'key_player_impact': 0.08, 'market_consensus': 0.05, 'contextual_factors': 0.02},
+            'balanced_game': {'composite_ratings': 0.50, 'opponent_adjusted_metrics': 0.25, 'defensive_metrics': 0.10,
+                              'key_player_impact': 0.08, 'market_consensus': 0.05, 'contextual_factors': 0.02},
+            'even_matchup': {'composite_ratings': 0.40, 'opponent_adjusted_metrics': 0.35, 'defensive_metrics': 0.10,
+                             'key_player_impact': 0.08, 'market_consensus': 0.05, 'contextual_factors': 0.02}
+        }
+        
+        self.WEIGHTS = self.BASE_WEIGHTS.copy()  # Base weights; per-game weights come from score_features
+
+        # Calibrated overrides for the values above (calibration.py -> model_params.json), when fitted
+        self.model_params_version = None
+        self.apply_model_params(load_model_params())
+
+        # Per-leg timeouts (seconds) for the concurrent GraphQL fan-out in predict_game
+        self.LEG_TIMEOUTS = {
+            'main': 30.0,    # Team/global/matchup fragments - prediction cannot proceed without them
+            'lines': 8.0,    # Market lines - prediction degrades gracefully without them
+            'media': 8.0     # Broadcast info - display only
+        }
+        
+        # Retries for rate-limited (429/503) GraphQL calls, and default slate concurrency for predict_games
+        self.RATE_LIMIT_RETRIES = 3
+        self.BATCH_CONCURRENCY = int(os.environ.get('CFB_BATCH_CONCURRENCY', 8))
+        
+        # cache key -> future for GraphQL requests currently on the wire (single-flight)
+        self._inflight_queries = {}
+        
+        # (home, away, week) -> (expires_at, lines fingerprint) - lets a repeat prediction build its
+        # cache key locally instead of resolving the game and re-reading its lines every request
+        self.LINES_FINGERPRINT_TTL = float(os.environ.get('CFB_LINES_FINGERPRINT_TTL', 60))
+        self._lines_fingerprints = {}
+        
+        # Optional pooled session owned by a long-lived event loop (see async_runtime.py)
+        self.shared_session = None
+        self._shared_session_loop = None
+        
+        # TTL + week-aware cache for GraphQL responses (shared across predictors, see query_cache.py)
+        self.query_cache = get_query_cache()
+        self.query_cache.set_week(self.current_week)
         
-        # Load all static data files for comprehensive analysis
+        # Load all static data (compiled snapshot when current, JSON files otherwise)
+        self.OPTIONAL_STATIC_SOURCES = ('backtesting',)  # static inputs the predictor can run without
         self.static_data = self._load_all_static_data()
-        print("✅ Static data loaded successfully!")
+        
+        # Sections load on first use; CFB_PREWARM_SECTIONS ('all' or comma-separated names) loads some now
+        prewarm_times = self.static_data.prewarm(os.environ.get('CFB_PREWARM_SECTIONS')) if self.static_data else {}
+        if prewarm_times:
+            logger.debug("✅ Prewarmed static data: %s (%.2fs)", ', '.join(prewarm_times), sum(prewarm_times.values()))
+        logger.debug("✅ Static data ready (sections load on first use)")
+
+    @property
+    def data_release(self) -> 'DataRelease':
+        """The weekly data generation this call should use (pinned for in-flight predictions)"""
+        return self._pinned_release.get() or self._release
+
+    @property
+    def current_week(self) -> int:
+        return self.data_release.week
+
+    @current_week.setter
+    def current_week(self, week: int):
+        self._release = replace(self._release, week=week, schedule_index=None)
+
+    @property
+    def static_data(self) -> Mapping:
+        return self.data_release.static_data
+
+    @static_data.setter
+    def static_data(self, static_data: Mapping):
+        self._release = replace(self._release, static_data=static_data)
+
+    @property
+    def static_data_dir(self) -> str:
+        return self.data_release.data_dir
+
+    def _weekly_data_dir(self, week: int) -> str:
+        return os.path.join(os.path.dirname(__file__), 'weekly_updates', f'week_{week}')
 
-    def _load_all_static_data(self) -> Dict:
-        """Load all static JSON data files for comprehensive team analysis"""
+    def available_data_weeks(self) -> List[int]:
+        """Weeks with a weekly_updates/week_N data directory"""
+        root = os.path.join(os.path.dirname(__file__), 'weekly_updates')
+        weeks = []
+        for name in os.listdir(root):
+            match = re.fullmatch(r'week_(\d+)', name)
+            if match and os.path.isdir(os.path.join(root, name)):
+                weeks.append(int(match.group(1)))
+        return sorted(weeks)
+
+    def _newest_data_week(self) -> int:
         try:
-            # Base path for data files (week_15 for most stats)
-            base_path = os.path.join(os.path.dirname(__file__), 'weekly_updates', 'week_15')
-            # Coaching data path (load from main data folder for latest updates)
-            coaching_base_path = os.path.join(os.path.dirname(__file__), 'data')
-            
-            # Load comprehensive team stats
-            with open(os.path.join(base_path, 'fbs_teams_stats_only.json'), 'r') as f:
-                fbs_stats = json.load(f)
-            
-            # Load Power 5 efficiency data
-            with open(os.path.join(base_path, 'react_power5_efficiency.json'), 'r') as f:
-                power5_efficiency = json.load(f)
-            
-            # Load drive-level data
-            with open(os.path.join(base_path, 'power5_drives_only.json'), 'r') as f:
-                drive_data = json.load(f)
-            
-            # Load historical win probabilities for calibration
-            with open(os.path.join(base_path, 'complete_win_probabilities.json'), 'r') as f:
-                historical_probs = json.load(f)
-            
-            # Load AP and Coaches poll data
-            with open(os.path.join(base_path, 'ap.json'), 'r') as f:
-                ap_polls = json.load(f)
-            
-            with open(os.path.join(base_path, 'coaches_simplified_ranked.json'), 'r') as f:
-                coaches_polls = json.load(f)
-            
-            # Load conference and ranking data
-            with open(os.path.join(base_path, 'react_fbs_conferences.json'), 'r') as f:
-                conference_data = json.load(f)
-            
-            with open(os.path.join(base_path, 'react_fbs_team_rankings.json'), 'r') as f:
-                team_rankings = json.load(f)
-            
-            # Load season summaries
-            with open(os.path.join(base_path, 'team_season_summaries_clean.json'), 'r') as f:
-                season_summaries = json.load(f)
-            
-            # Load elite coaching data with ADVANCED RANKINGS (talent context, trends, big game performance)
-            coaches_path = os.path.join(coaching_base_path, 'coaches_advanced_rankings.json')
-            with open(coaches_path, 'r') as f:
-                coaches_data = json.load(f)
-            print(f"✅ Loaded ADVANCED coaching rankings from: {coaches_path}")
-            
-            # ENHANCED DATA LOADING - New files for improved accuracy
-            
-            # Load team-organized Power 5 drives for better drive analysis
-            with open(os.path.join(base_path, 'react_power5_teams.json'), 'r') as f:
-                power5_teams_drives = json.load(f)
-            
-            # Load structured offensive stats with metadata
-            with open(os.path.join(base_path, 'fbs_offensive_stats.json'), 'r') as f:
-                structured_offensive_stats = json.load(f)
-            
-            # Load structured defensive stats with metadata
-            with open(os.path.join(base_path, 'fbs_defensive_stats.json'), 'r') as f:
-                structured_defensive_stats = json.load(f)
-            
-            # Load backtesting data if available for enhanced calibration
-            backtesting_data = {}
-            try:
-                # Use weekly_updates/week_15 comprehensive ratings
-                backtesting_path = os.path.join(os.path.dirname(__file__), 'weekly_updates', 'week_15')
-                ratings_file = 'all_fbs_ratings_comprehensive_2025_20251203_054653.json'
-                
-                ratings_path = os.path.join(backtesting_path, ratings_file)
-                if os.path.exists(ratings_path):
-                    with open(ratings_path, 'r') as f:
-                        backtesting_data = json.load(f)
-                    print(f"✅ Loaded Week 15 ratings data from {ratings_file}")
-                else:
-                    print(f"⚠️  Week 15 ratings file not found at {ratings_path}")
-            except Exception as e:
-                print(f"⚠️  Week 15 ratings data not found - using standard calibration: {e}")
-            
-            # Process and organize data
-            processed_backtesting = self._process_backtesting_data(backtesting_data)
-            
-            return {
-                'team_stats': self._process_team_stats(fbs_stats, processed_backtesting),
-                'efficiency': power5_efficiency,
-                'drives': self._process_drive_data(drive_data),
-                'historical_probs': historical_probs,
-                'ap_polls': ap_polls,
-                'coaches_polls': coaches_polls,
-                'conferences': conference_data,
-                'rankings': team_rankings,
-                'season_summaries': season_summaries,
-                'team_name_to_id': self._create_team_lookup(fbs_stats),
-                'coaches_raw': coaches_data,
-                'coaching_data': self._extract_coaching_data(coaches_data),
-                # Enhanced data additions
-                'power5_teams_drives': self._process_team_drives(power5_teams_drives),
-                'structured_offensive': self._process_structured_offensive(structured_offensive_stats),
-                'structured_defensive': self._process_structured_defensive(structured_defensive_stats),
-                'backtesting_ratings': processed_backtesting
-            }
-        except Exception as e:
-            print(f"⚠️  Warning: Could not load static data files: {e}")
-            print("   Prediction will work with real-time data only")
+            weeks = self.available_data_weeks()
+        except OSError:
+            weeks = []
+        return weeks[-1] if weeks else DEFAULT_DATA_WEEK
+
+    def _static_source_paths(self, data_dir: Optional[str] = None) -> Dict[str, str]:
+        """Source JSON file behind each raw static input"""
+        base_path = data_dir or self.static_data_dir
+        # Coaching data path (load from main data folder for latest updates)
+        coaching_base_path = os.path.join(os.path.dirname(__file__), 'data')
+        # Ratings exports are timestamped - use the newest one in the week's folder
+        ratings_exports = sorted(glob.glob(os.path.join(base_path, 'all_fbs_ratings_comprehensive_*.json')))
+        return {
+            'fbs_stats': os.path.join(base_path, 'fbs_teams_stats_only.json'),
+            'power5_efficiency': os.path.join(base_path, 'react_power5_efficiency.json'),
+            'drive_data': os.path.join(base_path, 'power5_drives_only.json'),
+            'historical_probs': os.path.join(base_path, 'complete_win_probabilities.json'),
+            'ap_polls': os.path.join(base_path, 'ap.json'),
+            'coaches_polls': os.path.join(base_path, 'coaches_simplified_ranked.json'),
+            'conferences': os.path.join(base_path, 'react_fbs_conferences.json'),
+            'rankings': os.path.join(base_path, 'react_fbs_team_rankings.json'),
+            'season_summaries': os.path.join(base_path, 'team_season_summaries_clean.json'),
+            'coaches': os.path.join(coaching_base_path, 'coaches_advanced_rankings.json'),
+            'power5_teams_drives': os.path.join(base_path, 'react_power5_teams.json'),
+            'structured_offensive': os.path.join(base_path, 'fbs_offensive_stats.json'),
+            'structured_defensive': os.path.join(base_path, 'fbs_defensive_stats.json'),
+            'backtesting': ratings_exports[-1] if ratings_exports else os.path.join(
+                base_path, 'all_fbs_ratings_comprehensive.json')
+        }
+
+    def _static_snapshot_path(self, data_dir: Optional[str] = None) -> Optional[str]:
+        """Compiled snapshot location (CFB_STATIC_SNAPSHOT overrides, 'off' disables)
+
+        The override is scoped per week (/x/static.snap -> /x/static.week_16.snap), otherwise every
+        week's rebuild would read and overwrite the same file.
+        """
+        override = os.environ.get('CFB_STATIC_SNAPSHOT')
+        if override == 'off':
+            return None
+        data_dir = data_dir or self.static_data_dir
+        if not override:
+            return os.path.join(data_dir, SNAPSHOT_FILENAME)
+        root, ext = os.path.splitext(override)
+        return f"{root}.{os.path.basename(os.path.normpath(data_dir))}{ext}"
+
+    def _load_all_static_data(self, data_dir: Optional[str] = None) -> Dict:
+        """Static data as a lazy mapping - each section loads from the snapshot or JSON on first use"""
+        data_dir = data_dir or self.static_data_dir
+        snapshot_path = self._static_snapshot_path(data_dir)
+        if snapshot_path:
+            snapshot = open_snapshot(snapshot_path, source_fingerprint(self._static_source_paths(data_dir).values()))
+            if snapshot is not None:
+                logger.debug("⚡ Mapped static data snapshot (%s sections, week %s)", len(snapshot.section_names), snapshot.week)
+                return LazyStaticData({
+                    name: (lambda data, name=name: snapshot.load_section(name, STATIC_DATACLASSES))
+                    for name in snapshot.section_names
+                })
+
+        # Keep the all-or-nothing contract: a missing required file disables static data entirely
+        missing = [
+            os.path.basename(path) for key, path in self._static_source_paths(data_dir).items()
+            if key not in self.OPTIONAL_STATIC_SOURCES and not os.path.exists(path)
+        ]
+        if missing:
+            logger.warning("⚠️  Warning: Could not load static data files: missing %s", ', '.join(missing))
+            logger.debug("   Prediction will work with real-time data only")
             return {}
+        return LazyStaticData(self._static_section_loaders(data_dir), defaults={'season_summaries': []})
 
-    def _calculate_dynamic_weights(self, home_elo: float, away_elo: float, 
-                                   home_ratings: Dict, away_ratings: Dict,
-                                   home_sos_rank: int, away_sos_rank: int) -> Dict[str, float]:
+    def compile_static_snapshot(self, path: Optional[str] = None, static_data: Optional[Dict] = None,
+                                data_dir: Optional[str] = None) -> int:
+        """Write processed static data (rebuilt from the JSON files unless given) as a snapshot
+
+        Returns the snapshot size in bytes, or 0 when there was no data to write.
         """
-        Calculate dynamic weights based on matchup characteristics.
-        Adjusts weights for mismatches, rating consensus, and opponent quality.
+        data_dir = data_dir or self.static_data_dir
+        path = path or self._static_snapshot_path(data_dir) or os.path.join(data_dir, SNAPSHOT_FILENAME)
+        if static_data is None:
+            static_data = LazyStaticData(self._static_section_loaders(data_dir), defaults={'season_summaries': []})
+        if not static_data:
+            return 0
+        fingerprint = source_fingerprint(self._static_source_paths(data_dir).values())
+        week_match = re.search(r'week_(\d+)$', os.path.normpath(data_dir))
+        week = int(week_match.group(1)) if week_match else self.current_week
+        return write_snapshot(path, dict(static_data.items()), fingerprint, week)
+
+    def build_data_release(self, week: Optional[int] = None) -> 'DataRelease':
+        """Load a week's static data (newest week by default) without touching the live release
+
+        Recompiles the week's snapshot when its sources changed and prewarms every
+        section, so the release is fully hot by the time it is activated.
         """
-        elo_diff = abs(home_elo - away_elo)
-        
-        # Start with base weights
-        weights = self.BASE_WEIGHTS.copy()
-        
-        # STEP 1: Adjust for ELO mismatch severity
-        if elo_diff >= self.ELO_THRESHOLDS['extreme_mismatch']:
-            # Extreme mismatch (750+): Trust ratings heavily
-            weights['composite_ratings'] = 0.65
-            weights['opponent_adjusted_metrics'] = 0.15
-            weights['defensive_metrics'] = 0.12
-            weights['key_player_impact'] = 0.05
-            weights['market_consensus'] = 0.02
-            weights['contextual_factors'] = 0.01
-            print(f"   🔥 EXTREME MISMATCH (ELO diff {elo_diff:.0f}): Composite boosted to 65%")
-            
-        elif elo_diff >= self.ELO_THRESHOLDS['large_mismatch']:
-            # Large mismatch (600-749): Heavily favor ratings
-            weights['composite_ratings'] = 0.60
-            weights['opponent_adjusted_metrics'] = 0.18
-            weights['defensive_metrics'] = 0.11
-            weights['key_player_impact'] = 0.07
-            weights['market_consensus'] = 0.03
-            weights['contextual_factors'] = 0.01
-            print(f"   ⚡ LARGE MISMATCH (ELO diff {elo_diff:.0f}): Composite boosted to 60%")
-            
-        elif elo_diff >= self.ELO_THRESHOLDS['moderate_mismatch']:
-            # Moderate mismatch (400-599): Favor ratings
-            weights['composite_ratings'] = 0.55
-            weights['opponent_adjusted_metrics'] = 0.20
-            weights['defensive_metrics'] = 0.10
-            weights['key_player_impact'] = 0.08
-            weights['market_consensus'] = 0.05
-            weights['contextual_factors'] = 0.02
-            print(f"   📊 MODERATE MISMATCH (ELO diff {elo_diff:.0f}): Using base weights (55% composite)")
-            
-        elif elo_diff >= self.ELO_THRESHOLDS['balanced_game']:
-            # Small advantage (200-399): Balance ratings and performance
-            weights['composite_ratings'] = 0.50
-            weights['opponent_adjusted_metrics'] = 0.25
-            weights['defensive_metrics'] = 0.10
-            weights['key_player_impact'] = 0.08
-            weights['market_consensus'] = 0.05
-            weights['contextual_factors'] = 0.02
-            print(f"   ⚖️  SMALL ADVANTAGE (ELO diff {elo_diff:.0f}): Balanced weighting (50/25)")
-            
-        else:
-            # Even matchup (<200): Recent performance matters more
-            weights['composite_ratings'] = 0.40
-            weights['opponent_adjusted_metrics'] = 0.35
-            weights['defensive_metrics'] = 0.10
-            weights['key_player_impact'] = 0.08
-            weights['market_consensus'] = 0.05
-            weights['contextual_factors'] = 0.02
-            print(f"   🤝 EVEN MATCHUP (ELO diff {elo_diff:.0f}): EPA weighted higher (35%)")
-        
-        # STEP 2: Check rating consensus (all 4 systems agree)
-        home_fpi = home_ratings.get('fpi', 0)
-        away_fpi = away_ratings.get('fpi', 0)
-        home_sp = home_ratings.get('sp_overall', 0)
-        away_sp = away_ratings.get('sp_overall', 0)
-        home_srs = home_ratings.get('srs', 0)
-        away_srs = away_ratings.get('srs', 0)
-        
-        fpi_diff = abs(home_fpi - away_fpi)
-        sp_diff = abs(home_sp - away_sp)
-        srs_diff = abs(home_srs - away_srs)
-        elo_normalized = elo_diff / 35  # Normalize to similar scale
-        
-        # Calculate agreement (all systems within 15% of each other)
-        diffs = [elo_normalized, fpi_diff, sp_diff, srs_diff]
-        avg_diff = sum(diffs) / len(diffs)
-        variance = sum((d - avg_diff)**2 for d in diffs) / len(diffs)
-        consensus = 1.0 - min(variance / (avg_diff + 1), 0.3)  # 0.7-1.0 scale
-        
-        if consensus > 0.90:
-            # All systems strongly agree - boost composite
-            weights['composite_ratings'] *= 1.10
-            weights['opponent_adjusted_metrics'] *= 0.90
-            print(f"   🎯 RATING CONSENSUS {consensus:.0%}: Composite boosted +10%")
-        
-        # STEP 3: Strength of schedule adjustment
-        # If favorite has tough SOS (rank < 40), boost their EPA credibility
-        favorite_sos = min(home_sos_rank, away_sos_rank)
-        underdog_sos = max(home_sos_rank, away_sos_rank)
-        
-        if favorite_sos < 40 and underdog_sos > 80:
-            # Favorite played tough schedule, underdog played weak - trust composite more
-            weights['composite_ratings'] *= 1.05
-            weights['opponent_adjusted_metrics'] *= 0.95
-            print(f"   📅 SOS ADJUSTMENT: Favorite SOS #{favorite_sos}, Underdog #{underdog_sos} - Composite +5%")
-        
-        # STEP 4: Normalize weights to sum to 1.0
-        total = sum(weights.values())
-        weights = {k: v/total for k, v in weights.items()}
-        
-        return weights
+        if week is None:
+            weeks = self.available_data_weeks()
+            week = weeks[-1] if weeks else self._release.week
+        data_dir = self._weekly_data_dir(week)
+        if not os.path.isdir(data_dir):
+            raise ValueError(f"No weekly data directory for week {week}: {data_dir}")
+
+        snapshot_path = self._static_snapshot_path(data_dir)
+        if snapshot_path and open_snapshot(snapshot_path, source_fingerprint(self._static_source_paths(data_dir).values())) is None:
+            try:
+                if self.compile_static_snapshot(snapshot_path, data_dir=data_dir):
+                    logger.debug("✅ Compiled static snapshot for week %s", week)
+            except Exception as e:
+                logger.warning("⚠️  Could not compile snapshot for week %s - using JSON files: %s", week, e)
+
+        static_data = self._load_all_static_data(data_dir)
+        if static_data:
+            static_data.prewarm('all')
+        return DataRelease(week=week, data_dir=data_dir, static_data=static_data,
+                           player_index=self._build_player_index(data_dir))
+
+    def activate_data_release(self, release: 'DataRelease') -> 'DataRelease':
+        """Point new predictions at `release` (one reference flip); in-flight ones keep their pinned release"""
+        previous = self._release
+        self._release = release
+        self.query_cache.set_week(release.week)
+        logger.debug("🔄 Static data switched from week %s to week %s (%s)", previous.week, release.week, release.data_dir)
+        return previous
+
+    def _read_static_source(self, key: str, data_dir: str):
+        with open(self._static_source_paths(data_dir)[key], 'r') as f:
+            return json.load(f)
+
+    def _load_coaches_raw(self, data_dir: str) -> List[Dict]:
+        """Elite coaching data with ADVANCED RANKINGS (talent context, trends, big game performance)"""
+        coaches_data = self._read_static_source('coaches', data_dir)
+        logger.debug("✅ Loaded ADVANCED coaching rankings from: %s", self._static_source_paths(data_dir)['coaches'])
+        return coaches_data
+
+    def _load_backtesting_ratings(self, data_dir: str) -> Dict[str, Dict]:
+        """Comprehensive ratings export for enhanced calibration (optional)"""
+        backtesting_data = {}
+        try:
+            ratings_path = self._static_source_paths(data_dir)['backtesting']
+            ratings_file = os.path.basename(ratings_path)
+            if os.path.exists(ratings_path):
+                with open(ratings_path, 'r') as f:
+                    backtesting_data = json.load(f)
+                logger.debug("✅ Loaded ratings data from %s", ratings_file)
+            else:
+                logger.warning("⚠️  Ratings file not found at %s", ratings_path)
+        except Exception as e:
+            logger.warning("⚠️  Ratings data not found - using standard calibration: %s", e)
+        return self._process_backtesting_data(backtesting_data)
+
+    def _static_section_loaders(self, data_dir: str) -> Dict[str, Callable[[Mapping], Any]]:
+        """Section name -> loader that reads and processes only the files that section needs"""
+        def read(key):
+            return self._read_static_source(key, data_dir)
+
+        return {
+            'team_stats': lambda data: self._process_team_stats(read('fbs_stats'), data['backtesting_ratings']),
+            'efficiency': lambda data: read('power5_efficiency'),
+            'drives': lambda data: self._process_drive_data(read('drive_data')),
+            'historical_probs': lambda data: read('historical_probs'),
+            'ap_polls': lambda data: read('ap_polls'),
+            'coaches_polls': lambda data: read('coaches_polls'),
+            'conferences': lambda data: read('conferences'),
+            'rankings': lambda data: read('rankings'),
+            'season_summaries': lambda data: read('season_summaries'),
+            'team_name_to_id': lambda data: self._create_team_lookup(read('fbs_stats')),
+            'coaches_raw': lambda data: self._load_coaches_raw(data_dir),
+            'coaching_data': lambda data: self._extract_coaching_data(data['coaches_raw']),
+            # Enhanced data additions
+            'power5_teams_drives': lambda data: self._process_team_drives(read('power5_teams_drives')),
+            'structured_offensive': lambda data: self._process_structured_offensive(read('structured_offensive')),
+            'structured_defensive': lambda data: self._process_structured_defensive(read('structured_defensive')),
+            'backtesting_ratings': lambda data: self._load_backtesting_ratings(data_dir)
+        }
 
     def _process_team_stats(self, fbs_stats: List[Dict], backtesting_ratings: Dict = None) -> Dict[str, ComprehensiveTeamStats]:
         """Process FBS team stats into comprehensive team objects"""
@@ -1750,286 +1851,11 @@ class LightningPredictor:
         return processed_stats
 
     def _process_drive_data(self, drive_data: List[Dict]) -> Dict[str, DriveMetrics]:
-        """Elite drive-level analytics engine - comprehensive game flow analysis"""
-        team_drives = {}
-        
-        for drive in drive_data:
-            team = drive.get('offense', '')
-            if not team:
-                continue
-                
-            if team not in team_drives:
-                team_drives[team] = {
-                    'drives': [],
-                    'total_yards': 0,
-                    'total_plays': 0,
-                    'total_time': 0,
-                    'scoring_drives': 0,
-                    
-                    # Drive outcomes
-                    'touchdowns': 0,
-                    'field_goals': 0,
-                    'punts': 0,
-                    'turnovers': 0,
-                    'turnover_on_downs': 0,
-                    'missed_field_goals': 0,
-                    'safeties': 0,
-                    
-                    # Basic metrics
-                    'three_and_outs': 0,
-                    'explosive_drives': 0,
-                    'red_zone_attempts': 0,
-                    'red_zone_scores': 0,
-                    'fourth_down_attempts': 0,
-                    'fourth_down_conversions': 0,
-                    
-                    # Quarter-by-quarter
-                    'q1_drives': 0, 'q1_scoring': 0, 'q1_yards': 0,
-                    'q2_drives': 0, 'q2_scoring': 0, 'q2_yards': 0,
-                    'q3_drives': 0, 'q3_scoring': 0, 'q3_yards': 0,
-                    'q4_drives': 0, 'q4_scoring': 0, 'q4_yards': 0,
-                    
-                    # Time management
-                    'quick_drives': 0,      # < 2 minutes
-                    'sustained_drives': 0,  # > 5 minutes  
-                    'two_min_attempts': 0,
-                    'two_min_scores': 0,
-                    
-                    # Field position
-                    'own_1_20': 0, 'own_1_20_scores': 0,
-                    'own_21_40': 0, 'own_21_40_scores': 0,
-                    'own_41_mid': 0, 'own_41_mid_scores': 0,
-                    'opp_territory': 0, 'opp_territory_scores': 0,
-                    
-                    # Advanced tracking
-                    'goal_line_attempts': 0,
-                    'goal_line_scores': 0,
-                    'momentum_swings': 0,
-                    'consecutive_scoring': 0,
-                    'max_consecutive_scoring': 0,
-                    'consecutive_stops': 0,
-                    'comeback_drives': 0
-                }
-            
-            team_data = team_drives[team]
-            team_data['drives'].append(drive)
-            
-            # Basic drive info
-            yards = drive.get('yards', 0)
-            plays = drive.get('plays', 0)
-            scoring = drive.get('scoring', False)
-            drive_result = drive.get('driveResult', '').upper()
-            start_yard = drive.get('startYardline', 50)
-            start_period = drive.get('startPeriod', 1)
-            
-            # Elapsed time calculation
-            elapsed = drive.get('elapsed', {})
-            drive_minutes = elapsed.get('minutes', 0)
-            drive_seconds = elapsed.get('seconds', 0)
-            total_drive_seconds = drive_minutes * 60 + drive_seconds
-            
-            # Aggregate basics
-            team_data['total_yards'] += yards
-            team_data['total_plays'] += plays
-            team_data['total_time'] += total_drive_seconds
-            
-            # Drive outcome analysis
-            if drive_result == 'TD':
-                team_data['touchdowns'] += 1
-                team_data['scoring_drives'] += 1
-                # Check consecutive scoring
-                team_data['consecutive_scoring'] += 1
-                team_data['max_consecutive_scoring'] = max(team_data['max_consecutive_scoring'], team_data['consecutive_scoring'])
-                team_data['consecutive_stops'] = 0
-            elif drive_result == 'FG':
-                team_data['field_goals'] += 1
-                team_data['scoring_drives'] += 1
-                team_data['consecutive_scoring'] += 1
-                team_data['max_consecutive_scoring'] = max(team_data['max_consecutive_scoring'], team_data['consecutive_scoring'])
-                team_data['consecutive_stops'] = 0
-            elif drive_result == 'PUNT':
-                team_data['punts'] += 1
-                team_data['consecutive_scoring'] = 0
-                team_data['consecutive_stops'] += 1
-            elif drive_result in ['INT', 'FUMBLE']:
-                team_data['turnovers'] += 1
-                team_data['consecutive_scoring'] = 0
-                team_data['consecutive_stops'] += 1
-            elif drive_result == 'DOWNS':
-                team_data['turnover_on_downs'] += 1
-                team_data['consecutive_scoring'] = 0
-                team_data['consecutive_stops'] += 1
-            elif drive_result == 'MISSED FG':
-                team_data['missed_field_goals'] += 1
-                team_data['consecutive_scoring'] = 0
-                team_data['consecutive_stops'] += 1
-            elif drive_result == 'SAFETY':
-                team_data['safeties'] += 1
-                team_data['consecutive_scoring'] = 0
-                team_data['consecutive_stops'] += 1
-                
-            # Three and outs
-            if plays <= 3 and not scoring:
-                team_data['three_and_outs'] += 1
-                
-            # Explosive drives (50+ yards)
-            if yards >= 50:
-                team_data['explosive_drives'] += 1
-                
-                # Quarter analysis - handle startPeriod 0 as Q1, and cap at Q4
-                quarter_num = max(start_period, 1)  # Treat 0 as 1
-                if quarter_num <= 4:  # Only track Q1-Q4
-                    if quarter_num == 1:
-                        team_data['q1_drives'] += 1
-                        team_data['q1_yards'] += yards
-                        if scoring:
-                            team_data['q1_scoring'] += 1
-                    elif quarter_num == 2:
-                        team_data['q2_drives'] += 1
-                        team_data['q2_yards'] += yards
-                        if scoring:
-                            team_data['q2_scoring'] += 1
-                    elif quarter_num == 3:
-                        team_data['q3_drives'] += 1
-                        team_data['q3_yards'] += yards
-                        if scoring:
-                            team_data['q3_scoring'] += 1
-                    else:  # quarter_num == 4
-                        team_data['q4_drives'] += 1
-                        team_data['q4_yards'] += yards
-                        if scoring:
-                            team_data['q4_scoring'] += 1
-                else:  # Overtime periods - count as Q4
-                    team_data['q4_drives'] += 1
-                    team_data['q4_yards'] += yards
-                    if scoring:
-                        team_data['q4_scoring'] += 1            # Time management
-            if total_drive_seconds > 0:
-                if total_drive_seconds < 120:  # Less than 2 minutes
-                    team_data['quick_drives'] += 1
-                elif total_drive_seconds > 300:  # More than 5 minutes
-                    team_data['sustained_drives'] += 1
-                    
-            # Two-minute drill (drives in final 2 minutes of half)
-            start_time = drive.get('startTime', {})
-            start_minutes = start_time.get('minutes', 15)
-            if (start_period == 2 and start_minutes <= 2) or (start_period == 4 and start_minutes <= 2):
-                team_data['two_min_attempts'] += 1
-                if scoring:
-                    team_data['two_min_scores'] += 1
-                    
-            # Field position analysis
-            if start_yard >= 80:  # Own 1-20
-                team_data['own_1_20'] += 1
-                if scoring:
-                    team_data['own_1_20_scores'] += 1
-            elif start_yard >= 60:  # Own 21-40
-                team_data['own_21_40'] += 1
-                if scoring:
-                    team_data['own_21_40_scores'] += 1
-            elif start_yard >= 50:  # Own 41 to midfield
-                team_data['own_41_mid'] += 1
-                if scoring:
-                    team_data['own_41_mid_scores'] += 1
-            else:  # Opponent territory
-                team_data['opp_territory'] += 1
-                if scoring:
-                    team_data['opp_territory_scores'] += 1
-                    
-            # Red zone tracking
-            if start_yard <= 20:  # Started in red zone
-                team_data['red_zone_attempts'] += 1
-                if scoring:
-                    team_data['red_zone_scores'] += 1
-                    
-            # Goal line situations (5-yard line or closer)
-            if start_yard <= 5:
-                team_data['goal_line_attempts'] += 1
-                if drive_result == 'TD':
-                    team_data['goal_line_scores'] += 1
-                    
-            # Comeback drives (scoring when trailing)
-            start_offense_score = drive.get('startOffenseScore', 0)
-            start_defense_score = drive.get('startDefenseScore', 0)
-            if scoring and start_offense_score < start_defense_score:
-                team_data['comeback_drives'] += 1
-        
-        # Convert to elite DriveMetrics objects
-        processed_drives = {}
-        for team, data in team_drives.items():
-            total_drives = len(data['drives'])
-            if total_drives == 0:
-                continue
-                
-            processed_drives[team] = DriveMetrics(
-                # Basic metrics
-                avg_drive_length=data['total_yards'] / total_drives,
-                avg_time_per_drive=data['total_time'] / total_drives if data['total_time'] > 0 else 0,
-                three_and_outs=data['three_and_outs'],
-                explosive_drives=data['explosive_drives'],
-                red_zone_attempts=data['red_zone_attempts'],
-                red_zone_scores=data['red_zone_scores'],
-                fourth_down_attempts=data['fourth_down_attempts'],
-                fourth_down_conversions=data['fourth_down_conversions'],
-                big_play_drives=data['explosive_drives'],
-                methodical_drives=total_drives - data['explosive_drives'] - data['three_and_outs'],
-                quick_scores=sum(1 for d in data['drives'] if d.get('scoring', False) and d.get('plays', 0) <= 6),
-                
-                # Drive outcomes
-                touchdowns=data['touchdowns'],
-                field_goals=data['field_goals'],
-                punts=data['punts'],
-                turnovers=data['turnovers'],
-                turnover_on_downs=data['turnover_on_downs'],
-                missed_field_goals=data['missed_field_goals'],
-                safeties=data['safeties'],
-                
-                # Quarter performance
-                q1_drives=data['q1_drives'],
-                q1_scoring_drives=data['q1_scoring'],
-                q1_avg_yards=data['q1_yards'] / max(data['q1_drives'], 1),
-                q2_drives=data['q2_drives'],
-                q2_scoring_drives=data['q2_scoring'],
-                q2_avg_yards=data['q2_yards'] / max(data['q2_drives'], 1),
-                q3_drives=data['q3_drives'],
-                q3_scoring_drives=data['q3_scoring'],
-                q3_avg_yards=data['q3_yards'] / max(data['q3_drives'], 1),
-                q4_drives=data['q4_drives'],
-                q4_scoring_drives=data['q4_scoring'],
-                q4_avg_yards=data['q4_yards'] / max(data['q4_drives'], 1),
-                
-                # Time management
-                quick_drives=data['quick_drives'],
-                sustained_drives=data['sustained_drives'],
-                two_minute_drill_attempts=data['two_min_attempts'],
-                two_minute_drill_scores=data['two_min_scores'],
-                
-                # Field position intelligence
-                own_1_20_drives=data['own_1_20'],
-                own_1_20_scoring=data['own_1_20_scores'],
-                own_21_40_drives=data['own_21_40'],
-                own_21_40_scoring=data['own_21_40_scores'],
-                own_41_midfield_drives=data['own_41_mid'],
-                own_41_midfield_scoring=data['own_41_mid_scores'],
-                opp_territory_drives=data['opp_territory'],
-                opp_territory_scoring=data['opp_territory_scores'],
-                
-                # Advanced efficiency
-                plays_per_drive=data['total_plays'] / total_drives,
-                yards_per_play=data['total_yards'] / max(data['total_plays'], 1),
-                scoring_percentage=data['scoring_drives'] / total_drives * 100,
-                red_zone_efficiency=data['red_zone_scores'] / max(data['red_zone_attempts'], 1) * 100,
-                goal_line_efficiency=data['goal_line_scores'],
-                goal_line_attempts=data['goal_line_attempts'],
-                
-                # Momentum tracking
-                momentum_swings=data['momentum_swings'],
-                consecutive_scoring_drives=data['max_consecutive_scoring'],
-                consecutive_stops=data['consecutive_stops'],
-                comeback_drives=data['comeback_drives']
-            )
-        
-        return processed_drives
+        """Elite drive-level analytics engine - comprehensive game flow analysis (columnar, see drive_analytics.py)"""
+        drives = [drive for drive in drive_data if drive.get('offense', '')]
+        columns = DriveColumns.from_drives([drive['offense'] for drive in drives], drives)
+        return {team: DriveMetrics(**metric_fields)
+                for team, metric_fields in aggregate_by_team(columns, drive_metric_fields).items()}
 
     def _create_team_lookup(self, fbs_stats: List[Dict]) -> Dict[str, int]:
         """Create team name to ID lookup (will need to map GraphQL IDs)"""
@@ -2121,33 +1947,9 @@ class LightningPredictor:
             current_week: Current week number
             
         Returns:
-            Weighted performance score
+            Weighted postgame win probability (0.5 without played games)
         """
-        weighted_performance = 0.0
-        total_weight = 0.0
-        
-        for game in games:
-            week = game.get('week', 0)
-            if week == 0:
-                continue
-                
-            # Calculate days ago (assume 7 days per week)
-            days_ago = (current_week - week) * 7
-            weight = self.dixon_coles_weight(days_ago)
-            
-            # Calculate game performance
-            if game.get('homeTeamId') == team_id:
-                win_prob = game.get('homePostgameWinProb', 0.5)
-            elif game.get('awayTeamId') == team_id:
-                win_prob = game.get('awayPostgameWinProb', 0.5)
-            else:
-                continue
-            
-            if win_prob is not None:
-                weighted_performance += win_prob * weight
-                total_weight += weight
-        
-        return weighted_performance / total_weight if total_weight > 0 else 0.5
+        return TeamSeason.from_games(games, team_id).temporal_performance(current_week, self.decay_xi)
     
     def platt_scaling_calibration(self, raw_probability: float) -> float:
         """
@@ -2162,83 +1964,15 @@ class LightningPredictor:
         Returns:
             Calibrated probability
         """
-        # Convert probability to logit (log-odds)
-        epsilon = 1e-10  # Prevent log(0)
-        raw_probability = max(epsilon, min(1 - epsilon, raw_probability))
-        raw_logit = math.log(raw_probability / (1 - raw_probability))
-        
-        # Apply Platt scaling
-        calibrated_logit = self.platt_a * raw_logit + self.platt_b
-        
-        # Convert back to probability
-        calibrated_prob = 1 / (1 + math.exp(-calibrated_logit))
-        
-        return calibrated_prob
+        return float(platt_calibrate(raw_probability, self.platt_a, self.platt_b))
 
     def _process_team_drives(self, power5_teams_drives: Dict) -> Dict[str, Dict]:
-        """Process team-organized drive data for enhanced drive analysis"""
-        processed_drives = {}
-        
-        for team_name, team_data in power5_teams_drives.items():
-            if 'offensive_drives' not in team_data:
-                continue
-                
-            drives = team_data['offensive_drives']
-            
-            # Enhanced drive metrics
-            red_zone_drives = []
-            goal_line_drives = []
-            long_drives = []
-            short_drives = []
-            quick_scores = []
-            
-            total_drives = len(drives)
-            scoring_drives = 0
-            total_yards = 0
-            total_plays = 0
-            
-            for drive in drives:
-                yards = drive.get('yards', 0)
-                plays = drive.get('plays', 0)
-                scoring = drive.get('scoring', False)
-                start_yardline = drive.get('startYardline', 50)
-                drive_result = drive.get('driveResult', '')
-                
-                total_yards += yards
-                total_plays += plays
-                if scoring:
-                    scoring_drives += 1
-                
-                # Categorize drives
-                if start_yardline >= 80:  # Red zone start
-                    red_zone_drives.append(drive)
-                elif start_yardline >= 95:  # Goal line
-                    goal_line_drives.append(drive)
-                    
-                if yards >= 75:  # Long drives
-                    long_drives.append(drive)
-                elif yards <= 20:  # Short drives
-                    short_drives.append(drive)
-                    
-                if plays <= 4 and scoring:  # Quick scores
-                    quick_scores.append(drive)
-            
-            processed_drives[team_name] = {
-                'total_drives': total_drives,
-                'scoring_drives': scoring_drives,
-                'scoring_percentage': scoring_drives / max(total_drives, 1),
-                'avg_yards_per_drive': total_yards / max(total_drives, 1),
-                'avg_plays_per_drive': total_plays / max(total_drives, 1),
-                'red_zone_drives': len(red_zone_drives),
-                'red_zone_scoring_pct': sum(1 for d in red_zone_drives if d.get('scoring', False)) / max(len(red_zone_drives), 1),
-                'goal_line_drives': len(goal_line_drives),
-                'goal_line_scoring_pct': sum(1 for d in goal_line_drives if d.get('scoring', False)) / max(len(goal_line_drives), 1),
-                'long_drive_pct': len(long_drives) / max(total_drives, 1),
-                'quick_score_pct': len(quick_scores) / max(total_drives, 1),
-                'drive_consistency': 1.0 - (len(short_drives) / max(total_drives, 1))
-            }
-        
-        return processed_drives
+        """Process team-organized drive data for enhanced drive analysis (columnar, see drive_analytics.py)"""
+        teams = [team_name for team_name, team_data in power5_teams_drives.items() if 'offensive_drives' in team_data]
+        columns = DriveColumns.from_team_drives(
+            teams, [power5_teams_drives[team_name]['offensive_drives'] for team_name in teams],
+            columns=TEAM_SUMMARY_COLUMNS)
+        return aggregate_by_team(columns, team_drive_summaries)
 
     def _process_structured_offensive(self, structured_offensive_stats: Dict) -> Dict[str, Dict]:
         """Process structured offensive statistics with enhanced calculations"""
@@ -2390,34 +2124,34 @@ class LightningPredictor:
             # ELITE TEAM DETECTION - Check for massive talent/performance gaps
             elite_factor = self._calculate_elite_team_factor(home_team_name, away_team_name)
             enhancement += elite_factor * 1.0  # FULL weight for elite detection - this is critical
-            print(f"      🏆 Elite Team Factor: {elite_factor:+.3f} (Applied: {elite_factor * 1.0:+.3f})")
+            logger.debug("      🏆 Elite Team Factor: %+.3f (Applied: %+.3f)", elite_factor, elite_factor * 1.0)
             
             # 1. Team-organized drive analysis enhancement (+3-5% accuracy)
             if 'power5_teams_drives' in self.static_data:
                 drive_enhancement = self._calculate_drive_enhancement(home_team_name, away_team_name)
                 enhancement += drive_enhancement * 0.15  # Further reduced weight due to elite factor dominance
-                print(f"      🚗 Drive Analysis Enhancement: {drive_enhancement:+.3f}")
+                logger.debug("      🚗 Drive Analysis Enhancement: %+.3f", drive_enhancement)
             
             # 2. Structured offensive stats enhancement (+2-3% accuracy)
             if 'structured_offensive' in self.static_data:
                 offensive_enhancement = self._calculate_offensive_enhancement(home_team_name, away_team_name)
                 enhancement += offensive_enhancement * 0.1  # Further reduced weight
-                print(f"      ⚡ Offensive Enhancement: {offensive_enhancement:+.3f}")
+                logger.debug("      ⚡ Offensive Enhancement: %+.3f", offensive_enhancement)
             
             # 3. Structured defensive stats enhancement (+2-3% accuracy)
             if 'structured_defensive' in self.static_data:
                 defensive_enhancement = self._calculate_defensive_enhancement(home_team_name, away_team_name)
                 enhancement += defensive_enhancement * 0.15  # Reduced weight
-                print(f"      🛡️  Defensive Enhancement: {defensive_enhancement:+.3f}")
+                logger.debug("      🛡️  Defensive Enhancement: %+.3f", defensive_enhancement)
             
             # 4. Backtesting ratings enhancement (+2-4% accuracy from calibration)
             if 'backtesting_ratings' in self.static_data:
                 backtesting_enhancement = self._calculate_backtesting_enhancement(home_team_name, away_team_name)
                 enhancement += backtesting_enhancement * 0.05  # Reduced weight
-                print(f"      📊 Backtesting Enhancement: {backtesting_enhancement:+.3f}")
+                logger.debug("      📊 Backtesting Enhancement: %+.3f", backtesting_enhancement)
             
         except Exception as e:
-            print(f"      ⚠️  Enhancement calculation error: {e}")
+            logger.warning("      ⚠️  Enhancement calculation error: %s", e)
             return 0.0
         
         return enhancement
@@ -2427,11 +2161,11 @@ class LightningPredictor:
         
         # HARDCODED ELITE VS STRUGGLING SCENARIOS FOR KNOWN MISMATCHES
         if away_team == "Ohio State" and home_team == "Wisconsin":
-            print(f"      🚨 ELITE vs STRUGGLING OVERRIDE: Ohio State @ Wisconsin")
-            print(f"      📊 Ohio State: 36.8 PPG, 6.8 allowed vs Wisconsin: 15.5 PPG, 22.7 allowed")
-            print(f"      🔥 Performance gap: 21.3 PPG scoring, 15.9 PPG defensive = 37.2 total gap")
+            logger.debug("      🚨 ELITE vs STRUGGLING OVERRIDE: Ohio State @ Wisconsin")
+            logger.debug("      📊 Ohio State: 36.8 PPG, 6.8 allowed vs Wisconsin: 15.5 PPG, 22.7 allowed")
+            logger.debug("      🔥 Performance gap: 21.3 PPG scoring, 15.9 PPG defensive = 37.2 total gap")
             elite_factor = +18.0  # MASSIVE advantage for elite away team vs struggling home team
-            print(f"      ⚡ APPLYING ELITE FACTOR: +{elite_factor} points")
+            logger.debug("      ⚡ APPLYING ELITE FACTOR: +%s points", elite_factor)
             return elite_factor
         
         # Get season summaries for actual performance data
@@ -2448,7 +2182,7 @@ class LightningPredictor:
                 away_stats = team
         
         if not home_stats or not away_stats:
-            print(f"      ⚠️  Elite factor: Missing team data for {home_team} and/or {away_team}")
+            logger.warning("      ⚠️  Elite factor: Missing team data for %s and/or %s", home_team, away_team)
             return 0.0
         
         # Get key performance metrics
@@ -2462,8 +2196,8 @@ class LightningPredictor:
         away_win_pct = away_stats.get('win_percentage', 0.5)
         away_point_diff = away_stats.get('avg_point_differential', 0)
         
-        print(f"      📊 {away_team}: {away_ppg:.1f} PPG, {away_ppg_allowed:.1f} allowed, {away_win_pct:.1%} wins")
-        print(f"      📊 {home_team}: {home_ppg:.1f} PPG, {home_ppg_allowed:.1f} allowed, {home_win_pct:.1%} wins")
+        logger.debug("      📊 %s: %.1f PPG, %.1f allowed, %s wins", away_team, away_ppg, away_ppg_allowed, lazy_format(away_win_pct, '.1%'))
+        logger.debug("      📊 %s: %.1f PPG, %.1f allowed, %s wins", home_team, home_ppg, home_ppg_allowed, lazy_format(home_win_pct, '.1%'))
         
         # Calculate performance gaps
         scoring_gap = away_ppg - home_ppg  # Away advantage if positive
@@ -2499,29 +2233,29 @@ class LightningPredictor:
         # Elite vs Struggling scenarios (major adjustments)
         if away_elite and home_struggling:
             elite_factor = +8.0  # Massive advantage for elite away team
-            print(f"      🏆 ELITE vs STRUGGLING: {away_team} (elite) @ {home_team} (struggling)")
+            logger.debug("      🏆 ELITE vs STRUGGLING: %s (elite) @ %s (struggling)", away_team, home_team)
         elif home_elite and away_struggling:
             elite_factor = -8.0  # Massive advantage for elite home team
-            print(f"      🏆 ELITE vs STRUGGLING: {away_team} (struggling) @ {home_team} (elite)")
+            logger.debug("      🏆 ELITE vs STRUGGLING: %s (struggling) @ %s (elite)", away_team, home_team)
         
         # Elite vs Average scenarios
         elif away_elite and not home_elite:
             # Calculate magnitude based on gaps
             magnitude = min(scoring_gap + defensive_gap + (point_diff_gap * 0.2), 12.0)
             elite_factor = +magnitude * 0.4
-            print(f"      🔥 ELITE AWAY: {away_team} advantage magnitude {magnitude:.1f}")
+            logger.debug("      🔥 ELITE AWAY: %s advantage magnitude %.1f", away_team, magnitude)
         elif home_elite and not away_elite:
             # Calculate magnitude based on gaps
             magnitude = min(-scoring_gap - defensive_gap + (-point_diff_gap * 0.2), 12.0)
             elite_factor = -magnitude * 0.4
-            print(f"      🔥 ELITE HOME: {home_team} advantage magnitude {magnitude:.1f}")
+            logger.debug("      🔥 ELITE HOME: %s advantage magnitude %.1f", home_team, magnitude)
         
         # Significant performance gaps (even if not elite tier)
         else:
             total_gap = scoring_gap + defensive_gap + (point_diff_gap * 0.15)
             if abs(total_gap) > 15.0:  # Significant gap threshold
                 elite_factor = total_gap * 0.15  # Moderate adjustment
-                print(f"      ⚖️  SIGNIFICANT GAP: Total performance gap {total_gap:.1f}")
+                logger.debug("      ⚖️  SIGNIFICANT GAP: Total performance gap %.1f", total_gap)
         
         return elite_factor
     
@@ -2664,8 +2398,69 @@ class LightningPredictor:
         backtesting_factor = (composite_diff * 0.1 + tier_adjustment + consistency_factor)
         return backtesting_factor
 
+    def use_shared_session(self, session: aiohttp.ClientSession, loop: asyncio.AbstractEventLoop):
+        """Route GraphQL calls made on `loop` through a pooled, long-lived session"""
+        self.shared_session = session
+        self._shared_session_loop = loop
+
+    @asynccontextmanager
+    async def _session_scope(self):
+        """Yield the shared pooled session when running on its loop, otherwise a per-call session"""
+        if (self.shared_session is not None and not self.shared_session.closed
+                and asyncio.get_running_loop() is self._shared_session_loop):
+            yield self.shared_session
+        else:
+            async with aiohttp.ClientSession() as session:
+                yield session
+
     async def _execute_query(self, session: aiohttp.ClientSession, query: str, variables: Dict) -> Dict:
-        """Execute GraphQL query"""
+        """Execute GraphQL query, serving repeats from the query cache
+
+        Concurrent identical queries on the same loop share one in-flight request,
+        so a slate of games that overlap on teams fetches each fragment once. If the
+        caller posting it is cancelled (its game failed or timed out), a waiter takes over.
+        """
+        cache_key = self.query_cache.make_key(self.base_url, query, variables)
+        cached = self.query_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        loop = asyncio.get_running_loop()
+        while True:
+            inflight = self._inflight_queries.get(cache_key)
+            if inflight is None or inflight.get_loop() is not loop:
+                break
+            try:
+                return copy.deepcopy(await asyncio.shield(inflight))
+            except QueryAbandoned:
+                continue
+
+        future = loop.create_future()
+        self._inflight_queries[cache_key] = future
+        try:
+            result = await self._post_query(session, query, variables)
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # mark retrieved - waiters (if any) re-raise it themselves
+            raise
+        except BaseException:
+            future.set_exception(QueryAbandoned())
+            future.exception()
+            raise
+        else:
+            # Waiters resume after we return, so hand them a snapshot the caller can't mutate
+            future.set_result(copy.deepcopy(result))
+        finally:
+            if self._inflight_queries.get(cache_key) is future:
+                del self._inflight_queries[cache_key]
+
+        # Only cache clean responses - errors should be retried on the next call
+        if 'data' in result and not result.get('errors'):
+            self.query_cache.set(cache_key, query, result)
+        return result
+
+    async def _post_query(self, session: aiohttp.ClientSession, query: str, variables: Dict) -> Dict:
+        """POST a GraphQL query, backing off when the API rate-limits us"""
         headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json"
@@ -2676,26 +2471,117 @@ class LightningPredictor:
             "variables": variables
         }
 
-        async with session.post(self.base_url, headers=headers, json=payload) as response:
-            if response.status != 200:
-                raise Exception(f"GraphQL query failed: {response.status}")
-            return await response.json()
+        for attempt in range(self.RATE_LIMIT_RETRIES + 1):
+            async with session.post(self.base_url, headers=headers, json=payload) as response:
+                if response.status in (429, 503) and attempt < self.RATE_LIMIT_RETRIES:
+                    retry_after = response.headers.get('Retry-After', '')
+                    delay = float(retry_after) if retry_after.isdigit() else 0.5 * (2 ** attempt)
+                    logger.debug("⏳ GraphQL API returned %s - retrying in %.1fs", response.status, delay)
+                    await asyncio.sleep(delay)
+                    continue
+                if response.status != 200:
+                    raise Exception(f"GraphQL query failed: {response.status}")
+                return await response.json()
 
-    async def predict_game(self, home_team_id: int, away_team_id: int) -> GamePrediction:
-        """Single game prediction using one GraphQL call"""
+    def _load_schedule_index(self) -> Dict[Tuple[int, int], int]:
+        """Build a (home_team_id, away_team_id) -> gameId index from the local schedule files"""
+        index = {}
+        base_dir = os.path.dirname(os.path.abspath(__file__))
 
-        query = """
-        query GamePredictorEnhanced($homeTeamId: Int!, $awayTeamId: Int!, $currentYear: smallint = 2025, $currentYearInt: Int = 2025, $currentWeek: smallint = 15) {
-            # Current season team metrics (ENHANCED with all available fields)
-            homeTeamMetrics: adjustedTeamMetrics(where: {teamId: {_eq: $homeTeamId}, year: {_eq: $currentYear}}) {
-                epa epaAllowed explosiveness explosivenessAllowed success successAllowed
-                passingEpa passingEpaAllowed rushingEpa rushingEpaAllowed
-                passingDownsSuccess passingDownsSuccessAllowed
-                standardDownsSuccess standardDownsSuccessAllowed
-                lineYards lineYardsAllowed secondLevelYards secondLevelYardsAllowed
-                openFieldYards openFieldYardsAllowed highlightYards highlightYardsAllowed
+        # week15.json carries team IDs directly
+        try:
+            with open(os.path.join(base_dir, 'week15.json'), 'r') as f:
+                week_games = json.load(f)
+            if isinstance(week_games, dict):
+                week_games = week_games.get('games', [])
+            for game in week_games:
+                if game.get('week') != self.current_week or game.get('season', self.current_year) != self.current_year:
+                    continue
+                if game.get('id') and game.get('homeTeamId') and game.get('awayTeamId'):
+                    index[(game['homeTeamId'], game['awayTeamId'])] = game['id']
+        except Exception as e:
+            logger.warning("⚠️  Could not load week15.json schedule: %s", e)
+
+        # Currentweekgames.json only carries team names - map them through the fbs.json directory
+        try:
+            directory = get_team_directory()
+            with open(os.path.join(base_dir, 'Currentweekgames.json'), 'r') as f:
+                current_games = json.load(f).get('games', [])
+            if isinstance(current_games, dict):
+                current_games = current_games.get('all', [])
+            for game in current_games:
+                game_info = game.get('gameInfo', {})
+                if game_info.get('week') != self.current_week or game_info.get('season', self.current_year) != self.current_year:
+                    continue
+                home_id = directory.resolve(game.get('homeTeam', {}).get('name', ''))
+                away_id = directory.resolve(game.get('awayTeam', {}).get('name', ''))
+                if home_id and away_id and game.get('gameId'):
+                    index.setdefault((home_id, away_id), game['gameId'])
+        except Exception as e:
+            logger.warning("⚠️  Could not load Currentweekgames.json schedule: %s", e)
+
+        return index
+
+    async def _resolve_game_id(self, session: aiohttp.ClientSession, home_team_id: int, away_team_id: int) -> Optional[int]:
+        """Resolve the current-week gameId locally, falling back to a tiny id-only query"""
+        release = self.data_release
+        if release.schedule_index is None:
+            release.schedule_index = self._load_schedule_index()
+
+        game_id = release.schedule_index.get((home_team_id, away_team_id))
+        if game_id:
+            return game_id
+
+        game_id_query = """
+        query GameId($homeTeamId: Int!, $awayTeamId: Int!, $currentYear: smallint!, $currentWeek: smallint!) {
+            game(where: {
+                homeTeamId: {_eq: $homeTeamId},
+                awayTeamId: {_eq: $awayTeamId},
+                season: {_eq: $currentYear},
+                week: {_eq: $currentWeek}
+            }) {
+                id
             }
-            awayTeamMetrics: adjustedTeamMetrics(where: {teamId: {_eq: $awayTeamId}, year: {_eq: $currentYear}}) {
+        }
+        """
+
+        try:
+            result = await asyncio.wait_for(
+                self._execute_query(session, game_id_query, {
+                    "homeTeamId": home_team_id,
+                    "awayTeamId": away_team_id,
+                    "currentYear": self.current_year,
+                    "currentWeek": self.current_week
+                }),
+                timeout=self.LEG_TIMEOUTS['lines']
+            )
+            games = result.get('data', {}).get('game', [])
+            return games[0].get('id') if games else None
+        except Exception as e:
+            logger.warning("⚠️ Failed to resolve gameId: %r", e)
+            return None
+
+    async def _run_leg(self, leg: str, coro, default):
+        """Await one fan-out leg under its timeout, returning the default on failure"""
+        try:
+            return await asyncio.wait_for(coro, timeout=self.LEG_TIMEOUTS[leg])
+        except Exception as e:
+            logger.warning("⚠️ %s leg failed (%r) - continuing with partial data", leg, e)
+            return default
+
+    async def _fetch_fragment(self, session: aiohttp.ClientSession, name: str, query: str, variables: Dict) -> Dict:
+        """Run one query fragment and return its data dict, raising on GraphQL errors"""
+        result = await self._execute_query(session, query, variables)
+        if 'data' not in result or result.get('errors'):
+            raise Exception(f"GraphQL errors in {name} fragment: {result.get('errors', result)}")
+        return result['data']
+
+    async def _fetch_team_fragment(self, session: aiohttp.ClientSession, team_id: int) -> Dict:
+        """Team-specific data - cached per team, so it is shared by every matchup the team plays"""
+        team_query = """
+        query TeamFragment($teamId: Int!, $currentYear: smallint!) {
+            # Current season team metrics (ENHANCED with all available fields)
+            teamMetrics: adjustedTeamMetrics(where: {teamId: {_eq: $teamId}, year: {_eq: $currentYear}}) {
                 epa epaAllowed explosiveness explosivenessAllowed success successAllowed
                 passingEpa passingEpaAllowed rushingEpa rushingEpaAllowed
                 passingDownsSuccess passingDownsSuccessAllowed
@@ -2704,72 +2590,127 @@ class LightningPredictor:
                 openFieldYards openFieldYardsAllowed highlightYards highlightYardsAllowed
             }
             
-            # KEY PLAYER METRICS - Individual Player Analysis (Simplified)
-            allPlayers: adjustedPlayerMetrics(
-                where: {
-                    year: {_eq: $currentYear}
-                },
-                orderBy: {metricValue: DESC},
-                limit: 100
-            ) {
-                athleteId
-                metricType
-                metricValue
-                plays
-                athlete {
-                    name
-                }
-            }
-            
             # Team talent ratings
-            homeTeamTalent: teamTalent(where: {team: {teamId: {_eq: $homeTeamId}}, year: {_eq: $currentYear}}) {
-                talent
-            }
-            awayTeamTalent: teamTalent(where: {team: {teamId: {_eq: $awayTeamId}}, year: {_eq: $currentYear}}) {
+            teamTalent: teamTalent(where: {team: {teamId: {_eq: $teamId}}, year: {_eq: $currentYear}}) {
                 talent
             }
             
-            # All season games for comprehensive analysis (using correct field names)
-            homeSeasonGames: game(where: {_or: [{homeTeamId: {_eq: $homeTeamId}}, {awayTeamId: {_eq: $homeTeamId}}], season: {_eq: $currentYear}}, orderBy: {week: ASC}) {
-                id homePoints awayPoints homeTeam awayTeam homeTeamId awayTeamId homePostgameWinProb awayPostgameWinProb homeStartElo awayStartElo week seasonType
-            }
-            awaySeasonGames: game(where: {_or: [{homeTeamId: {_eq: $awayTeamId}}, {awayTeamId: {_eq: $awayTeamId}}], season: {_eq: $currentYear}}, orderBy: {week: ASC}) {
+            # All season games for comprehensive analysis
+            seasonGames: game(where: {_or: [{homeTeamId: {_eq: $teamId}}, {awayTeamId: {_eq: $teamId}}], season: {_eq: $currentYear}}, orderBy: {week: ASC}) {
                 id homePoints awayPoints homeTeam awayTeam homeTeamId awayTeamId homePostgameWinProb awayPostgameWinProb homeStartElo awayStartElo week seasonType
             }
             
-            # Recent games (last 4) for immediate form (using correct field names)
-            homeRecentGames: game(where: {_or: [{homeTeamId: {_eq: $homeTeamId}}, {awayTeamId: {_eq: $homeTeamId}}], season: {_eq: $currentYear}}, orderBy: {startDate: DESC}, limit: 4) {
-                id homePoints awayPoints homeTeam awayTeam homeTeamId awayTeamId homePostgameWinProb awayPostgameWinProb homeStartElo awayStartElo week seasonType
-            }
-            awayRecentGames: game(where: {_or: [{homeTeamId: {_eq: $awayTeamId}}, {awayTeamId: {_eq: $awayTeamId}}], season: {_eq: $currentYear}}, orderBy: {startDate: DESC}, limit: 4) {
+            # Recent games (last 4) for immediate form
+            recentGames: game(where: {_or: [{homeTeamId: {_eq: $teamId}}, {awayTeamId: {_eq: $teamId}}], season: {_eq: $currentYear}}, orderBy: {startDate: DESC}, limit: 4) {
                 id homePoints awayPoints homeTeam awayTeam homeTeamId awayTeamId homePostgameWinProb awayPostgameWinProb homeStartElo awayStartElo week seasonType
             }
             
-            # Team information (using correct field name)
-            homeTeam: currentTeams(where: {teamId: {_eq: $homeTeamId}}) {
-                school conference
-            }
-            awayTeam: currentTeams(where: {teamId: {_eq: $awayTeamId}}) {
+            # Team information
+            team: currentTeams(where: {teamId: {_eq: $teamId}}) {
                 school conference
             }
             
-            # NEW HIGH-IMPACT ENDPOINTS (working versions based on schema discovery):
-            
-            # 2. Composite ratings for validation - FIXED SCHEMA!
-            homeRatings: ratings(where: {
-                teamId: {_eq: $homeTeamId}, 
+            # Composite ratings for validation
+            ratings: ratings(where: {
+                teamId: {_eq: $teamId}, 
                 year: {_eq: $currentYear}
             }) {
                 teamId year elo fpi conference team
             }
-            awayRatings: ratings(where: {
-                teamId: {_eq: $awayTeamId}, 
+        }
+        """
+        return await self._fetch_fragment(session, 'team', team_query, {
+            "teamId": team_id,
+            "currentYear": self.current_year
+        })
+
+    async def _fetch_global_fragment(self, session: aiohttp.ClientSession) -> Dict:
+        """Team-independent data - one cached copy serves the whole slate
+
+        Split into one query per TTL class: the query cache expires a response with its
+        shortest-lived root field, so weather (30 min) sharing a query with polls and the
+        calendar (week rollover) would drag them down to a 30 minute refetch.
+        """
+        week_query = """
+        query WeekFragment($currentYear: smallint!, $currentYearInt: Int!, $currentWeek: smallint!) {
+            # Poll rankings with team mapping
+            currentPolls: pollRank(
+                where: {
+                    poll: {
+                        season: {_eq: $currentYearInt},
+                        week: {_eq: $currentWeek}
+                    }
+                },
+                limit: 50
+            ) {
+                rank
+                firstPlaceVotes
+                points
+                team {
+                    teamId
+                    school
+                }
+                poll {
+                    pollType {
+                        name
+                        shortName
+                    }
+                }
+            }
+            
+            # Weekly calendar for bye week detection
+            weeklyCalendar: calendar(where: {
                 year: {_eq: $currentYear}
             }) {
-                teamId year elo fpi conference team
+                week startDate endDate
             }
-            
-            # 3. Current game information with weather - THIS IS THE KEY FIX!
+        }
+        """
+        players_query = """
+        query PlayersFragment($currentYear: smallint!) {
+            # KEY PLAYER METRICS - Individual Player Analysis (Simplified)
+            allPlayers: adjustedPlayerMetrics(
+                where: {
+                    year: {_eq: $currentYear}
+                },
+                orderBy: {metricValue: DESC},
+                limit: 100
+            ) {
+                athleteId
+                metricType
+                metricValue
+                plays
+                athlete {
+                    name
+                }
+            }
+        }
+        """
+        weather_query = """
+        query WeatherFragment {
+            # Legacy weather data fallback - get recent weather data
+            gameWeather: gameWeather(limit: 10, orderBy: {gameId: DESC}) {
+                temperature windSpeed precipitation gameId
+            }
+        }
+        """
+        week_data, players_data, weather_data = await gather_or_cancel(
+            self._fetch_fragment(session, 'week', week_query, {
+                "currentYear": self.current_year,
+                "currentYearInt": self.current_year,
+                "currentWeek": self.current_week
+            }),
+            self._fetch_fragment(session, 'players', players_query, {
+                "currentYear": self.current_year
+            }),
+            self._fetch_fragment(session, 'weather', weather_query, {})
+        )
+        return {**players_data, **weather_data, **week_data}
+
+    async def _fetch_game_fragment(self, session: aiohttp.ClientSession, home_team_id: int, away_team_id: int) -> Dict:
+        """The only pair-specific data: this week's game row with weather and media"""
+        game_query = """
+        query MatchupFragment($homeTeamId: Int!, $awayTeamId: Int!, $currentYear: smallint!, $currentWeek: smallint!) {
             currentGame: game(
                 where: {
                     homeTeamId: {_eq: $homeTeamId},
@@ -2804,68 +2745,107 @@ class LightningPredictor:
                     name
                 }
             }
-            
-            # 4. Legacy weather data fallback - get recent weather data
-            gameWeather: gameWeather(limit: 10, orderBy: {gameId: DESC}) {
-                temperature windSpeed precipitation gameId
-            }
-            
-            # 4. Poll rankings - NOW WITH TEAM MAPPING!
-            currentPolls: pollRank(
-                where: {
-                    poll: {
-                        season: {_eq: $currentYearInt},
-                        week: {_eq: $currentWeek}
-                    }
-                },
-                limit: 50
-            ) {
-                rank
-                firstPlaceVotes
-                points
-                team {
-                    teamId
-                    school
-                }
-                poll {
-                    pollType {
-                        name
-                        shortName
-                    }
-                }
-            }
-            
-            # 5. Weekly calendar for bye week detection - WORKS!
-            weeklyCalendar: calendar(where: {
-                year: {_eq: $currentYear}
-            }) {
-                week startDate endDate
-            }
-            
-            # 6. Current matchup game to get gameId for lines
-            currentMatchup: game(where: {
-                homeTeamId: {_eq: $homeTeamId},
-                awayTeamId: {_eq: $awayTeamId},
-                season: {_eq: $currentYear},
-                week: {_eq: $currentWeek}
-            }) {
-                id homeTeam awayTeam startDate
-                mediaInfo {
-                    mediaType
-                    name
-                }
-            }
         }
         """
+        return await self._fetch_fragment(session, 'matchup', game_query, {
+            "homeTeamId": home_team_id,
+            "awayTeamId": away_team_id,
+            "currentYear": self.current_year,
+            "currentWeek": self.current_week
+        })
 
-        async with aiohttp.ClientSession() as session:
-            result = await self._execute_query(session, query, {
-                "homeTeamId": home_team_id,
-                "awayTeamId": away_team_id,
-                "currentYear": self.current_year,
-                "currentYearInt": self.current_year,
-                "currentWeek": self.current_week
-            })
+    async def _fetch_matchup_data(self, session: aiohttp.ClientSession, home_team_id: int, away_team_id: int) -> Dict:
+        """Fetch all fragments concurrently and assemble the data dict _calculate_prediction expects"""
+        home_data, away_data, global_data, game_data = await gather_or_cancel(
+            self._fetch_team_fragment(session, home_team_id),
+            self._fetch_team_fragment(session, away_team_id),
+            self._fetch_global_fragment(session),
+            self._fetch_game_fragment(session, home_team_id, away_team_id)
+        )
+
+        data = {}
+        for side, team_data in (('home', home_data), ('away', away_data)):
+            data[f'{side}TeamMetrics'] = team_data.get('teamMetrics', [])
+            data[f'{side}TeamTalent'] = team_data.get('teamTalent', [])
+            data[f'{side}SeasonGames'] = team_data.get('seasonGames', [])
+            data[f'{side}RecentGames'] = team_data.get('recentGames', [])
+            data[f'{side}Team'] = team_data.get('team', [])
+            data[f'{side}Ratings'] = team_data.get('ratings', [])
+        data.update(global_data)
+
+        # currentMatchup used to be a second copy of the current game row - derive it instead
+        data['currentGame'] = game_data.get('currentGame', [])
+        data['currentMatchup'] = [
+            {key: game.get(key) for key in ('id', 'homeTeam', 'awayTeam', 'startDate', 'mediaInfo')}
+            for game in data['currentGame']
+        ]
+        return {'data': data}
+
+    async def predict_game(self, home_team_id: int, away_team_id: int) -> GamePrediction:
+        """Single game prediction, pinned to the data release that was live when it started"""
+        token = self._pinned_release.set(self.data_release)
+        try:
+            return await self._predict_game(home_team_id, away_team_id)
+        finally:
+            self._pinned_release.reset(token)
+
+    def cached_prediction_key(self, home_team_id: int, away_team_id: int) -> Optional[Tuple]:
+        """prediction_cache_key from memory when the matchup's lines fingerprint is still fresh, else None"""
+        release = self.data_release
+        cached = self._lines_fingerprints.get((home_team_id, away_team_id, release.week))
+        if cached is None or cached[0] < time.monotonic():
+            return None
+        return self._prediction_key(release, home_team_id, away_team_id, cached[1])
+
+    async def prediction_cache_key(self, home_team_id: int, away_team_id: int) -> Tuple:
+        """(home, away, week, static data version, lines fingerprint) - equal keys predict identically
+
+        The lines come through the query cache (gameLines TTL), so the key follows line moves
+        at the same cadence the prediction itself would see them. The fingerprint is then
+        remembered for LINES_FINGERPRINT_TTL so repeat requests skip the lookup.
+        """
+        key = self.cached_prediction_key(home_team_id, away_team_id)
+        if key is not None:
+            return key
+        release = self.data_release
+        async with self._session_scope() as session:
+            game_id = await self._resolve_game_id(session, home_team_id, away_team_id)
+            lines = await self._fetch_game_lines(session, game_id) if game_id else []
+        fingerprint = lines_fingerprint(lines)
+        if len(self._lines_fingerprints) > 4096:
+            now = time.monotonic()
+            self._lines_fingerprints = {k: v for k, v in self._lines_fingerprints.items() if v[0] >= now}
+        self._lines_fingerprints[(home_team_id, away_team_id, release.week)] = (
+            time.monotonic() + self.LINES_FINGERPRINT_TTL, fingerprint)
+        return self._prediction_key(release, home_team_id, away_team_id, fingerprint)
+
+    def _prediction_key(self, release: 'DataRelease', home_team_id: int, away_team_id: int, fingerprint: str) -> Tuple:
+        data_version = (release.data_dir, release.loaded_at, self.model_params_version)
+        return home_team_id, away_team_id, release.week, data_version, fingerprint
+
+    async def _predict_game(self, home_team_id: int, away_team_id: int) -> GamePrediction:
+        """Single game prediction from cached per-team, global and matchup query fragments"""
+        async with self._session_scope() as session:
+            # Resolve the gameId up front so lines and media can run alongside the main query
+            game_id = await self._resolve_game_id(session, home_team_id, away_team_id)
+
+            main_leg = asyncio.wait_for(
+                self._fetch_matchup_data(session, home_team_id, away_team_id),
+                timeout=self.LEG_TIMEOUTS['main']
+            )
+
+            if game_id:
+                logger.debug("🎯 Found gameId: %s - Fetching matchup data, market lines and media concurrently...", game_id)
+                # A failed or timed-out main leg cancels lines/media - the prediction is lost anyway
+                result, game_lines, game_media = await gather_or_cancel(
+                    main_leg,
+                    self._run_leg('lines', self._fetch_game_lines(session, game_id), []),
+                    self._run_leg('media', self._fetch_game_media(session, game_id), [])
+                )
+            else:
+                logger.warning("⚠️ No gameId found for current matchup - skipping market lines and media")
+                result = await main_leg
+                game_lines, game_media = [], []
 
             # Check if we got the main data
             if 'data' not in result:
@@ -2873,25 +2853,10 @@ class LightningPredictor:
                     raise Exception(f"GraphQL errors: {result['errors']}")
                 else:
                     raise Exception(f"Unexpected response structure: {result}")
-            
-            # Try to get gameId for lines
-            game_lines = []
-            game_media = []
-            current_matchup = result['data'].get('currentMatchup', [])
-            if current_matchup:
-                game_id = current_matchup[0].get('id')
-                if game_id:
-                    print(f"🎯 Found gameId: {game_id} - Fetching market lines...")
-                    game_lines = await self._fetch_game_lines(session, game_id)
-                    result['data']['marketLines'] = game_lines
-                    
-                    print(f"🎯 Fetching game media information...")
-                    game_media = await self._fetch_game_media(session, game_id)
-                    result['data']['gameMedia'] = game_media
-                else:
-                    print("⚠️ No gameId found in current matchup")
-            else:
-                print("⚠️ No current matchup found")
+
+            if game_id:
+                result['data']['marketLines'] = game_lines
+                result['data']['gameMedia'] = game_media
 
         # Debug: Print the raw response to understand the structure
         # print(f"🔍 DEBUG: Raw GraphQL Response: {json.dumps(result, indent=2)}")
@@ -2899,31 +2864,60 @@ class LightningPredictor:
         # Handle different response structures
         return self._calculate_prediction(result['data'], home_team_id, away_team_id)
 
+    def current_week_matchups(self) -> List[Tuple[int, int]]:
+        """(home_team_id, away_team_id) pairs on the current week's schedule"""
+        release = self.data_release
+        if release.schedule_index is None:
+            release.schedule_index = self._load_schedule_index()
+        return list(release.schedule_index.keys())
+
+    async def predict_games(self, matchups: List[Tuple[int, int]], concurrency: Optional[int] = None
+                            ) -> AsyncIterator[Tuple[int, int, int, Optional[GamePrediction], Optional[Exception]]]:
+        """Predict a slate concurrently, yielding (index, home_id, away_id, prediction, error) as games finish
+
+        Games overlapping on a team share its fragment through the query cache and
+        single-flight, so the slate costs roughly one fetch per team plus one per game.
+        """
+        semaphore = asyncio.Semaphore(concurrency or self.BATCH_CONCURRENCY)
+
+        async def predict_one(index: int, home_team_id: int, away_team_id: int):
+            async with semaphore:
+                try:
+                    prediction = await self.predict_game(home_team_id, away_team_id)
+                    return index, home_team_id, away_team_id, prediction, None
+                except Exception as e:
+                    return index, home_team_id, away_team_id, None, e
+
+        tasks = [
+            asyncio.ensure_future(predict_one(index, home_team_id, away_team_id))
+            for index, (home_team_id, away_team_id) in enumerate(matchups)
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # Consumer went away (e.g. client disconnected) - don't keep predicting
+            for task in tasks:
+                task.cancel()
+
     def _extract_team_metrics(self, metrics_data: Dict, recent_games: List[Dict], season_games: List[Dict], historical_metrics: List[Dict], is_home: bool, team_id: int) -> TeamMetrics:
         """Extract comprehensive team metrics from GraphQL response"""
+        # Season games -> columns once; Dixon-Coles form, SoS, consistency and splits come from the arrays
+        season = TeamSeason.from_games(season_games, team_id).season_features(self.current_week, self.decay_xi)
         if not metrics_data:
             # Default values if no data
-            return TeamMetrics(0, 0, 0, 0.5, 0, 0, 1500, 0, 0, 0.5, 0)
+            return TeamMetrics(0, 0, 0, 0.5, 0, 0, 1500, 0, 0, 0.5, 0, season['temporal_performance'])
 
         metrics = metrics_data[0] if metrics_data else {}
 
-        # Calculate recent form from last 4 games
-        recent_form = self._calculate_recent_form(recent_games, team_id)
+        # Recent form from the last 4 games
+        recent_form = TeamSeason.from_games(recent_games[:4], team_id).average_win_prob()
         
         # Get ELO from most recent game
         elo_rating = self._get_latest_elo(recent_games, team_id)
         
         # Analyze season trends
         season_trend = self._analyze_season_trends(historical_metrics, season_games, team_id)
-        
-        # Calculate strength of schedule
-        sos_rating = self._calculate_strength_of_schedule(season_games, team_id)
-        
-        # Calculate consistency score
-        consistency_score = self._analyze_performance_consistency(season_games, team_id)
-        
-        # Calculate recent vs early season differential
-        recent_vs_early = self._calculate_recent_vs_early_differential(season_games, team_id)
 
         return TeamMetrics(
             epa=metrics.get('epa', 0),
@@ -2934,9 +2928,10 @@ class LightningPredictor:
             recent_form=recent_form,
             elo_rating=elo_rating,
             season_trend=season_trend,
-            sos_rating=sos_rating,
-            consistency_score=consistency_score,
-            recent_vs_early_differential=recent_vs_early
+            sos_rating=season['sos_rating'],
+            consistency_score=season['consistency_score'],
+            recent_vs_early_differential=season['recent_vs_early_differential'],
+            temporal_performance=season['temporal_performance']
         )
 
     async def _fetch_game_lines(self, session: aiohttp.ClientSession, game_id: int) -> List[Dict]:
@@ -2962,7 +2957,7 @@ class LightningPredictor:
             result = await self._execute_query(session, lines_query, {"gameId": game_id})
             return result.get('data', {}).get('gameLines', [])
         except Exception as e:
-            print(f"⚠️ Failed to fetch game lines: {e}")
+            logger.warning("⚠️ Failed to fetch game lines: %s", e)
             return []
 
     async def _fetch_game_media(self, session: aiohttp.ClientSession, game_id: int) -> List[Dict]:
@@ -2989,21 +2984,50 @@ class LightningPredictor:
                 return games[0].get('mediaInfo', [])
             return []
         except Exception as e:
-            print(f"⚠️ Failed to fetch game media: {e}")
+            logger.warning("⚠️ Failed to fetch game media: %s", e)
             return []
 
     def _calculate_prediction(self, data: Dict, home_team_id: int, away_team_id: int) -> GamePrediction:
-        """Advanced calculation-based prediction with historical analysis"""
+        """Advanced calculation-based prediction: extract the feature row, score it, assemble the result"""
+        features = self._extract_game_features(data, home_team_id, away_team_id)
+        scores = score_features(features.values[np.newaxis, :], self._scoring_params())
+        return self._build_prediction(features, score_row(scores, 0))
+
+    def score_games(self, games: List[GameFeatures]) -> Dict[str, np.ndarray]:
+        """Score many extracted games in one vectorized pass (batch slates, backtests)"""
+        return score_features(feature_matrix(games), self._scoring_params())
+
+    def _scoring_params(self) -> ScoringParams:
+        return ScoringParams.from_tables(self.ELO_THRESHOLDS, self.TIER_WEIGHTS, self.platt_a, self.platt_b)
+
+    def apply_model_params(self, params: Optional[Dict]):
+        """Override the hand-set decay, Platt and tier tables with a calibrated parameter file (model_params.py)"""
+        if not params:
+            return
+        self.decay_xi = float(params.get('decay_xi', self.decay_xi))
+        self.platt_a = float(params.get('platt_a', self.platt_a))
+        self.platt_b = float(params.get('platt_b', self.platt_b))
+        if params.get('elo_thresholds'):
+            self.ELO_THRESHOLDS = {tier: float(value) for tier, value in params['elo_thresholds'].items()}
+        if params.get('tier_weights'):
+            self.TIER_WEIGHTS = {tier: {key: float(value) for key, value in weights.items()}
+                                 for tier, weights in params['tier_weights'].items()}
+        self.model_params_version = params.get('version')
+        logger.info("✅ Model parameters %s (decay_xi=%.4f, platt a=%.3f b=%.3f)",
+                    self.model_params_version, self.decay_xi, self.platt_a, self.platt_b)
+
+    def _extract_game_features(self, data: Dict, home_team_id: int, away_team_id: int) -> GameFeatures:
+        """One matchup's GraphQL data -> fixed-width feature row plus display context (no shared state is touched)"""
 
         # Display detailed data analysis
-        print("\n" + "="*80)
-        print("📊 GAMEDAY+ GRAPHQL DATA ANALYSIS")
-        print("="*80)
+        logger.debug('\n' + '=' * 80)
+        logger.debug("📊 GAMEDAY+ GRAPHQL DATA ANALYSIS")
+        logger.debug('=' * 80)
         
         # Team Information
         home_team_name = data.get('homeTeam', [{}])[0].get('school', 'Unknown') if data.get('homeTeam') else 'Unknown'
         away_team_name = data.get('awayTeam', [{}])[0].get('school', 'Unknown') if data.get('awayTeam') else 'Unknown'
-        print(f"🏈 MATCHUP: {away_team_name} @ {home_team_name}")
+        logger.debug("🏈 MATCHUP: %s @ %s", away_team_name, home_team_name)
         
         # ENHANCED CORE METRICS with advanced team metrics - MOVED HERE FOR DISPLAY
         advanced_metrics_differential, advanced_metrics = self._calculate_advanced_metrics_differential(
@@ -3012,84 +3036,84 @@ class LightningPredictor:
         )
         
         # Team Metrics
-        print(f"\n📈 ENHANCED TEAM METRICS (2025 Season):")
+        logger.debug("\n📈 ENHANCED TEAM METRICS (2025 Season):")
         home_metrics_raw = data.get('homeTeamMetrics', [{}])[0] if data.get('homeTeamMetrics') else {}
         away_metrics_raw = data.get('awayTeamMetrics', [{}])[0] if data.get('awayTeamMetrics') else {}
         
-        print(f"  🏠 {home_team_name}:")
-        print(f"     Overall EPA: {home_metrics_raw.get('epa', 0):.3f} | EPA Allowed: {home_metrics_raw.get('epaAllowed', 0):.3f}")
-        print(f"     Passing EPA: {home_metrics_raw.get('passingEpa', 0):.3f} | Passing EPA Allowed: {home_metrics_raw.get('passingEpaAllowed', 0):.3f}")
-        print(f"     Rushing EPA: {home_metrics_raw.get('rushingEpa', 0):.3f} | Rushing EPA Allowed: {home_metrics_raw.get('rushingEpaAllowed', 0):.3f}")
-        print(f"     Success Rate: {home_metrics_raw.get('success', 0):.3f} | Success Allowed: {home_metrics_raw.get('successAllowed', 0):.3f}")
-        print(f"     Explosiveness: {home_metrics_raw.get('explosiveness', 0):.3f} | Explosiveness Allowed: {home_metrics_raw.get('explosivenessAllowed', 0):.3f}")
-        
-        print(f"  ✈️  {away_team_name}:")
-        print(f"     Overall EPA: {away_metrics_raw.get('epa', 0):.3f} | EPA Allowed: {away_metrics_raw.get('epaAllowed', 0):.3f}")
-        print(f"     Passing EPA: {away_metrics_raw.get('passingEpa', 0):.3f} | Passing EPA Allowed: {away_metrics_raw.get('passingEpaAllowed', 0):.3f}")
-        print(f"     Rushing EPA: {away_metrics_raw.get('rushingEpa', 0):.3f} | Rushing EPA Allowed: {away_metrics_raw.get('rushingEpaAllowed', 0):.3f}")
-        print(f"     Success Rate: {away_metrics_raw.get('success', 0):.3f} | Success Allowed: {away_metrics_raw.get('successAllowed', 0):.3f}")
-        print(f"     Explosiveness: {away_metrics_raw.get('explosiveness', 0):.3f} | Explosiveness Allowed: {away_metrics_raw.get('explosivenessAllowed', 0):.3f}")
-        
-        print(f"\n🏈 SITUATIONAL PERFORMANCE:")
-        print(f"  🏠 {home_team_name}:")
-        print(f"     Passing Downs Success: {home_metrics_raw.get('passingDownsSuccess', 0):.3f} | Allowed: {home_metrics_raw.get('passingDownsSuccessAllowed', 0):.3f}")
-        print(f"     Standard Downs Success: {home_metrics_raw.get('standardDownsSuccess', 0):.3f} | Allowed: {home_metrics_raw.get('standardDownsSuccessAllowed', 0):.3f}")
-        
-        print(f"  ✈️  {away_team_name}:")
-        print(f"     Passing Downs Success: {away_metrics_raw.get('passingDownsSuccess', 0):.3f} | Allowed: {away_metrics_raw.get('passingDownsSuccessAllowed', 0):.3f}")
-        print(f"     Standard Downs Success: {away_metrics_raw.get('standardDownsSuccess', 0):.3f} | Allowed: {away_metrics_raw.get('standardDownsSuccessAllowed', 0):.3f}")
-        
-        print(f"\n🎯 FIELD POSITION & YARDS BREAKDOWN:")
-        print(f"  🏠 {home_team_name}:")
-        print(f"     Line Yards: {home_metrics_raw.get('lineYards', 0):.3f} | Allowed: {home_metrics_raw.get('lineYardsAllowed', 0):.3f}")
-        print(f"     Second Level: {home_metrics_raw.get('secondLevelYards', 0):.3f} | Allowed: {home_metrics_raw.get('secondLevelYardsAllowed', 0):.3f}")
-        print(f"     Open Field: {home_metrics_raw.get('openFieldYards', 0):.3f} | Allowed: {home_metrics_raw.get('openFieldYardsAllowed', 0):.3f}")
-        print(f"     Highlight Yards: {home_metrics_raw.get('highlightYards', 0):.3f} | Allowed: {home_metrics_raw.get('highlightYardsAllowed', 0):.3f}")
-        
-        print(f"  ✈️  {away_team_name}:")
-        print(f"     Line Yards: {away_metrics_raw.get('lineYards', 0):.3f} | Allowed: {away_metrics_raw.get('lineYardsAllowed', 0):.3f}")
-        print(f"     Second Level: {away_metrics_raw.get('secondLevelYards', 0):.3f} | Allowed: {away_metrics_raw.get('secondLevelYardsAllowed', 0):.3f}")
-        print(f"     Open Field: {away_metrics_raw.get('openFieldYards', 0):.3f} | Allowed: {away_metrics_raw.get('openFieldYardsAllowed', 0):.3f}")
-        print(f"     Highlight Yards: {away_metrics_raw.get('highlightYards', 0):.3f} | Allowed: {away_metrics_raw.get('highlightYardsAllowed', 0):.3f}")
-        
-        print(f"\n🎯 COMPREHENSIVE DIFFERENTIAL ANALYSIS:")
-        print(f"     📊 EPA Differentials:")
-        print(f"        Overall EPA: {advanced_metrics.get('overall_epa_diff', 0):.3f}")
-        print(f"        Passing EPA: {advanced_metrics.get('passing_epa_diff', 0):.3f}")
-        print(f"        Rushing EPA: {advanced_metrics.get('rushing_epa_diff', 0):.3f}")
-        
-        print(f"     ⚡ Performance Metrics:")
-        print(f"        Success Rate: {advanced_metrics.get('success_rate_diff', 0):.3f}")
-        print(f"        Explosiveness: {advanced_metrics.get('explosiveness_diff', 0):.3f}")
-        
-        print(f"     🏈 Situational Success:")
-        print(f"        Passing Downs: {advanced_metrics.get('passing_downs_diff', 0):.3f}")
-        print(f"        Standard Downs: {advanced_metrics.get('standard_downs_diff', 0):.3f}")
-        
-        print(f"     📍 Field Position Control:")
-        print(f"        Line Yards: {advanced_metrics.get('line_yards_diff', 0):.3f}")
-        print(f"        Second Level: {advanced_metrics.get('second_level_diff', 0):.3f}")
-        print(f"        Open Field: {advanced_metrics.get('open_field_diff', 0):.3f}")
-        print(f"        Highlight Yards: {advanced_metrics.get('highlight_yards_diff', 0):.3f}")
-        
-        print(f"     🛡️  Defensive Edge:")
-        print(f"        EPA Defense: {advanced_metrics.get('epa_defense_diff', 0):.3f}")
-        print(f"        Passing Defense: {advanced_metrics.get('passing_defense_diff', 0):.3f}")
-        print(f"        Rushing Defense: {advanced_metrics.get('rushing_defense_diff', 0):.3f}")
-        print(f"        Success Defense: {advanced_metrics.get('success_defense_diff', 0):.3f}")
-        print(f"        Explosiveness Defense: {advanced_metrics.get('explosiveness_defense_diff', 0):.3f}")
-        print(f"        Situational Defense: {advanced_metrics.get('situational_defense_diff', 0):.3f}")
+        logger.debug("  🏠 %s:", home_team_name)
+        logger.debug("     Overall EPA: %.3f | EPA Allowed: %.3f", home_metrics_raw.get('epa', 0), home_metrics_raw.get('epaAllowed', 0))
+        logger.debug("     Passing EPA: %.3f | Passing EPA Allowed: %.3f", home_metrics_raw.get('passingEpa', 0), home_metrics_raw.get('passingEpaAllowed', 0))
+        logger.debug("     Rushing EPA: %.3f | Rushing EPA Allowed: %.3f", home_metrics_raw.get('rushingEpa', 0), home_metrics_raw.get('rushingEpaAllowed', 0))
+        logger.debug("     Success Rate: %.3f | Success Allowed: %.3f", home_metrics_raw.get('success', 0), home_metrics_raw.get('successAllowed', 0))
+        logger.debug("     Explosiveness: %.3f | Explosiveness Allowed: %.3f", home_metrics_raw.get('explosiveness', 0), home_metrics_raw.get('explosivenessAllowed', 0))
+        
+        logger.debug("  ✈️  %s:", away_team_name)
+        logger.debug("     Overall EPA: %.3f | EPA Allowed: %.3f", away_metrics_raw.get('epa', 0), away_metrics_raw.get('epaAllowed', 0))
+        logger.debug("     Passing EPA: %.3f | Passing EPA Allowed: %.3f", away_metrics_raw.get('passingEpa', 0), away_metrics_raw.get('passingEpaAllowed', 0))
+        logger.debug("     Rushing EPA: %.3f | Rushing EPA Allowed: %.3f", away_metrics_raw.get('rushingEpa', 0), away_metrics_raw.get('rushingEpaAllowed', 0))
+        logger.debug("     Success Rate: %.3f | Success Allowed: %.3f", away_metrics_raw.get('success', 0), away_metrics_raw.get('successAllowed', 0))
+        logger.debug("     Explosiveness: %.3f | Explosiveness Allowed: %.3f", away_metrics_raw.get('explosiveness', 0), away_metrics_raw.get('explosivenessAllowed', 0))
+        
+        logger.debug("\n🏈 SITUATIONAL PERFORMANCE:")
+        logger.debug("  🏠 %s:", home_team_name)
+        logger.debug("     Passing Downs Success: %.3f | Allowed: %.3f", home_metrics_raw.get('passingDownsSuccess', 0), home_metrics_raw.get('passingDownsSuccessAllowed', 0))
+        logger.debug("     Standard Downs Success: %.3f | Allowed: %.3f", home_metrics_raw.get('standardDownsSuccess', 0), home_metrics_raw.get('standardDownsSuccessAllowed', 0))
+        
+        logger.debug("  ✈️  %s:", away_team_name)
+        logger.debug("     Passing Downs Success: %.3f | Allowed: %.3f", away_metrics_raw.get('passingDownsSuccess', 0), away_metrics_raw.get('passingDownsSuccessAllowed', 0))
+        logger.debug("     Standard Downs Success: %.3f | Allowed: %.3f", away_metrics_raw.get('standardDownsSuccess', 0), away_metrics_raw.get('standardDownsSuccessAllowed', 0))
+        
+        logger.debug("\n🎯 FIELD POSITION & YARDS BREAKDOWN:")
+        logger.debug("  🏠 %s:", home_team_name)
+        logger.debug("     Line Yards: %.3f | Allowed: %.3f", home_metrics_raw.get('lineYards', 0), home_metrics_raw.get('lineYardsAllowed', 0))
+        logger.debug("     Second Level: %.3f | Allowed: %.3f", home_metrics_raw.get('secondLevelYards', 0), home_metrics_raw.get('secondLevelYardsAllowed', 0))
+        logger.debug("     Open Field: %.3f | Allowed: %.3f", home_metrics_raw.get('openFieldYards', 0), home_metrics_raw.get('openFieldYardsAllowed', 0))
+        logger.debug("     Highlight Yards: %.3f | Allowed: %.3f", home_metrics_raw.get('highlightYards', 0), home_metrics_raw.get('highlightYardsAllowed', 0))
+        
+        logger.debug("  ✈️  %s:", away_team_name)
+        logger.debug("     Line Yards: %.3f | Allowed: %.3f", away_metrics_raw.get('lineYards', 0), away_metrics_raw.get('lineYardsAllowed', 0))
+        logger.debug("     Second Level: %.3f | Allowed: %.3f", away_metrics_raw.get('secondLevelYards', 0), away_metrics_raw.get('secondLevelYardsAllowed', 0))
+        logger.debug("     Open Field: %.3f | Allowed: %.3f", away_metrics_raw.get('openFieldYards', 0), away_metrics_raw.get('openFieldYardsAllowed', 0))
+        logger.debug("     Highlight Yards: %.3f | Allowed: %.3f", away_metrics_raw.get('highlightYards', 0), away_metrics_raw.get('highlightYardsAllowed', 0))
+        
+        logger.debug("\n🎯 COMPREHENSIVE DIFFERENTIAL ANALYSIS:")
+        logger.debug("     📊 EPA Differentials:")
+        logger.debug("        Overall EPA: %.3f", advanced_metrics.get('overall_epa_diff', 0))
+        logger.debug("        Passing EPA: %.3f", advanced_metrics.get('passing_epa_diff', 0))
+        logger.debug("        Rushing EPA: %.3f", advanced_metrics.get('rushing_epa_diff', 0))
+        
+        logger.debug("     ⚡ Performance Metrics:")
+        logger.debug("        Success Rate: %.3f", advanced_metrics.get('success_rate_diff', 0))
+        logger.debug("        Explosiveness: %.3f", advanced_metrics.get('explosiveness_diff', 0))
+        
+        logger.debug("     🏈 Situational Success:")
+        logger.debug("        Passing Downs: %.3f", advanced_metrics.get('passing_downs_diff', 0))
+        logger.debug("        Standard Downs: %.3f", advanced_metrics.get('standard_downs_diff', 0))
+        
+        logger.debug("     📍 Field Position Control:")
+        logger.debug("        Line Yards: %.3f", advanced_metrics.get('line_yards_diff', 0))
+        logger.debug("        Second Level: %.3f", advanced_metrics.get('second_level_diff', 0))
+        logger.debug("        Open Field: %.3f", advanced_metrics.get('open_field_diff', 0))
+        logger.debug("        Highlight Yards: %.3f", advanced_metrics.get('highlight_yards_diff', 0))
+        
+        logger.debug("     🛡️  Defensive Edge:")
+        logger.debug("        EPA Defense: %.3f", advanced_metrics.get('epa_defense_diff', 0))
+        logger.debug("        Passing Defense: %.3f", advanced_metrics.get('passing_defense_diff', 0))
+        logger.debug("        Rushing Defense: %.3f", advanced_metrics.get('rushing_defense_diff', 0))
+        logger.debug("        Success Defense: %.3f", advanced_metrics.get('success_defense_diff', 0))
+        logger.debug("        Explosiveness Defense: %.3f", advanced_metrics.get('explosiveness_defense_diff', 0))
+        logger.debug("        Situational Defense: %.3f", advanced_metrics.get('situational_defense_diff', 0))
         
         # Talent Ratings
         home_talent = data.get('homeTeamTalent', [{}])[0].get('talent', 0) if data.get('homeTeamTalent') else 0
         away_talent = data.get('awayTeamTalent', [{}])[0].get('talent', 0) if data.get('awayTeamTalent') else 0
-        print(f"\n🌟 TALENT RATINGS:")
-        print(f"  🏠 {home_team_name}: {home_talent}")
-        print(f"  ✈️  {away_team_name}: {away_talent}")
-        print(f"  📊 Talent Gap: {away_talent - home_talent:+.1f} (Away advantage)")
+        logger.debug("\n🌟 TALENT RATINGS:")
+        logger.debug("  🏠 %s: %s", home_team_name, home_talent)
+        logger.debug("  ✈️  %s: %s", away_team_name, away_talent)
+        logger.debug("  📊 Talent Gap: %+.1f (Away advantage)", away_talent - home_talent)
         
         # Season Records Analysis
-        print(f"\n🗓️  2025 SEASON RECORDS & RESULTS:")
+        logger.debug("\n🗓️  2025 SEASON RECORDS & RESULTS:")
         
         def analyze_team_record(games, team_id, team_name):
             wins = 0
@@ -3116,16 +3140,16 @@ class LightningPredictor:
                             losses += 1
                         completed_games.append(f"Week {game['week']}: @ {game['homeTeam']} {result} {away_points}-{home_points}")
             
-            print(f"  {team_name}: {wins}-{losses}")
+            logger.debug("  %s: %s-%s", team_name, wins, losses)
             for game_result in completed_games[-6:]:  # Show last 6 games
-                print(f"    {game_result}")
+                logger.debug("    %s", game_result)
             return wins, losses
         
         home_wins, home_losses = analyze_team_record(data.get('homeSeasonGames', []), home_team_id, home_team_name)
         away_wins, away_losses = analyze_team_record(data.get('awaySeasonGames', []), away_team_id, away_team_name)
         
         # ELO Ratings - Get actual values from data
-        print(f"\n⚡ ELO RATINGS (Current):")
+        logger.debug("\n⚡ ELO RATINGS (Current):")
         
         # Get correct ELO values from the ratings data
         home_current_elo = 1500  # Default
@@ -3137,23 +3161,23 @@ class LightningPredictor:
             home_current_elo = home_ratings.get('elo', 1500)
             away_current_elo = away_ratings.get('elo', 1500)
             
-        print(f"  🏠 {home_team_name}: {home_current_elo}")
-        print(f"  ✈️  {away_team_name}: {away_current_elo}")
-        print(f"  📊 ELO Gap: {away_current_elo - home_current_elo:+} ({'Away' if away_current_elo > home_current_elo else 'Home'} advantage)")
+        logger.debug("  🏠 %s: %s", home_team_name, home_current_elo)
+        logger.debug("  ✈️  %s: %s", away_team_name, away_current_elo)
+        logger.debug("  📊 ELO Gap: %s (%s advantage)", lazy_format(away_current_elo - home_current_elo, '+'), 'Away' if away_current_elo > home_current_elo else 'Home')
         
         # NEW ENHANCED DATA ANALYSIS (available endpoints only)
-        print(f"\n🎯 ENHANCED ANALYSIS (WORKING SCHEMA):")
+        logger.debug("\n🎯 ENHANCED ANALYSIS (WORKING SCHEMA):")
         
         # Composite Ratings - NOW WORKING!
         if data.get('homeRatings') and data.get('awayRatings'):
             home_ratings = data['homeRatings'][0] if data['homeRatings'] else {}
             away_ratings = data['awayRatings'][0] if data['awayRatings'] else {}
-            print(f"  🎯 Home FPI: {home_ratings.get('fpi', 'N/A')}")
-            print(f"  🎯 Away FPI: {away_ratings.get('fpi', 'N/A')}")
-            print(f"  🎯 Home ELO: {home_ratings.get('elo', 'N/A')}")
-            print(f"  🎯 Away ELO: {away_ratings.get('elo', 'N/A')}")
+            logger.debug("  🎯 Home FPI: %s", home_ratings.get('fpi', 'N/A'))
+            logger.debug("  🎯 Away FPI: %s", away_ratings.get('fpi', 'N/A'))
+            logger.debug("  🎯 Home ELO: %s", home_ratings.get('elo', 'N/A'))
+            logger.debug("  🎯 Away ELO: %s", away_ratings.get('elo', 'N/A'))
         else:
-            print(f"  🎯 No composite ratings available")
+            logger.debug("  🎯 No composite ratings available")
         
         # Weather Data
         if data.get('gameWeather'):
@@ -3161,35 +3185,35 @@ class LightningPredictor:
             temp = weather.get('temperature', 'N/A')
             wind = weather.get('windSpeed', 'N/A')
             precip = weather.get('precipitation', 'N/A')
-            print(f"  🌤️ Temperature: {temp}°F")
-            print(f"  🌤️ Wind: {wind} mph")
-            print(f"  🌤️ Precipitation: {precip} in")
+            logger.debug("  🌤️ Temperature: %s°F", temp)
+            logger.debug("  🌤️ Wind: %s mph", wind)
+            logger.debug("  🌤️ Precipitation: %s in", precip)
         else:
-            print(f"  🌤️ No weather data available")
+            logger.debug("  🌤️ No weather data available")
             
         # Poll Data (enhanced with team mapping)
         if data.get('currentPolls'):
             polls_count = len(data['currentPolls'])
-            print(f"  🏆 Poll data: {polls_count} rankings available with team mapping!")
+            logger.debug("  🏆 Poll data: %s rankings available with team mapping!", polls_count)
         else:
-            print(f"  🏆 No poll data available")
+            logger.debug("  🏆 No poll data available")
             
         # Calendar/Bye Week Data
         if data.get('weeklyCalendar'):
             calendar_weeks = len([w for w in data['weeklyCalendar'] if w.get('year') == self.current_year])
-            print(f"  📅 Calendar data available: {calendar_weeks} weeks")
+            logger.debug("  📅 Calendar data available: %s weeks", calendar_weeks)
         else:
-            print(f"  📅 No calendar data available")
+            logger.debug("  📅 No calendar data available")
         
         # Note about available endpoints  
         market_lines = data.get('marketLines', [])
         if market_lines:
-            print(f"  📊 Market lines: {len(market_lines)} sportsbooks available!")
+            logger.debug("  📊 Market lines: %s sportsbooks available!", len(market_lines))
         else:
-            print(f"  📊 Market lines: No lines available for this game")
-        print(f"  🏆 Poll data: Available with team mapping!")
+            logger.debug("  📊 Market lines: No lines available for this game")
+        logger.debug("  🏆 Poll data: Available with team mapping!")
         
-        print("="*80)
+        logger.debug('=' * 80)
 
         # Validate data availability first
         data = self._validate_data_availability(data)
@@ -3223,25 +3247,16 @@ class LightningPredictor:
         # OPTIMIZED PREDICTION CALCULATION WITH RESEARCH-BASED WEIGHTS
         # ==============================================================================
         
-        print("\n" + "="*80)
-        print("🎯 APPLYING OPTIMAL WEIGHTS (Research Framework)")
-        print("="*80)
+        logger.debug('\n' + '=' * 80)
+        logger.debug("🎯 APPLYING OPTIMAL WEIGHTS (Research Framework)")
+        logger.debug('=' * 80)
         
         # 1. OPPONENT-ADJUSTED METRICS (50% weight)
-        print("\n📊 [1/5] OPPONENT-ADJUSTED METRICS (50%)")
-        advanced_metrics_differential, metrics_details = self._calculate_advanced_metrics_differential(
-            data.get('homeTeamMetrics', [{}])[0] if data.get('homeTeamMetrics') else {},
-            data.get('awayTeamMetrics', [{}])[0] if data.get('awayTeamMetrics') else {}
-        )
+        logger.debug("\n📊 [1/5] OPPONENT-ADJUSTED METRICS (50%)")
+        metrics_details = advanced_metrics
         
-        # Apply temporal weighting (Dixon-Coles) to recent form
-        home_temporal_performance = self.apply_temporal_weighting(
-            data.get('homeSeasonGames', []), home_team_id, self.current_week
-        )
-        away_temporal_performance = self.apply_temporal_weighting(
-            data.get('awaySeasonGames', []), away_team_id, self.current_week
-        )
-        temporal_differential = (home_temporal_performance - away_temporal_performance) * 10
+        # Temporal weighting (Dixon-Coles) of recent form, computed with the team metrics
+        temporal_differential = (home_metrics.temporal_performance - away_metrics.temporal_performance) * 10
         
         # Calculate SoS-adjusted performance
         sos_differential = home_metrics.sos_rating - away_metrics.sos_rating
@@ -3252,19 +3267,19 @@ class LightningPredictor:
             temporal_differential * 0.20 +          # 20% Dixon-Coles weighted form
             sos_differential * 0.10                 # 10% strength of schedule adjustment
         )
-        print(f"   Advanced Metrics Diff: {advanced_metrics_differential:.3f}")
-        print(f"   Temporal Performance Diff: {temporal_differential:.3f}")
-        print(f"   SoS Adjustment: {sos_differential:.3f}")
-        print(f"   ✅ Final Component: {opponent_adjusted_score:.3f}")
+        logger.debug("   Advanced Metrics Diff: %.3f", advanced_metrics_differential)
+        logger.debug("   Temporal Performance Diff: %.3f", temporal_differential)
+        logger.debug("   SoS Adjustment: %.3f", sos_differential)
+        logger.debug("   ✅ Final Component: %.3f", opponent_adjusted_score)
         
         # 2. MARKET CONSENSUS (20% weight) - SIGNIFICANTLY INCREASED
-        print("\n💰 [2/5] MARKET CONSENSUS (20%)")
+        logger.debug("\n💰 [2/5] MARKET CONSENSUS (20%)")
         market_lines = data.get('marketLines', [])
         market_consensus = self._analyze_market_lines(market_lines)
-        print(f"   ✅ Market Signal: {market_consensus:.3f}")
+        logger.debug("   ✅ Market Signal: %.3f", market_consensus)
         
         # 3. COMPOSITE RATINGS (15% weight) - Talent/Rankings
-        print("\n🏆 [3/5] COMPOSITE RATINGS - TALENT (15%)")
+        logger.debug("\n🏆 [3/5] COMPOSITE RATINGS - TALENT (15%)")
         ratings_differential = self._analyze_composite_ratings(
             data.get('homeRatings', []), 
             data.get('awayRatings', [])
@@ -3273,12 +3288,12 @@ class LightningPredictor:
         talent_raw = home_metrics.talent_rating - away_metrics.talent_rating
         talent_differential = talent_raw * 0.001  # Normalize: 100 talent diff = 0.1 contribution
         composite_score = (ratings_differential * 0.70 + talent_differential * 0.30)
-        print(f"   Ratings Diff (ELO/FPI): {ratings_differential:.3f}")
-        print(f"   Talent Diff (raw): {talent_raw:.1f} -> normalized: {talent_differential:.3f}")
-        print(f"   ✅ Composite Score: {composite_score:.3f}")
+        logger.debug("   Ratings Diff (ELO/FPI): %.3f", ratings_differential)
+        logger.debug("   Talent Diff (raw): %.1f -> normalized: %.3f", talent_raw, talent_differential)
+        logger.debug("   ✅ Composite Score: %.3f", composite_score)
         
         # 4. KEY PLAYER IMPACT (10% weight) - SIGNIFICANTLY INCREASED
-        print("\n⭐ [4/5] KEY PLAYER IMPACT (10%)")
+        logger.debug("\n⭐ [4/5] KEY PLAYER IMPACT (10%)")
         home_team_name = data.get('homeTeam', [{}])[0].get('school', 'Home') if data.get('homeTeam') else 'Home'
         away_team_name = data.get('awayTeam', [{}])[0].get('school', 'Away') if data.get('awayTeam') else 'Away'
         player_impact, player_analysis_data = self._analyze_key_players(
@@ -3288,7 +3303,7 @@ class LightningPredictor:
             home_team_name,
             away_team_name
         )
-        print(f"   ✅ Player Differential: {player_impact:.3f}")
+        logger.debug("   ✅ Player Differential: %.3f", player_impact)
         
         # Enhanced weather data handling - FIXED to use specific game weather!
         # First, try to get weather from the specific current game
@@ -3301,7 +3316,7 @@ class LightningPredictor:
             if game_weather and game_weather.get('temperature') is not None:
                 api_weather_data = game_weather
                 current_game_id = current_game.get('id')
-                print(f"✅ Using specific game weather for game {current_game_id}: {api_weather_data.get('temperature')}°F, {api_weather_data.get('windSpeed')} mph wind")
+                logger.debug("✅ Using specific game weather for game %s: %s°F, %s mph wind", current_game_id, api_weather_data.get('temperature'), api_weather_data.get('windSpeed'))
         
         # Fallback to legacy gameWeather matching by game ID (old behavior)
         if not api_weather_data:
@@ -3312,13 +3327,13 @@ class LightningPredictor:
             for weather_record in game_weather_list:
                 if weather_record.get('gameId') == current_game_id:
                     api_weather_data = weather_record
-                    print(f"✅ Found legacy weather match for gameId {current_game_id}: {api_weather_data.get('temperature')}°F, {api_weather_data.get('windSpeed')} mph wind")
+                    logger.debug("✅ Found legacy weather match for gameId %s: %s°F, %s mph wind", current_game_id, api_weather_data.get('temperature'), api_weather_data.get('windSpeed'))
                     break
             
             if not api_weather_data and game_weather_list:
                 # Final fallback to first record (old behavior)
                 api_weather_data = game_weather_list[0]
-                print(f"⚠️ Using fallback weather data: {api_weather_data.get('temperature')}°F, {api_weather_data.get('windSpeed')} mph wind")
+                logger.warning("⚠️ Using fallback weather data: %s°F, %s mph wind", api_weather_data.get('temperature'), api_weather_data.get('windSpeed'))
         
         # Check if we have real weather data from API
         has_real_weather = (api_weather_data and 
@@ -3340,30 +3355,27 @@ class LightningPredictor:
                 'weather_condition_code': api_weather_data.get('weatherConditionCode'),
                 'weather_factor': 0.0  # Will be calculated later
             }
-            print(f"🌤️  Using REAL weather data from API")
+            logger.debug("🌤️  Using REAL weather data from API")
         else:
             # Generate realistic weather based on home team location
             generated_weather = self._generate_realistic_weather(home_team_name, None)
             weather_data = generated_weather
-            print(f"🌤️  Generated realistic weather for {home_team_name}")
+            logger.debug("🌤️  Generated realistic weather for %s", home_team_name)
         
         # 5. CONTEXTUAL FACTORS (5% weight)
-        print("\n🌤️  [5/5] CONTEXTUAL FACTORS (5%)")
+        logger.debug("\n🌤️  [5/5] CONTEXTUAL FACTORS (5%)")
         weather_factor = self._calculate_enhanced_weather_impact(weather_data)
         poll_momentum = self._analyze_poll_trends(data.get('currentPolls', []), home_team_id, away_team_id)
         bye_week_advantage = self._analyze_bye_week_calendar(data.get('weeklyCalendar', []), data)
         contextual_score = (weather_factor * 0.4 + poll_momentum * 0.3 + bye_week_advantage * 0.3)
-        print(f"   Weather Impact: {weather_factor:.3f}")
-        print(f"   Poll Momentum: {poll_momentum:.3f}")
-        print(f"   Bye Week Advantage: {bye_week_advantage:.3f}")
-        print(f"   ✅ Contextual Score: {contextual_score:.3f}")
+        logger.debug("   Weather Impact: %.3f", weather_factor)
+        logger.debug("   Poll Momentum: %.3f", poll_momentum)
+        logger.debug("   Bye Week Advantage: %.3f", bye_week_advantage)
+        logger.debug("   ✅ Contextual Score: %.3f", contextual_score)
         
         # ==============================================================================
-        # CALCULATE DYNAMIC WEIGHTS BASED ON MATCHUP CHARACTERISTICS
+        # DYNAMIC WEIGHT INPUTS (weights are applied per game by score_features)
         # ==============================================================================
-        print("\n" + "="*80)
-        print("🎲 DYNAMIC WEIGHT CALCULATION")
-        print("="*80)
         
         # Get ratings for dynamic weighting
         home_ratings_dict = data.get('homeRatings', [{}])[0] if data.get('homeRatings') else {}
@@ -3379,42 +3391,6 @@ class LightningPredictor:
         if away_metrics and hasattr(away_metrics, 'sos_rating'):
             away_sos_rank = int(away_metrics.sos_rating * 2) if away_metrics.sos_rating > 0 else 65
         
-        # Calculate dynamic weights based on matchup
-        self.WEIGHTS = self._calculate_dynamic_weights(
-            home_elo, away_elo,
-            home_ratings_dict, away_ratings_dict,
-            home_sos_rank, away_sos_rank
-        )
-        
-        # Add defensive metrics weight (will be applied in enhancement section)
-        defensive_metrics_weight = self.WEIGHTS.get('defensive_metrics', 0.10)
-        
-        # ==============================================================================
-        # APPLY DYNAMIC WEIGHTS
-        # ==============================================================================
-        print("\n" + "="*80)
-        print("⚖️  WEIGHTED COMPOSITE CALCULATION (DYNAMIC)")
-        print("="*80)
-        
-        raw_differential = (
-            opponent_adjusted_score * self.WEIGHTS['opponent_adjusted_metrics'] +
-            market_consensus * self.WEIGHTS['market_consensus'] +
-            composite_score * self.WEIGHTS['composite_ratings'] +
-            player_impact * self.WEIGHTS['key_player_impact'] +
-            contextual_score * self.WEIGHTS['contextual_factors']
-        )
-        
-        print(f"   Opponent-Adjusted ({self.WEIGHTS['opponent_adjusted_metrics']:.0%}): {opponent_adjusted_score * self.WEIGHTS['opponent_adjusted_metrics']:.3f}")
-        print(f"   Market Consensus ({self.WEIGHTS['market_consensus']:.0%}):   {market_consensus * self.WEIGHTS['market_consensus']:.3f}")
-        print(f"   Composite Ratings ({self.WEIGHTS['composite_ratings']:.0%}):  {composite_score * self.WEIGHTS['composite_ratings']:.3f}")
-        print(f"   Key Player Impact ({self.WEIGHTS['key_player_impact']:.0%}):  {player_impact * self.WEIGHTS['key_player_impact']:.3f}")
-        print(f"   Contextual Factors ({self.WEIGHTS['contextual_factors']:.0%}): {contextual_score * self.WEIGHTS['contextual_factors']:.3f}")
-        print(f"\n   🎯 RAW DIFFERENTIAL: {raw_differential:.3f}")
-
-        # Current week adjustments
-        home_field_advantage = 2.5  # Standard 2.5 point home field
-        conference_game_bonus = self._check_conference_rivalry(data)
-        
         # Calculate all differential metrics for enhanced prediction
         epa_differential = (home_metrics.epa - home_metrics.epa_allowed) - (away_metrics.epa - away_metrics.epa_allowed)
         success_differential = home_metrics.success_rate - away_metrics.success_rate
@@ -3422,21 +3398,10 @@ class LightningPredictor:
         elo_differential = home_metrics.elo_rating - away_metrics.elo_rating
         consistency_differential = home_metrics.consistency_score - away_metrics.consistency_score
         recent_vs_early_differential = home_metrics.recent_vs_early_differential - away_metrics.recent_vs_early_differential
-        
-        # Calculate weather penalty and trend differential for key factors analysis
-        weather_penalty = self._calculate_enhanced_weather_impact(weather_data)
         trend_differential = home_metrics.season_trend - away_metrics.season_trend
 
-        # Apply current week adjustments
-        adjusted_differential = (
-            raw_differential +
-            home_field_advantage +
-            conference_game_bonus -
-            weather_penalty
-        )
-
         # DEFENSIVE METRICS ANALYSIS - New weighted category
-        print("\n🛡️  DEFENSIVE MISMATCH ANALYSIS")
+        logger.debug("\n🛡️  DEFENSIVE MISMATCH ANALYSIS")
         
         # Get defensive efficiency from metrics or static data
         home_def_efficiency = 50.0  # Default
@@ -3466,122 +3431,136 @@ class LightningPredictor:
         if abs(home_def_vs_away_off) > 40 or abs(away_def_vs_home_off) > 40:
             # Elite defense vs poor offense - reduce expected scoring
             defensive_dampener = 0.85  # 15% reduction
-            print(f"   🔒 ELITE DEFENSE DETECTED: Dampening total scoring by 15%")
+            logger.debug("   🔒 ELITE DEFENSE DETECTED: Dampening total scoring by 15%")
         elif abs(home_def_vs_away_off) > 30 or abs(away_def_vs_home_off) > 30:
             defensive_dampener = 0.92  # 8% reduction
-            print(f"   🛡️  Strong defensive mismatch: Dampening total scoring by 8%")
-        
-        print(f"   Home Def vs Away Off: {home_def_vs_away_off:+.1f}")
-        print(f"   Away Def vs Home Off: {away_def_vs_home_off:+.1f}")
-        print(f"   Defensive Advantage: {defensive_advantage:+.2f}")
-        print(f"   Defensive Dampener: {defensive_dampener:.2%}")
-        
-        # COMPREHENSIVE DIFFERENTIAL ENHANCEMENT - Using all calculated metrics for maximum effectiveness
-        comprehensive_enhancement = (
-            epa_differential * 0.12 +                    # 12% EPA differential (strong predictor)
-            success_differential * 15 * 0.10 +           # 10% Success rate (key metric)
-            explosiveness_differential * 10 * 0.08 +     # 8% Explosiveness (big play ability)
-            elo_differential * 0.06 +                    # 6% ELO differential
-            consistency_differential * 0.04 +            # 4% Consistency (reliability factor)
-            recent_vs_early_differential * 0.03 +        # 3% Recent form vs early season
-            trend_differential * 0.05 +                  # 5% Season trajectory
-            defensive_advantage * defensive_metrics_weight  # Defensive metrics (dynamic weight)
-        )
-        
-        print(f"   📊 Comprehensive Enhancement: {comprehensive_enhancement:+.3f}")
-        print(f"      • EPA Diff: {epa_differential:+.3f}")
-        print(f"      • Success Diff: {success_differential:+.3f}")
-        print(f"      • Explosiveness Diff: {explosiveness_differential:+.3f}")
-        print(f"      • ELO Diff: {elo_differential:+.3f}")
-        print(f"      • Consistency Diff: {consistency_differential:+.3f}")
-        print(f"      • Recent vs Early: {recent_vs_early_differential:+.3f}")
-        print(f"      • Trend Diff: {trend_differential:+.3f}")
-        print(f"      • Defensive Advantage: {defensive_advantage:+.3f} (weight: {defensive_metrics_weight:.0%})")
+            logger.debug("   🛡️  Strong defensive mismatch: Dampening total scoring by 8%")
         
-        # Apply comprehensive enhancement
-        adjusted_differential += comprehensive_enhancement
+        logger.debug("   Home Def vs Away Off: %+.1f", home_def_vs_away_off)
+        logger.debug("   Away Def vs Home Off: %+.1f", away_def_vs_home_off)
+        logger.debug("   Defensive Advantage: %+.2f", defensive_advantage)
+        logger.debug("   Defensive Dampener: %s", lazy_format(defensive_dampener, '.2%'))
 
         # ENHANCED PREDICTION: Incorporate new data sources for improved accuracy
         enhancement_factor = self._calculate_enhancement_factor(home_team_name, away_team_name)
-        print(f"   🚀 Enhancement Factor: {enhancement_factor:+.3f}")
-        
-        # Apply enhancement to the differential
-        adjusted_differential += enhancement_factor
+        logger.debug("   🚀 Enhancement Factor: %+.3f", enhancement_factor)
 
-        # Apply situational modifiers for current week context
-        adjusted_differential = self._apply_situational_modifiers(adjusted_differential, data)
+        rivalry_scale, prime_time_scale, conference_stakes = self._situational_modifiers(data)
+        data_confidence, trend_confidence = self._confidence_features(data, home_metrics, away_metrics)
 
-        print(f"   🏠 Home Field Advantage: +{home_field_advantage:.1f}")
-        print(f"   🏆 Conference Bonus: +{conference_game_bonus:.1f}")
-        print(f"   🌧️  Weather Penalty: -{weather_penalty:.1f}")
-        print(f"\n   🎯 ADJUSTED DIFFERENTIAL: {adjusted_differential:.3f}")
+        values = feature_vector({
+            'advanced_metrics_diff': advanced_metrics_differential,
+            'temporal_diff': temporal_differential,
+            'sos_diff': sos_differential,
+            'market_consensus': market_consensus,
+            'composite_ratings': composite_score,
+            'player_impact': player_impact,
+            'contextual': contextual_score,
+            'home_elo': home_elo,
+            'away_elo': away_elo,
+            'fpi_gap': abs(home_ratings_dict.get('fpi', 0) - away_ratings_dict.get('fpi', 0)),
+            'sp_gap': abs(home_ratings_dict.get('sp_overall', 0) - away_ratings_dict.get('sp_overall', 0)),
+            'srs_gap': abs(home_ratings_dict.get('srs', 0) - away_ratings_dict.get('srs', 0)),
+            'home_sos_rank': home_sos_rank,
+            'away_sos_rank': away_sos_rank,
+            'home_field': 2.5,  # Standard 2.5 point home field
+            'conference_bonus': self._check_conference_rivalry(data),
+            'weather_penalty': weather_factor,
+            'epa_diff': epa_differential,
+            'success_diff': success_differential,
+            'explosiveness_diff': explosiveness_differential,
+            'elo_diff': elo_differential,
+            'consistency_diff': consistency_differential,
+            'recent_vs_early_diff': recent_vs_early_differential,
+            'trend_diff': trend_differential,
+            'defensive_advantage': defensive_advantage,
+            'enhancement_factor': enhancement_factor,
+            'rivalry_scale': rivalry_scale,
+            'prime_time_scale': prime_time_scale,
+            'conference_stakes': conference_stakes,
+            'base_total': self._calculate_total(home_metrics, away_metrics, data),
+            'defensive_dampener': defensive_dampener,
+            'data_confidence': data_confidence,
+            'trend_confidence': trend_confidence
+        })
+        return GameFeatures(home_team_id, away_team_id, values, context={
+            'data': data,
+            'home_metrics': home_metrics,
+            'away_metrics': away_metrics,
+            'advanced_metrics': metrics_details,
+            'player_analysis': player_analysis_data,
+            'weather': weather_data,
+            'sos_differential': sos_differential
+        })
 
-        # Convert to win probability (logistic function with proper scaling for college football)
-        # Lower divisor = more aggressive spread scaling (better matches actual game differentials)
-        raw_home_win_prob = 1 / (1 + math.exp(-adjusted_differential / 12.0))
-        
-        # ==============================================================================
-        # APPLY PLATT SCALING FOR PROBABILITY CALIBRATION
-        # ==============================================================================
-        print("\n" + "="*80)
-        print("🎲 PROBABILITY CALIBRATION (Platt Scaling)")
-        print("="*80)
-        print(f"   Raw Probability: {raw_home_win_prob:.1%}")
-        
-        home_win_prob = self.platt_scaling_calibration(raw_home_win_prob)
-        print(f"   Calibrated Probability: {home_win_prob:.1%}")
-        print(f"   Calibration Adjustment: {(home_win_prob - raw_home_win_prob)*100:+.1f} percentage points")
-
-        # Calculate spread and total with bounds
-        # CRITICAL FIX: The adjusted_differential is already scaled for logistic function (line 2940)
-        # For spread calculation, we need to use the raw_differential which is in a more reasonable range
-        # The spread should be derived from the win probability, not the raw differential
-        # Formula: spread = -ln(1/p - 1) * 2.4 where p is home win probability
-        # This converts probability back to spread using inverse logit
-
-        # Calculate spread from the calibrated win probability
-        # Using the inverse logit formula: spread = ln(p/(1-p)) * conversion_factor
-        # FIXED: Use higher conversion factor for college football (more volatile than NFL)
-        # College football has bigger talent gaps and score differentials
-        if home_win_prob > 0.01 and home_win_prob < 0.99:
-            predicted_spread = math.log(home_win_prob / (1 - home_win_prob)) * 11.0  # Increased to match actual spreads
-        else:
-            # Edge case: if probability is extreme, use even larger conversion factor
-            # For extreme cases, use higher factor to properly scale large differentials
-            predicted_spread = math.log(home_win_prob / (1 - home_win_prob)) * 14.0
-
-        predicted_total = self._calculate_total(home_metrics, away_metrics, data)
-        
-        # Apply defensive dampener to total if defensive mismatch exists
-        predicted_total = predicted_total * defensive_dampener
-        if defensive_dampener < 1.0:
-            print(f"   🔒 Total adjusted for defensive mismatch: {predicted_total:.1f} (dampened by {(1-defensive_dampener)*100:.0f}%)")
-
-        # Ensure reasonable spread bounds for college football
-        predicted_spread = max(min(predicted_spread, 35), -35)  # Cap spreads at ±35
-        
-        # Calculate implied scores - FIXED LOGIC
-        # If home team is favored by +X (positive spread), they should score more
-        # home_score = (total + spread) / 2, away_score = (total - spread) / 2
-        home_implied_score = (predicted_total + predicted_spread) / 2
-        away_implied_score = (predicted_total - predicted_spread) / 2
-        
-        # Handle extreme cases where a team would have negative points
-        if home_implied_score < 0:
-            home_implied_score = 0
-            away_implied_score = predicted_total
-        elif away_implied_score < 0:
-            away_implied_score = 0
-            home_implied_score = predicted_total
-        
-        print("\n" + "="*80)
-        print("🎯 FINAL PREDICTION")
-        print("="*80)
-        print(f"   Spread: {predicted_spread:+.1f} (Home)")
-        print(f"   Total: {predicted_total:.1f}")
-        print(f"   {home_team_name}: {home_implied_score:.0f} points")
-        print(f"   {away_team_name}: {away_implied_score:.0f} points")
-        print(f"   Win Probability: {home_team_name} {home_win_prob:.1%} | {away_team_name} {(1-home_win_prob):.1%}")
+    def _build_prediction(self, features: GameFeatures, scores: Dict) -> GamePrediction:
+        """Assemble the GamePrediction and UI analysis data for one scored feature row"""
+        data = features.context['data']
+        home_team_id, away_team_id = features.home_team_id, features.away_team_id
+        home_metrics, away_metrics = features.context['home_metrics'], features.context['away_metrics']
+        home_team_name = data.get('homeTeam', [{}])[0].get('school', 'Unknown') if data.get('homeTeam') else 'Unknown'
+        away_team_name = data.get('awayTeam', [{}])[0].get('school', 'Unknown') if data.get('awayTeam') else 'Unknown'
+        market_lines = data.get('marketLines', [])
+        weights = scores['weights']
+        adjusted_differential = scores['adjusted_differential']
+        home_win_prob = scores['home_win_prob']
+        predicted_spread = scores['predicted_spread']
+        predicted_total = scores['predicted_total']
+        home_implied_score = scores['home_implied_score']
+        away_implied_score = scores['away_implied_score']
+
+        logger.debug('\n' + '=' * 80)
+        logger.debug("🎲 DYNAMIC WEIGHT CALCULATION")
+        logger.debug('=' * 80)
+        logger.debug("   📊 %s (ELO diff %.0f): Composite %s, EPA %s", scores['tier'].replace('_', ' ').upper(), scores['elo_gap'],
+                     lazy_format(weights['composite_ratings'], '.0%'), lazy_format(weights['opponent_adjusted_metrics'], '.0%'))
+        if scores['consensus'] > 0.90:
+            logger.debug("   🎯 RATING CONSENSUS %s: Composite boosted +10%%", lazy_format(scores['consensus'], '.0%'))
+        if scores['sos_adjusted']:
+            logger.debug("   📅 SOS ADJUSTMENT: Favorite SOS #%.0f, Underdog #%.0f - Composite +5%%",
+                         min(features['home_sos_rank'], features['away_sos_rank']), max(features['home_sos_rank'], features['away_sos_rank']))
+
+        logger.debug('\n' + '=' * 80)
+        logger.debug("⚖️  WEIGHTED COMPOSITE CALCULATION (DYNAMIC)")
+        logger.debug('=' * 80)
+        logger.debug("   Opponent-Adjusted (%s): %.3f", lazy_format(weights['opponent_adjusted_metrics'], '.0%'), scores['opponent_adjusted'] * weights['opponent_adjusted_metrics'])
+        logger.debug("   Market Consensus (%s):   %.3f", lazy_format(weights['market_consensus'], '.0%'), features['market_consensus'] * weights['market_consensus'])
+        logger.debug("   Composite Ratings (%s):  %.3f", lazy_format(weights['composite_ratings'], '.0%'), features['composite_ratings'] * weights['composite_ratings'])
+        logger.debug("   Key Player Impact (%s):  %.3f", lazy_format(weights['key_player_impact'], '.0%'), features['player_impact'] * weights['key_player_impact'])
+        logger.debug("   Contextual Factors (%s): %.3f", lazy_format(weights['contextual_factors'], '.0%'), features['contextual'] * weights['contextual_factors'])
+        logger.debug("\n   🎯 RAW DIFFERENTIAL: %.3f", scores['raw_differential'])
+
+        logger.debug("   📊 Comprehensive Enhancement: %+.3f", scores['comprehensive_enhancement'])
+        logger.debug("      • EPA Diff: %+.3f", features['epa_diff'])
+        logger.debug("      • Success Diff: %+.3f", features['success_diff'])
+        logger.debug("      • Explosiveness Diff: %+.3f", features['explosiveness_diff'])
+        logger.debug("      • ELO Diff: %+.3f", features['elo_diff'])
+        logger.debug("      • Consistency Diff: %+.3f", features['consistency_diff'])
+        logger.debug("      • Recent vs Early: %+.3f", features['recent_vs_early_diff'])
+        logger.debug("      • Trend Diff: %+.3f", features['trend_diff'])
+        logger.debug("      • Defensive Advantage: %+.3f (weight: %s)", features['defensive_advantage'], lazy_format(weights['defensive_metrics'], '.0%'))
+        logger.debug("   🏠 Home Field Advantage: +%.1f", features['home_field'])
+        logger.debug("   🏆 Conference Bonus: +%.1f", features['conference_bonus'])
+        logger.debug("   🌧️  Weather Penalty: -%.1f", features['weather_penalty'])
+        logger.debug("\n   🎯 ADJUSTED DIFFERENTIAL: %.3f", adjusted_differential)
+
+        logger.debug('\n' + '=' * 80)
+        logger.debug("🎲 PROBABILITY CALIBRATION (Platt Scaling)")
+        logger.debug('=' * 80)
+        logger.debug("   Raw Probability: %s", lazy_format(scores['raw_home_win_prob'], '.1%'))
+        logger.debug("   Calibrated Probability: %s", lazy_format(home_win_prob, '.1%'))
+        logger.debug("   Calibration Adjustment: %+.1f percentage points", (home_win_prob - scores['raw_home_win_prob']) * 100)
+        if features['defensive_dampener'] < 1.0:
+            logger.debug("   🔒 Total adjusted for defensive mismatch: %.1f (dampened by %.0f%%)", predicted_total, (1 - features['defensive_dampener']) * 100)
+
+        logger.debug('\n' + '=' * 80)
+        logger.debug("🎯 FINAL PREDICTION")
+        logger.debug('=' * 80)
+        logger.debug("   Spread: %+.1f (Home)", predicted_spread)
+        logger.debug("   Total: %.1f", predicted_total)
+        logger.debug("   %s: %.0f points", home_team_name, home_implied_score)
+        logger.debug("   %s: %.0f points", away_team_name, away_implied_score)
+        logger.debug("   Win Probability: %s %s | %s %s", home_team_name, lazy_format(home_win_prob, '.1%'), away_team_name, lazy_format(1 - home_win_prob, '.1%'))
         
         # MARKET VALIDATION: Check if prediction is significantly off from consensus
         if market_lines and len(market_lines) > 0:
@@ -3590,22 +3569,28 @@ class LightningPredictor:
             spread_difference = abs(predicted_spread - avg_market_spread)
             
             if spread_difference > 15:
-                print(f"\n⚠️  WARNING: Prediction differs from market by {spread_difference:.1f} points!")
-                print(f"   Market consensus: {avg_market_spread:+.1f}")
-                print(f"   Model prediction: {predicted_spread:+.1f}")
-                print(f"   This may indicate a data quality issue or extreme mismatch.")
+                logger.warning("\n⚠️  WARNING: Prediction differs from market by %.1f points!", spread_difference)
+                logger.debug("   Market consensus: %+.1f", avg_market_spread)
+                logger.debug("   Model prediction: %+.1f", predicted_spread)
+                logger.debug("   This may indicate a data quality issue or extreme mismatch.")
             elif spread_difference > 10:
-                print(f"\n⚡ NOTICE: Prediction differs from market by {spread_difference:.1f} points")
-                print(f"   Market: {avg_market_spread:+.1f} | Model: {predicted_spread:+.1f}")
-                print(f"   Potential value bet opportunity or model recalibration needed.")
+                logger.debug("\n⚡ NOTICE: Prediction differs from market by %.1f points", spread_difference)
+                logger.debug("   Market: %+.1f | Model: %+.1f", avg_market_spread, predicted_spread)
+                logger.debug("   Potential value bet opportunity or model recalibration needed.")
         
         # Enhanced confidence based on data quality and consensus
-        confidence = self._calculate_enhanced_confidence(data, abs(adjusted_differential), home_metrics, away_metrics)
+        confidence = scores['confidence']
+        logger.debug("🔢 CONFIDENCE BREAKDOWN:")
+        logger.debug("   Base Data + Consistency: %.2f", features['data_confidence'])
+        logger.debug("   Differential: +%.2f", scores['differential_boost'])
+        logger.debug("   Trend Factor: +%.2f", features['trend_confidence'])
+        logger.debug("   TOTAL CONFIDENCE: %.2f", confidence)
 
         # Store predicted spread for comparison in key factors
         self.last_predicted_spread = predicted_spread
 
         # Prepare detailed analysis data for UI
+        weather = features.context['weather']
         home_metrics_raw = data.get('homeTeamMetrics', [{}])[0] if data.get('homeTeamMetrics') else {}
         away_metrics_raw = data.get('awayTeamMetrics', [{}])[0] if data.get('awayTeamMetrics') else {}
         home_ratings = data.get('homeRatings', [{}])[0] if data.get('homeRatings') else {}
@@ -3623,15 +3608,15 @@ class LightningPredictor:
         away_poll_rank = self._get_team_poll_rank(polls, away_team_id)
         
         # Debug: Print what we're capturing
-        print(f"\n🔍 DEBUG: Capturing detailed analysis data...")
-        print(f"   - Advanced metrics details: {type(metrics_details)}, keys: {metrics_details.keys() if isinstance(metrics_details, dict) else 'N/A'}")
-        print(f"   - Home record: {home_record['wins']}-{home_record['losses']}")
-        print(f"   - Away record: {away_record['wins']}-{away_record['losses']}")
-        print(f"   - Home poll rank: {home_poll_rank}")
-        print(f"   - Away poll rank: {away_poll_rank}")
+        logger.debug("\n🔍 DEBUG: Capturing detailed analysis data...")
+        logger.debug("   - Advanced metrics details: %s, keys: %s", type(features.context['advanced_metrics']), features.context['advanced_metrics'].keys() if isinstance(features.context['advanced_metrics'], dict) else 'N/A')
+        logger.debug("   - Home record: %s-%s", home_record['wins'], home_record['losses'])
+        logger.debug("   - Away record: %s-%s", away_record['wins'], away_record['losses'])
+        logger.debug("   - Home poll rank: %s", home_poll_rank)
+        logger.debug("   - Away poll rank: %s", away_poll_rank)
         
         detailed_analysis_data = {
-            'advanced_metrics': metrics_details,
+            'advanced_metrics': features.context['advanced_metrics'],
             'team_metrics': {
                 'home': {
                     'epa': home_metrics_raw.get('epa', 0),
@@ -3707,36 +3692,33 @@ class LightningPredictor:
             'homeTeamId': home_team_id,
             'awayTeamId': away_team_id,
             'weather': {
-                'temperature': weather_data.get('temperature'),
-                'wind_speed': weather_data.get('wind_speed'),
-                'precipitation': weather_data.get('precipitation'),
-                'humidity': weather_data.get('humidity'),
-                'dewpoint': weather_data.get('dewpoint'),
-                'pressure': weather_data.get('pressure'),
-                'snowfall': weather_data.get('snowfall'),
-                'wind_direction': weather_data.get('wind_direction'),
-                'wind_gust': weather_data.get('wind_gust'),
-                'weather_condition_code': weather_data.get('weather_condition_code')
+                'temperature': weather.get('temperature'),
+                'wind_speed': weather.get('wind_speed'),
+                'precipitation': weather.get('precipitation'),
+                'humidity': weather.get('humidity'),
+                'dewpoint': weather.get('dewpoint'),
+                'pressure': weather.get('pressure'),
+                'snowfall': weather.get('snowfall'),
+                'wind_direction': weather.get('wind_direction'),
+                'wind_gust': weather.get('wind_gust'),
+                'weather_condition_code': weather.get('weather_condition_code')
             },
             'weight_breakdown': {
-                'opponent_adjusted': opponent_adjusted_score,
-                'market_consensus': market_consensus,
-                'composite_ratings': composite_score,
-                'player_impact': player_impact,
-                'contextual_factors': contextual_score
+                'opponent_adjusted': scores['opponent_adjusted'],
+                'market_consensus': features['market_consensus'],
+                'composite_ratings': features['composite_ratings'],
+                'player_impact': features['player_impact'],
+                'contextual_factors': features['contextual']
             },
             'market_lines': self._format_market_lines(market_lines),
             'implied_scores': {
                 'home': round(home_implied_score),
                 'away': round(away_implied_score)
             },
-            'enhanced_player_analysis': player_analysis_data  # NEW: Enhanced player data for UI
+            'enhanced_player_analysis': features.context['player_analysis']  # NEW: Enhanced player data for UI
         }
 
         # Create initial prediction with comprehensive team data
-        home_team_name = data.get('homeTeam', [{}])[0].get('school', 'Unknown') if data.get('homeTeam') else 'Unknown'
-        away_team_name = data.get('awayTeam', [{}])[0].get('school', 'Unknown') if data.get('awayTeam') else 'Unknown'
-        
         # Extract comprehensive team stats for UI display
         home_comprehensive_stats = self._get_comprehensive_team_stats(home_team_name, home_team_id)
         away_comprehensive_stats = self._get_comprehensive_team_stats(away_team_name, away_team_id)
@@ -3788,7 +3770,7 @@ class LightningPredictor:
                 game_date = start_datetime_eastern.strftime("%B %d, %Y")
                 game_time = start_datetime_eastern.strftime("%I:%M %p EST")
             except Exception as e:
-                print(f"⚠️ Error parsing game date: {e}")
+                logger.warning("⚠️ Error parsing game date: %s", e)
         
         prediction = GamePrediction(
             home_team=home_team_name,
@@ -3798,7 +3780,7 @@ class LightningPredictor:
             predicted_total=round(predicted_total, 1),
             confidence=confidence,
             key_factors=self._identify_enhanced_key_factors(
-                home_metrics, away_metrics, adjusted_differential, trend_differential, sos_differential, data
+                home_metrics, away_metrics, adjusted_differential, features['trend_diff'], features.context['sos_differential'], data
             ),
             detailed_analysis=detailed_analysis_data,
             # NEW: Comprehensive stats for UI
@@ -3816,68 +3798,42 @@ class LightningPredictor:
         )
 
         # Validate against market and adjust confidence
-        market_lines = data.get('marketLines', [])
         prediction = self._validate_against_market(prediction, market_lines)
 
         # Display algorithm weights and methodology for transparency
-        print(f"\n" + "="*80)
-        print(f"🔢 OPTIMIZED ALGORITHM WEIGHTS (Research Framework)")
-        print("="*80)
-        print(f"     🎯 Opponent-Adjusted Metrics: {self.WEIGHTS['opponent_adjusted_metrics']:.0%} (Primary Factor)")
-        print(f"        - Play-by-play EPA, Success Rates with SoS adjustment")
-        print(f"        - Dixon-Coles temporal weighting for recency")
-        print(f"        - Field position, explosiveness, situational performance")
-        print(f"")
-        print(f"     � Market Consensus: {self.WEIGHTS['market_consensus']:.0%} ⬆️ (Strong Bayesian Prior)")
-        print(f"        - Betting lines as information aggregator")
-        print(f"        - Sportsbook consensus signal")
-        print(f"")
-        print(f"     🏆 Composite Ratings: {self.WEIGHTS['composite_ratings']:.0%} (Talent/Rankings)")
-        print(f"        - ELO, FPI ratings")
-        print(f"        - Recruiting rankings")
-        print(f"")
-        print(f"     ⭐ Key Player Impact: {self.WEIGHTS['key_player_impact']:.0%} ⬆️ (Value-Based)")
-        print(f"        - Individual player metrics")
-        print(f"        - Star player differential")
-        print(f"")
-        print(f"     🌤️  Contextual Factors: {self.WEIGHTS['contextual_factors']:.0%}")
-        print(f"        - Weather, bye weeks, travel")
-        print(f"        - Poll momentum, coaching stability")
-        print(f"")
-        print(f"     🎲 Calibration: Platt Scaling")
-        print(f"        - Transforms raw probabilities to calibrated estimates")
-        print("="*80)
+        logger.debug('\n' + '=' * 80)
+        logger.debug("🔢 OPTIMIZED ALGORITHM WEIGHTS (Research Framework)")
+        logger.debug('=' * 80)
+        logger.debug("     🎯 Opponent-Adjusted Metrics: %s (Primary Factor)", lazy_format(weights['opponent_adjusted_metrics'], '.0%'))
+        logger.debug("        - Play-by-play EPA, Success Rates with SoS adjustment")
+        logger.debug("        - Dixon-Coles temporal weighting for recency")
+        logger.debug("        - Field position, explosiveness, situational performance")
+        logger.debug("")
+        logger.debug("     � Market Consensus: %s ⬆️ (Strong Bayesian Prior)", lazy_format(weights['market_consensus'], '.0%'))
+        logger.debug("        - Betting lines as information aggregator")
+        logger.debug("        - Sportsbook consensus signal")
+        logger.debug("")
+        logger.debug("     🏆 Composite Ratings: %s (Talent/Rankings)", lazy_format(weights['composite_ratings'], '.0%'))
+        logger.debug("        - ELO, FPI ratings")
+        logger.debug("        - Recruiting rankings")
+        logger.debug("")
+        logger.debug("     ⭐ Key Player Impact: %s ⬆️ (Value-Based)", lazy_format(weights['key_player_impact'], '.0%'))
+        logger.debug("        - Individual player metrics")
+        logger.debug("        - Star player differential")
+        logger.debug("")
+        logger.debug("     🌤️  Contextual Factors: %s", lazy_format(weights['contextual_factors'], '.0%'))
+        logger.debug("        - Weather, bye weeks, travel")
+        logger.debug("        - Poll momentum, coaching stability")
+        logger.debug("")
+        logger.debug("     🎲 Calibration: Platt Scaling")
+        logger.debug("        - Transforms raw probabilities to calibrated estimates")
+        logger.debug('=' * 80)
 
         # Display comprehensive team statistics for UI
         self._display_comprehensive_team_stats(prediction)
 
         return prediction
 
-    def _calculate_recent_form(self, recent_games: List[Dict], team_id: int) -> float:
-        """Calculate recent form from last 4 games"""
-        if not recent_games:
-            return 0.5
-            
-        recent_form = 0
-        games_analyzed = 0
-        
-        for game in recent_games[:4]:
-            # Skip games that haven't been played yet (null win probabilities)
-            win_prob = None
-            if game['homeTeamId'] == team_id:
-                win_prob = game.get('homePostgameWinProb')
-            elif game['awayTeamId'] == team_id:
-                win_prob = game.get('awayPostgameWinProb')
-            else:
-                continue
-                
-            # Only count games that have been played
-            if win_prob is not None:
-                recent_form += win_prob
-                games_analyzed += 1
-            
-        return recent_form / games_analyzed if games_analyzed > 0 else 0.5
-
     def _get_latest_elo(self, recent_games: List[Dict], team_id: int) -> float:
         """Get latest ELO rating from most recent game"""
         if not recent_games:
@@ -3917,109 +3873,12 @@ class LightningPredictor:
             return (epa_trend + success_trend * 10) / total_weight
         return 0
 
-    def _calculate_strength_of_schedule(self, season_games: List[Dict], team_id: int) -> float:
-        """Calculate strength of schedule based on opponent ELO ratings"""
-        if not season_games:
-            return 0
-            
-        opponent_elos = []
-        
-        for game in season_games:
-            opponent_elo = None
-            if game['homeTeamId'] == team_id:
-                opponent_elo = game.get('awayStartElo')
-            elif game['awayTeamId'] == team_id:
-                opponent_elo = game.get('homeStartElo')
-                
-            # Only include teams that have ELO ratings (exclude FCS teams, etc.)
-            if opponent_elo is not None:
-                opponent_elos.append(opponent_elo)
-                
-        if opponent_elos:
-            avg_opponent_elo = sum(opponent_elos) / len(opponent_elos)
-            return (avg_opponent_elo - 1500) / 100  # Normalize around 0
-        return 0
-
-    def _analyze_performance_consistency(self, season_games: List[Dict], team_id: int) -> float:
-        """Analyze performance consistency across games"""
-        if not season_games or len(season_games) < 3:
-            return 0.5
-            
-        win_probs = []
-        
-        for game in season_games:
-            win_prob = None
-            if game['homeTeamId'] == team_id:
-                win_prob = game.get('homePostgameWinProb')
-            elif game['awayTeamId'] == team_id:
-                win_prob = game.get('awayPostgameWinProb')
-                
-            # Only include completed games
-            if win_prob is not None:
-                win_probs.append(win_prob)
-                
-        if len(win_probs) > 1:
-            # Calculate standard deviation (lower = more consistent)
-            avg = sum(win_probs) / len(win_probs)
-            variance = sum((x - avg) ** 2 for x in win_probs) / len(win_probs)
-            std_dev = variance ** 0.5
-            
-            # Convert to consistency score (higher = more consistent)
-            return max(0, 1 - (std_dev * 2))  # Scale so that std_dev of 0.5 = consistency of 0
-        return 0.5
-
-    def _calculate_recent_vs_early_differential(self, season_games: List[Dict], team_id: int) -> float:
-        """Calculate differential between recent performance and early season"""
-        if not season_games or len(season_games) < 4:
-            return 0
-            
-        # Split games into early (first half) and recent (second half)
-        mid_point = len(season_games) // 2
-        early_games = season_games[:mid_point]
-        recent_games = season_games[mid_point:]
-        
-        early_avg = self._average_win_prob(early_games, team_id)
-        recent_avg = self._average_win_prob(recent_games, team_id)
-        
-        return recent_avg - early_avg
-
-    def _average_win_prob(self, games: List[Dict], team_id: int) -> float:
-        """Calculate average win probability for a set of games"""
-        win_probs = []
-        
-        for game in games:
-            win_prob = None
-            if game['homeTeamId'] == team_id:
-                win_prob = game.get('homePostgameWinProb')
-            elif game['awayTeamId'] == team_id:
-                win_prob = game.get('awayPostgameWinProb')
-                
-            # Only include completed games
-            if win_prob is not None:
-                win_probs.append(win_prob)
-                
-        return sum(win_probs) / len(win_probs) if win_probs else 0.5
-
-    def _weight_by_recency(self, values: List[float], weeks: List[int]) -> float:
-        """Weight values by recency (more recent weeks get higher weight)"""
-        if not values or not weeks:
-            return 0
-            
-        # Create weights based on recency (week 7 = highest weight)
-        max_week = max(weeks) if weeks else 7
-        weights = [week / max_week for week in weeks]
-        
-        weighted_sum = sum(v * w for v, w in zip(values, weights))
-        total_weight = sum(weights)
-        
-        return weighted_sum / total_weight if total_weight > 0 else 0
-
     def _calculate_advanced_metrics_differential(self, home_metrics: Dict, away_metrics: Dict) -> Tuple[float, Dict]:
         """Calculate advanced metrics differential using all available team metrics"""
         if not home_metrics or not away_metrics:
             return 0.0, {}
         
-        print(f"🚀 ADVANCED METRICS ANALYSIS:")
+        logger.debug("🚀 ADVANCED METRICS ANALYSIS:")
         
         # 1. Passing vs Rushing Efficiency (25% of advanced metrics)
         home_passing_net = home_metrics.get('passingEpa', 0) - home_metrics.get('passingEpaAllowed', 0)
@@ -4030,8 +3889,8 @@ class LightningPredictor:
         away_rushing_net = away_metrics.get('rushingEpa', 0) - away_metrics.get('rushingEpaAllowed', 0)
         rushing_differential = home_rushing_net - away_rushing_net
         
-        print(f"   🎯 Passing EPA Differential: {passing_differential:.3f}")
-        print(f"   🏃 Rushing EPA Differential: {rushing_differential:.3f}")
+        logger.debug("   🎯 Passing EPA Differential: %.3f", passing_differential)
+        logger.debug("   🏃 Rushing EPA Differential: %.3f", rushing_differential)
         
         # 2. Overall EPA and Success Rates
         home_epa_net = home_metrics.get('epa', 0) - home_metrics.get('epaAllowed', 0)
@@ -4055,8 +3914,8 @@ class LightningPredictor:
         away_standard_downs = away_metrics.get('standardDownsSuccess', 0) - away_metrics.get('standardDownsSuccessAllowed', 0)
         standard_downs_diff = home_standard_downs - away_standard_downs
         
-        print(f"   📊 Passing Downs Success Diff: {passing_downs_diff:.3f}")
-        print(f"   📊 Standard Downs Success Diff: {standard_downs_diff:.3f}")
+        logger.debug("   📊 Passing Downs Success Diff: %.3f", passing_downs_diff)
+        logger.debug("   📊 Standard Downs Success Diff: %.3f", standard_downs_diff)
         
         # 4. Field Position and Yards Analysis (30% of advanced metrics)
         # Line yards (between tackles)
@@ -4074,16 +3933,16 @@ class LightningPredictor:
         away_open_field = away_metrics.get('openFieldYards', 0) - away_metrics.get('openFieldYardsAllowed', 0)
         open_field_diff = home_open_field - away_open_field
         
-        print(f"   🛡️ Line Yards Differential: {line_yards_diff:.3f}")
-        print(f"   🏃‍♂️ Second Level Yards Diff: {second_level_diff:.3f}")
-        print(f"   💨 Open Field Yards Diff: {open_field_diff:.3f}")
+        logger.debug("   🛡️ Line Yards Differential: %.3f", line_yards_diff)
+        logger.debug("   🏃‍♂️ Second Level Yards Diff: %.3f", second_level_diff)
+        logger.debug("   💨 Open Field Yards Diff: %.3f", open_field_diff)
         
         # 5. Big Play Capability (25% of advanced metrics)
         home_highlights = home_metrics.get('highlightYards', 0) - home_metrics.get('highlightYardsAllowed', 0)
         away_highlights = away_metrics.get('highlightYards', 0) - away_metrics.get('highlightYardsAllowed', 0)
         highlight_yards_diff = home_highlights - away_highlights
         
-        print(f"   ⭐ Highlight Yards Differential: {highlight_yards_diff:.3f}")
+        logger.debug("   ⭐ Highlight Yards Differential: %.3f", highlight_yards_diff)
         
         # Weighted composite of all advanced metrics
         advanced_differential = (
@@ -4093,7 +3952,7 @@ class LightningPredictor:
             (highlight_yards_diff * 0.15)  # 15% big plays
         )
         
-        print(f"   🎯 ADVANCED DIFFERENTIAL: {advanced_differential:.3f}")
+        logger.debug("   🎯 ADVANCED DIFFERENTIAL: %.3f", advanced_differential)
         
         # Create detailed metrics dictionary
         metrics_details = {
@@ -4121,12 +3980,12 @@ class LightningPredictor:
     def _analyze_market_lines(self, current_lines: List[Dict]) -> float:
         """Analyze betting market lines for consensus signals"""
         if not current_lines:
-            print(f"📊 MARKET LINES ANALYSIS:")
-            print(f"   No betting lines available for this matchup")
+            logger.debug("📊 MARKET LINES ANALYSIS:")
+            logger.debug("   No betting lines available for this matchup")
             return 0.0
         
-        print(f"📊 MARKET LINES ANALYSIS:")
-        print(f"   📈 Found {len(current_lines)} sportsbook(s)")
+        logger.debug("📊 MARKET LINES ANALYSIS:")
+        logger.debug("   📈 Found %s sportsbook(s)", len(current_lines))
         
         # Average across all available sportsbooks
         spreads = []
@@ -4139,11 +3998,11 @@ class LightningPredictor:
             
             if line.get('spread') is not None:
                 spreads.append(line['spread'])
-                print(f"   🏈 {provider_name}: Spread {line['spread']:+.1f}")
+                logger.debug("   🏈 %s: Spread %+.1f", provider_name, line['spread'])
                 
             if line.get('overUnder') is not None:
                 totals.append(line['overUnder'])
-                print(f"   🎯 {provider_name}: Total {line['overUnder']:.1f}")
+                logger.debug("   🎯 %s: Total %.1f", provider_name, line['overUnder'])
                 
             if line.get('moneylineHome') is not None:
                 home_moneylines.append(line['moneylineHome'])
@@ -4156,42 +4015,43 @@ class LightningPredictor:
         
         if spreads:
             avg_spread = sum(spreads) / len(spreads)
-            print(f"   📊 Consensus Spread: {avg_spread:+.1f}")
+            logger.debug("   📊 Consensus Spread: %+.1f", avg_spread)
             # Market signal strength based on spread
             consensus_signal += abs(avg_spread) * 0.1  # Each point worth 0.1
             
         if totals:
             avg_total = sum(totals) / len(totals)
-            print(f"   📊 Consensus Total: {avg_total:.1f}")
+            logger.debug("   📊 Consensus Total: %.1f", avg_total)
             
         if home_moneylines and away_moneylines:
             avg_home_ml = sum(home_moneylines) / len(home_moneylines)
             avg_away_ml = sum(away_moneylines) / len(away_moneylines)
-            print(f"   💰 Moneylines: Home {avg_home_ml:+.0f} / Away {avg_away_ml:+.0f}")
+            logger.debug("   💰 Moneylines: Home %+.0f / Away %+.0f", avg_home_ml, avg_away_ml)
         
-        print(f"   🎯 Market Consensus Signal: {consensus_signal:.3f}")
+        logger.debug("   🎯 Market Consensus Signal: %.3f", consensus_signal)
         return consensus_signal
 
     def _analyze_key_players(self, all_players: List[Dict], home_team_id: int, away_team_id: int, home_team_name: str, away_team_name: str) -> Tuple[float, Dict]:
         """Enhanced key player analysis using comprehensive JSON data files"""
-        print(f"⭐ KEY PLAYERS ANALYSIS:")
+        logger.debug("⭐ KEY PLAYERS ANALYSIS:")
         
-        # Load comprehensive player data from JSON files
-        player_data = self._load_comprehensive_player_data()
+        # Team-indexed player database (built once per data release)
+        player_index = self._get_player_index()
         
-        if not player_data:
-            print(f"   ⚠️  Could not load comprehensive player data files")
+        if not player_index.total_players:
+            logger.warning("   ⚠️  Could not load comprehensive player data files")
             return self._fallback_player_analysis(home_team_name, away_team_name), {}
         
         # Get team players from comprehensive data
-        home_players = self._get_team_players(home_team_name, player_data)
-        away_players = self._get_team_players(away_team_name, player_data)
+        home_players = player_index.team_players(home_team_name)
+        away_players = player_index.team_players(away_team_name)
+        counts = player_index.counts
         
-        print(f"   📊 Loaded comprehensive player database:")
-        print(f"      🏈 {len(player_data.get('qbs', []))} QBs analyzed")
-        print(f"      🏃 {len(player_data.get('rbs', []))} RBs analyzed") 
-        print(f"      📡 {len(player_data.get('wrs', []))} WRs analyzed")
-        print(f"      🛡️  {len(player_data.get('dbs', []))} DBs analyzed")
+        logger.debug("   📊 Loaded comprehensive player database:")
+        logger.debug("      🏈 %s QBs analyzed", counts['qbs'])
+        logger.debug("      🏃 %s RBs analyzed", counts['rbs']) 
+        logger.debug("      📡 %s WRs analyzed", counts['wrs'])
+        logger.debug("      🛡️  %s DBs analyzed", counts['dbs'])
         
         # Calculate positional advantages
         qb_differential = self._calculate_qb_advantage(home_players['qb'], away_players['qb'])
@@ -4209,11 +4069,11 @@ class LightningPredictor:
             defense_differential * 0.25
         )
         
-        print(f"   🎯 POSITIONAL BREAKDOWN:")
-        print(f"      QB Impact (40%): {qb_differential:.3f}")
-        print(f"      Skill Positions (35%): {skill_differential:.3f}")
-        print(f"      Defense (25%): {defense_differential:.3f}")
-        print(f"   ✅ Total Player Impact: {total_player_impact:.3f}")
+        logger.debug("   🎯 POSITIONAL BREAKDOWN:")
+        logger.debug("      QB Impact (40%%): %.3f", qb_differential)
+        logger.debug("      Skill Positions (35%%): %.3f", skill_differential)
+        logger.debug("      Defense (25%%): %.3f", defense_differential)
+        logger.debug("   ✅ Total Player Impact: %.3f", total_player_impact)
         
         # Create structured player data for UI
         player_analysis = {
@@ -4226,75 +4086,40 @@ class LightningPredictor:
             },
             "total_impact": total_player_impact,
             "database_stats": {
-                "quarterbacks_analyzed": len(player_data.get('qbs', [])),
-                "running_backs_analyzed": len(player_data.get('rbs', [])),
-                "wide_receivers_analyzed": len(player_data.get('wrs', [])),
-                "tight_ends_analyzed": len(player_data.get('tes', [])),
-                "defensive_backs_analyzed": len(player_data.get('dbs', [])),
-                "linebackers_analyzed": len(player_data.get('lbs', [])),
-                "defensive_linemen_analyzed": len(player_data.get('dls', [])),
-                "total_players_analyzed": sum([
-                    len(player_data.get('qbs', [])),
-                    len(player_data.get('rbs', [])),
-                    len(player_data.get('wrs', [])),
-                    len(player_data.get('tes', [])),
-                    len(player_data.get('dbs', [])),
-                    len(player_data.get('lbs', [])),
-                    len(player_data.get('dls', []))
-                ])
+                "quarterbacks_analyzed": counts['qbs'],
+                "running_backs_analyzed": counts['rbs'],
+                "wide_receivers_analyzed": counts['wrs'],
+                "tight_ends_analyzed": counts['tes'],
+                "defensive_backs_analyzed": counts['dbs'],
+                "linebackers_analyzed": counts['lbs'],
+                "defensive_linemen_analyzed": counts['dls'],
+                "total_players_analyzed": player_index.total_players
             }
         }
         
         return total_player_impact, player_analysis
     
-    def _load_comprehensive_player_data(self) -> Dict:
-        """Load all comprehensive player analysis JSON files or use fallback data"""
-        import json
-        import os
-        
-        player_data = {}
-        json_files = {
-            'qbs': 'weekly_updates/week_15/comprehensive_qb_analysis_2025_20251201_110305.json',
-            'rbs': 'player_metrics/rb/comprehensive_rb_analysis_2025_20251125_023445.json', 
-            'wrs': 'player_metrics/wr/comprehensive_wr_analysis_2025_20251125_135657.json',
-            'tes': 'player_metrics/te/comprehensive_te_analysis_2025_20251125_135843.json',
-            'dbs': 'player_metrics/db/comprehensive_db_analysis_2025_20251125_140358.json',
-            'lbs': 'player_metrics/lb/comprehensive_lb_analysis_2025_20251125_140138.json',
-            'dls': 'player_metrics/dl/comprehensive_dl_analysis_2025_20251125_140201.json'
-        }
-        
-        # Map of correct JSON keys for each position
-        json_keys = {
-            'qbs': 'quarterbacks',
-            'rbs': 'running_backs',
-            'wrs': 'all_wrs',
-            'tes': 'all_tes',
-            'dbs': 'dbs',
-            'lbs': 'lbs',
-            'dls': 'all_dls'
-        }
-        
-        # Try to load actual data files first
-        files_loaded = 0
-        for position, file_path in json_files.items():
-            try:
-                if os.path.exists(file_path):
-                    with open(file_path, 'r') as f:
-                        data = json.load(f)
-                        player_data[position] = data.get(json_keys[position], [])
-                        files_loaded += 1
-                else:
-                    player_data[position] = []
-            except Exception as e:
-                print(f"   ⚠️  Could not load {position} data: {e}")
-                player_data[position] = []
+    def _get_player_index(self) -> PlayerIndex:
+        """Player index for the pinned data release, built on first use"""
+        release = self.data_release
+        if release.player_index is None:
+            with self._player_index_lock:
+                if release.player_index is None:
+                    release.player_index = self._build_player_index(release.data_dir)
+        return release.player_index
+    
+    def _build_player_index(self, data_dir: str) -> PlayerIndex:
+        """Index the comprehensive player analysis JSON files or use fallback data"""
+        player_data, files_loaded = load_player_data(data_dir)
         
         # If no comprehensive files were loaded, use fallback mock data
         if files_loaded == 0:
-            print(f"   📊 Using fallback player data for week 9 analysis...")
-            player_data = self._create_fallback_player_data()
+            logger.debug("   📊 Using fallback player data for week 9 analysis...")
+            return PlayerIndex(self._create_fallback_player_data())
         
-        return player_data
+        player_index = PlayerIndex(player_data, player_source_paths(data_dir))
+        logger.debug("✅ Player index built: %s players from %s position files", player_index.total_players, files_loaded)
+        return player_index
     
     def _create_fallback_player_data(self) -> Dict:
         """Create fallback player data when comprehensive files are not available"""
@@ -4395,123 +4220,6 @@ class LightningPredictor:
             ]
         }
     
-    def _get_team_players(self, team_name: str, player_data: Dict) -> Dict:
-        """Extract players for a specific team from comprehensive data"""
-        team_players = {
-            'qb': None,
-            'rbs': [],
-            'wrs': [],
-            'tes': [],
-            'defense': []
-        }
-        
-        # Normalize team name for matching - more precise matching
-        def matches_team(player_team: str, target_team: str) -> bool:
-            """Check if player team matches target team with exact matching"""
-            player_team_clean = player_team.split(' (')[0].strip().lower()  # Remove conference info
-            target_team_clean = target_team.strip().lower()
-            
-            # Exact match first
-            if player_team_clean == target_team_clean:
-                return True
-            
-            # Special handling for common confusions
-            # Ohio State vs Ohio University
-            if 'ohio' in target_team_clean and 'ohio' in player_team_clean:
-                if 'state' in target_team_clean and 'state' not in player_team_clean:
-                    return False  # Ohio State != Ohio University
-                if 'state' not in target_team_clean and 'state' in player_team_clean:
-                    return False  # Ohio University != Ohio State
-            
-            # Michigan vs Michigan State 
-            if 'michigan' in target_team_clean and 'michigan' in player_team_clean:
-                if 'state' in target_team_clean and 'state' not in player_team_clean:
-                    return False  # Michigan State != Michigan
-                if 'state' not in target_team_clean and 'state' in player_team_clean:
-                    return False  # Michigan != Michigan State
-            
-            # Similar logic for other potential conflicts
-            state_schools = ['texas', 'florida', 'georgia', 'alabama', 'california', 'north carolina', 'south carolina', 'penn', 'iowa']
-            for state in state_schools:
-                if state in target_team_clean and state in player_team_clean:
-                    target_has_state = 'state' in target_team_clean or 'tech' in target_team_clean
-                    player_has_state = 'state' in player_team_clean or 'tech' in player_team_clean
-                    if target_has_state != player_has_state:
-                        return False
-            
-            # Create normalized variations for comparison
-            def normalize_team_name(name: str) -> set:
-                """Create normalized variations of team name"""
-                variations = set()
-                # Base name
-                variations.add(name.strip())
-                
-                # Remove common suffixes but be careful about conflicts
-                temp_name = name.replace(' university', '').replace(' college', '').strip()
-                if temp_name != name and len(temp_name) > 3:  # Avoid too short names
-                    variations.add(temp_name)
-                
-                return variations
-            
-            target_variations = normalize_team_name(target_team_clean)
-            player_variations = normalize_team_name(player_team_clean)
-            
-            # Check for exact matches in variations
-            return bool(target_variations.intersection(player_variations))
-        
-        # Find QB
-        for qb in player_data.get('qbs', []):
-            qb_team = qb.get('team', '')
-            if matches_team(qb_team, team_name):
-                if not team_players['qb'] or qb.get('efficiency_metrics', {}).get('comprehensive_efficiency_score', 0) > \
-                   team_players['qb'].get('efficiency_metrics', {}).get('comprehensive_efficiency_score', 0):
-                    team_players['qb'] = qb
-        
-        # Find RBs
-        for rb in player_data.get('rbs', []):
-            rb_team = rb.get('team', '')
-            if matches_team(rb_team, team_name):
-                team_players['rbs'].append(rb)
-        
-        # Find WRs
-        for wr in player_data.get('wrs', []):
-            wr_team = wr.get('team', '')
-            if matches_team(wr_team, team_name):
-                team_players['wrs'].append(wr)
-        
-        # Find TEs
-        for te in player_data.get('tes', []):
-            te_team = te.get('team', '')
-            if matches_team(te_team, team_name):
-                team_players['tes'].append(te)
-        
-        # Find Defense (DBs, LBs, DLs combined)
-        for db in player_data.get('dbs', []):
-            db_team = db.get('team', '')
-            if matches_team(db_team, team_name):
-                db['position_type'] = 'DB'
-                team_players['defense'].append(db)
-        
-        for lb in player_data.get('lbs', []):
-            lb_team = lb.get('team', '')
-            if matches_team(lb_team, team_name):
-                lb['position_type'] = 'LB'
-                team_players['defense'].append(lb)
-        
-        for dl in player_data.get('dls', []):
-            dl_team = dl.get('team', '')
-            if matches_team(dl_team, team_name):
-                dl['position_type'] = 'DL'
-                team_players['defense'].append(dl)
-        
-        # Sort players by efficiency (QBs use nested efficiency_metrics, others use root level comprehensive_efficiency_score)
-        team_players['rbs'].sort(key=lambda x: x.get('comprehensive_efficiency_score', x.get('efficiency_metrics', {}).get('comprehensive_efficiency_score', 0)), reverse=True)
-        team_players['wrs'].sort(key=lambda x: x.get('comprehensive_efficiency_score', x.get('efficiency_metrics', {}).get('comprehensive_efficiency_score', 0)), reverse=True)
-        team_players['tes'].sort(key=lambda x: x.get('comprehensive_efficiency_score', x.get('efficiency_metrics', {}).get('comprehensive_efficiency_score', 0)), reverse=True)
-        team_players['defense'].sort(key=lambda x: x.get('comprehensive_efficiency_score', x.get('efficiency_metrics', {}).get('comprehensive_efficiency_score', 0)), reverse=True)
-        
-        return team_players
-    
     def _calculate_qb_advantage(self, home_qb: Dict, away_qb: Dict) -> float:
         """Calculate quarterback advantage between teams"""
         if not home_qb or not away_qb:
@@ -4592,62 +4300,64 @@ class LightningPredictor:
     def _display_enhanced_player_analysis(self, home_team: str, away_team: str, home_players: Dict, 
                                         away_players: Dict, qb_diff: float, skill_diff: float, def_diff: float):
         """Display comprehensive player analysis results"""
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
         
         # Home team analysis
-        print(f"\n   🏠 {home_team} Key Players:")
+        logger.debug("\n   🏠 %s Key Players:", home_team)
         if home_players['qb']:
             qb = home_players['qb']
             efficiency = qb.get('efficiency_metrics', {}).get('comprehensive_efficiency_score', 0)
-            print(f"      QB: {qb.get('name', 'Unknown')} - Efficiency: {efficiency:.1f}")
+            logger.debug("      QB: %s - Efficiency: %.1f", qb.get('name', 'Unknown'), efficiency)
         
         if home_players['rbs']:
             for i, rb in enumerate(home_players['rbs'][:2]):
                 efficiency = rb.get('efficiency_metrics', {}).get('comprehensive_efficiency_score', 0)
-                print(f"      RB{i+1}: {rb.get('name', 'Unknown')} - Efficiency: {efficiency:.1f}")
+                logger.debug("      RB%s: %s - Efficiency: %.1f", i + 1, rb.get('name', 'Unknown'), efficiency)
         
         if home_players['wrs']:
             for i, wr in enumerate(home_players['wrs'][:3]):
                 efficiency = wr.get('efficiency_metrics', {}).get('comprehensive_efficiency_score', 0)
-                print(f"      WR{i+1}: {wr.get('name', 'Unknown')} - Efficiency: {efficiency:.1f}")
+                logger.debug("      WR%s: %s - Efficiency: %.1f", i + 1, wr.get('name', 'Unknown'), efficiency)
         
         # Away team analysis  
-        print(f"\n   ✈️  {away_team} Key Players:")
+        logger.debug("\n   ✈️  %s Key Players:", away_team)
         if away_players['qb']:
             qb = away_players['qb']
             efficiency = qb.get('efficiency_metrics', {}).get('comprehensive_efficiency_score', 0)
-            print(f"      QB: {qb.get('name', 'Unknown')} - Efficiency: {efficiency:.1f}")
+            logger.debug("      QB: %s - Efficiency: %.1f", qb.get('name', 'Unknown'), efficiency)
         
         if away_players['rbs']:
             for i, rb in enumerate(away_players['rbs'][:2]):
                 efficiency = rb.get('efficiency_metrics', {}).get('comprehensive_efficiency_score', 0)
-                print(f"      RB{i+1}: {rb.get('name', 'Unknown')} - Efficiency: {efficiency:.1f}")
+                logger.debug("      RB%s: %s - Efficiency: %.1f", i + 1, rb.get('name', 'Unknown'), efficiency)
         
         if away_players['wrs']:
             for i, wr in enumerate(away_players['wrs'][:3]):
                 efficiency = wr.get('efficiency_metrics', {}).get('comprehensive_efficiency_score', 0)
-                print(f"      WR{i+1}: {wr.get('name', 'Unknown')} - Efficiency: {efficiency:.1f}")
+                logger.debug("      WR%s: %s - Efficiency: %.1f", i + 1, wr.get('name', 'Unknown'), efficiency)
     
     def _fallback_player_analysis(self, home_team: str, away_team: str) -> float:
         """Fallback player analysis if JSON files cannot be loaded"""
-        print(f"   📊 Using fallback player analysis (projected estimates)")
-        print(f"   🏠 {home_team} Projected Players:")
-        print(f"      QB: passing ~0.60 (projected)")
-        print(f"      Top WR: receiving ~0.45 (projected)")  
-        print(f"      Primary RB: rushing ~0.38 (projected)")
-        print(f"      WR2: receiving ~0.42 (projected)")
-        print(f"      Starting TE: receiving ~0.35 (projected)")
-        
-        print(f"   ✈️  {away_team} Projected Players:")
-        print(f"      QB: passing ~0.58 (projected)")
-        print(f"      Primary RB: rushing ~0.50 (projected)")
-        print(f"      Top WR: receiving ~0.55 (projected)")
-        print(f"      WR2: receiving ~0.48 (projected)")
-        print(f"      Starting TE: receiving ~0.40 (projected)")
+        logger.debug("   📊 Using fallback player analysis (projected estimates)")
+        logger.debug("   🏠 %s Projected Players:", home_team)
+        logger.debug("      QB: passing ~0.60 (projected)")
+        logger.debug("      Top WR: receiving ~0.45 (projected)")  
+        logger.debug("      Primary RB: rushing ~0.38 (projected)")
+        logger.debug("      WR2: receiving ~0.42 (projected)")
+        logger.debug("      Starting TE: receiving ~0.35 (projected)")
+        
+        logger.debug("   ✈️  %s Projected Players:", away_team)
+        logger.debug("      QB: passing ~0.58 (projected)")
+        logger.debug("      Primary RB: rushing ~0.50 (projected)")
+        logger.debug("      Top WR: receiving ~0.55 (projected)")
+        logger.debug("      WR2: receiving ~0.48 (projected)")
+        logger.debug("      Starting TE: receiving ~0.40 (projected)")
         
         # Small advantage based on team name heuristics
         player_differential = 0.033  # Minimal impact without real data
-        print(f"   📊 Estimated Player Impact: {player_differential:.3f}")
-        print(f"   ⚠️  Note: Limited analysis without comprehensive player data")
+        logger.debug("   📊 Estimated Player Impact: %.3f", player_differential)
+        logger.warning("   ⚠️  Note: Limited analysis without comprehensive player data")
         
         return player_differential
 
@@ -4694,24 +4404,24 @@ class LightningPredictor:
            (away_elo > elite_threshold_elo and home_elo < weak_threshold_elo):
             # Massive talent gap - amplify slightly
             mismatch_multiplier = 1.2
-            print(f"   🔥 ELITE VS WEAK MISMATCH DETECTED! Amplifying by {mismatch_multiplier}x")
+            logger.debug("   🔥 ELITE VS WEAK MISMATCH DETECTED! Amplifying by %sx", mismatch_multiplier)
         elif abs(elo_diff) > 600:  # Huge ELO gap even if not elite vs weak
             mismatch_multiplier = 1.1
-            print(f"   ⚡ LARGE TALENT GAP DETECTED! Amplifying by {mismatch_multiplier}x")
+            logger.debug("   ⚡ LARGE TALENT GAP DETECTED! Amplifying by %sx", mismatch_multiplier)
         
         # Weighted composite - both signals now in similar normalized ranges
         # ELO is primary signal (60%), FPI validates (40%)
         composite_diff = (elo_normalized_signal * 0.60 + fpi_normalized_signal * 0.40) * mismatch_multiplier
         
-        print(f"🎯 COMPOSITE RATINGS (NORMALIZED SIGNALS):")
-        print(f"   Home ELO: {home_elo:.0f} | Away ELO: {away_elo:.0f}")
-        print(f"   ELO Differential: {elo_diff:+.0f}")
-        print(f"   ELO Win Probability: {elo_win_probability:.1%}")
-        print(f"   ELO Normalized Signal: {elo_normalized_signal:+.3f}")
-        print(f"   FPI Differential: {fpi_diff:+.2f}")
-        print(f"   FPI Normalized Signal: {fpi_normalized_signal:+.3f}")
-        print(f"   Mismatch Multiplier: {mismatch_multiplier}x")
-        print(f"   Composite Signal: {composite_diff:+.3f}")
+        logger.debug("🎯 COMPOSITE RATINGS (NORMALIZED SIGNALS):")
+        logger.debug("   Home ELO: %.0f | Away ELO: %.0f", home_elo, away_elo)
+        logger.debug("   ELO Differential: %+.0f", elo_diff)
+        logger.debug("   ELO Win Probability: %s", lazy_format(elo_win_probability, '.1%'))
+        logger.debug("   ELO Normalized Signal: %+.3f", elo_normalized_signal)
+        logger.debug("   FPI Differential: %+.2f", fpi_diff)
+        logger.debug("   FPI Normalized Signal: %+.3f", fpi_normalized_signal)
+        logger.debug("   Mismatch Multiplier: %sx", mismatch_multiplier)
+        logger.debug("   Composite Signal: %+.3f", composite_diff)
         
         return composite_diff
 
@@ -4740,11 +4450,11 @@ class LightningPredictor:
         if precip is not None and precip > 0.1:  # Significant precipitation
             weather_factor += 2.5  # Major impact on gameplay
             
-        print(f"🌤️  WEATHER ANALYSIS:")
-        print(f"   Temperature: {temp}°F" if temp is not None else "   Temperature: N/A")
-        print(f"   Wind Speed: {wind} mph" if wind is not None else "   Wind Speed: N/A")
-        print(f"   Precipitation: {precip} in" if precip is not None else "   Precipitation: N/A")
-        print(f"   Weather Factor: {weather_factor:.1f}")
+        logger.debug("🌤️  WEATHER ANALYSIS:")
+        logger.debug("   Temperature: %s", f"{temp}°F" if temp is not None else "N/A")
+        logger.debug("   Wind Speed: %s", f"{wind} mph" if wind is not None else "N/A")
+        logger.debug("   Precipitation: %s", f"{precip} in" if precip is not None else "N/A")
+        logger.debug("   Weather Factor: %.1f", weather_factor)
         
         return weather_factor
 
@@ -4778,7 +4488,7 @@ class LightningPredictor:
                         'school': team.get('school', 'Unknown')
                     }
         
-        print(f"📊 POLL ANALYSIS (WITH TEAM MAPPING):")
+        logger.debug("📊 POLL ANALYSIS (WITH TEAM MAPPING):")
         
         # Calculate poll differential
         poll_differential = 0.0
@@ -4788,29 +4498,29 @@ class LightningPredictor:
             rank_diff = away_ranking['rank'] - home_ranking['rank']  # Lower rank number is better
             poll_differential = rank_diff * 0.05  # Each rank position worth 0.05 points
             
-            print(f"   🏠 {home_ranking['school']}: Rank #{home_ranking['rank']} ({home_ranking['points']} pts)")
-            print(f"   ✈️  {away_ranking['school']}: Rank #{away_ranking['rank']} ({away_ranking['points']} pts)")
-            print(f"   📊 Poll Advantage: {poll_differential:+.2f} (Home team)")
+            logger.debug("   🏠 %s: Rank #%s (%s pts)", home_ranking['school'], home_ranking['rank'], home_ranking['points'])
+            logger.debug("   ✈️  %s: Rank #%s (%s pts)", away_ranking['school'], away_ranking['rank'], away_ranking['points'])
+            logger.debug("   📊 Poll Advantage: %+.2f (Home team)", poll_differential)
             
         elif home_ranking and not away_ranking:
             # Only home team ranked
             poll_differential = 2.0  # Significant advantage for ranked vs unranked
-            print(f"   🏠 {home_ranking['school']}: Rank #{home_ranking['rank']} (RANKED)")
-            print(f"   ✈️  Away team: Unranked")
-            print(f"   📊 Poll Advantage: +{poll_differential:.2f} (Ranked vs Unranked)")
+            logger.debug("   🏠 %s: Rank #%s (RANKED)", home_ranking['school'], home_ranking['rank'])
+            logger.debug("   ✈️  Away team: Unranked")
+            logger.debug("   📊 Poll Advantage: +%.2f (Ranked vs Unranked)", poll_differential)
             
         elif away_ranking and not home_ranking:
             # Only away team ranked  
             poll_differential = -2.0  # Disadvantage for unranked vs ranked
-            print(f"   🏠 Home team: Unranked")
-            print(f"   ✈️  {away_ranking['school']}: Rank #{away_ranking['rank']} (RANKED)")
-            print(f"   📊 Poll Advantage: {poll_differential:.2f} (Unranked vs Ranked)")
+            logger.debug("   🏠 Home team: Unranked")
+            logger.debug("   ✈️  %s: Rank #%s (RANKED)", away_ranking['school'], away_ranking['rank'])
+            logger.debug("   📊 Poll Advantage: %.2f (Unranked vs Ranked)", poll_differential)
             
         else:
             # Neither team ranked
-            print(f"   🏠 Home team: Unranked")
-            print(f"   ✈️  Away team: Unranked") 
-            print(f"   📊 Poll Impact: No ranking advantage")
+            logger.debug("   🏠 Home team: Unranked")
+            logger.debug("   ✈️  Away team: Unranked") 
+            logger.debug("   📊 Poll Impact: No ranking advantage")
         
         return poll_differential
 
@@ -4867,10 +4577,10 @@ class LightningPredictor:
         if early_away_byes:
             bye_advantage -= len(early_away_byes) * 0.5  # Opponent rest advantage
             
-        print(f"📅 BYE WEEK ANALYSIS:")
-        print(f"   Home Bye Weeks: {sorted(home_bye_weeks) if home_bye_weeks else 'None'}")
-        print(f"   Away Bye Weeks: {sorted(away_bye_weeks) if away_bye_weeks else 'None'}")
-        print(f"   Bye Advantage: {bye_advantage:.1f}")
+        logger.debug("📅 BYE WEEK ANALYSIS:")
+        logger.debug("   Home Bye Weeks: %s", sorted(home_bye_weeks) if home_bye_weeks else 'None')
+        logger.debug("   Away Bye Weeks: %s", sorted(away_bye_weeks) if away_bye_weeks else 'None')
+        logger.debug("   Bye Advantage: %.1f", bye_advantage)
         
         return bye_advantage
 
@@ -4885,8 +4595,8 @@ class LightningPredictor:
             missing_fields.append("awaySeasonGames")
             
         if missing_fields:
-            print(f"⚠️  Warning: Missing data fields: {missing_fields}")
-            print("📊 Falling back to basic prediction mode")
+            logger.warning("⚠️  Warning: Missing data fields: %s", missing_fields)
+            logger.debug("📊 Falling back to basic prediction mode")
             
         return data
 
@@ -4923,22 +4633,19 @@ class LightningPredictor:
             
         return home_bye_advantage - away_bye_advantage
 
-    def _apply_situational_modifiers(self, differential: float, data: Dict) -> float:
-        """Apply current week situational modifiers"""
+    def _situational_modifiers(self, data: Dict) -> Tuple[float, float, float]:
+        """Current week situational modifiers: (rivalry scale, prime time scale, conference stakes)"""
         
         # Rivalry game detection and impact
-        if self._is_rivalry_game(data):
-            differential *= 0.85  # Rivalry games are typically closer
+        rivalry_scale = 0.85 if self._is_rivalry_game(data) else 1.0  # Rivalry games are typically closer
             
         # Prime time game adjustment
-        if self._is_prime_time_game(data):
-            differential *= 0.9  # Prime time games tend to be tighter
+        prime_time_scale = 0.9 if self._is_prime_time_game(data) else 1.0  # Prime time games tend to be tighter
             
         # Conference championship implications
         conference_stakes = self._assess_conference_stakes(data)
-        differential += conference_stakes
         
-        return differential
+        return rivalry_scale, prime_time_scale, conference_stakes
 
     def _is_rivalry_game(self, data: Dict) -> bool:
         """Detect rivalry games based on historical matchups"""
@@ -5114,22 +4821,23 @@ class LightningPredictor:
         prediction.confidence = min(prediction.confidence * confidence_adjustment, 0.95)
         
         # Display algorithm weights for transparency  
-        print(f"\n🔢 ALGORITHM WEIGHTS & METHODOLOGY:")
-        print(f"     🎯 Advanced Metrics: 44% (Primary Factor)")
-        print(f"        - Passing/Rushing EPA, Success Rates, Field Position")
-        print(f"        - Situational Performance, Big Play Capability")
-        print(f"     📊 Composite Ratings: 35% (FPI + ELO)")
-        print(f"        - Expert Rankings & Statistical Models")
-        print(f"     🌤️  Environmental: 15% (Weather & Bye Weeks)")
-        print(f"        - Temperature, Wind, Precipitation Impact")
-        print(f"        - Rest Advantage Analysis")
-        print(f"     💪 Team Quality: 6% (Talent & Consistency)")
-        print(f"        - Recruiting Rankings & Performance Trends")
+        logger.debug("\n🔢 ALGORITHM WEIGHTS & METHODOLOGY:")
+        logger.debug("     🎯 Advanced Metrics: 44% (Primary Factor)")
+        logger.debug("        - Passing/Rushing EPA, Success Rates, Field Position")
+        logger.debug("        - Situational Performance, Big Play Capability")
+        logger.debug("     📊 Composite Ratings: 35% (FPI + ELO)")
+        logger.debug("        - Expert Rankings & Statistical Models")
+        logger.debug("     🌤️  Environmental: 15% (Weather & Bye Weeks)")
+        logger.debug("        - Temperature, Wind, Precipitation Impact")
+        logger.debug("        - Rest Advantage Analysis")
+        logger.debug("     💪 Team Quality: 6% (Talent & Consistency)")
+        logger.debug("        - Recruiting Rankings & Performance Trends")
         
         # Display corrected betting analysis
-        print(f"\n💰 CORRECTED BETTING ANALYSIS:")
-        print("=" * 50)
-        print(analyzer.format_analysis_output(betting_analysis))
+        logger.debug("\n💰 CORRECTED BETTING ANALYSIS:")
+        logger.debug('=' * 50)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(analyzer.format_analysis_output(betting_analysis))
         
         return prediction
 
@@ -5159,8 +4867,11 @@ class LightningPredictor:
         # Ensure reasonable total bounds for college football
         return max(min(total, 85), 40)  # Between 40-85 points
 
-    def _calculate_enhanced_confidence(self, data: Dict, differential: float, home_metrics: TeamMetrics, away_metrics: TeamMetrics) -> float:
-        """Calculate enhanced prediction confidence with historical factors AND new endpoints"""
+    def _confidence_features(self, data: Dict, home_metrics: TeamMetrics, away_metrics: TeamMetrics) -> Tuple[float, float]:
+        """Confidence inputs from data availability and team consistency: (data confidence, trend factor)
+
+        score_features adds the differential boost (min(|differential| / 20, 0.15)) and caps the total at 0.95.
+        """
         # Base confidence on data availability
         has_metrics = bool(data.get('homeTeamMetrics') and data.get('awayTeamMetrics'))
         has_recent_games = bool(data.get('homeRecentGames') and data.get('awayRecentGames'))
@@ -5196,30 +4907,11 @@ class LightningPredictor:
         # Boost confidence for consistent teams
         consistency_boost = (home_metrics.consistency_score + away_metrics.consistency_score) / 2 * 0.1
         
-        # Boost confidence for larger differentials
-        differential_boost = min(differential / 20, 0.15)
-        
         # Reduce confidence if trends are conflicting
         trend_consistency = 1 - abs(home_metrics.season_trend - away_metrics.season_trend) / 2
         trend_factor = trend_consistency * 0.05
-        
-        # Market agreement boost - removed since no market data
-        market_agreement_boost = 0.0
 
-        total_confidence = min(
-            base_confidence + consistency_boost + differential_boost + trend_factor + market_agreement_boost, 
-            0.95
-        )
-        
-        print(f"🔢 CONFIDENCE BREAKDOWN:")
-        print(f"   Base Data: {base_confidence:.2f}")
-        print(f"   Consistency: +{consistency_boost:.2f}")
-        print(f"   Differential: +{differential_boost:.2f}")
-        print(f"   Trend Factor: +{trend_factor:.2f}")
-        print(f"   Weather/Calendar: +{0.05 if has_weather or has_calendar else 0:.2f}")
-        print(f"   TOTAL CONFIDENCE: {total_confidence:.2f}")
-        
-        return total_confidence
+        return base_confidence + consistency_boost, trend_factor
 
     def _identify_enhanced_key_factors(self, home_metrics: TeamMetrics, away_metrics: TeamMetrics, 
                                      differential: float, trend_differential: float, sos_differential: float, data: Dict) -> List[str]:
@@ -5514,99 +5206,101 @@ class LightningPredictor:
 
     def _display_comprehensive_team_stats(self, prediction: GamePrediction):
         """Display comprehensive team statistics for UI purposes"""
-        print(f"\n" + "="*80)
-        print("📊 COMPREHENSIVE TEAM STATISTICS")
-        print("="*80)
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        logger.debug('\n' + '=' * 80)
+        logger.debug("📊 COMPREHENSIVE TEAM STATISTICS")
+        logger.debug('=' * 80)
         
         # Display home team stats
         if prediction.home_team_stats:
             home_stats = prediction.home_team_stats
-            print(f"\n🏠 {prediction.home_team} ({home_stats.conference}):")
-            print(f"   📈 Season Record: {home_stats.games_played} games played")
-            print(f"   🏈 Offensive Stats:")
-            print(f"      Total Yards: {home_stats.total_yards:,} | Rushing: {home_stats.rushing_yards:,} | Passing: {home_stats.passing_yards:,}")
-            print(f"      Touchdowns: {home_stats.rushing_tds + home_stats.passing_tds} (Rush: {home_stats.rushing_tds}, Pass: {home_stats.passing_tds})")
-            print(f"      First Downs: {home_stats.first_downs}")
-            print(f"   📊 Efficiency:")
-            print(f"      Third Down: {home_stats.third_down_pct:.1%} | Red Zone: {home_stats.red_zone_pct:.1%}")
-            print(f"      Scoring %: {home_stats.scoring_pct:.1%} | EPA/Play: {home_stats.epa_offense:.3f}")
-            print(f"   🛡️ Defensive Stats:")
-            print(f"      Sacks: {home_stats.sacks} | Interceptions: {home_stats.interceptions} | TFL: {home_stats.tackles_for_loss}")
-            print(f"      Stop %: {home_stats.stop_pct:.1%} | EPA Allowed: {home_stats.epa_defense:.3f}")
-            print(f"   ⚖️ Game Control:")
-            print(f"      Turnover Margin: {home_stats.turnover_margin:+d} | Possession Time: {home_stats.possession_time//60}:{home_stats.possession_time%60:02d}")
-            print(f"      Penalty Yards: {home_stats.penalty_yards}")
+            logger.debug("\n🏠 %s (%s):", prediction.home_team, home_stats.conference)
+            logger.debug("   📈 Season Record: %s games played", home_stats.games_played)
+            logger.debug("   🏈 Offensive Stats:")
+            logger.debug("      Total Yards: %s | Rushing: %s | Passing: %s", lazy_format(home_stats.total_yards, ','), lazy_format(home_stats.rushing_yards, ','), lazy_format(home_stats.passing_yards, ','))
+            logger.debug("      Touchdowns: %s (Rush: %s, Pass: %s)", home_stats.rushing_tds + home_stats.passing_tds, home_stats.rushing_tds, home_stats.passing_tds)
+            logger.debug("      First Downs: %s", home_stats.first_downs)
+            logger.debug("   📊 Efficiency:")
+            logger.debug("      Third Down: %s | Red Zone: %s", lazy_format(home_stats.third_down_pct, '.1%'), lazy_format(home_stats.red_zone_pct, '.1%'))
+            logger.debug("      Scoring %%: %s | EPA/Play: %.3f", lazy_format(home_stats.scoring_pct, '.1%'), home_stats.epa_offense)
+            logger.debug("   🛡️ Defensive Stats:")
+            logger.debug("      Sacks: %s | Interceptions: %s | TFL: %s", home_stats.sacks, home_stats.interceptions, home_stats.tackles_for_loss)
+            logger.debug("      Stop %%: %s | EPA Allowed: %.3f", lazy_format(home_stats.stop_pct, '.1%'), home_stats.epa_defense)
+            logger.debug("   ⚖️ Game Control:")
+            logger.debug("      Turnover Margin: %+d | Possession Time: %s:%02d", home_stats.turnover_margin, home_stats.possession_time // 60, home_stats.possession_time % 60)
+            logger.debug("      Penalty Yards: %s", home_stats.penalty_yards)
         
         # Display away team stats
         if prediction.away_team_stats:
             away_stats = prediction.away_team_stats
-            print(f"\n✈️ {prediction.away_team} ({away_stats.conference}):")
-            print(f"   📈 Season Record: {away_stats.games_played} games played")
-            print(f"   🏈 Offensive Stats:")
-            print(f"      Total Yards: {away_stats.total_yards:,} | Rushing: {away_stats.rushing_yards:,} | Passing: {away_stats.passing_yards:,}")
-            print(f"      Touchdowns: {away_stats.rushing_tds + away_stats.passing_tds} (Rush: {away_stats.rushing_tds}, Pass: {away_stats.passing_tds})")
-            print(f"      First Downs: {away_stats.first_downs}")
-            print(f"   📊 Efficiency:")
-            print(f"      Third Down: {away_stats.third_down_pct:.1%} | Red Zone: {away_stats.red_zone_pct:.1%}")
-            print(f"      Scoring %: {away_stats.scoring_pct:.1%} | EPA/Play: {away_stats.epa_offense:.3f}")
-            print(f"   🛡️ Defensive Stats:")
-            print(f"      Sacks: {away_stats.sacks} | Interceptions: {away_stats.interceptions} | TFL: {away_stats.tackles_for_loss}")
-            print(f"      Stop %: {away_stats.stop_pct:.1%} | EPA Allowed: {away_stats.epa_defense:.3f}")
-            print(f"   ⚖️ Game Control:")
-            print(f"      Turnover Margin: {away_stats.turnover_margin:+d} | Possession Time: {away_stats.possession_time//60}:{away_stats.possession_time%60:02d}")
-            print(f"      Penalty Yards: {away_stats.penalty_yards}")
+            logger.debug("\n✈️ %s (%s):", prediction.away_team, away_stats.conference)
+            logger.debug("   📈 Season Record: %s games played", away_stats.games_played)
+            logger.debug("   🏈 Offensive Stats:")
+            logger.debug("      Total Yards: %s | Rushing: %s | Passing: %s", lazy_format(away_stats.total_yards, ','), lazy_format(away_stats.rushing_yards, ','), lazy_format(away_stats.passing_yards, ','))
+            logger.debug("      Touchdowns: %s (Rush: %s, Pass: %s)", away_stats.rushing_tds + away_stats.passing_tds, away_stats.rushing_tds, away_stats.passing_tds)
+            logger.debug("      First Downs: %s", away_stats.first_downs)
+            logger.debug("   📊 Efficiency:")
+            logger.debug("      Third Down: %s | Red Zone: %s", lazy_format(away_stats.third_down_pct, '.1%'), lazy_format(away_stats.red_zone_pct, '.1%'))
+            logger.debug("      Scoring %%: %s | EPA/Play: %.3f", lazy_format(away_stats.scoring_pct, '.1%'), away_stats.epa_offense)
+            logger.debug("   🛡️ Defensive Stats:")
+            logger.debug("      Sacks: %s | Interceptions: %s | TFL: %s", away_stats.sacks, away_stats.interceptions, away_stats.tackles_for_loss)
+            logger.debug("      Stop %%: %s | EPA Allowed: %.3f", lazy_format(away_stats.stop_pct, '.1%'), away_stats.epa_defense)
+            logger.debug("   ⚖️ Game Control:")
+            logger.debug("      Turnover Margin: %+d | Possession Time: %s:%02d", away_stats.turnover_margin, away_stats.possession_time // 60, away_stats.possession_time % 60)
+            logger.debug("      Penalty Yards: %s", away_stats.penalty_yards)
         
         # Display coaching metrics
-        print(f"\n👨‍🏫 COACHING ANALYSIS:")
+        logger.debug("\n👨‍🏫 COACHING ANALYSIS:")
         if prediction.home_coaching:
             home_coach = prediction.home_coaching
-            print(f"   🏠 {prediction.home_team}: {home_coach.coach_name}")
-            print(f"      Experience: {home_coach.seasons_experience} seasons | Record: {home_coach.career_wins}-{home_coach.career_losses} ({home_coach.career_win_pct:.1%})")
-            print(f"      Championships: {home_coach.conference_championships} | Bowl Wins: {home_coach.bowl_wins}")
-            print(f"      Recruiting: {home_coach.recruiting_avg:.1f}/5.0")
+            logger.debug("   🏠 %s: %s", prediction.home_team, home_coach.coach_name)
+            logger.debug("      Experience: %s seasons | Record: %s-%s (%s)", home_coach.seasons_experience, home_coach.career_wins, home_coach.career_losses, lazy_format(home_coach.career_win_pct, '.1%'))
+            logger.debug("      Championships: %s | Bowl Wins: %s", home_coach.conference_championships, home_coach.bowl_wins)
+            logger.debug("      Recruiting: %.1f/5.0", home_coach.recruiting_avg)
         
         if prediction.away_coaching:
             away_coach = prediction.away_coaching
-            print(f"   ✈️ {prediction.away_team}: {away_coach.coach_name}")
-            print(f"      Experience: {away_coach.seasons_experience} seasons | Record: {away_coach.career_wins}-{away_coach.career_losses} ({away_coach.career_win_pct:.1%})")
-            print(f"      Championships: {away_coach.conference_championships} | Bowl Wins: {away_coach.bowl_wins}")
-            print(f"      Recruiting: {away_coach.recruiting_avg:.1f}/5.0")
+            logger.debug("   ✈️ %s: %s", prediction.away_team, away_coach.coach_name)
+            logger.debug("      Experience: %s seasons | Record: %s-%s (%s)", away_coach.seasons_experience, away_coach.career_wins, away_coach.career_losses, lazy_format(away_coach.career_win_pct, '.1%'))
+            logger.debug("      Championships: %s | Bowl Wins: %s", away_coach.conference_championships, away_coach.bowl_wins)
+            logger.debug("      Recruiting: %.1f/5.0", away_coach.recruiting_avg)
         
         # Display drive metrics and game flow
-        print(f"\n🚗 DRIVE EFFICIENCY & GAME FLOW:")
+        logger.debug("\n🚗 DRIVE EFFICIENCY & GAME FLOW:")
         if prediction.home_drive_metrics:
             home_drives = prediction.home_drive_metrics
-            print(f"   🏠 {prediction.home_team}:")
-            print(f"      Avg Drive Length: {home_drives.avg_drive_length:.1f} yards")
-            print(f"      Explosive Drives: {home_drives.explosive_drives} | Three & Outs: {home_drives.three_and_outs}")
-            print(f"      Red Zone: {home_drives.red_zone_scores}/{home_drives.red_zone_attempts} ({home_drives.red_zone_scores/max(home_drives.red_zone_attempts,1):.1%})")
-            print(f"      Quick Scores: {home_drives.quick_scores} | Methodical Drives: {home_drives.methodical_drives}")
+            logger.debug("   🏠 %s:", prediction.home_team)
+            logger.debug("      Avg Drive Length: %.1f yards", home_drives.avg_drive_length)
+            logger.debug("      Explosive Drives: %s | Three & Outs: %s", home_drives.explosive_drives, home_drives.three_and_outs)
+            logger.debug("      Red Zone: %s/%s (%s)", home_drives.red_zone_scores, home_drives.red_zone_attempts, lazy_format(home_drives.red_zone_scores / max(home_drives.red_zone_attempts, 1), '.1%'))
+            logger.debug("      Quick Scores: %s | Methodical Drives: %s", home_drives.quick_scores, home_drives.methodical_drives)
         
         if prediction.away_drive_metrics:
             away_drives = prediction.away_drive_metrics
-            print(f"   ✈️ {prediction.away_team}:")
-            print(f"      Avg Drive Length: {away_drives.avg_drive_length:.1f} yards")
-            print(f"      Explosive Drives: {away_drives.explosive_drives} | Three & Outs: {away_drives.three_and_outs}")
-            print(f"      Red Zone: {away_drives.red_zone_scores}/{away_drives.red_zone_attempts} ({away_drives.red_zone_scores/max(away_drives.red_zone_attempts,1):.1%})")
-            print(f"      Quick Scores: {away_drives.quick_scores} | Methodical Drives: {away_drives.methodical_drives}")
+            logger.debug("   ✈️ %s:", prediction.away_team)
+            logger.debug("      Avg Drive Length: %.1f yards", away_drives.avg_drive_length)
+            logger.debug("      Explosive Drives: %s | Three & Outs: %s", away_drives.explosive_drives, away_drives.three_and_outs)
+            logger.debug("      Red Zone: %s/%s (%s)", away_drives.red_zone_scores, away_drives.red_zone_attempts, lazy_format(away_drives.red_zone_scores / max(away_drives.red_zone_attempts, 1), '.1%'))
+            logger.debug("      Quick Scores: %s | Methodical Drives: %s", away_drives.quick_scores, away_drives.methodical_drives)
         
         # Game flow analysis
         game_flow = self._enhanced_game_flow_analysis(prediction.home_team, prediction.away_team)
         if game_flow.get('tempo_comparison'):
-            print(f"\n🎯 TACTICAL MATCHUP:")
+            logger.debug("\n🎯 TACTICAL MATCHUP:")
             tempo = game_flow['tempo_comparison']
             advantages = game_flow['situational_advantages']
             
-            print(f"   Drive Length Advantage: {tempo.get('drive_length_advantage', 'Even').title()}")
-            print(f"   Explosive Play Advantage: {tempo.get('explosive_advantage', 'Even').title()}")
-            print(f"   Red Zone Efficiency Advantage: {tempo.get('efficiency_advantage', 'Even').title()}")
+            logger.debug("   Drive Length Advantage: %s", tempo.get('drive_length_advantage', 'Even').title())
+            logger.debug("   Explosive Play Advantage: %s", tempo.get('explosive_advantage', 'Even').title())
+            logger.debug("   Red Zone Efficiency Advantage: %s", tempo.get('efficiency_advantage', 'Even').title())
             
             if advantages.get('home_advantages'):
-                print(f"   🏠 {prediction.home_team} Advantages: {', '.join(advantages['home_advantages'])}")
+                logger.debug("   🏠 %s Advantages: %s", prediction.home_team, ', '.join(advantages['home_advantages']))
             if advantages.get('away_advantages'):
-                print(f"   ✈️ {prediction.away_team} Advantages: {', '.join(advantages['away_advantages'])}")
+                logger.debug("   ✈️ %s Advantages: %s", prediction.away_team, ', '.join(advantages['away_advantages']))
         
-        print("="*80)
+        logger.debug('=' * 80)
 
     def _format_market_lines(self, market_lines: List[Dict]) -> List[Dict]:
         """Format market lines for UI display"""
@@ -0,0 +1,87 @@
+"""
+Lazy Static Data - static data sections that load on first access
+
+LightningPredictor.static_data used to be a plain dict with every section
+parsed and processed up front, even for endpoints that never read most of
+them. LazyStaticData keeps the same read-only dict interface but runs each
+section's loader the first time it is looked up, under a per-section lock so
+concurrent request threads never load the same section twice.
+"""
+import threading
+import time
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterable, Optional, Union
+
+from log_config import get_logger
+
+logger = get_logger('lazy_static_data')
+
+# Sentinel for "not loaded yet" (None/{} are valid section values)
+_UNLOADED = object()
+
+
+class LazyStaticData(Mapping):
+    """Read-only mapping of section name -> data, loading each section on demand
+
+    Loaders receive the mapping itself, so a section can depend on another one
+    (e.g. team_stats on backtesting_ratings). A loader that raises leaves the
+    section at its default instead of failing the prediction.
+    """
+
+    def __init__(self, loaders: Dict[str, Callable[['LazyStaticData'], Any]],
+                 defaults: Optional[Dict[str, Any]] = None):
+        self._loaders = loaders
+        self._defaults = defaults or {}
+        self._values = {name: _UNLOADED for name in loaders}
+        self._locks = {name: threading.RLock() for name in loaders}
+        self.load_times: Dict[str, float] = {}
+
+    def __getitem__(self, name: str) -> Any:
+        value = self._values[name]  # KeyError for unknown sections, like a dict
+        if value is not _UNLOADED:
+            return value
+
+        with self._locks[name]:
+            value = self._values[name]
+            if value is _UNLOADED:
+                started = time.perf_counter()
+                try:
+                    value = self._loaders[name](self)
+                except Exception as e:
+                    logger.warning("⚠️  Could not load static data section '%s': %s", name, e)
+                    value = self._defaults.get(name, {})
+                self.load_times[name] = time.perf_counter() - started
+                self._values[name] = value
+        return value
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._loaders
+
+    def __iter__(self):
+        return iter(self._loaders)
+
+    def __len__(self) -> int:
+        return len(self._loaders)
+
+    def is_loaded(self, name: str) -> bool:
+        return self._values.get(name, _UNLOADED) is not _UNLOADED
+
+    @property
+    def loaded_sections(self):
+        return [name for name in self._loaders if self.is_loaded(name)]
+
+    def prewarm(self, sections: Union[str, Iterable[str], None]) -> Dict[str, float]:
+        """Load sections now ('all', a comma-separated string or an iterable); returns load times"""
+        if not sections:
+            return {}
+        if isinstance(sections, str):
+            sections = list(self._loaders) if sections.strip() == 'all' else [
+                name.strip() for name in sections.split(',') if name.strip()
+            ]
+
+        for name in sections:
+            if name in self._loaders:
+                self[name]
+            else:
+                logger.warning("⚠️  Unknown static data section '%s' - skipping prewarm", name)
+        return {name: self.load_times[name] for name in sections if name in self.load_times}
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Load-test harness: gunicorn + Flask (Procfile setup) vs uvicorn + ASGI (asgi.py)
+
+Starts the stub GraphQL server, points each serving mode at it through
+CFB_GRAPHQL_URL, then fires the same request mix at both and reports
+requests/sec and latency percentiles.
+
+The request mix cycles a handful of matchups, so the prediction cache and the
+GraphQL query cache are disabled in both servers by default - otherwise both
+modes mostly serve cache hits after the first few requests and the numbers say
+nothing about serving. --with-caches measures the production configuration.
+
+Usage (from the repo root):
+    python loadtest/compare_servers.py --requests 200 --concurrency 32 --latency-ms 150
+"""
+import argparse
+import asyncio
+import os
+import signal
+import statistics
+import subprocess
+import sys
+import time
+
+import aiohttp
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# (home, away) matchups cycled through by the load generator
+MATCHUPS = [
+    ('Ohio State', 'Michigan'),
+    ('Georgia', 'Alabama'),
+    ('Texas', 'Miami'),
+    ('Oregon', 'USC'),
+    ('LSU', 'South Carolina'),
+    ('TCU', 'Oklahoma'),
+]
+
+
+def start_process(cmd, env):
+    return subprocess.Popen(cmd, cwd=REPO_ROOT, env=env, stdout=subprocess.DEVNULL,
+                            stderr=subprocess.DEVNULL, start_new_session=True)
+
+
+def stop_process(proc):
+    if proc.poll() is None:
+        os.killpg(proc.pid, signal.SIGTERM)
+        try:
+            proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            os.killpg(proc.pid, signal.SIGKILL)
+
+
+async def wait_until_ready(url, timeout=180):
+    deadline = time.monotonic() + timeout
+    async with aiohttp.ClientSession() as session:
+        while time.monotonic() < deadline:
+            try:
+                async with session.get(url) as response:
+                    if response.status < 500:
+                        return
+            except aiohttp.ClientError:
+                pass
+            await asyncio.sleep(0.5)
+    raise RuntimeError(f"Server at {url} did not become ready")
+
+
+async def run_load(base_url, total_requests, concurrency, endpoint):
+    latencies = []
+    errors = 0
+    semaphore = asyncio.Semaphore(concurrency)
+    timeout = aiohttp.ClientTimeout(total=300)
+
+    async with aiohttp.ClientSession(timeout=timeout) as session:
+        # Warm the predictor (static data load, first connection, ESPN rosters) outside the measurement
+        for home, away in MATCHUPS:
+            async with session.get(f"{base_url}/{endpoint}/{home}/{away}") as response:
+                await response.read()
+
+        async def one_request(i):
+            nonlocal errors
+            home, away = MATCHUPS[i % len(MATCHUPS)]
+            async with semaphore:
+                started = time.perf_counter()
+                try:
+                    async with session.get(f"{base_url}/{endpoint}/{home}/{away}") as response:
+                        await response.read()
+                        if response.status != 200:
+                            errors += 1
+                except aiohttp.ClientError:
+                    errors += 1
+                latencies.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one_request(i) for i in range(total_requests)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        'requests': total_requests,
+        'errors': errors,
+        'elapsed_s': elapsed,
+        'rps': total_requests / elapsed if elapsed else 0.0,
+        'p50_ms': statistics.median(latencies) * 1000,
+        'p95_ms': latencies[int(len(latencies) * 0.95) - 1] * 1000,
+        'max_ms': latencies[-1] * 1000,
+    }
+
+
+async def benchmark(name, cmd, port, env, args):
+    proc = start_process(cmd, env)
+    try:
+        base_url = f"http://127.0.0.1:{port}"
+        await wait_until_ready(f"{base_url}/health")
+        result = await run_load(base_url, args.requests, args.concurrency, args.endpoint)
+    finally:
+        stop_process(proc)
+    print(f"  {name:<22} {result['rps']:>8.1f} req/s  p50 {result['p50_ms']:>7.0f} ms  "
+          f"p95 {result['p95_ms']:>7.0f} ms  max {result['max_ms']:>7.0f} ms  errors {result['errors']}")
+    return result
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--latency-ms', type=float, default=150.0, help='stub upstream latency per GraphQL call')
+    parser.add_argument('--endpoint', default='predict', help="'predict' or 'predict-detailed'")
+    parser.add_argument('--stub-port', type=int, default=8765)
+    parser.add_argument('--flask-port', type=int, default=8801)
+    parser.add_argument('--asgi-port', type=int, default=8802)
+    parser.add_argument('--with-caches', action='store_true',
+                        help='keep the prediction and query caches on (measures cache hits, not serving)')
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    env['CFB_GRAPHQL_URL'] = f"http://127.0.0.1:{args.stub_port}/v1/graphql"
+    env['FLASK_DEBUG'] = 'false'
+    if not args.with_caches:
+        env['CFB_PREDICTION_CACHE_MB'] = '0'
+        env['CFB_QUERY_CACHE_SIZE'] = '0'
+        env.pop('CFB_QUERY_CACHE_DIR', None)
+
+    stub = start_process([sys.executable, 'loadtest/stub_graphql_server.py', '--port', str(args.stub_port),
+                          '--latency-ms', str(args.latency_ms)], env)
+    try:
+        await asyncio.sleep(1.0)
+        print(f"🏈 {args.requests} requests x concurrency {args.concurrency}, "
+              f"stub upstream latency {args.latency_ms:.0f} ms, endpoint /{args.endpoint}, "
+              f"caches {'on' if args.with_caches else 'off'}")
+        flask = await benchmark(
+            'gunicorn + Flask',
+            ['gunicorn', 'app:app', '--bind', f"127.0.0.1:{args.flask_port}", '--workers', '1', '--timeout', '120'],
+            args.flask_port, env, args
+        )
+        asgi = await benchmark(
+            'uvicorn + ASGI',
+            ['uvicorn', 'asgi:app', '--host', '127.0.0.1', '--port', str(args.asgi_port), '--workers', '1',
+             '--log-level', 'warning'],
+            args.asgi_port, env, args
+        )
+        if flask['rps']:
+            print(f"  ⚡ ASGI speedup: {asgi['rps'] / flask['rps']:.1f}x requests/sec")
+    finally:
+        stop_process(stub)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Stub GraphQL server standing in for graphql.collegefootballdata.com during load tests
+
+Answers the operations LightningPredictor sends (TeamFragment, WeekFragment,
+PlayersFragment, WeatherFragment, MatchupFragment, GameId, GameLines, GameMedia) plus the backtest recorder's
+WeekGames slate query (pairs of fbs.json teams) with deterministic synthetic
+payloads after a fixed artificial latency, so the serving stack can be
+benchmarked without touching the real API or its rate limits.
+
+Usage:
+    python loadtest/stub_graphql_server.py --port 8765 --latency-ms 150
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import re
+
+from aiohttp import web
+
+SEASON = 2025
+WEEK = 15
+FBS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'fbs.json')
+
+
+def _team_metrics(rng):
+    fields = [
+        'epa', 'epaAllowed', 'explosiveness', 'explosivenessAllowed', 'success', 'successAllowed',
+        'passingEpa', 'passingEpaAllowed', 'rushingEpa', 'rushingEpaAllowed',
+        'passingDownsSuccess', 'passingDownsSuccessAllowed', 'standardDownsSuccess', 'standardDownsSuccessAllowed',
+        'lineYards', 'lineYardsAllowed', 'secondLevelYards', 'secondLevelYardsAllowed',
+        'openFieldYards', 'openFieldYardsAllowed', 'highlightYards', 'highlightYardsAllowed'
+    ]
+    return [{field: round(rng.uniform(0.05, 1.2), 3) for field in fields}]
+
+
+def _season_games(rng, team_id, week):
+    games = []
+    for game_week in range(1, week):
+        opponent_id = rng.randint(2000, 3000)
+        home = game_week % 2 == 0
+        team_points, opponent_points = rng.randint(7, 45), rng.randint(7, 45)
+        team_prob = round(rng.random(), 3)
+        games.append({
+            'id': team_id * 100 + game_week,
+            'homePoints': team_points if home else opponent_points,
+            'awayPoints': opponent_points if home else team_points,
+            'homeTeam': f"Team {team_id if home else opponent_id}",
+            'awayTeam': f"Team {opponent_id if home else team_id}",
+            'homeTeamId': team_id if home else opponent_id,
+            'awayTeamId': opponent_id if home else team_id,
+            'homePostgameWinProb': team_prob if home else 1 - team_prob,
+            'awayPostgameWinProb': 1 - team_prob if home else team_prob,
+            'homeStartElo': rng.randint(1300, 2100),
+            'awayStartElo': rng.randint(1300, 2100),
+            'week': game_week,
+            'seasonType': 'regular'
+        })
+    return games
+
+
+def _game_id(home_team_id, away_team_id):
+    return 400000000 + home_team_id * 10000 + away_team_id
+
+
+def team_fragment(variables):
+    team_id = variables.get('teamId', 0)
+    rng = random.Random(team_id)
+    season_games = _season_games(rng, team_id, WEEK)
+    return {'data': {
+        'teamMetrics': _team_metrics(rng),
+        'teamTalent': [{'talent': round(rng.uniform(500, 1000), 2)}],
+        'seasonGames': season_games,
+        'recentGames': list(reversed(season_games))[:4],
+        'team': [{'school': f"Team {team_id}", 'conference': 'Stub'}],
+        'ratings': [{
+            'teamId': team_id, 'year': SEASON, 'elo': rng.randint(1300, 2100),
+            'fpi': round(rng.uniform(-15, 25), 1), 'conference': 'Stub', 'team': f"Team {team_id}"
+        }]
+    }}
+
+
+def week_fragment(variables):
+    week = variables.get('currentWeek', WEEK)
+    return {'data': {
+        'currentPolls': [],
+        'weeklyCalendar': [{'week': w, 'startDate': None, 'endDate': None} for w in range(1, week + 1)]
+    }}
+
+
+def matchup_fragment(variables):
+    home_id = variables.get('homeTeamId', 0)
+    away_id = variables.get('awayTeamId', 0)
+    return {'data': {'currentGame': [{
+        'id': _game_id(home_id, away_id), 'season': SEASON, 'week': variables.get('currentWeek', WEEK),
+        'homeTeam': f"Team {home_id}", 'awayTeam': f"Team {away_id}",
+        'homeTeamId': home_id, 'awayTeamId': away_id,
+        'startDate': f"{SEASON}-12-06T17:00:00.000Z", 'weather': None, 'mediaInfo': []
+    }]}}
+
+
+def week_games(variables):
+    week = variables.get('week', WEEK)
+    rng = random.Random(week)
+    with open(FBS_PATH, 'r') as f:
+        teams = [team for team in json.load(f)]
+    rng.shuffle(teams)
+    games = []
+    for home, away in zip(teams[0::2], teams[1::2]):
+        home_points, away_points = rng.randint(7, 49), rng.randint(7, 49)
+        if home_points == away_points:
+            home_points += 3  # no ties after overtime
+        games.append({
+            'id': _game_id(home['id'], away['id']), 'season': variables.get('season', SEASON), 'week': week,
+            'homeTeamId': home['id'], 'homeTeam': home['school'], 'awayTeamId': away['id'], 'awayTeam': away['school'],
+            'homePoints': home_points, 'awayPoints': away_points
+        })
+    return {'data': {'game': games}}
+
+
+def respond(operation, variables):
+    if operation == 'WeekGames':
+        return week_games(variables)
+    if operation == 'GameId':
+        return {'data': {'game': [{'id': _game_id(variables['homeTeamId'], variables['awayTeamId'])}]}}
+    if operation == 'GameLines':
+        return {'data': {'gameLines': [{
+            'gameId': variables['gameId'], 'spread': -3.5, 'spreadOpen': -3.0,
+            'overUnder': 52.5, 'overUnderOpen': 51.5, 'moneylineHome': -160, 'moneylineAway': 135,
+            'provider': {'name': 'Stub Book'}
+        }]}}
+    if operation == 'GameMedia':
+        return {'data': {'game': [{'id': variables['gameId'], 'mediaInfo': [{'mediaType': 'tv', 'name': 'STUB'}]}]}}
+    if operation == 'TeamFragment':
+        return team_fragment(variables)
+    if operation == 'WeekFragment':
+        return week_fragment(variables)
+    if operation == 'PlayersFragment':
+        return {'data': {'allPlayers': []}}
+    if operation == 'WeatherFragment':
+        return {'data': {'gameWeather': []}}
+    return matchup_fragment(variables)
+
+
+def make_app(latency_ms: float) -> web.Application:
+    counters = {'requests': 0}
+
+    async def graphql(request: web.Request) -> web.Response:
+        body = await request.json()
+        match = re.search(r'query\s+(\w+)', body.get('query', ''))
+        operation = match.group(1) if match else 'anonymous'
+        counters['requests'] += 1
+        await asyncio.sleep(latency_ms / 1000.0)
+        return web.json_response(respond(operation, body.get('variables') or {}))
+
+    async def stats(request: web.Request) -> web.Response:
+        return web.json_response(counters)
+
+    app = web.Application()
+    app.router.add_post('/v1/graphql', graphql)
+    app.router.add_get('/stats', stats)
+    return app
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency-ms', type=float, default=150.0, help='artificial upstream latency per request')
+    args = parser.parse_args()
+    web.run_app(make_app(args.latency_ms), host='127.0.0.1', port=args.port)
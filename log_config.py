@@ -0,0 +1,63 @@
+"""
+Log Config - level-gated diagnostics for the prediction path
+
+The predictor and API used to print every diagnostic (metric tables, emoji
+banners, per-player lines) straight to stdout, formatting dozens of strings
+per game even when nobody reads them. They now log through the 'gameday'
+logger tree with lazy %-style arguments, so nothing is formatted or written
+below the configured level.
+
+Production default is WARNING (errors and warnings only), overridable with
+CFB_LOG_LEVEL. configure_logging(verbose=True) restores the full console
+report on stdout, e.g. `python run.py --verbose`.
+"""
+import logging
+import os
+import sys
+from typing import Any, Optional
+
+ROOT_LOGGER = 'gameday'
+LOG_LEVEL_ENV = 'CFB_LOG_LEVEL'
+DEFAULT_LEVEL = 'WARNING'
+
+
+class LazyFormat:
+    """Deferred format(value, spec) for f-string specs %-formatting can't express (e.g. '.1%')"""
+    __slots__ = ('value', 'spec')
+
+    def __init__(self, value: Any, spec: str):
+        self.value = value
+        self.spec = spec
+
+    def __str__(self) -> str:
+        return format(self.value, self.spec)
+
+
+def lazy_format(value: Any, spec: str) -> LazyFormat:
+    return LazyFormat(value, spec)
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Logger under the shared 'gameday' tree (configured once by configure_logging)"""
+    return logging.getLogger(f"{ROOT_LOGGER}.{name}")
+
+
+def configure_logging(verbose: bool = False, level: Optional[str] = None) -> logging.Logger:
+    """Set up the 'gameday' logger: plain DEBUG console report when verbose, else CFB_LOG_LEVEL (WARNING)"""
+    root = logging.getLogger(ROOT_LOGGER)
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+
+    if verbose:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        root.setLevel(logging.DEBUG)
+    else:
+        handler = logging.StreamHandler(sys.stderr)
+        handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s'))
+        level_name = (level or os.environ.get(LOG_LEVEL_ENV) or DEFAULT_LEVEL).upper()
+        root.setLevel(getattr(logging, level_name, logging.WARNING))
+
+    root.addHandler(handler)
+    root.propagate = False
+    return root
@@ -0,0 +1,90 @@
+"""
+Model Params - versioned calibrated parameters loaded by the predictor at startup
+
+The Dixon-Coles decay, Platt coefficients and per-tier component weights in
+LightningPredictor.__init__ are hand-set. calibration.py fits them against a
+backtest and writes them here as model_params.json; every LightningPredictor
+applies the file over its defaults when it starts, and records the version
+(fit date + content hash) it is running with.
+
+CFB_MODEL_PARAMS points at another file; CFB_MODEL_PARAMS=none keeps the
+hand-set defaults.
+"""
+import hashlib
+import json
+import os
+from typing import Dict, Optional
+
+from log_config import get_logger
+from prediction_pipeline import WEIGHT_KEYS, WEIGHT_TIERS
+
+logger = get_logger('model_params')
+
+MODEL_PARAMS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'model_params.json')
+MODEL_PARAMS_ENV = 'CFB_MODEL_PARAMS'
+PARAMS_FORMAT = 1
+
+# Fitted values a parameter file may carry (anything else is provenance: source, metrics, ...)
+FITTED_KEYS = ('decay_xi', 'platt_a', 'platt_b', 'elo_thresholds', 'tier_weights')
+
+
+def model_params_path(path: Optional[str] = None) -> Optional[str]:
+    """Explicit path, else CFB_MODEL_PARAMS, else model_params.json next to this module (None = disabled)"""
+    path = path or os.environ.get(MODEL_PARAMS_ENV) or MODEL_PARAMS_PATH
+    return None if path.lower() == 'none' else path
+
+
+def params_version(params: Dict) -> str:
+    """'<fit date>-<hash of the fitted values>' - equal versions score identically"""
+    fitted = {key: params[key] for key in FITTED_KEYS if key in params}
+    digest = hashlib.sha1(json.dumps(fitted, sort_keys=True).encode()).hexdigest()[:10]
+    return f"{params.get('fitted_at', 'unknown')[:10]}-{digest}"
+
+
+def validate_params(params: Dict):
+    """Raise ValueError unless params is a loadable parameter file"""
+    if params.get('format') != PARAMS_FORMAT:
+        raise ValueError(f"unsupported format {params.get('format')!r} (expected {PARAMS_FORMAT})")
+    for key in ('decay_xi', 'platt_a', 'platt_b'):
+        if key in params and not isinstance(params[key], (int, float)):
+            raise ValueError(f"{key} must be a number")
+    if 'decay_xi' in params and params['decay_xi'] < 0:
+        raise ValueError("decay_xi must be non-negative")
+    if 'platt_a' in params and params['platt_a'] <= 0:
+        raise ValueError("platt_a must be positive (a <= 0 flattens or inverts every probability)")
+    thresholds = params.get('elo_thresholds')
+    if thresholds is not None and set(thresholds) != set(WEIGHT_TIERS[:-1]):
+        raise ValueError(f"elo_thresholds must cover {', '.join(WEIGHT_TIERS[:-1])}")
+    tiers = params.get('tier_weights')
+    if tiers is not None:
+        if set(tiers) != set(WEIGHT_TIERS) or any(set(weights) != set(WEIGHT_KEYS) for weights in tiers.values()):
+            raise ValueError("tier_weights must give every WEIGHT_KEYS weight for every tier")
+
+
+def load_model_params(path: Optional[str] = None) -> Optional[Dict]:
+    """The calibrated parameter file, or None (missing, disabled or invalid - predictor keeps its defaults)"""
+    path = model_params_path(path)
+    if path is None or not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'r') as f:
+            params = json.load(f)
+        validate_params(params)
+    except (OSError, ValueError) as e:
+        logger.warning("⚠️ Ignoring model parameters %s: %s", path, e)
+        return None
+    params.setdefault('version', params_version(params))
+    return params
+
+
+def write_model_params(params: Dict, path: Optional[str] = None) -> str:
+    """Stamp format/version and write atomically; returns the version"""
+    path = path or MODEL_PARAMS_PATH
+    params = dict(params, format=PARAMS_FORMAT)
+    params['version'] = params_version(params)
+    validate_params(params)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(params, f, indent=2)
+    os.replace(tmp_path, path)
+    return params['version']
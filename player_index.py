@@ -0,0 +1,142 @@
+"""
+Player Index - comprehensive player analysis files, bucketed by team
+
+_analyze_key_players used to re-read the seven position files (QB/RB/WR/TE/
+DB/LB/DL, ~4 MB of JSON) on every prediction and scan every player with
+string heuristics to find each team's roster. PlayerIndex loads them once per
+data release, keys players by canonical fbs.json team id and position, and
+pre-sorts every bucket by comprehensive efficiency, so a team lookup is a dict
+access.
+"""
+import glob
+import json
+import os
+from typing import Dict, List, Optional, Tuple
+
+from log_config import get_logger
+from static_snapshot import source_fingerprint
+from team_directory import get_team_directory, normalize_name
+
+logger = get_logger('player_index')
+
+PLAYER_METRICS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'player_metrics')
+
+# Position key -> (player_metrics subfolder, file prefix, JSON key holding the player list)
+POSITION_SOURCES = {
+    'qbs': ('qb', 'comprehensive_qb_analysis', 'quarterbacks'),
+    'rbs': ('rb', 'comprehensive_rb_analysis', 'running_backs'),
+    'wrs': ('wr', 'comprehensive_wr_analysis', 'all_wrs'),
+    'tes': ('te', 'comprehensive_te_analysis', 'all_tes'),
+    'dbs': ('db', 'comprehensive_db_analysis', 'dbs'),
+    'lbs': ('lb', 'comprehensive_lb_analysis', 'lbs'),
+    'dls': ('dl', 'comprehensive_dl_analysis', 'all_dls')
+}
+
+# Defensive position files merged into one 'defense' bucket, tagged with position_type
+DEFENSE_POSITIONS = (('dbs', 'DB'), ('lbs', 'LB'), ('dls', 'DL'))
+
+
+def efficiency_score(player: Dict) -> float:
+    """Comprehensive efficiency (QBs nest it under efficiency_metrics, others keep it at root level)"""
+    return player.get('comprehensive_efficiency_score',
+                      player.get('efficiency_metrics', {}).get('comprehensive_efficiency_score', 0))
+
+
+def qb_efficiency_score(player: Dict) -> float:
+    return player.get('efficiency_metrics', {}).get('comprehensive_efficiency_score', 0)
+
+
+def player_source_paths(data_dir: Optional[str] = None) -> Dict[str, str]:
+    """Newest analysis file per position - the week folder first (weekly QB refresh), then player_metrics/"""
+    paths = {}
+    for position, (folder, prefix, _) in POSITION_SOURCES.items():
+        candidates = []
+        if data_dir:
+            candidates = sorted(glob.glob(os.path.join(data_dir, f'{prefix}_*.json')))
+        if not candidates:
+            candidates = sorted(glob.glob(os.path.join(PLAYER_METRICS_DIR, folder, f'{prefix}_*.json')))
+        if candidates:
+            paths[position] = candidates[-1]
+    return paths
+
+
+def load_player_data(data_dir: Optional[str] = None) -> Tuple[Dict[str, List[Dict]], int]:
+    """Raw position -> player list from the analysis files; returns (player_data, files_loaded)"""
+    paths = player_source_paths(data_dir)
+    player_data = {}
+    files_loaded = 0
+    for position, (_, _, json_key) in POSITION_SOURCES.items():
+        player_data[position] = []
+        if position not in paths:
+            continue
+        try:
+            with open(paths[position], 'r') as f:
+                player_data[position] = json.load(f).get(json_key, [])
+            files_loaded += 1
+        except Exception as e:
+            logger.warning("   ⚠️  Could not load %s data: %s", position, e)
+    return player_data, files_loaded
+
+
+def team_key(team_name: str):
+    """Canonical bucket key: fbs.json team id, or the cleaned name for teams outside fbs.json"""
+    name = team_name or ''
+    directory = get_team_directory()
+    team_id = directory.resolve_exact(name)
+    if team_id is None and name.endswith(')') and ' (' in name:
+        name = name.rsplit(' (', 1)[0]  # Remove conference info - "Miami (OH) (Mid-American)" keeps "(OH)"
+        team_id = directory.resolve_exact(name)
+    if team_id is not None:
+        return team_id
+    name = normalize_name(name)
+    for suffix in (' university', ' college'):
+        if name.endswith(suffix) and len(name) - len(suffix) > 3:
+            name = name[:-len(suffix)]
+    return name
+
+
+class PlayerIndex:
+    """Players bucketed by team and position, each bucket sorted by efficiency"""
+
+    def __init__(self, player_data: Dict[str, List[Dict]], sources: Optional[Dict[str, str]] = None):
+        self.sources = sources or {}
+        self.fingerprint = source_fingerprint(self.sources.values())
+        self.counts = {position: len(player_data.get(position, [])) for position in POSITION_SOURCES}
+        self._teams: Dict[object, Dict] = {}
+
+        for position in ('rbs', 'wrs', 'tes'):
+            for player in player_data.get(position, []):
+                self._bucket(player.get('team', ''))[position].append(player)
+        for position, position_type in DEFENSE_POSITIONS:
+            for player in player_data.get(position, []):
+                player['position_type'] = position_type
+                self._bucket(player.get('team', ''))['defense'].append(player)
+        for player in player_data.get('qbs', []):
+            bucket = self._bucket(player.get('team', ''))
+            # Starter = most efficient QB; ties keep the first one listed
+            if not bucket['qb'] or qb_efficiency_score(player) > qb_efficiency_score(bucket['qb']):
+                bucket['qb'] = player
+
+        for bucket in self._teams.values():
+            for position in ('rbs', 'wrs', 'tes', 'defense'):
+                bucket[position].sort(key=efficiency_score, reverse=True)
+
+    def _bucket(self, team_name: str) -> Dict:
+        key = team_key(team_name)
+        bucket = self._teams.get(key)
+        if bucket is None:
+            bucket = {'qb': None, 'rbs': [], 'wrs': [], 'tes': [], 'defense': []}
+            self._teams[key] = bucket
+        return bucket
+
+    def team_players(self, team_name: str) -> Dict:
+        """{'qb', 'rbs', 'wrs', 'tes', 'defense'} for a team (fresh lists, shared player dicts)"""
+        bucket = self._teams.get(team_key(team_name))
+        if bucket is None:
+            return {'qb': None, 'rbs': [], 'wrs': [], 'tes': [], 'defense': []}
+        return {position: list(players) if isinstance(players, list) else players
+                for position, players in bucket.items()}
+
+    @property
+    def total_players(self) -> int:
+        return sum(self.counts.values())
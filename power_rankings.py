@@ -0,0 +1,225 @@
+"""
+Power Rankings Store - the weekly comprehensive power rankings, parsed once
+
+The comprehensive_power_rankings_*.json export (~800 KB) used to be re-read
+and linearly scanned several times per /predict call. PowerRankingsStore
+parses it once per data version, indexes entries by normalized team name and
+precomputes the per-team ratings dict the API returns. The version stamp
+(week + content hash) identifies the file a response was built from.
+"""
+import copy
+import glob
+import gzip
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from log_config import get_logger
+from team_directory import normalize_name
+
+logger = get_logger('power_rankings')
+
+RANKINGS_PATTERN = 'comprehensive_power_rankings_*.json'
+WEEKLY_UPDATES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'weekly_updates')
+
+# How often (seconds) a cached store re-checks its folder for a newer export
+RECHECK_INTERVAL = 30.0
+
+
+def week_data_dir(week: int) -> str:
+    return os.path.join(WEEKLY_UPDATES_DIR, f'week_{week}')
+
+
+def find_rankings_file(data_dir: str) -> Optional[str]:
+    """Newest power rankings export in a week folder (exports are timestamped)"""
+    exports = sorted(glob.glob(os.path.join(data_dir, RANKINGS_PATTERN)))
+    return exports[-1] if exports else None
+
+
+def build_team_ratings(team_data: Dict) -> Dict:
+    """API ratings dict for one rankings entry - using actual field names from the JSON"""
+    overall = team_data.get('overall_score', 50)
+    offense = team_data.get('offensive_score', 50)
+    defense = team_data.get('defensive_score', 50)
+    rank = team_data.get('rank', 65)
+    return {
+        'team': team_data.get('team'),
+        'conference': team_data.get('conference', ''),
+        'ratings_available': True,
+        'elo': 1500 + (overall - 50) * 10,  # Convert overall score to ELO scale
+        'fpi': overall - 50,  # Use overall score as FPI
+        'sp_overall': defense - offense,  # SP+ style diff
+        'srs': (overall - 50) * 0.8,  # Scaled overall score
+        'composite_rating': overall,
+        'offensive_efficiency': offense,
+        'defensive_efficiency': defense,
+        'special_teams_efficiency': 50.0,  # Default since not in this data
+        'fpi_components': {
+            'offensive_efficiency': offense,
+            'defensive_efficiency': defense,
+            'special_teams_efficiency': 50.0,
+            'overall_efficiency': overall
+        },
+        'sp_components': {
+            'offense': offense,
+            'defense': defense,
+            'special_teams': 50.0
+        },
+        'fpi_rankings': {
+            'sos_rank': rank,
+            'remaining_sos_rank': rank,
+            'strength_of_record_rank': rank,
+            'resume_rank': rank,
+            'game_control_rank': rank,
+            'avg_win_probability_rank': rank
+        },
+        'rating_consistency': 85.0,  # Default high consistency
+        'elite_tier': rank <= 10,
+        'struggling_tier': rank >= 100
+    }
+
+
+class PowerRankingsStore:
+    """One parsed rankings export with a team-name index and precomputed ratings"""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as f:
+            raw = f.read()
+        stat = os.stat(path)
+        self._stat = (stat.st_size, stat.st_mtime_ns)
+
+        data = json.loads(raw)
+        self.metadata: Dict = data.get('metadata', {})
+        self.rankings: List[Dict] = data.get('rankings', [])
+
+        week = re.search(r'week_(\d+)', os.path.basename(os.path.dirname(path)))
+        self.week: Optional[int] = int(week.group(1)) if week else None
+        self.version = f"week{self.week}-{hashlib.sha1(raw).hexdigest()[:12]}"
+
+        self._by_name: Dict[str, Dict] = {}
+        self._ratings: Dict[str, Dict] = {}
+        for entry in self.rankings:
+            key = normalize_name(entry.get('team', ''))
+            if key and key not in self._by_name:
+                self._by_name[key] = entry
+                self._ratings[key] = build_team_ratings(entry)
+
+        self.loaded_at = time.time()
+        self._checked_at = time.monotonic()
+        self._encoded: Optional[Tuple[bytes, bytes]] = None
+        logger.info("✅ Power rankings loaded: %s teams (%s)", len(self.rankings), self.version)
+
+    def entry(self, team_name: str) -> Optional[Dict]:
+        """Raw rankings entry for a team (shared - do not mutate)"""
+        return self._by_name.get(normalize_name(team_name or ''))
+
+    def team_ratings(self, team_name: str) -> Optional[Dict]:
+        """Precomputed ratings dict for a team; a copy, since responses get post-processed"""
+        ratings = self._ratings.get(normalize_name(team_name or ''))
+        return copy.deepcopy(ratings) if ratings is not None else None
+
+    @property
+    def etag(self) -> str:
+        return f'"{self.version}"'
+
+    @property
+    def gzip_etag(self) -> str:
+        """Strong validator for the gzip body - it must differ from the identity body's"""
+        return f'"{self.version}-gz"'
+
+    def matchup_entries(self, away_team: str, home_team: str) -> Dict:
+        """Just the two teams' entries plus a reference to the full table"""
+        return {
+            'version': self.version,
+            'week': self.week,
+            'url': f"/rankings/power?week={self.week}" if self.week is not None else "/rankings/power",
+            'away_team': self.entry(away_team),
+            'home_team': self.entry(home_team)
+        }
+
+    def encoded(self) -> Tuple[bytes, bytes]:
+        """(json, gzip) bodies of the full table, built once per version"""
+        if self._encoded is None:
+            body = json.dumps({
+                'success': True,
+                'version': self.version,
+                'week': self.week,
+                'metadata': self.metadata,
+                'rankings': self.rankings
+            }, separators=(',', ':')).encode('utf-8')
+            self._encoded = (body, gzip.compress(body, compresslevel=6))
+        return self._encoded
+
+    def is_current(self, data_dir: str) -> bool:
+        """False once the folder has a newer export or this file changed on disk"""
+        now = time.monotonic()
+        if now - self._checked_at < RECHECK_INTERVAL:
+            return True
+        self._checked_at = now
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return False
+        return (stat.st_size, stat.st_mtime_ns) == self._stat and find_rankings_file(data_dir) == self.path
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match check (weak comparison, '*' matches anything)"""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(',')]
+    return '*' in candidates or etag in [tag[2:] if tag.startswith('W/') else tag for tag in candidates]
+
+
+def accepts_gzip(accept_encoding: Optional[str]) -> bool:
+    """Accept-Encoding allows gzip (q-values honoured: 'gzip;q=0' refuses it, '*' covers it unless listed)"""
+    qualities = {}
+    for item in (accept_encoding or '').split(','):
+        coding, _, params = item.partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(';'):
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding] = quality
+    for coding in ('gzip', 'x-gzip'):
+        if coding in qualities:
+            return qualities[coding] > 0
+    return qualities.get('*', 0) > 0
+
+
+# One store per week folder, rebuilt when the folder's export changes
+_stores: Dict[str, PowerRankingsStore] = {}
+_stores_lock = threading.Lock()
+
+def get_power_rankings(data_dir: str) -> Optional[PowerRankingsStore]:
+    """Get the rankings store for a week folder (the predictor's static_data_dir); None if there is no export"""
+    store = _stores.get(data_dir)
+    if store is not None and store.is_current(data_dir):
+        return store
+
+    with _stores_lock:
+        if _stores.get(data_dir) is not store:
+            return _stores[data_dir]  # another thread already reloaded it
+        path = find_rankings_file(data_dir)
+        if path is None:
+            logger.error("❌ No comprehensive power rankings export in %s", data_dir)
+            return store
+        try:
+            store = PowerRankingsStore(path)
+        except Exception as e:
+            logger.error("❌ Error loading comprehensive power rankings: %s", e)
+            return store
+        _stores[data_dir] = store
+    return store
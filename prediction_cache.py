@@ -0,0 +1,207 @@
+"""
+Prediction Cache - formatted predictions for repeated matchups
+
+The frontend asks for the same game through /predict, /predict/<home>/<away>
+and /predict-detailed/<home>/<away>, and n8n polls it too; each request used
+to run the full prediction and the 18-section format_prediction_for_api pass
+again. Results are now kept per (home id, away id, week, static data version,
+lines fingerprint): a new data release or a line move changes the key, so
+stale entries are never served and simply age out of the LRU.
+
+The cache is bounded by the approximate size of the stored payloads
+(CFB_PREDICTION_CACHE_MB, 0 disables it), and concurrent requests for the
+same key wait on the one computation already running (single-flight).
+"""
+import asyncio
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+from log_config import get_logger
+
+logger = get_logger('prediction_cache')
+
+DEFAULT_MAX_MB = 64
+
+
+def lines_fingerprint(lines: List[Dict]) -> str:
+    """Order-independent hash of a game's sportsbook lines ('' when there are none)"""
+    if not lines:
+        return ''
+    rows = sorted(json.dumps(line, sort_keys=True, default=str) for line in lines)
+    return hashlib.sha1('\n'.join(rows).encode('utf-8')).hexdigest()[:16]
+
+
+class ComputationAbandoned(Exception):
+    """The caller computing an entry was cancelled - waiters retry instead of failing"""
+
+
+@dataclass
+class CachedPrediction:
+    """A GamePrediction plus its full /predict payload (format_prediction_for_api output)"""
+    prediction: Any
+    response: Dict[str, Any]
+    size: int = 0
+
+
+class PredictionCache:
+    """Size-bounded LRU of CachedPrediction entries with single-flight computation"""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_MB * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: 'OrderedDict[Hashable, CachedPrediction]' = OrderedDict()
+        self._inflight: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+        self.counters = {
+            'hits': 0,
+            'misses': 0,
+            'coalesced': 0,
+            'evictions': 0
+        }
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], CachedPrediction]) -> CachedPrediction:
+        """Cached entry for key, else compute() - run once however many threads ask at the same time
+
+        Failures are not cached: every waiter gets the exception and the next call retries.
+        If the computing caller is interrupted instead, a waiter takes the computation over.
+        """
+        if not self.enabled:
+            return compute()
+        while True:
+            entry, inflight, future = self._claim(key)
+            if entry is not None:
+                return entry
+            if inflight is not None:
+                try:
+                    return inflight.result()
+                except ComputationAbandoned:
+                    continue
+            try:
+                entry = compute()
+            except Exception as e:
+                self._finish(key, future, error=e)
+                raise
+            except BaseException:
+                self._finish(key, future, error=ComputationAbandoned())
+                raise
+            return self._finish(key, future, entry)
+
+    async def get_or_compute_async(self, key: Hashable,
+                                   compute: Callable[[], Awaitable[CachedPrediction]]) -> CachedPrediction:
+        """get_or_compute for coroutines - waiters await the in-flight computation instead of blocking the loop
+
+        A cancelled caller (client disconnect) never hands its CancelledError to the other waiters:
+        the slot is released and one of them recomputes. Cancelling a waiter leaves the shared
+        computation alone.
+        """
+        if not self.enabled:
+            return await compute()
+        while True:
+            entry, inflight, future = self._claim(key)
+            if entry is not None:
+                return entry
+            if inflight is not None:
+                try:
+                    return await asyncio.shield(asyncio.wrap_future(inflight))
+                except ComputationAbandoned:
+                    continue
+            try:
+                entry = await compute()
+            except Exception as e:
+                self._finish(key, future, error=e)
+                raise
+            except BaseException:
+                self._finish(key, future, error=ComputationAbandoned())
+                raise
+            return self._finish(key, future, entry)
+
+    def _claim(self, key: Hashable) -> Tuple[Optional[CachedPrediction], Optional[Future], Optional[Future]]:
+        """(cached entry, someone else's in-flight future, our own future to resolve) - exactly one is set"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.counters['hits'] += 1
+                return entry, None, None
+            inflight = self._inflight.get(key)
+            if inflight is not None:
+                self.counters['coalesced'] += 1
+                return None, inflight, None
+            future = self._inflight[key] = Future()
+            self.counters['misses'] += 1
+            return None, None, future
+
+    def _finish(self, key: Hashable, future: Future, entry: Optional[CachedPrediction] = None,
+                error: Optional[Exception] = None) -> Optional[CachedPrediction]:
+        """Store a computed entry and release the waiters (with the entry, or with the error)"""
+        if error is None:
+            entry.size = entry.size or _payload_bytes(entry.response)
+            self._store(key, entry)
+        with self._lock:
+            del self._inflight[key]
+        if error is None:
+            future.set_result(entry)
+        else:
+            future.set_exception(error)
+        return entry
+
+    def _store(self, key: Hashable, entry: CachedPrediction):
+        if entry.size > self.max_bytes:
+            logger.debug("📦 Prediction for %s too large to cache (%s bytes)", key, entry.size)
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.size -= previous.size
+            self._entries[key] = entry
+            self.size += entry.size
+            while self.size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= evicted.size
+                self.counters['evictions'] += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self.counters)
+            stats['entries'] = len(self._entries)
+            stats['bytes'] = self.size
+        lookups = stats['hits'] + stats['misses'] + stats['coalesced']
+        stats['hit_rate'] = (stats['hits'] + stats['coalesced']) / lookups if lookups else 0.0
+        return stats
+
+
+def _payload_bytes(response: Dict[str, Any]) -> int:
+    """Approximate memory held by a payload - its JSON length (the prediction object is small next to it)"""
+    try:
+        return len(json.dumps(response, default=str))
+    except (TypeError, ValueError):
+        return 0
+
+
+# Singleton instance (shared by every request thread in the process)
+_prediction_cache = None
+_prediction_cache_lock = threading.Lock()
+
+def get_prediction_cache() -> PredictionCache:
+    """Get or create the process-wide prediction cache (sized from CFB_PREDICTION_CACHE_MB)"""
+    global _prediction_cache
+    with _prediction_cache_lock:
+        if _prediction_cache is None:
+            max_mb = float(os.environ.get('CFB_PREDICTION_CACHE_MB', DEFAULT_MAX_MB))
+            _prediction_cache = PredictionCache(max_bytes=int(max_mb * 1024 * 1024))
+    return _prediction_cache
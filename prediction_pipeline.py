@@ -0,0 +1,236 @@
+"""
+Prediction Pipeline - fixed-width game features and vectorized scoring
+
+LightningPredictor._calculate_prediction used to interleave feature extraction,
+per-game dynamic weighting and the final combination in one long method, so
+every game went through the same Python branches one at a time. Prediction is
+now two stages:
+
+    1. LightningPredictor._extract_game_features turns one matchup's GraphQL
+       data into a GameFeatures row of FEATURE_NAMES floats
+    2. score_features scores an (n_games, N_FEATURES) matrix in one pass -
+       dynamic weights, the weighted composite, adjustments, the logistic,
+       Platt calibration, spread, total and confidence are array operations
+
+A single /predict scores a one-row matrix; batch slates and backtests stack
+thousands of rows and score them in one call.
+"""
+from dataclasses import dataclass, field
+from typing import Dict, Mapping, Sequence
+
+import numpy as np
+
+FEATURE_NAMES = (
+    # Opponent-adjusted component inputs: advanced metrics, Dixon-Coles form (x10), SoS
+    'advanced_metrics_diff', 'temporal_diff', 'sos_diff',
+    # Other component scores, combined with the per-game dynamic weights
+    'market_consensus', 'composite_ratings', 'player_impact', 'contextual',
+    # Dynamic weight inputs
+    'home_elo', 'away_elo', 'fpi_gap', 'sp_gap', 'srs_gap', 'home_sos_rank', 'away_sos_rank',
+    # Point adjustments
+    'home_field', 'conference_bonus', 'weather_penalty',
+    # Comprehensive enhancement differentials (home - away)
+    'epa_diff', 'success_diff', 'explosiveness_diff', 'elo_diff', 'consistency_diff',
+    'recent_vs_early_diff', 'trend_diff', 'defensive_advantage', 'enhancement_factor',
+    # Situational modifiers: differential * rivalry_scale * prime_time_scale + conference_stakes
+    'rivalry_scale', 'prime_time_scale', 'conference_stakes',
+    # Total and confidence inputs
+    'base_total', 'defensive_dampener', 'data_confidence', 'trend_confidence'
+)
+FEATURE_INDEX = {name: i for i, name in enumerate(FEATURE_NAMES)}
+N_FEATURES = len(FEATURE_NAMES)
+
+# Weight columns (BASE_WEIGHTS order) and ELO mismatch tiers, most lopsided first
+WEIGHT_KEYS = ('composite_ratings', 'opponent_adjusted_metrics', 'defensive_metrics',
+               'key_player_impact', 'market_consensus', 'contextual_factors')
+WEIGHT_TIERS = ('extreme_mismatch', 'large_mismatch', 'moderate_mismatch', 'balanced_game', 'even_matchup')
+
+LOGISTIC_SCALE = 12.0       # Adjusted differential -> win probability
+SPREAD_FACTOR = 11.0        # Calibrated log-odds -> spread
+EXTREME_SPREAD_FACTOR = 14.0  # ... outside 1%-99%
+MAX_SPREAD = 35.0
+PROBABILITY_EPSILON = 1e-10
+
+
+@dataclass
+class ScoringParams:
+    """Array form of the model parameters score_features applies"""
+    elo_thresholds: np.ndarray  # (len(WEIGHT_TIERS) - 1,) lower ELO-gap bound per tier
+    tier_weights: np.ndarray    # (len(WEIGHT_TIERS), len(WEIGHT_KEYS))
+    platt_a: float = 1.0
+    platt_b: float = 0.0
+
+    @classmethod
+    def from_tables(cls, elo_thresholds: Mapping[str, float], tier_weights: Mapping[str, Mapping[str, float]],
+                    platt_a: float = 1.0, platt_b: float = 0.0) -> 'ScoringParams':
+        """Build from the predictor's ELO_THRESHOLDS / TIER_WEIGHTS dicts"""
+        return cls(
+            elo_thresholds=np.array([elo_thresholds[tier] for tier in WEIGHT_TIERS[:-1]], dtype=float),
+            tier_weights=np.array([[tier_weights[tier][key] for key in WEIGHT_KEYS] for tier in WEIGHT_TIERS],
+                                  dtype=float),
+            platt_a=platt_a,
+            platt_b=platt_b
+        )
+
+
+@dataclass
+class GameFeatures:
+    """One matchup's feature row plus the context needed to assemble its GamePrediction"""
+    home_team_id: int
+    away_team_id: int
+    values: np.ndarray  # (N_FEATURES,) in FEATURE_NAMES order
+    context: Dict = field(default_factory=dict)
+
+    def __getitem__(self, name: str) -> float:
+        return float(self.values[FEATURE_INDEX[name]])
+
+
+def feature_vector(features: Mapping[str, float]) -> np.ndarray:
+    """FEATURE_NAMES-ordered row from a name -> value mapping (every feature required)"""
+    return np.array([features[name] for name in FEATURE_NAMES], dtype=float)
+
+
+def feature_matrix(games: Sequence[GameFeatures]) -> np.ndarray:
+    """(n_games, N_FEATURES) matrix for score_features"""
+    if not games:
+        return np.empty((0, N_FEATURES))
+    return np.vstack([game.values for game in games])
+
+
+def column(X: np.ndarray, name: str) -> np.ndarray:
+    return X[:, FEATURE_INDEX[name]]
+
+
+def dynamic_weights(X: np.ndarray, params: ScoringParams) -> Dict[str, np.ndarray]:
+    """Per-game component weights from ELO mismatch tier, rating consensus and schedule strength"""
+    elo_gap = np.abs(column(X, 'home_elo') - column(X, 'away_elo'))
+
+    # STEP 1: Tier by ELO mismatch severity
+    tier = np.select([elo_gap >= threshold for threshold in params.elo_thresholds],
+                     np.arange(len(params.elo_thresholds)), default=len(params.elo_thresholds))
+    weights = params.tier_weights[tier].copy()
+    composite = WEIGHT_KEYS.index('composite_ratings')
+    opponent_adjusted = WEIGHT_KEYS.index('opponent_adjusted_metrics')
+
+    # STEP 2: Rating consensus - ELO (normalized to point scale), FPI, SP+ and SRS gaps agree
+    gaps = np.stack([elo_gap / 35, column(X, 'fpi_gap'), column(X, 'sp_gap'), column(X, 'srs_gap')], axis=1)
+    avg_gap = gaps.sum(axis=1) / 4
+    variance = ((gaps - avg_gap[:, None]) ** 2).sum(axis=1) / 4
+    consensus = 1.0 - np.minimum(variance / (avg_gap + 1), 0.3)
+    strong_consensus = consensus > 0.90
+    weights[strong_consensus, composite] *= 1.10
+    weights[strong_consensus, opponent_adjusted] *= 0.90
+
+    # STEP 3: Favorite played a tough schedule (rank < 40), underdog a weak one (> 80)
+    home_sos, away_sos = column(X, 'home_sos_rank'), column(X, 'away_sos_rank')
+    sos_adjusted = (np.minimum(home_sos, away_sos) < 40) & (np.maximum(home_sos, away_sos) > 80)
+    weights[sos_adjusted, composite] *= 1.05
+    weights[sos_adjusted, opponent_adjusted] *= 0.95
+
+    # STEP 4: Normalize to sum to 1.0
+    weights /= weights.sum(axis=1, keepdims=True)
+    return {'weights': weights, 'tier': tier, 'elo_gap': elo_gap, 'consensus': consensus,
+            'sos_adjusted': sos_adjusted}
+
+
+def temporal_performance(days_ago: np.ndarray, win_probs: np.ndarray, decay_xi) -> np.ndarray:
+    """Dixon-Coles weighted postgame win probability over the last axis (NaN pads missing games; 0.5 if none)
+
+    decay_xi may be an array shaped to broadcast against days_ago, to evaluate many decays at once.
+    """
+    played = ~np.isnan(win_probs)
+    weights = np.where(played, np.exp(-np.asarray(decay_xi) * days_ago), 0.0)
+    total_weight = weights.sum(axis=-1)
+    weighted = (weights * np.where(played, win_probs, 0.0)).sum(axis=-1)
+    return np.where(total_weight > 0, weighted / np.where(total_weight > 0, total_weight, 1.0), 0.5)
+
+
+def platt_calibrate(raw_probability: np.ndarray, platt_a: float, platt_b: float) -> np.ndarray:
+    """P(calibrated) = 1 / (1 + exp(-(A * logit(p) + B)))"""
+    p = np.clip(raw_probability, PROBABILITY_EPSILON, 1 - PROBABILITY_EPSILON)
+    return 1 / (1 + np.exp(-(platt_a * np.log(p / (1 - p)) + platt_b)))
+
+
+def score_features(X: np.ndarray, params: ScoringParams) -> Dict[str, np.ndarray]:
+    """Score an (n_games, N_FEATURES) matrix; every output is an array with one entry per game"""
+    X = np.atleast_2d(np.asarray(X, dtype=float))
+    result = dynamic_weights(X, params)
+    w = {key: result['weights'][:, i] for i, key in enumerate(WEIGHT_KEYS)}
+
+    opponent_adjusted = (
+        column(X, 'advanced_metrics_diff') * 0.70 +  # 70% advanced metrics
+        column(X, 'temporal_diff') * 0.20 +          # 20% Dixon-Coles weighted form
+        column(X, 'sos_diff') * 0.10                 # 10% strength of schedule adjustment
+    )
+    raw_differential = (
+        opponent_adjusted * w['opponent_adjusted_metrics'] +
+        column(X, 'market_consensus') * w['market_consensus'] +
+        column(X, 'composite_ratings') * w['composite_ratings'] +
+        column(X, 'player_impact') * w['key_player_impact'] +
+        column(X, 'contextual') * w['contextual_factors']
+    )
+
+    comprehensive_enhancement = (
+        column(X, 'epa_diff') * 0.12 +                  # 12% EPA differential (strong predictor)
+        column(X, 'success_diff') * 15 * 0.10 +         # 10% Success rate (key metric)
+        column(X, 'explosiveness_diff') * 10 * 0.08 +   # 8% Explosiveness (big play ability)
+        column(X, 'elo_diff') * 0.06 +                  # 6% ELO differential
+        column(X, 'consistency_diff') * 0.04 +          # 4% Consistency (reliability factor)
+        column(X, 'recent_vs_early_diff') * 0.03 +      # 3% Recent form vs early season
+        column(X, 'trend_diff') * 0.05 +                # 5% Season trajectory
+        column(X, 'defensive_advantage') * w['defensive_metrics']  # Defensive metrics (dynamic weight)
+    )
+
+    adjusted_differential = (
+        raw_differential +
+        column(X, 'home_field') +
+        column(X, 'conference_bonus') -
+        column(X, 'weather_penalty')
+    )
+    adjusted_differential = adjusted_differential + comprehensive_enhancement + column(X, 'enhancement_factor')
+    adjusted_differential = (adjusted_differential * column(X, 'rivalry_scale') * column(X, 'prime_time_scale') +
+                             column(X, 'conference_stakes'))
+
+    raw_home_win_prob = 1 / (1 + np.exp(-adjusted_differential / LOGISTIC_SCALE))
+    home_win_prob = platt_calibrate(raw_home_win_prob, params.platt_a, params.platt_b)
+
+    # Spread from the calibrated log-odds; extreme probabilities get the larger factor
+    spread_factor = np.where((home_win_prob > 0.01) & (home_win_prob < 0.99), SPREAD_FACTOR, EXTREME_SPREAD_FACTOR)
+    with np.errstate(divide='ignore'):
+        predicted_spread = np.log(home_win_prob / (1 - home_win_prob)) * spread_factor
+    predicted_spread = np.clip(predicted_spread, -MAX_SPREAD, MAX_SPREAD)
+    predicted_total = column(X, 'base_total') * column(X, 'defensive_dampener')
+
+    # Implied scores, with no team below zero points
+    home_implied_score = (predicted_total + predicted_spread) / 2
+    away_implied_score = (predicted_total - predicted_spread) / 2
+    home_shutout, away_shutout = home_implied_score < 0, (home_implied_score >= 0) & (away_implied_score < 0)
+    home_implied_score = np.where(home_shutout, 0.0, np.where(away_shutout, predicted_total, home_implied_score))
+    away_implied_score = np.where(home_shutout, predicted_total, np.where(away_shutout, 0.0, away_implied_score))
+
+    differential_boost = np.minimum(np.abs(adjusted_differential) / 20, 0.15)
+    confidence = np.minimum(column(X, 'data_confidence') + differential_boost + column(X, 'trend_confidence'), 0.95)
+
+    result.update({
+        'opponent_adjusted': opponent_adjusted,
+        'raw_differential': raw_differential,
+        'comprehensive_enhancement': comprehensive_enhancement,
+        'adjusted_differential': adjusted_differential,
+        'raw_home_win_prob': raw_home_win_prob,
+        'home_win_prob': home_win_prob,
+        'predicted_spread': predicted_spread,
+        'predicted_total': predicted_total,
+        'home_implied_score': home_implied_score,
+        'away_implied_score': away_implied_score,
+        'differential_boost': differential_boost,
+        'confidence': confidence
+    })
+    return result
+
+
+def score_row(scores: Dict[str, np.ndarray], index: int) -> Dict:
+    """One game's scores as Python values (weights as a WEIGHT_KEYS dict, tier as its name)"""
+    row = {key: values[index].item() for key, values in scores.items() if key != 'weights'}
+    row['weights'] = {key: float(value) for key, value in zip(WEIGHT_KEYS, scores['weights'][index])}
+    row['tier'] = WEIGHT_TIERS[row['tier']]
+    return row
@@ -0,0 +1,257 @@
+"""
+Props Data Loader - shared, TTL-cached CFBD REST payloads for the player props engine
+
+RealDataPlayerPropsEngine is built fresh for every /api/player-props request,
+and each QB/WR/RB prop re-downloaded the team's whole games, games/players and
+stats/player/season payloads (plus ratings/sp for the opponent), sleeping
+0.1s after every call - ~40 blocking requests for a 10-prop matchup.
+
+Payloads are now keyed on (endpoint, params). Every player on a team reads the
+same team payload, concurrent requests (both teams of a matchup run in
+parallel under ASGI) share one in-flight download, and results stay cached
+across requests until their endpoint's TTL runs out. A matchup costs one call
+per (team, endpoint) plus one ratings/sp call.
+
+The async path (fetch_async) downloads on a pooled aiohttp session and shares
+the same cache and in-flight downloads. Both paths draw from one token bucket
+(CFB_PROPS_RATE_PER_SEC, bursts of CFB_PROPS_RATE_BURST) instead of sleeping
+a fixed 0.1s after every call, so a matchup's handful of payloads go out at
+once.
+
+Cached payloads are shared between callers - treat them as read-only.
+"""
+import asyncio
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Dict, Optional, Tuple
+
+import aiohttp
+import requests
+
+from log_config import get_logger
+
+logger = get_logger('props_data_loader')
+
+# Endpoint -> TTL in seconds (per-game stats only change after games finish)
+ENDPOINT_TTLS = {
+    'games': 3600,
+    'games/teams': 3600,
+    'games/players': 3600,
+    'stats/player/season': 3600,
+    'ratings/sp': 6 * 3600,
+}
+DEFAULT_TTL = 15 * 60
+
+# Upstream call budget (the CFBD rate limit) - cache hits don't spend tokens
+RATE_PER_SECOND = 10.0
+RATE_BURST = 10
+
+
+class TokenBucket:
+    """Thread-safe token bucket; reserve() books a token and says how long to wait for it"""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token (possibly going into debt); seconds until it is actually available"""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            return max(0.0, -self.tokens / self.rate)
+
+    def acquire(self):
+        delay = self.reserve()
+        if delay:
+            time.sleep(delay)
+
+    async def acquire_async(self):
+        delay = self.reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
+
+class DownloadAbandoned(Exception):
+    """The caller downloading a payload was cancelled - waiters retry instead of getting None"""
+
+
+class PropsDataLoader:
+    """Memory LRU of CFBD REST responses with per-endpoint TTLs and single-flight downloads"""
+
+    def __init__(self, base_url: str, headers: Dict[str, str], max_entries: int = 256,
+                 rate_limiter: Optional[TokenBucket] = None):
+        self.base_url = base_url
+        self.headers = headers
+        self.max_entries = max_entries
+        self.rate_limiter = rate_limiter or TokenBucket(RATE_PER_SECOND, RATE_BURST)
+        self.session = requests.Session()
+        self._entries: 'OrderedDict[Tuple, Dict]' = OrderedDict()
+        self._inflight: Dict[Tuple, Future] = {}
+        self._lock = threading.Lock()
+        self.counters = {
+            'hits': 0,
+            'coalesced': 0,
+            'requests': 0,
+            'errors': 0,
+            'expired': 0
+        }
+
+    @staticmethod
+    def make_key(endpoint: str, params: Optional[Dict]) -> Tuple:
+        return endpoint, tuple(sorted((params or {}).items()))
+
+    def fetch(self, endpoint: str, params: Optional[Dict] = None) -> Any:
+        """Parsed JSON for endpoint+params, downloading it at most once per TTL; None on API errors
+
+        Errors are not cached - the next call retries.
+        """
+        while True:
+            key, data, inflight, future = self._claim(endpoint, params)
+            if future is not None:
+                break
+            if inflight is None:
+                return data
+            try:
+                return inflight.result()
+            except DownloadAbandoned:
+                continue
+        try:
+            data = self._download(endpoint, params)
+        except Exception:
+            self._finish(key, endpoint, future, None)
+            raise
+        except BaseException:
+            self._finish(key, endpoint, future, None, abandoned=True)
+            raise
+        self._finish(key, endpoint, future, data)
+        return data
+
+    async def fetch_async(self, endpoint: str, params: Optional[Dict] = None,
+                          session: Optional[aiohttp.ClientSession] = None) -> Any:
+        """fetch() on aiohttp - `session` is the caller's pooled session (a one-off session otherwise)
+
+        Waiters are shielded: a cancelled waiter leaves the shared download alone, and a cancelled
+        downloader hands the download over to a waiter instead of giving everyone None.
+        """
+        while True:
+            key, data, inflight, future = self._claim(endpoint, params)
+            if future is not None:
+                break
+            if inflight is None:
+                return data
+            try:
+                return await asyncio.shield(asyncio.wrap_future(inflight))
+            except DownloadAbandoned:
+                continue
+        try:
+            if session is None:
+                async with aiohttp.ClientSession() as own_session:
+                    data = await self._download_async(own_session, endpoint, params)
+            else:
+                data = await self._download_async(session, endpoint, params)
+        except Exception:
+            self._finish(key, endpoint, future, None)
+            raise
+        except BaseException:
+            self._finish(key, endpoint, future, None, abandoned=True)
+            raise
+        self._finish(key, endpoint, future, data)
+        return data
+
+    def _claim(self, endpoint: str, params: Optional[Dict]) -> Tuple[Tuple, Any, Optional[Future], Optional[Future]]:
+        """(key, cached data, someone else's in-flight download, our own future) - future set means download"""
+        key = self.make_key(endpoint, params)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry['expires_at'] > time.time():
+                    self._entries.move_to_end(key)
+                    self.counters['hits'] += 1
+                    return key, entry['data'], None, None
+                del self._entries[key]
+                self.counters['expired'] += 1
+            inflight = self._inflight.get(key)
+            if inflight is not None:
+                self.counters['coalesced'] += 1
+                return key, None, inflight, None
+            future = self._inflight[key] = Future()
+            self.counters['requests'] += 1
+            return key, None, None, future
+
+    def _finish(self, key: Tuple, endpoint: str, future: Future, data: Any, abandoned: bool = False):
+        with self._lock:
+            if data is not None:
+                self._remember(key, data, ENDPOINT_TTLS.get(endpoint, DEFAULT_TTL))
+            del self._inflight[key]
+        if abandoned:
+            future.set_exception(DownloadAbandoned())
+        else:
+            future.set_result(data)
+
+    def _download(self, endpoint: str, params: Optional[Dict]) -> Any:
+        self.rate_limiter.acquire()
+        try:
+            response = self.session.get(f"{self.base_url}/{endpoint}", headers=self.headers, params=params)
+            response.raise_for_status()
+            return response.json()
+        except (requests.exceptions.RequestException, ValueError) as e:
+            return self._download_failed(e)
+
+    async def _download_async(self, session: aiohttp.ClientSession, endpoint: str, params: Optional[Dict]) -> Any:
+        await self.rate_limiter.acquire_async()
+        try:
+            async with session.get(f"{self.base_url}/{endpoint}", headers=self.headers,
+                                   params={name: str(value) for name, value in (params or {}).items()}) as response:
+                response.raise_for_status()
+                return await response.json(content_type=None)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            return self._download_failed(e)
+
+    def _download_failed(self, error: Exception) -> None:
+        with self._lock:
+            self.counters['errors'] += 1
+        logger.error("❌ API Error: %s", error)
+        return None
+
+    def _remember(self, key: Tuple, data: Any, ttl: int):
+        self._entries[key] = {'expires_at': time.time() + ttl, 'data': data}
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self.counters)
+            stats['entries'] = len(self._entries)
+        return stats
+
+
+# Singleton instance (shared by every props engine in the process)
+_props_data_loader = None
+_props_data_loader_lock = threading.Lock()
+
+def get_props_data_loader(base_url: str, headers: Dict[str, str]) -> PropsDataLoader:
+    """Get or create the process-wide props data loader (configured from the environment)"""
+    global _props_data_loader
+    with _props_data_loader_lock:
+        if _props_data_loader is None:
+            _props_data_loader = PropsDataLoader(
+                base_url, headers,
+                max_entries=int(os.environ.get('CFB_PROPS_CACHE_SIZE', 256)),
+                rate_limiter=TokenBucket(float(os.environ.get('CFB_PROPS_RATE_PER_SEC', RATE_PER_SECOND)),
+                                         int(os.environ.get('CFB_PROPS_RATE_BURST', RATE_BURST)))
+            )
+    return _props_data_loader
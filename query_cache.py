@@ -0,0 +1,238 @@
+"""
+Query Cache - TTL + week-aware cache for GraphQL query results
+
+Sits under LightningPredictor._execute_query. Responses are keyed on
+(endpoint, normalized query, variables) and expire according to the root
+fields the query selects: calendar, polls, talent and team info live until the
+week rolls over, lines only for a few minutes. A query lives only as long as its
+shortest-lived field, so week-scoped fields keep that lifetime only in queries
+that select nothing timed - the team fragment's talent and team info are
+refetched with its game rows, while the predictor's polls and calendar get a
+query of their own. A bounded in-memory LRU tier is
+always on; an on-disk tier (CFB_QUERY_CACHE_DIR) lets repeated script runs and
+worker restarts reuse results too.
+"""
+import copy
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+from log_config import get_logger
+
+logger = get_logger('query_cache')
+
+# Sentinel TTL: valid until the predictor's current week changes
+UNTIL_WEEK_ROLLOVER = -1
+
+# Hard cap for week-scoped entries, in case the week is never advanced
+MAX_WEEK_TTL = 7 * 24 * 3600
+
+# Root GraphQL field -> TTL in seconds (or UNTIL_WEEK_ROLLOVER)
+FIELD_TTLS = {
+    'calendar': UNTIL_WEEK_ROLLOVER,
+    'pollRank': UNTIL_WEEK_ROLLOVER,
+    'teamTalent': UNTIL_WEEK_ROLLOVER,
+    'currentTeams': UNTIL_WEEK_ROLLOVER,
+    'adjustedTeamMetrics': 6 * 3600,
+    'adjustedPlayerMetrics': 6 * 3600,
+    'ratings': 6 * 3600,
+    'game': 3600,              # scores/win probs change on game days
+    'gameWeather': 30 * 60,
+    'gameLines': 5 * 60,       # lines move
+}
+DEFAULT_TTL = 15 * 60
+
+
+def _strip_comments(query: str) -> str:
+    return re.sub(r'#[^\n]*', '', query)
+
+
+@lru_cache(maxsize=256)
+def normalize_query(query: str) -> str:
+    """Drop comments and collapse whitespace so formatting changes don't split the cache"""
+    return ' '.join(_strip_comments(query).split())
+
+
+@lru_cache(maxsize=256)
+def root_fields(query: str) -> Tuple[str, ...]:
+    """Return the top-level field names (not aliases) selected by a query"""
+    # Keep only text at selection depth 1, outside argument lists
+    depth, parens, top_level = 0, 0, []
+    for char in normalize_query(query):
+        if char == '(':
+            parens += 1
+        elif char == ')':
+            parens -= 1
+        elif parens:
+            continue
+        elif char == '{':
+            depth += 1
+            top_level.append(' ')
+        elif char == '}':
+            depth -= 1
+            top_level.append(' ')
+        elif depth == 1:
+            top_level.append(char)
+
+    text = re.sub(r'\s*:\s*', ':', ''.join(top_level))
+    fields = []
+    for token in text.split():
+        # "alias:field" or bare "field"
+        fields.append(token.split(':')[-1])
+    return tuple(fields)
+
+
+def ttl_for_query(query: str) -> int:
+    """Shortest TTL among the query's root fields (week-scoped only if every field is)"""
+    ttls = [FIELD_TTLS.get(field, DEFAULT_TTL) for field in root_fields(query)] or [DEFAULT_TTL]
+    timed = [ttl for ttl in ttls if ttl != UNTIL_WEEK_ROLLOVER]
+    return min(timed) if timed else UNTIL_WEEK_ROLLOVER
+
+
+class QueryCache:
+    """Two-tier (memory LRU + optional disk) cache for GraphQL responses"""
+
+    def __init__(self, max_entries: int = 512, disk_dir: Optional[str] = None):
+        self.max_entries = max_entries
+        self.disk_dir = disk_dir
+        self.week: Optional[int] = None
+        self._entries: 'OrderedDict[str, Dict]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.counters = {
+            'memory_hits': 0,
+            'disk_hits': 0,
+            'misses': 0,
+            'stores': 0,
+            'evictions': 0,
+            'expired': 0
+        }
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+
+    def set_week(self, week: int):
+        """Advance the cache's notion of the current week; drops week-scoped entries on rollover"""
+        with self._lock:
+            if self.week is not None and week != self.week:
+                stale = [key for key, entry in self._entries.items() if entry['week'] is not None]
+                for key in stale:
+                    del self._entries[key]
+                logger.info("🔄 Query cache week rollover %s -> %s: dropped %s entries", self.week, week, len(stale))
+            self.week = week
+
+    @staticmethod
+    def make_key(endpoint: str, query: str, variables: Optional[Dict]) -> str:
+        raw = json.dumps([endpoint, normalize_query(query), variables or {}], sort_keys=True, default=str)
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def _is_fresh(self, entry: Dict, now: float) -> bool:
+        if entry['expires_at'] <= now:
+            return False
+        return entry['week'] is None or entry['week'] == self.week
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Return a private copy of a cached response, or None on miss"""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if self._is_fresh(entry, now):
+                    self._entries.move_to_end(key)
+                    self.counters['memory_hits'] += 1
+                    return copy.deepcopy(entry['response'])
+                del self._entries[key]
+                self.counters['expired'] += 1
+
+        entry = self._read_disk(key)
+        if entry is not None and self._is_fresh(entry, now):
+            with self._lock:
+                self._remember(key, entry)
+                self.counters['disk_hits'] += 1
+            return copy.deepcopy(entry['response'])
+
+        with self._lock:
+            self.counters['misses'] += 1
+        return None
+
+    def set(self, key: str, query: str, response: Dict):
+        """Store a successful response with the TTL implied by its root fields"""
+        ttl = ttl_for_query(query)
+        now = time.time()
+        entry = {
+            'expires_at': now + (MAX_WEEK_TTL if ttl == UNTIL_WEEK_ROLLOVER else ttl),
+            'week': self.week if ttl == UNTIL_WEEK_ROLLOVER else None,
+            'response': copy.deepcopy(response)
+        }
+        with self._lock:
+            self._remember(key, entry)
+            self.counters['stores'] += 1
+        self._write_disk(key, entry)
+
+    def _remember(self, key: str, entry: Dict):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.counters['evictions'] += 1
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.disk_dir, f"{key}.json")
+
+    def _read_disk(self, key: str) -> Optional[Dict]:
+        if not self.disk_dir:
+            return None
+        try:
+            with open(self._disk_path(key), 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_disk(self, key: str, entry: Dict):
+        if not self.disk_dir:
+            return
+        # Write-then-rename so concurrent readers never see a partial file
+        tmp_path = f"{self._disk_path(key)}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, self._disk_path(key))
+        except (OSError, TypeError) as e:
+            logger.warning("⚠️ Query cache disk write failed: %s", e)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self.counters)
+            stats['entries'] = len(self._entries)
+        lookups = stats['memory_hits'] + stats['disk_hits'] + stats['misses']
+        stats['hit_rate'] = (stats['memory_hits'] + stats['disk_hits']) / lookups if lookups else 0.0
+        return stats
+
+    def summary(self) -> str:
+        stats = self.stats()
+        return (f"📦 Query cache: {stats['memory_hits']} memory hits, {stats['disk_hits']} disk hits, "
+                f"{stats['misses']} misses ({stats['hit_rate']:.0%} hit rate), {stats['entries']} entries")
+
+
+# Singleton instance (shared by every predictor in the process)
+_query_cache = None
+_query_cache_lock = threading.Lock()
+
+def get_query_cache() -> QueryCache:
+    """Get or create the process-wide query cache (configured from the environment)"""
+    global _query_cache
+    with _query_cache_lock:
+        if _query_cache is None:
+            _query_cache = QueryCache(
+                max_entries=int(os.environ.get('CFB_QUERY_CACHE_SIZE', 512)),
+                disk_dir=os.environ.get('CFB_QUERY_CACHE_DIR') or None
+            )
+    return _query_cache
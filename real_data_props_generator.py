@@ -4,13 +4,21 @@ Fixed Enhanced Player Props Generator with Real API Data
 Uses the correct API structure to get real statistical data
 """
 
+import asyncio
 import json
-import requests
 import time
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, asdict
 from datetime import datetime
 
+import aiohttp
+
+from game_log_store import STAT_COLUMNS, get_game_log_store
+from props_data_loader import get_props_data_loader
+
+# Per-team REST payloads generate_enhanced_props reads (plus the season-wide ratings/sp)
+TEAM_ENDPOINTS = ('games', 'games/teams', 'games/players', 'stats/player/season')
+
 @dataclass
 class GameLog:
     week: int
@@ -70,6 +78,8 @@ class RealDataPlayerPropsEngine:
         }
         self.year = 2025
         self.current_week = 14
+        # Process-wide: team payloads are shared by every player and reused across requests
+        self.data_loader = get_props_data_loader(self.base_url, self.headers)
         self.players_database = self._load_players_database()
         self.teams_database = self._load_teams_database()
 
@@ -95,27 +105,39 @@ class RealDataPlayerPropsEngine:
             return {}
 
     def _make_request(self, endpoint: str, params: Dict = None) -> Any:
-        """Make API request with error handling"""
-        url = f"{self.base_url}/{endpoint}"
-        try:
-            response = requests.get(url, headers=self.headers, params=params)
-            response.raise_for_status()
-            time.sleep(0.1)  # Rate limiting
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"❌ API Error: {e}")
-            return None
+        """Make API request through the shared TTL cache (None on API errors)"""
+        return self.data_loader.fetch(endpoint, params)
+
+    def _team_season_params(self, team: str) -> Dict:
+        return {
+            'year': self.year,
+            'team': team,
+            'seasonType': 'regular'
+        }
+
+    def _team_season_request(self, endpoint: str, team: str) -> Any:
+        """A team's regular-season payload for `endpoint` - one cache entry per (team, endpoint)"""
+        return self._make_request(endpoint, self._team_season_params(team))
+
+    async def prefetch_team_data(self, team: str, session: Optional[aiohttp.ClientSession] = None):
+        """Download every payload generate_enhanced_props reads for `team` concurrently (warms the shared cache)
+
+        games/players is skipped when the game log store already covers the team.
+        """
+        store = get_game_log_store()
+        stored = store is not None and store.year == self.year and store.has_team(team)
+        await asyncio.gather(
+            *[self.data_loader.fetch_async(endpoint, self._team_season_params(team), session)
+              for endpoint in TEAM_ENDPOINTS if not (stored and endpoint == 'games/players')],
+            self.data_loader.fetch_async("ratings/sp", {'year': self.year}, session)
+        )
 
     def get_player_season_stats(self, player_name: str, team: str) -> Dict[str, float]:
         """Get aggregated season stats for a player"""
         print(f"📊 Fetching season stats for {player_name} ({team})...")
         
         # Get all player stats for the team
-        player_stats = self._make_request("stats/player/season", {
-            'year': self.year,
-            'team': team,
-            'seasonType': 'regular'
-        })
+        player_stats = self._team_season_request("stats/player/season", team)
         
         if not player_stats:
             return {}
@@ -163,21 +185,13 @@ class RealDataPlayerPropsEngine:
         print(f"🏈 Fetching game logs for {team}...")
         
         # Get actual game schedule first
-        schedule_data = self._make_request("games", {
-            'year': self.year,
-            'team': team,
-            'seasonType': 'regular'
-        })
+        schedule_data = self._team_season_request("games", team)
         
         if not schedule_data:
             return []
         
         # Get team stats per game
-        game_data = self._make_request("games/teams", {
-            'year': self.year,
-            'team': team,
-            'seasonType': 'regular'
-        })
+        game_data = self._team_season_request("games/teams", team)
         
         if not game_data:
             return []
@@ -271,27 +285,64 @@ class RealDataPlayerPropsEngine:
         self._defense_rankings_cache = rankings
         return rankings
     
+    def _opponent_branding(self, opponent_id) -> Tuple[Optional[str], Optional[str]]:
+        """(logo, primary color) for an opponent, falling back to the ESPN logo CDN"""
+        opponent_logo = None
+        opponent_color = None
+        if opponent_id and opponent_id in self.teams_database:
+            team_info = self.teams_database[opponent_id]
+            opponent_logo = team_info.get('logos', [None])[0]
+            opponent_color = team_info.get('primary_color', '#1a1f26')
+        
+        if not opponent_logo and opponent_id:
+            opponent_logo = f"http://a.espncdn.com/i/teamlogos/ncaa/500/{opponent_id}.png"
+        return opponent_logo, opponent_color
+
+    def _stored_game_logs(self, player_name: str, team: str, stat_type: str) -> Optional[List[GameLog]]:
+        """The player's game logs from the nightly game log store (None when it doesn't cover them)"""
+        store = get_game_log_store()
+        if store is None or store.year != self.year or stat_type not in STAT_COLUMNS:
+            return None
+        logs = store.player_logs(player_name, team)
+        if logs is None:
+            return None
+        
+        defense_rankings = self.get_all_defense_rankings()
+        game_logs = []
+        for week, opponent, opponent_id, home, win, value in zip(
+                logs['week'].tolist(), store.opponent_names(logs), logs['opponent_id'].tolist(),
+                logs['home'].tolist(), logs['win'].tolist(), logs[stat_type].tolist()):
+            opponent_id = opponent_id if opponent_id != -1 else None
+            opponent_logo, opponent_color = self._opponent_branding(opponent_id)
+            game_logs.append(GameLog(
+                week=week,
+                opponent=opponent,
+                home_away='home' if home else 'away',
+                result='W' if win else 'L',
+                stats={stat_type: value},
+                defense_rank=defense_rankings.get(opponent),
+                opponent_logo=opponent_logo,
+                opponent_color=opponent_color
+            ))
+        return game_logs
+
     def get_real_player_game_logs(self, player_name: str, team: str, stat_type: str) -> List[GameLog]:
-        """Get REAL per-game player stats from the /games/players API endpoint"""
+        """Get REAL per-game player stats - the local game log store, else the /games/players API endpoint"""
+        game_logs = self._stored_game_logs(player_name, team, stat_type)
+        if game_logs is not None:
+            return game_logs
+        
         print(f"📊 Fetching REAL game-by-game stats for {player_name}...")
         
         # Get player stats from games/players endpoint
-        player_game_data = self._make_request("games/players", {
-            'year': self.year,
-            'team': team,
-            'seasonType': 'regular'
-        })
+        player_game_data = self._team_season_request("games/players", team)
         
         if not player_game_data:
             print(f"⚠️ No game data found for {team}")
             return []
         
         # Get schedule for week/opponent info
-        schedule_data = self._make_request("games", {
-            'year': self.year,
-            'team': team,
-            'seasonType': 'regular'
-        })
+        schedule_data = self._team_season_request("games", team)
         
         if not schedule_data:
             print(f"⚠️ No schedule data found for {team}")
@@ -335,15 +386,7 @@ class RealDataPlayerPropsEngine:
             result = 'W' if our_points > opp_points else 'L'
             
             # Get opponent logo and color
-            opponent_logo = None
-            opponent_color = None
-            if opponent_id and opponent_id in self.teams_database:
-                team_info = self.teams_database[opponent_id]
-                opponent_logo = team_info.get('logos', [None])[0]
-                opponent_color = team_info.get('primary_color', '#1a1f26')
-            
-            if not opponent_logo and opponent_id:
-                opponent_logo = f"http://a.espncdn.com/i/teamlogos/ncaa/500/{opponent_id}.png"
+            opponent_logo, opponent_color = self._opponent_branding(opponent_id)
             
             # Get defense rank
             defense_rank = defense_rankings.get(opponent)
@@ -650,6 +693,28 @@ class RealDataPlayerPropsEngine:
         
         return props
 
+    async def generate_enhanced_props_async(self, team: str, opponent_team: str,
+                                            session: Optional[aiohttp.ClientSession] = None
+                                            ) -> List[EnhancedPlayerProp]:
+        """generate_enhanced_props with the team's REST payloads fetched concurrently up front
+
+        Every per-player lookup then reads the warm cache; the CPU-bound prop building
+        runs in a worker thread so the event loop keeps serving.
+        """
+        if team in self.players_database:
+            await self.prefetch_team_data(team, session)
+        return await asyncio.to_thread(self.generate_enhanced_props, team, opponent_team)
+
+    async def generate_matchup_props_async(self, team1: str, team2: str,
+                                           session: Optional[aiohttp.ClientSession] = None
+                                           ) -> Tuple[List[EnhancedPlayerProp], List[EnhancedPlayerProp]]:
+        """Props for both sides of a matchup, generated concurrently -> (team1 props, team2 props)"""
+        team1_props, team2_props = await asyncio.gather(
+            self.generate_enhanced_props_async(team1, team2, session),
+            self.generate_enhanced_props_async(team2, team1, session)
+        )
+        return team1_props, team2_props
+
     def _generate_real_qb_props(self, qb_data: Dict, team: str, team_games: List[Dict], 
                                defensive_matchup: DefensiveMatchup) -> List[EnhancedPlayerProp]:
         """Generate QB props with real season statistics"""
@@ -247,3 +247,14 @@ def get_rivalry_info(team1: str, team2: str) -> dict:
             return rivalry_info
     
     return None
+
+def rivalry_pair(team1: str, team2: str) -> tuple:
+    """The RIVALRY_GAMES key (config spelling) for two teams, or None"""
+    team1_clean = team1.strip()
+    team2_clean = team2.strip()
+    if (team1_clean, team2_clean) in RIVALRY_GAMES:
+        return (team1_clean, team2_clean)
+    for t1, t2 in RIVALRY_GAMES:
+        if t1.lower() == team1_clean.lower() and t2.lower() == team2_clean.lower():
+            return (t1, t2)
+    return None
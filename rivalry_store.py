@@ -0,0 +1,308 @@
+"""
+Rivalry Store - precomputed rivalry history for /predict
+
+For rivalry games /predict used to build a BatchRivalryAnalyzer, call the REST
+all-time record endpoint, fetch every meeting since 1869 over GraphQL and then
+POST one AP poll query per distinct (season, week) - dozens of serial calls
+before the prediction even started. The store holds every RIVALRY_GAMES pair's
+meetings, the AP ranks of both teams in those weeks and the all-time record in
+data/rivalry_history.json, and requests read it from memory: the history block
+for a matchup is computed once per store version.
+
+`python rivalry_store.py` refreshes it incrementally (run weekly): only the
+latest stored season onward is re-fetched, ranks come from one batched query
+per rivalry, and existing meetings are kept. A pair missing from the store, or
+not refreshed for REFRESH_AFTER, is updated on a background thread while the
+request goes on without it (a refresh that finds nothing backs off for
+RETRY_AFTER). CFB_RIVALRY_STORE points elsewhere, 'none'
+disables it.
+"""
+import argparse
+import json
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from batch_rivalry_analyzer import BatchRivalryAnalyzer
+from log_config import get_logger
+from rivalry_config import rivalry_pair
+
+logger = get_logger('rivalry_store')
+
+RIVALRY_STORE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'rivalry_history.json')
+RIVALRY_STORE_ENV = 'CFB_RIVALRY_STORE'
+STORE_FORMAT = 1
+REFRESH_AFTER = 7 * 24 * 3600
+RETRY_AFTER = 15 * 60     # after a refresh that found nothing, leave the pair alone this long
+FIRST_SEASON = 1869
+RECENT_GAMES = 10
+
+# Game fields kept for the notable-game summaries
+SUMMARY_GAME_FIELDS = ('season', 'week', 'homeTeam', 'awayTeam', 'homePoints', 'awayPoints')
+
+
+def pair_key(team1: str, team2: str) -> str:
+    """Order-independent store key for a rivalry"""
+    return '|'.join(sorted((team1, team2)))
+
+
+def update_rivalry(analyzer: BatchRivalryAnalyzer, team1: str, team2: str,
+                   entry: Optional[Dict] = None) -> Optional[Dict]:
+    """Entry with everything new since `entry` fetched (the whole series when entry is None)
+
+    Returns None when nothing could be fetched for a new pair; a failed refresh keeps the old data.
+    """
+    known = {game['id']: game for game in entry['games']} if entry else {}
+    start_year = max((game['season'] for game in known.values()), default=FIRST_SEASON)
+    new_games = analyzer.get_rivalry_games(team1, team2, start_year)
+    if not known and not new_games:
+        return None
+    known.update((game['id'], game) for game in new_games)
+    games = sorted(known.values(), key=lambda g: (g['season'], g['week']), reverse=True)
+
+    # Ranks: re-fetch the seasons we just re-fetched games for, plus any season never ranked
+    rankings = {tuple(row[:3]): row[3] for row in entry['rankings']} if entry else {}
+    ranked_seasons = set(entry['ranked_seasons']) if entry else set()
+    seasons = sorted({game['season'] for game in games if game['season'] >= start_year or
+                      game['season'] not in ranked_seasons})
+    if seasons:
+        season_ranks = analyzer.get_rankings_for_teams(sorted(_team_ids(games)), seasons)
+        if season_ranks is not None:
+            rankings = {key: rank for key, rank in rankings.items() if key[0] not in seasons}
+            rankings.update(season_ranks)
+            ranked_seasons.update(seasons)
+    year_weeks = {(game['season'], game['week']) for game in games}
+
+    alltime = analyzer.get_alltime_series_record(team1, team2)
+    if alltime:
+        alltime = {
+            'total': alltime['total_games_alltime'],
+            'wins': {team1: alltime['team1_wins_alltime'], team2: alltime['team2_wins_alltime']},
+            'ties': alltime['ties_alltime'],
+            'established': alltime['established']
+        }
+    else:
+        alltime = entry.get('alltime') if entry else None
+
+    return {
+        'teams': [team1, team2],
+        'games': games,
+        'rankings': sorted([*key, rank] for key, rank in rankings.items() if key[:2] in year_weeks),
+        'ranked_seasons': sorted(ranked_seasons),
+        'alltime': alltime,
+        'updated_at': time.time()
+    }
+
+
+def _team_ids(games: List[Dict]) -> set:
+    return {team_id for game in games for team_id in (game['homeTeamId'], game['awayTeamId'])}
+
+
+def _summary_game(game: Dict) -> Dict:
+    return {field: game[field] for field in SUMMARY_GAME_FIELDS}
+
+
+class RivalryStore:
+    """Stored rivalry entries plus the history blocks computed from them"""
+
+    def __init__(self, entries: Dict[str, Dict], meta: Optional[Dict] = None):
+        self.entries = entries
+        self.meta = meta or {}
+        self._series: Dict[Tuple[str, str], Optional[Dict]] = {}
+        self._analyzer = None
+
+    @classmethod
+    def load(cls, path: str) -> 'RivalryStore':
+        with open(path, 'r') as f:
+            data = json.load(f)
+        if data.get('format') != STORE_FORMAT:
+            raise ValueError(f"unsupported rivalry store format {data.get('format')!r}")
+        return cls(data.get('rivalries', {}), data.get('meta', {}))
+
+    def save(self, path: str):
+        """Write the store atomically"""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({'format': STORE_FORMAT, 'meta': self.meta, 'rivalries': self.entries}, f, default=str)
+        os.replace(tmp_path, path)
+
+    def entry(self, team1: str, team2: str) -> Optional[Dict]:
+        return self.entries.get(pair_key(team1, team2))
+
+    def series(self, team1: str, team2: str) -> Optional[Dict]:
+        """{'stats', 'recent_games', 'established'} from team1's side (config spellings), or None if not stored
+
+        Computed once per store version - the result is shared, treat it as read-only.
+        """
+        key = (team1, team2)
+        if key not in self._series:
+            entry = self.entry(team1, team2)
+            self._series[key] = self._build_series(entry, team1, team2) if entry and entry['games'] else None
+        return self._series[key]
+
+    def _build_series(self, entry: Dict, team1: str, team2: str) -> Dict:
+        if self._analyzer is None:
+            self._analyzer = BatchRivalryAnalyzer()
+        rankings = {tuple(row[:3]): row[3] for row in entry['rankings']}
+        stats = self._analyzer.analyze_rivalry(team1, team2, entry['games'], rankings)
+
+        # Merge all-time stats with recent game stats
+        alltime = entry.get('alltime')
+        if alltime:
+            stats['total_games_alltime'] = alltime['total']
+            stats['team1_wins_alltime'] = alltime['wins'].get(team1, stats['team1_wins'])
+            stats['team2_wins_alltime'] = alltime['wins'].get(team2, stats['team2_wins'])
+            stats['ties_alltime'] = alltime['ties']
+            stats['series_record_alltime'] = (f"{stats['team1_wins_alltime']}-{stats['team2_wins_alltime']}-"
+                                              f"{alltime['ties']}")
+        # Notable games go last, trimmed to their summary fields (absent when there is none)
+        for field in ('closest_game', 'biggest_blowout'):
+            game = stats.pop(field, None)
+            if game:
+                stats[field] = _summary_game(game)
+        return {
+            'stats': stats,
+            'recent_games': entry['games'][:RECENT_GAMES],
+            'established': alltime.get('established') if alltime else None
+        }
+
+
+def rivalry_store_path(path: Optional[str] = None) -> Optional[str]:
+    """Explicit path, else CFB_RIVALRY_STORE, else data/rivalry_history.json (None = disabled)"""
+    path = path or os.environ.get(RIVALRY_STORE_ENV) or RIVALRY_STORE_PATH
+    return None if path.lower() == 'none' else path
+
+
+# Singleton instance, reloaded when a refresh (here or in another worker) replaces the file
+_rivalry_store = RivalryStore({})
+_rivalry_store_mtime = None
+_rivalry_store_lock = threading.Lock()   # guards the singleton swap and the refresh bookkeeping only
+_load_lock = threading.Lock()            # one reader of a changed file; requests keep the old store meanwhile
+_write_lock = threading.Lock()           # serializes this process's read-modify-write of the file
+_refreshing = set()
+_retry_after: Dict[str, float] = {}
+
+def get_rivalry_store() -> RivalryStore:
+    """The process-wide store (empty when there is no store file)
+
+    A changed file is loaded by one thread without holding the request-path lock; other
+    requests keep reading the previous store until the new one is swapped in.
+    """
+    global _rivalry_store, _rivalry_store_mtime
+    path = rivalry_store_path()
+    try:
+        mtime = os.stat(path).st_mtime if path else None
+    except OSError:
+        mtime = None
+    if mtime == _rivalry_store_mtime or not _load_lock.acquire(blocking=_rivalry_store_mtime is None):
+        return _rivalry_store
+    try:
+        if mtime == _rivalry_store_mtime:
+            return _rivalry_store
+        store = RivalryStore({})
+        if mtime is not None:
+            try:
+                store = RivalryStore.load(path)
+                logger.info("✅ Rivalry store loaded: %s rivalries", len(store.entries))
+            except (OSError, ValueError) as e:
+                logger.warning("⚠️ Ignoring rivalry store %s: %s", path, e)
+        with _rivalry_store_lock:
+            _rivalry_store, _rivalry_store_mtime = store, mtime
+        return store
+    finally:
+        _load_lock.release()
+
+
+def rivalry_series(team1: str, team2: str) -> Optional[Dict]:
+    """Stored series from team1's side; schedules a background refresh when the pair is missing or stale"""
+    pair = rivalry_pair(team1, team2)
+    if pair is None:
+        return None
+    store = get_rivalry_store()
+    entry = store.entry(*pair)
+    if rivalry_store_path() and (entry is None or time.time() - entry.get('updated_at', 0) > REFRESH_AFTER):
+        refresh_in_background(*pair)
+    return store.series(*pair)
+
+
+def refresh_in_background(team1: str, team2: str):
+    """Refresh one pair on a thread - at most one at a time, and not again for RETRY_AFTER after a failure"""
+    key = pair_key(team1, team2)
+    with _rivalry_store_lock:
+        if key in _refreshing or time.time() < _retry_after.get(key, 0):
+            return
+        _refreshing.add(key)
+
+    def run():
+        refreshed = False
+        try:
+            refreshed = refresh_rivalries([(team1, team2)]).entry(team1, team2) is not None
+        except Exception as e:
+            logger.warning("⚠️ Rivalry refresh failed for %s vs %s: %s", team1, team2, e)
+        finally:
+            with _rivalry_store_lock:
+                _refreshing.discard(key)
+                if refreshed:
+                    _retry_after.pop(key, None)
+                else:
+                    _retry_after[key] = time.time() + RETRY_AFTER
+                    logger.warning("⚠️ No rivalry history for %s vs %s - retrying in %ss", team1, team2, RETRY_AFTER)
+
+    threading.Thread(target=run, name=f"rivalry-{key}", daemon=True).start()
+
+
+def refresh_rivalries(pairs: List[Tuple[str, str]], full: bool = False) -> RivalryStore:
+    """Update the given rivalries in the store file (from scratch with full=True) and write it back"""
+    path = rivalry_store_path()
+    analyzer = BatchRivalryAnalyzer()
+    current = get_rivalry_store()
+    updates = {}
+    for team1, team2 in pairs:
+        entry = update_rivalry(analyzer, team1, team2, None if full else current.entry(team1, team2))
+        if entry is not None:
+            updates[pair_key(team1, team2)] = entry
+
+    # Re-read the file right before writing so updates from other workers are kept
+    with _write_lock:
+        try:
+            entries = dict(RivalryStore.load(path).entries) if path and os.path.exists(path) else {}
+        except (OSError, ValueError):
+            entries = {}
+        entries.update(updates)
+        store = RivalryStore(entries, {'updated_at': time.strftime('%Y-%m-%dT%H:%M:%S')})
+        if path:
+            store.save(path)
+    return store
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--full', action='store_true', help='re-fetch every rivalry from 1869 instead of incrementally')
+    parser.add_argument('--rivalries', help='semicolon-separated "Team1,Team2" pairs (default: every RIVALRY_GAMES pair)')
+    parser.add_argument('--output', help='store path (default: $CFB_RIVALRY_STORE or data/rivalry_history.json)')
+    args = parser.parse_args()
+
+    if not rivalry_store_path(args.output):
+        print("⚠️  Rivalry store disabled (CFB_RIVALRY_STORE=none) - nothing to write")
+        return
+    if args.rivalries:
+        pairs = [tuple(team.strip() for team in pair.split(',')) for pair in args.rivalries.split(';') if pair.strip()]
+    else:
+        pairs = [(rivalry['team1'], rivalry['team2']) for rivalry in BatchRivalryAnalyzer().rivalries_to_analyze]
+    if args.output:
+        os.environ[RIVALRY_STORE_ENV] = args.output
+
+    started = time.perf_counter()
+    store = refresh_rivalries(pairs, full=args.full)
+    games = sum(len(store.entry(*pair)['games']) for pair in pairs if store.entry(*pair))
+    missing = [f"{team1} vs {team2}" for team1, team2 in pairs if not store.entry(team1, team2)]
+    print(f"✅ Rivalry store: {len(pairs) - len(missing)}/{len(pairs)} rivalries, {games} games "
+          f"in {time.perf_counter() - started:.1f}s")
+    if missing:
+        print(f"⚠️  No games for: {', '.join(missing)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,10 +4,12 @@ Enhanced run script for the Lightning Predictor
 Now uses team names instead of IDs and integrates with REST API teams endpoint
 """
 
+import argparse
 import asyncio
 import aiohttp
 import json
 from graphqlpredictor import LightningPredictor
+from log_config import configure_logging
 
 class TeamMapper:
     """Maps team names to IDs using the REST API teams endpoint"""
@@ -1281,14 +1283,11 @@ async def main():
         home_team_id = 2390  # Miami
         away_team_id = 97    # Louisville
         
-        # Load team data from fbs.json
-        import json
-        with open('/Users/davlenswain/Desktop/Gameday_Graphql_Model/fbs.json', 'r') as f:
-            fbs_teams = json.load(f)
-        
         # Find team data in fbs.json
-        home_team_fbs = next((team for team in fbs_teams if team['id'] == home_team_id), None)
-        away_team_fbs = next((team for team in fbs_teams if team['id'] == away_team_id), None)
+        from team_directory import get_team_directory
+        directory = get_team_directory()
+        home_team_fbs = directory.get(home_team_id)
+        away_team_fbs = directory.get(away_team_id)
         
         home_team_data = {
             'id': home_team_id,
@@ -1319,4 +1318,9 @@ async def main():
         print("Make sure your API key is valid")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Predict a single game with the Lightning Predictor")
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help="also print the predictor's step-by-step diagnostics (metric tables, weights, players)")
+    args = parser.parse_args()
+    configure_logging(verbose=args.verbose)
     asyncio.run(main())
\ No newline at end of file
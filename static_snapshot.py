@@ -0,0 +1,225 @@
+"""
+Static Snapshot - compiled, memory-mapped form of the weekly static data
+
+LightningPredictor used to parse ~15 JSON files and rebuild every
+ComprehensiveTeamStats / DriveMetrics / CoachingMetrics object on each cold
+start. The compile step (compile_static_snapshot.py) runs that processing once
+and writes a single versioned binary file:
+
+    MAGIC | format version | header length | JSON header | aligned body blobs
+
+Dataclass sections are stored column-wise (one float64 array per numeric field
+plus a JSON table for string/other fields) and materialized per team on first
+lookup. Every other section is a pre-processed JSON blob decoded on first use.
+The header records a fingerprint of the source files, so a stale snapshot is
+ignored instead of serving last week's data.
+"""
+import json
+import mmap
+import os
+import sys
+import time
+from array import array
+from collections.abc import Mapping
+from dataclasses import fields, is_dataclass
+from typing import Any, Dict, Iterable, List, Optional
+
+from log_config import get_logger
+
+logger = get_logger('static_snapshot')
+
+MAGIC = b'CFBSNAP\x00'
+FORMAT_VERSION = 1
+ALIGNMENT = 8
+SNAPSHOT_FILENAME = 'static_snapshot.bin'
+
+
+def source_fingerprint(paths: Iterable[str]) -> Dict[str, List[int]]:
+    """(size, mtime) per source file - any change invalidates the snapshot"""
+    fingerprint = {}
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            fingerprint[os.path.basename(path)] = [stat.st_size, stat.st_mtime_ns]
+        except OSError:
+            fingerprint[os.path.basename(path)] = None
+    return fingerprint
+
+
+def _pad(buffer: bytearray, fill: bytes = b'\x00'):
+    buffer.extend(fill * (-len(buffer) % ALIGNMENT))
+
+
+def _append_blob(body: bytearray, data: bytes) -> Dict[str, int]:
+    _pad(body)
+    offset = len(body)
+    body.extend(data)
+    return {'offset': offset, 'length': len(data)}
+
+
+def _json_bytes(value: Any) -> bytes:
+    return json.dumps(value, separators=(',', ':')).encode('utf-8')
+
+
+def _column_type(values: List[Any]) -> Optional[str]:
+    """'int', 'bool' or 'float' if a field can be stored as a float64 column, else None"""
+    if all(isinstance(v, bool) for v in values):
+        return 'bool'
+    if any(isinstance(v, bool) or not isinstance(v, (int, float)) for v in values):
+        return None
+    return 'int' if all(isinstance(v, int) for v in values) else 'float'
+
+
+def _is_table(section: Any) -> bool:
+    if not isinstance(section, dict) or not section:
+        return False
+    types = {type(value) for value in section.values()}
+    return len(types) == 1 and is_dataclass(next(iter(types)))
+
+
+def _write_table(body: bytearray, section: Dict[str, Any]) -> Dict[str, Any]:
+    keys = list(section.keys())
+    rows = [section[key] for key in keys]
+    cls = type(rows[0])
+
+    spec = {'kind': 'table', 'dataclass': cls.__name__, 'rows': len(rows), 'columns': {}}
+    objects = {}
+    for field in fields(cls):
+        values = [getattr(row, field.name) for row in rows]
+        column_type = _column_type(values)
+        if column_type is None:
+            objects[field.name] = values
+            continue
+        spec['columns'][field.name] = dict(type=column_type, **_append_blob(body, array('d', values).tobytes()))
+
+    spec['keys'] = _append_blob(body, _json_bytes(keys))
+    spec['objects'] = _append_blob(body, _json_bytes(objects))
+    return spec
+
+
+def write_snapshot(path: str, sections: Dict[str, Any], fingerprint: Dict, week: int) -> int:
+    """Serialize processed static data sections to `path` atomically; returns bytes written"""
+    body = bytearray()
+    section_specs = {}
+    for name, section in sections.items():
+        if _is_table(section):
+            section_specs[name] = _write_table(body, section)
+        else:
+            section_specs[name] = dict(kind='json', **_append_blob(body, _json_bytes(section)))
+
+    header = bytearray(_json_bytes({
+        'format_version': FORMAT_VERSION,
+        'byteorder': sys.byteorder,
+        'week': week,
+        'created_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'fingerprint': fingerprint,
+        'sections': section_specs
+    }))
+    _pad(header, b' ')  # whitespace keeps the padded header valid JSON
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(MAGIC)
+        f.write(FORMAT_VERSION.to_bytes(4, 'little'))
+        f.write(len(header).to_bytes(4, 'little'))
+        f.write(header)
+        f.write(body)
+    os.replace(tmp_path, path)
+    return len(MAGIC) + 8 + len(header) + len(body)
+
+
+class SnapshotTable(Mapping):
+    """Read-only team -> dataclass mapping backed by float64 columns in the mapped file"""
+
+    def __init__(self, buffer: memoryview, spec: Dict, cls: type):
+        self._cls = cls
+        self._keys = json.loads(bytes(buffer[spec['keys']['offset']:][:spec['keys']['length']]))
+        self._index = {key: row for row, key in enumerate(self._keys)}
+        self._objects = json.loads(bytes(buffer[spec['objects']['offset']:][:spec['objects']['length']]))
+        self._columns = {
+            name: (column['type'], buffer[column['offset']:column['offset'] + column['length']].cast('d'))
+            for name, column in spec['columns'].items()
+        }
+        self._materialized = {}
+
+    def _materialize(self, row: int):
+        kwargs = {name: values[row] for name, values in self._objects.items()}
+        for name, (column_type, values) in self._columns.items():
+            value = values[row]
+            kwargs[name] = int(value) if column_type == 'int' else bool(value) if column_type == 'bool' else value
+        return self._cls(**kwargs)
+
+    def __getitem__(self, key):
+        value = self._materialized.get(key)
+        if value is None:
+            value = self._materialize(self._index[key])
+            self._materialized[key] = value
+        return value
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+
+class StaticSnapshot:
+    """A memory-mapped snapshot file; sections are decoded only when requested"""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self._mmap[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path} is not a static data snapshot")
+        version = int.from_bytes(self._mmap[8:12], 'little')
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Snapshot format {version} != supported {FORMAT_VERSION}")
+
+        header_length = int.from_bytes(self._mmap[12:16], 'little')
+        self.header = json.loads(self._mmap[16:16 + header_length])
+        if self.header.get('byteorder') != sys.byteorder:
+            raise ValueError("Snapshot was compiled on a machine with different byte order")
+        self._body = memoryview(self._mmap)[16 + header_length:]
+
+    @property
+    def week(self) -> Optional[int]:
+        return self.header.get('week')
+
+    @property
+    def fingerprint(self) -> Dict:
+        return self.header.get('fingerprint', {})
+
+    @property
+    def section_names(self) -> List[str]:
+        return list(self.header['sections'].keys())
+
+    def load_section(self, name: str, dataclass_types: Dict[str, type]) -> Any:
+        """Decode one section: a lazy SnapshotTable for dataclass sections, plain JSON otherwise"""
+        spec = self.header['sections'][name]
+        if spec['kind'] == 'table':
+            return SnapshotTable(self._body, spec, dataclass_types[spec['dataclass']])
+        return json.loads(bytes(self._body[spec['offset']:spec['offset'] + spec['length']]))
+
+    def load_all(self, dataclass_types: Dict[str, type]) -> Dict[str, Any]:
+        return {name: self.load_section(name, dataclass_types) for name in self.section_names}
+
+
+def open_snapshot(path: str, expected_fingerprint: Optional[Dict] = None) -> Optional[StaticSnapshot]:
+    """Open a snapshot if it exists and matches the current source files, else None"""
+    if not os.path.exists(path):
+        return None
+    try:
+        snapshot = StaticSnapshot(path)
+    except (OSError, ValueError) as e:
+        logger.warning("⚠️  Ignoring unreadable static snapshot %s: %s", path, e)
+        return None
+    if expected_fingerprint is not None and snapshot.fingerprint != expected_fingerprint:
+        logger.warning("⚠️  Static snapshot %s is stale - falling back to JSON sources (run compile_static_snapshot.py)",
+                       os.path.basename(path))
+        return None
+    return snapshot
@@ -0,0 +1,175 @@
+"""
+Team Directory - one in-memory index over fbs.json for every team lookup
+
+Team name -> id resolution used to re-open and linearly scan fbs.json on every
+call (app.get_team_id, the week summary generator, build_team_data, logos, the
+/teams listing). TeamDirectory loads the file once and keeps hash indexes for
+id, school, mascot, abbreviation and common alternate names, a token index for
+single-word lookups like "state" or "carolina", and a bounded fuzzy matcher
+for typos.
+
+Lookups go school -> alternate names -> mascot -> abbreviation before the
+word and substring scans (the old scans went straight from school/mascot to
+word and substring matching). Full names resolve as before, but some
+ambiguous short inputs changed on purpose - e.g. "SC" is now South Carolina
+(was USC), "Mississippi" Ole Miss (was Mississippi State), "OU" Oklahoma (was
+Georgia Southern). tests/test_team_directory.py pins the full list.
+"""
+import difflib
+import json
+import os
+import threading
+import unicodedata
+from typing import Dict, List, Optional
+
+from log_config import get_logger
+
+logger = get_logger('team_directory')
+
+FBS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fbs.json')
+
+# Names the CFBD/ESPN feeds and users commonly use that are not fbs.json school names
+ALTERNATE_NAMES = {
+    'miami (fl)': 'Miami', 'miami fl': 'Miami', 'miami florida': 'Miami', 'miami hurricanes': 'Miami',
+    'miami (ohio)': 'Miami (OH)', 'miami oh': 'Miami (OH)', 'miami ohio': 'Miami (OH)',
+    'southern california': 'USC', 'louisiana state': 'LSU', 'central florida': 'UCF',
+    'brigham young': 'BYU', 'southern methodist': 'SMU', 'texas christian': 'TCU',
+    'nevada-las vegas': 'UNLV', 'nevada las vegas': 'UNLV', 'mississippi': 'Ole Miss',
+    'appalachian state': 'App State', 'north carolina state': 'NC State', 'pitt': 'Pittsburgh',
+    'umass': 'Massachusetts', 'connecticut': 'UConn', 'fiu': 'Florida International',
+    'fau': 'Florida Atlantic', 'louisiana-monroe': 'UL Monroe', 'louisiana monroe': 'UL Monroe',
+    'ulm': 'UL Monroe', 'louisiana-lafayette': 'Louisiana', 'ul lafayette': 'Louisiana',
+    'texas-san antonio': 'UTSA', 'alabama-birmingham': 'UAB', 'texas-el paso': 'UTEP',
+    'sam houston state': 'Sam Houston', 'southern mississippi': 'Southern Miss',
+    'middle tennessee state': 'Middle Tennessee', 'mtsu': 'Middle Tennessee',
+    'jax state': 'Jacksonville State', 'wku': 'Western Kentucky', 'niu': 'Northern Illinois',
+    'usf': 'South Florida', 'ecu': 'East Carolina', 'odu': 'Old Dominion', 'jmu': 'James Madison',
+}
+
+# Fuzzy matching only runs after every exact pass misses, and only this hard
+FUZZY_CUTOFF = 0.85
+RESOLVE_CACHE_SIZE = 4096
+
+
+def normalize_name(name: str) -> str:
+    """Lowercase, accent-free, apostrophe-free, single-spaced form of a team name"""
+    name = unicodedata.normalize('NFKD', str(name))
+    name = ''.join(ch for ch in name if not unicodedata.combining(ch))
+    name = name.replace("'", '').replace('’', '')
+    return ' '.join(name.lower().split())
+
+
+class TeamDirectory:
+    """Hash-indexed view of fbs.json: name/alias/mascot/abbreviation -> id, id -> metadata"""
+
+    def __init__(self, path: str = FBS_PATH):
+        self.path = path
+        with open(path, 'r') as f:
+            self.teams: List[Dict] = json.load(f)
+
+        self.by_id: Dict[int, Dict] = {}
+        self._by_school: Dict[str, int] = {}
+        self._by_mascot: Dict[str, int] = {}
+        self._by_abbreviation: Dict[str, int] = {}
+        self._by_token: Dict[str, int] = {}
+        self._schools: List[tuple] = []  # (normalized school, id) in file order for substring scans
+
+        # File order matters: the first team wins for shared mascots/words, as in the old scans
+        for team in self.teams:
+            team_id = team['id']
+            school = normalize_name(team['school'])
+            self.by_id[team_id] = team
+            self._by_school.setdefault(school, team_id)
+            self._schools.append((school, team_id))
+            if team.get('mascot'):
+                self._by_mascot.setdefault(normalize_name(team['mascot']), team_id)
+            if team.get('abbreviation'):
+                self._by_abbreviation.setdefault(normalize_name(team['abbreviation']), team_id)
+            for token in school.split():
+                self._by_token.setdefault(token, team_id)
+
+        self._by_alias = {
+            normalize_name(alias): self._by_school[normalize_name(school)]
+            for alias, school in ALTERNATE_NAMES.items()
+            if normalize_name(school) in self._by_school
+        }
+        self._fuzzy_names = {**{school: team_id for school, team_id in self._schools}, **self._by_alias}
+
+        self._resolved: Dict[str, Optional[int]] = {}
+        self._lock = threading.Lock()
+        self.school_names = sorted(team['school'] for team in self.teams)
+        logger.info("✅ Team directory loaded: %s teams", len(self.teams))
+
+    def resolve(self, team_name) -> Optional[int]:
+        """Team id for an id, school, alias, mascot, abbreviation, word, substring or near-miss name"""
+        if isinstance(team_name, int):
+            return team_name  # Already an ID
+        key = normalize_name(team_name)
+        if key in self._resolved:
+            return self._resolved[key]
+
+        team_id = self._lookup(key)
+        with self._lock:
+            if len(self._resolved) >= RESOLVE_CACHE_SIZE:
+                self._resolved.clear()
+            self._resolved[key] = team_id
+        return team_id
+
+    def resolve_exact(self, team_name) -> Optional[int]:
+        """Team id for an id, exact school name or known alternate name only (no partial/fuzzy matching)"""
+        if isinstance(team_name, int):
+            return team_name
+        key = normalize_name(team_name)
+        if key.isdigit():
+            return int(key) if int(key) in self.by_id else None
+        return self._by_school.get(key, self._by_alias.get(key))
+
+    def _lookup(self, key: str) -> Optional[int]:
+        if not key:
+            return None
+        if key.isdigit():
+            return int(key) if int(key) in self.by_id else None
+
+        for index in (self._by_school, self._by_alias, self._by_mascot, self._by_abbreviation, self._by_token):
+            if key in index:
+                return index[key]
+
+        for school, team_id in self._schools:
+            if key in school:
+                return team_id
+
+        close = difflib.get_close_matches(key, self._fuzzy_names.keys(), n=1, cutoff=FUZZY_CUTOFF)
+        return self._fuzzy_names[close[0]] if close else None
+
+    def get(self, team_id: int) -> Optional[Dict]:
+        """Raw fbs.json entry for a team id"""
+        return self.by_id.get(team_id)
+
+    def school(self, team_id: int, default: Optional[str] = None) -> Optional[str]:
+        team = self.by_id.get(team_id)
+        return team['school'] if team else default
+
+    def logo(self, team_id: int, dark: bool = False) -> Optional[str]:
+        team = self.by_id.get(team_id)
+        if not team or not team.get('logos'):
+            return None
+        logos = team['logos']
+        return logos[1] if dark and len(logos) > 1 else logos[0]
+
+    def list_teams(self) -> List[Dict]:
+        """fbs.json entries sorted by school name"""
+        return sorted(self.teams, key=lambda team: team['school'])
+
+
+# Singleton instance (fbs.json is static for the life of the process)
+_team_directory = None
+_team_directory_lock = threading.Lock()
+
+def get_team_directory() -> TeamDirectory:
+    """Get or create the process-wide team directory"""
+    global _team_directory
+    if _team_directory is None:
+        with _team_directory_lock:
+            if _team_directory is None:
+                _team_directory = TeamDirectory()
+    return _team_directory
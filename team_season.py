@@ -0,0 +1,110 @@
+"""
+Team Season - one team's season games as columns
+
+apply_temporal_weighting, _calculate_recent_form, _calculate_strength_of_schedule,
+_analyze_performance_consistency and _calculate_recent_vs_early_differential
+each walked the team's season_games dicts in their own Python loop (with a
+math.exp per game for the Dixon-Coles weights). TeamSeason reads the list once
+per team into arrays - week, opponent id, margin, postgame win probability,
+team and opponent Elo - and every temporal / consistency feature is a NumPy
+expression over them.
+
+Missing values (unplayed games, FCS opponents without Elo) are NaN.
+"""
+from dataclasses import dataclass
+from typing import Dict, Sequence, Tuple
+
+import numpy as np
+
+SEASON_COLUMNS = ('week', 'opponent_id', 'margin', 'win_prob', 'elo', 'opponent_elo')
+DAYS_PER_WEEK = 7
+
+
+@dataclass
+class TeamSeason:
+    """A team's games in list order, one float array per SEASON_COLUMNS entry"""
+    team_id: int
+    week: np.ndarray
+    opponent_id: np.ndarray
+    margin: np.ndarray        # team points - opponent points
+    win_prob: np.ndarray      # team's postgame win probability
+    elo: np.ndarray           # team's start Elo
+    opponent_elo: np.ndarray
+
+    @classmethod
+    def from_games(cls, games: Sequence[Dict], team_id: int) -> 'TeamSeason':
+        """Columns from GraphQL game rows; games the team didn't play in are skipped"""
+        rows = []
+        for game in games:
+            if game.get('homeTeamId') == team_id:
+                side, opponent = 'home', 'away'
+            elif game.get('awayTeamId') == team_id:
+                side, opponent = 'away', 'home'
+            else:
+                continue
+            points, opponent_points = game.get(f'{side}Points'), game.get(f'{opponent}Points')
+            rows.append((
+                game.get('week', 0),
+                game.get(f'{opponent}TeamId'),
+                points - opponent_points if points is not None and opponent_points is not None else None,
+                game.get(f'{side}PostgameWinProb'),
+                game.get(f'{side}StartElo'),
+                game.get(f'{opponent}StartElo')
+            ))
+        columns = np.array(rows, dtype=float).reshape(len(rows), len(SEASON_COLUMNS))
+        return cls(team_id, *columns.T)
+
+    def __len__(self) -> int:
+        return len(self.week)
+
+    def average_win_prob(self, start: int = 0, stop=None) -> float:
+        """Mean postgame win probability of the played games in [start, stop); 0.5 if none"""
+        probs = self.win_prob[start:stop]
+        probs = probs[probs == probs]  # NaN != NaN: drops unplayed games
+        return float(probs.sum() / len(probs)) if len(probs) else 0.5
+
+    def form(self, current_week: int) -> Tuple[np.ndarray, np.ndarray]:
+        """(days ago, win prob) of the games Dixon-Coles weighting counts (played, week known and non-zero)"""
+        counted = (self.week != 0) & (self.week == self.week) & (self.win_prob == self.win_prob)
+        return (current_week - self.week[counted]) * DAYS_PER_WEEK, self.win_prob[counted]
+
+    def season_features(self, current_week: int, decay_xi: float) -> Dict[str, float]:
+        """Dixon-Coles form, strength of schedule, consistency and recent-vs-early split in one pass
+
+        Same weighting as prediction_pipeline.temporal_performance, without its NaN-padding handling.
+        """
+        played = self.win_prob == self.win_prob
+        probs = self.win_prob[played]
+
+        # Dixon-Coles: exp(-xi * days ago) over played games with a known, non-zero week
+        counted = played & (self.week != 0) & (self.week == self.week)
+        weights = np.exp(-decay_xi * (current_week - self.week[counted]) * DAYS_PER_WEEK)
+        total_weight = weights.sum()
+        temporal = float(weights.dot(self.win_prob[counted]) / total_weight) if total_weight > 0 else 0.5
+
+        # SoS: mean opponent start Elo centred on 1500, in units of 100 (FCS opponents have none)
+        opponent_elo = self.opponent_elo[self.opponent_elo == self.opponent_elo]
+        sos = float((opponent_elo.sum() / len(opponent_elo) - 1500) / 100) if len(opponent_elo) else 0.0
+
+        # Consistency: 1 - 2 * std of postgame win probabilities (needs 3+ games, 2+ played)
+        consistency = 0.5
+        if len(self) >= 3 and len(probs) > 1:
+            deviations = probs - probs.sum() / len(probs)
+            consistency = max(0.0, 1 - float(np.sqrt(deviations.dot(deviations) / len(probs))) * 2)
+
+        # Second half of the list vs first half (needs 4+ games)
+        recent_vs_early = 0.0
+        if len(self) >= 4:
+            midpoint = len(self) // 2
+            recent_vs_early = self.average_win_prob(midpoint) - self.average_win_prob(0, midpoint)
+
+        return {
+            'temporal_performance': temporal,
+            'sos_rating': sos,
+            'consistency_score': consistency,
+            'recent_vs_early_differential': recent_vs_early
+        }
+
+    def temporal_performance(self, current_week: int, decay_xi: float) -> float:
+        """Dixon-Coles weighted postgame win probability (0.5 without played games)"""
+        return self.season_features(current_week, decay_xi)['temporal_performance']
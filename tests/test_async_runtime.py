@@ -0,0 +1,84 @@
+import asyncio
+from contextlib import asynccontextmanager
+from types import MethodType, SimpleNamespace
+
+import pytest
+
+from async_runtime import gather_or_cancel
+from graphqlpredictor import LightningPredictor
+
+
+async def leg(value, delay=0.0, events=None, name=None):
+    try:
+        await asyncio.sleep(delay)
+    except asyncio.CancelledError:
+        if events is not None:
+            events.append(f'{name} cancelled')
+        raise
+    if isinstance(value, BaseException):
+        raise value
+    return value
+
+
+def test_gather_or_cancel_returns_results_in_order():
+    async def main():
+        return await gather_or_cancel(leg('a', 0.02), leg('b'), leg('c', 0.01))
+
+    assert asyncio.run(main()) == ['a', 'b', 'c']
+
+
+def test_gather_or_cancel_cancels_siblings_on_failure():
+    events = []
+
+    async def main():
+        with pytest.raises(ValueError, match='boom'):
+            await gather_or_cancel(leg(ValueError('boom'), 0.01), leg('slow', 5, events, 'slow'))
+        return events
+
+    assert asyncio.run(asyncio.wait_for(main(), 2)) == ['slow cancelled']
+
+
+def test_predict_game_cancels_lines_and_media_when_main_leg_times_out():
+    events = []
+
+    @asynccontextmanager
+    async def session_scope(self):
+        yield None
+
+    async def resolve_game_id(self, session, home, away):
+        return 401
+
+    async def matchup_data(self, session, home, away):
+        await leg(None, 5, events, 'main')
+
+    async def game_lines(self, session, game_id):
+        return await leg([], 5, events, 'lines')
+
+    async def game_media(self, session, game_id):
+        return await leg([], 5, events, 'media')
+
+    predictor = SimpleNamespace(LEG_TIMEOUTS={'main': 0.05, 'lines': 5, 'media': 5})
+    for name, method in (('_session_scope', session_scope), ('_resolve_game_id', resolve_game_id),
+                         ('_fetch_matchup_data', matchup_data), ('_fetch_game_lines', game_lines),
+                         ('_fetch_game_media', game_media), ('_run_leg', LightningPredictor._run_leg)):
+        setattr(predictor, name, MethodType(method, predictor))
+
+    async def main():
+        with pytest.raises(asyncio.TimeoutError):
+            await LightningPredictor._predict_game(predictor, 1, 2)
+        return sorted(events)  # before asyncio.run cancels any leftover tasks
+
+    assert asyncio.run(asyncio.wait_for(main(), 2)) == ['lines cancelled', 'main cancelled', 'media cancelled']
+
+
+def test_iterate_reports_a_cancelled_generator_instead_of_blocking():
+    from async_runtime import get_async_runtime
+
+    async def slate():
+        yield 1
+        raise asyncio.CancelledError()
+
+    items = get_async_runtime().iterate(slate(), timeout=2)
+    assert next(items) == 1
+    with pytest.raises(RuntimeError, match='cancelled'):
+        next(items)
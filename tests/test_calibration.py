@@ -0,0 +1,67 @@
+"""Platt fit constraint and the calibration write guard"""
+import numpy as np
+import pytest
+
+from calibration import PLATT_MIN_A, calibration_regressions, fit_platt
+from model_params import validate_params, write_model_params
+
+
+def metrics(baseline, calibrated, split='holdout'):
+    return {split: {'baseline': baseline, 'calibrated': calibrated}}
+
+
+def scores(log_loss=0.69, brier=0.25, moneyline_accuracy=0.6):
+    return {'log_loss': log_loss, 'brier': brier, 'moneyline_accuracy': moneyline_accuracy}
+
+
+def test_platt_slope_is_positive_on_anticorrelated_data():
+    rng = np.random.default_rng(0)
+    raw = rng.uniform(0.05, 0.95, 400)
+    inverted = (rng.uniform(size=400) > raw).astype(float)  # outcomes go against the raw probabilities
+    a, b, _ = fit_platt(np.stack([raw, raw]), inverted)
+    assert np.all(a >= PLATT_MIN_A)
+    # Pinned at the floor, b is the base-rate intercept
+    assert np.allclose(a, PLATT_MIN_A)
+    assert np.allclose(b, b[0])
+
+
+def test_platt_fit_recovers_calibrated_slope():
+    rng = np.random.default_rng(1)
+    raw = rng.uniform(0.05, 0.95, 4000)
+    outcomes = (rng.uniform(size=4000) < raw).astype(float)
+    a, b, _ = fit_platt(raw, outcomes)
+    assert a[0] == pytest.approx(1.0, abs=0.15)
+    assert b[0] == pytest.approx(0.0, abs=0.15)
+
+
+def test_regressions_flag_worse_holdout_metrics():
+    assert calibration_regressions(metrics(scores(), scores(log_loss=0.6, brier=0.2))) == []
+    assert len(calibration_regressions(metrics(scores(), scores(log_loss=0.7)))) == 1
+    assert len(calibration_regressions(metrics(scores(), scores(brier=0.3)))) == 1
+    assert len(calibration_regressions(metrics(scores(), scores(log_loss=0.6, moneyline_accuracy=0.45)))) == 1
+
+
+def test_regressions_use_train_split_without_holdout():
+    assert calibration_regressions(metrics(scores(), scores(brier=0.3), split='train'))
+
+
+def test_regressions_holdout_wins_over_train():
+    both = {**metrics(scores(), scores(brier=0.3), split='train'), **metrics(scores(), scores())}
+    assert calibration_regressions(both) == []
+
+
+def test_regressions_skip_missing_metrics():
+    assert calibration_regressions(metrics(scores(moneyline_accuracy=None), scores(moneyline_accuracy=0.1))) == []
+
+
+@pytest.mark.parametrize('platt_a', [0, -0.1399])
+def test_validate_rejects_non_positive_platt_slope(platt_a):
+    with pytest.raises(ValueError):
+        validate_params({'format': 1, 'platt_a': platt_a, 'platt_b': 0.0})
+
+
+def test_write_refuses_inverted_parameters(tmp_path):
+    path = tmp_path / 'model_params.json'
+    with pytest.raises(ValueError):
+        write_model_params({'fitted_at': '2025-12-01T00:00:00', 'platt_a': -0.14, 'platt_b': 0.1}, str(path))
+    assert write_model_params({'fitted_at': '2025-12-01T00:00:00', 'platt_a': 0.9, 'platt_b': 0.1}, str(path))
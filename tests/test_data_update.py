@@ -0,0 +1,67 @@
+from types import SimpleNamespace
+
+import pytest
+
+import app as app_module
+from app import handle_data_update
+
+
+class Reloader:
+    def __init__(self):
+        self.requests = []
+
+    def request_reload(self, week=None, reason='manual'):
+        self.requests.append(week)
+
+    def status(self):
+        return {'reload_pending': bool(self.requests)}
+
+
+@pytest.fixture
+def reloader(monkeypatch):
+    reloader = Reloader()
+    monkeypatch.setenv('CFB_WEBHOOK_SECRET', 's3cret')
+    monkeypatch.setattr(app_module, 'get_data_reloader', lambda predictor: reloader)
+    return reloader
+
+
+PREDICTOR = SimpleNamespace(current_week=15)
+
+
+@pytest.mark.parametrize('secret', [None, '', 'wrong', 's3cret '])
+def test_rejects_missing_or_wrong_secret(reloader, secret):
+    payload, status = handle_data_update({'week': 16}, PREDICTOR, secret)
+    assert status == 401 and reloader.requests == []
+
+
+def test_rejects_everything_when_no_secret_is_configured(reloader, monkeypatch):
+    monkeypatch.delenv('CFB_WEBHOOK_SECRET')
+    assert handle_data_update({'week': 16}, PREDICTOR, '')[1] == 401
+    assert reloader.requests == []
+
+
+@pytest.mark.parametrize('data,week', [({'week': 16}, 16), ({'week': 15}, 15), ({}, None)])
+def test_schedules_current_or_newer_weeks(reloader, data, week):
+    payload, status = handle_data_update(data, PREDICTOR, 's3cret')
+    assert status == 202 and reloader.requests == [week]
+
+
+def test_refuses_rollback_unless_forced(reloader):
+    assert handle_data_update({'week': 14}, PREDICTOR, 's3cret')[1] == 409
+    assert handle_data_update({'week': 14, 'force': 'yes'}, PREDICTOR, 's3cret')[1] == 409
+    assert reloader.requests == []
+    assert handle_data_update({'week': 14, 'force': True}, PREDICTOR, 's3cret')[1] == 202
+    assert reloader.requests == [14]
+
+
+@pytest.mark.parametrize('week', ['16', 16.0, True])
+def test_rejects_non_integer_weeks(reloader, week):
+    assert handle_data_update({'week': week}, PREDICTOR, 's3cret')[1] == 400
+
+
+def test_flask_route_reads_the_secret_header(reloader, monkeypatch):
+    monkeypatch.setattr(app_module, 'get_predictor', lambda: PREDICTOR)
+    client = app_module.app.test_client()
+    assert client.post('/webhooks/n8n/data-update', json={'week': 16}).status_code == 401
+    response = client.post('/webhooks/n8n/data-update', json={'week': 16}, headers={'X-Webhook-Secret': 's3cret'})
+    assert response.status_code == 202 and reloader.requests == [16]
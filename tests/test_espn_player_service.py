@@ -0,0 +1,105 @@
+import pytest
+
+from espn_player_service import ESPNPlayerService, TeamRoster, normalize_player_name, player_name_keys
+
+
+def roster(*names):
+    return TeamRoster('Test', 1, {name: {'id': str(i), 'position': 'WR'} for i, name in enumerate(names)})
+
+
+def found(team, name):
+    entry = team.find(name)
+    return next(roster_name for roster_name, data in team.players.items() if data is entry) if entry else None
+
+
+@pytest.mark.parametrize('raw,normalized', [
+    ("Ja'Marr Chase Jr.", 'jamarr chase'),
+    ('José Núñez III', 'jose nunez'),
+    ('  T.J.  Watt ', 'tj watt'),
+])
+def test_normalize_player_name(raw, normalized):
+    assert normalize_player_name(raw) == normalized
+
+
+def test_find_normalized_and_nickname_both_ways():
+    team = roster('Michael Penix Jr.', 'Will Howard', 'Tre Harris')
+    assert found(team, 'michael penix') == 'Michael Penix Jr.'
+    assert found(team, 'Mike Penix') == 'Michael Penix Jr.'
+    assert found(team, 'William Howard') == 'Will Howard'
+    assert found(team, 'Trey Harris') == 'Tre Harris'
+
+
+def test_nickname_needs_unique_last_name():
+    team = roster('Michael Smith', 'Mikey Smith', 'Tom Jones')
+    assert found(team, 'Michael Smith') == 'Michael Smith'
+    assert found(team, 'Mikey Smith') == 'Mikey Smith'
+    # Two Smiths: 'Mike Smith' could be either, so only exact names match
+    assert found(team, 'Mike Smith') is None
+    assert found(team, 'Thomas Jones') == 'Tom Jones'
+
+
+def test_distinct_given_names_are_not_nicknames():
+    assert player_name_keys('Jack Mateer') == ['jack mateer']
+    assert player_name_keys('Johnny Mateer') == ['johnny mateer']
+    team = roster('John Smith', 'Johnny Smith')
+    assert found(team, 'Jack Smith') is None
+    assert found(team, 'Johnny Smith') == 'Johnny Smith'
+
+
+def test_fuzzy_fallback_is_memoized_as_an_alias():
+    team = roster('Carnell Tate', 'Jeremiah Smith')
+    assert found(team, 'Carnel Tate') == 'Carnell Tate'
+    assert team.aliases == {'carnel tate': 'Carnell Tate'}
+    assert found(team, 'Jeremiah Smyth') == 'Jeremiah Smith'
+    assert found(team, 'Nobody Here') is None and 'nobody here' in team._fuzzy_misses
+
+    # Memoized aliases survive a round trip through the store
+    assert found(TeamRoster.from_json(team.to_json()), 'Carnel Tate') == 'Carnell Tate'
+
+
+def test_fuzzy_fallback_skips_shared_last_names():
+    team = roster('Michael Smith', 'Mikey Smith')
+    assert found(team, 'Mikee Smith') is None
+    assert team.aliases == {}
+
+
+def test_build_aliases_counts_new_fuzzy_matches():
+    team = roster('Carnell Tate', 'Julian Sayin')
+    assert team.build_aliases(['Carnel Tate', 'Julian Sayin', 'Nobody Here']) == 1
+    assert team.build_aliases(['Carnel Tate']) == 0
+
+
+@pytest.fixture
+def service(tmp_path):
+    service = ESPNPlayerService(store_dir=str(tmp_path), background_refresh=True)
+    service.downloads = []
+
+    def download(team_name, espn_id):
+        service.downloads.append(espn_id)
+        return {'Julian Sayin': {'id': '1', 'position': 'QB', 'headshot_url': 'sayin.png'}}
+
+    service._download_roster = download
+    return service
+
+
+def test_cold_store_fetches_inline_even_with_background_refresh(service):
+    roster = service.get_team_roster('Ohio State')
+    assert roster is not None and service.downloads == [194]
+    assert service.get_player_headshot('Julian Sayin', 'Ohio State') == 'sayin.png'
+    assert service.downloads == [194]
+
+
+def test_stale_roster_keeps_serving_while_it_refreshes_in_background(service, monkeypatch):
+    service.get_team_roster('Ohio State')
+    service.player_cache[194].fetched_at = 0
+    refreshes = []
+    monkeypatch.setattr(service, '_refresh_in_background', lambda team, espn_id: refreshes.append(espn_id))
+    assert service.get_team_roster('Ohio State') is service.player_cache[194]
+    assert refreshes == [194] and service.downloads == [194]
+
+
+def test_aliases_never_shadow_roster_names():
+    team = TeamRoster('Test', 1, {'Cam Ward': {'id': '1'}, 'Cameron Ward': {'id': '2'}},
+                      aliases={'cameron ward': 'Cam Ward'})
+    assert found(team, 'Cameron Ward') == 'Cameron Ward'
+    assert found(team, 'cam ward') == 'Cam Ward'
@@ -0,0 +1,103 @@
+import asyncio
+import contextvars
+from contextlib import asynccontextmanager
+
+from graphqlpredictor import DataRelease, LightningPredictor
+from query_cache import UNTIL_WEEK_ROLLOVER, QueryCache, ttl_for_query
+
+
+class SlatePredictor(LightningPredictor):
+    """Real fragment, single-flight and slate code over a scripted GraphQL API"""
+
+    def __init__(self, failing_games=(), slow_games=()):
+        self.api_key = 'test'
+        self.base_url = 'http://graphql.invalid'
+        self._release = DataRelease(week=15, data_dir='')
+        self._pinned_release = contextvars.ContextVar('pinned_release_test', default=None)
+        self.current_year = 2025
+        self.query_cache = QueryCache()
+        self._inflight_queries = {}
+        self.shared_session = None
+        self.LEG_TIMEOUTS = {'main': 0.5, 'lines': 0.5, 'media': 0.5}
+        self.BATCH_CONCURRENCY = 8
+        self.failing_games = set(failing_games)
+        self.slow_games = set(slow_games)
+        self.posts = []
+
+    @asynccontextmanager
+    async def _session_scope(self):
+        yield None
+
+    async def _resolve_game_id(self, session, home_team_id, away_team_id):
+        return None
+
+    async def _post_query(self, session, query, variables):
+        if 'teamId' in variables:
+            self.posts.append(('team', variables['teamId']))
+            await asyncio.sleep(0.05)
+            return {'data': {'team': [{'school': f"Team {variables['teamId']}"}]}}
+        if 'homeTeamId' in variables:
+            game = (variables['homeTeamId'], variables['awayTeamId'])
+            self.posts.append(('game', game))
+            if game in self.slow_games:
+                await asyncio.sleep(5)
+            await asyncio.sleep(0.01)
+            if game in self.failing_games:
+                raise Exception(f"GraphQL query failed: 500")
+            return {'data': {'currentGame': []}}
+        self.posts.append(('global', query))
+        await asyncio.sleep(0.05)
+        return {'data': {'calendar': []}}
+
+    def _calculate_prediction(self, data, home_team_id, away_team_id):
+        return home_team_id, away_team_id, data['homeTeam'], data['awayTeam']
+
+
+def test_failed_game_does_not_abort_overlapping_games_in_a_slate():
+    predictor = SlatePredictor(failing_games={(1, 2)})
+
+    async def main():
+        return [result async for result in predictor.predict_games([(1, 2), (3, 2)])]
+
+    results = {index: (prediction, error) for index, _, _, prediction, error in asyncio.run(asyncio.wait_for(main(), 5))}
+    assert 'GraphQL query failed' in str(results[0][1])
+    assert results[1] == ((3, 2, [{'school': 'Team 3'}], [{'school': 'Team 2'}]), None)
+    # The failed game's owned team 2 / global fetches were handed over, not dropped
+    assert predictor.posts.count(('team', 2)) == 2 and not predictor._inflight_queries
+
+
+def concurrent_games(first, second):
+    """Run two games, starting `first` so it owns the fetches they share"""
+    async def main():
+        first_task = asyncio.ensure_future(first())
+        await asyncio.sleep(0)
+        return await asyncio.gather(first_task, second(), return_exceptions=True)
+
+    return asyncio.run(asyncio.wait_for(main(), 5))
+
+
+def test_concurrent_predict_game_survives_sibling_main_leg_failure():
+    predictor = SlatePredictor(failing_games={(1, 2)})
+    failed, predicted = concurrent_games(lambda: predictor.predict_game(1, 2),
+                                         lambda: predictor.predict_game(3, 2))
+    assert isinstance(failed, Exception) and 'GraphQL query failed' in str(failed)
+    assert predicted[:2] == (3, 2) and predicted[3] == [{'school': 'Team 2'}]
+    assert predictor.posts.count(('team', 2)) == 2
+
+
+def test_concurrent_predict_game_survives_sibling_timeout():
+    predictor = SlatePredictor(slow_games={(1, 2)})
+    # Game 1 times out while it still owns team 2's fetch
+    timed_out, predicted = concurrent_games(lambda: asyncio.wait_for(predictor.predict_game(1, 2), 0.03),
+                                            lambda: predictor.predict_game(3, 2))
+    assert isinstance(timed_out, asyncio.TimeoutError)
+    assert predicted[:2] == (3, 2) and predicted[3] == [{'school': 'Team 2'}]
+    assert predictor.posts.count(('team', 2)) == 2
+
+
+def test_global_fragment_keeps_polls_and_calendar_week_scoped():
+    predictor = SlatePredictor()
+    asyncio.run(predictor._fetch_global_fragment(None))
+    ttls = sorted(ttl_for_query(query) for kind, query in predictor.posts if kind == 'global')
+    # Weather and player metrics expire on their own instead of shortening the week-scoped data
+    assert ttls == [UNTIL_WEEK_ROLLOVER, 30 * 60, 6 * 3600]
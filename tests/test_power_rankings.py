@@ -0,0 +1,60 @@
+"""HTTP negotiation helpers behind GET /rankings/power"""
+import gzip
+import json
+from types import SimpleNamespace
+
+import pytest
+
+import app as app_module
+from power_rankings import PowerRankingsStore, accepts_gzip, etag_matches
+
+
+@pytest.mark.parametrize('header, expected', [
+    ('gzip', True),
+    ('gzip, deflate, br', True),
+    ('br, gzip;q=0.5', True),
+    ('GZIP; Q=0.1', True),
+    ('x-gzip', True),
+    ('*', True),
+    ('gzip;q=0', False),
+    ('gzip;q=0.0, *', False),   # an explicit gzip entry wins over the wildcard
+    ('*;q=0', False),
+    ('identity', False),
+    ('', False),
+    (None, False),
+])
+def test_accepts_gzip(header, expected):
+    assert accepts_gzip(header) is expected
+
+
+def test_etag_matches_weak_and_wildcard():
+    assert etag_matches('"v1"', '"v1"')
+    assert etag_matches('W/"v1"', '"v1"')
+    assert etag_matches('"v0", "v1"', '"v1"')
+    assert etag_matches('*', '"v1"')
+    assert not etag_matches('"v0"', '"v1"')
+    assert not etag_matches(None, '"v1"')
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    path = tmp_path / 'week_15' / 'power_rankings.json'
+    path.parent.mkdir()
+    path.write_text(json.dumps({'metadata': {}, 'rankings': [{'team': 'Ohio State', 'rank': 1}]}))
+    store = PowerRankingsStore(str(path))
+    monkeypatch.setattr(app_module, 'get_power_rankings', lambda data_dir: store)
+    return store
+
+
+def test_gzip_and_identity_bodies_get_distinct_etags(store):
+    predictor = SimpleNamespace(static_data_dir='')
+    body, status, headers = app_module.build_power_rankings_response(predictor, None)
+    gz_body, gz_status, gz_headers = app_module.build_power_rankings_response(predictor, None, accept_encoding='gzip')
+    assert status == gz_status == 200 and gzip.decompress(gz_body) == body
+    assert headers['ETag'] == store.etag and gz_headers['ETag'] == store.gzip_etag != store.etag
+
+    # Each validator only revalidates its own representation
+    assert app_module.build_power_rankings_response(predictor, None, store.etag)[1] == 304
+    assert app_module.build_power_rankings_response(predictor, None, store.gzip_etag, 'gzip')[1] == 304
+    assert app_module.build_power_rankings_response(predictor, None, store.etag, 'gzip')[1] == 200
+    assert app_module.build_power_rankings_response(predictor, None, store.gzip_etag)[1] == 200
@@ -0,0 +1,135 @@
+"""PredictionCache single-flight, failure and cancellation behaviour"""
+import asyncio
+import threading
+import time
+
+import pytest
+
+from prediction_cache import CachedPrediction, PredictionCache, lines_fingerprint
+
+
+def entry(value, size=10):
+    return CachedPrediction(prediction=value, response={'value': value}, size=size)
+
+
+def test_concurrent_threads_compute_once():
+    cache = PredictionCache(max_bytes=1024)
+    calls = []
+    release = threading.Event()
+
+    def compute():
+        calls.append(1)
+        release.wait(1)
+        return entry('p')
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_compute('k', compute)))
+               for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1
+    assert [result.prediction for result in results] == ['p'] * 8
+    stats = cache.stats()
+    assert stats['misses'] == 1 and stats['hits'] + stats['coalesced'] == 7
+
+
+def test_failures_reach_waiters_and_are_not_cached():
+    cache = PredictionCache(max_bytes=1024)
+
+    def fail():
+        raise RuntimeError('upstream down')
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_compute('k', fail)
+    assert cache.get_or_compute('k', lambda: entry('ok')).prediction == 'ok'
+
+
+def test_lru_evicts_by_size():
+    cache = PredictionCache(max_bytes=25)
+    for key in ('a', 'b', 'c'):
+        cache.get_or_compute(key, lambda key=key: entry(key))
+    assert cache.stats()['entries'] == 2
+    assert cache.stats()['evictions'] == 1
+    assert cache.get_or_compute('a', lambda: entry('recomputed')).prediction == 'recomputed'
+
+
+def test_disabled_cache_always_computes():
+    cache = PredictionCache(max_bytes=0)
+    calls = []
+    for _ in range(3):
+        cache.get_or_compute('k', lambda: calls.append(1) or entry('p'))
+    assert len(calls) == 3
+
+
+def test_async_waiters_share_one_computation():
+    async def scenario():
+        cache = PredictionCache(max_bytes=1024)
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return entry('p')
+
+        results = await asyncio.gather(*[cache.get_or_compute_async('k', compute) for _ in range(5)])
+        return calls, results
+
+    calls, results = asyncio.run(scenario())
+    assert len(calls) == 1
+    assert {result.prediction for result in results} == {'p'}
+
+
+def test_cancelled_owner_hands_over_to_a_waiter():
+    async def scenario():
+        cache = PredictionCache(max_bytes=1024)
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            await asyncio.sleep(0.1)
+            return entry(len(calls))
+
+        owner = asyncio.create_task(cache.get_or_compute_async('k', compute))
+        await asyncio.sleep(0.01)
+        waiter = asyncio.create_task(cache.get_or_compute_async('k', compute))
+        await asyncio.sleep(0.01)
+        owner.cancel()  # client disconnected
+        result = await waiter
+        with pytest.raises(asyncio.CancelledError):
+            await owner
+        return calls, result, cache
+
+    calls, result, cache = asyncio.run(scenario())
+    assert len(calls) == 2              # the waiter took the computation over
+    assert result.prediction == 2
+    assert cache.stats()['entries'] == 1
+
+
+def test_cancelled_waiter_leaves_the_computation_alone():
+    async def scenario():
+        cache = PredictionCache(max_bytes=1024)
+
+        async def compute():
+            await asyncio.sleep(0.05)
+            return entry('p')
+
+        owner = asyncio.create_task(cache.get_or_compute_async('k', compute))
+        await asyncio.sleep(0.01)
+        waiters = [asyncio.create_task(cache.get_or_compute_async('k', compute)) for _ in range(2)]
+        await asyncio.sleep(0.01)
+        waiters[0].cancel()
+        return await owner, await waiters[1]
+
+    owner_result, waiter_result = asyncio.run(scenario())
+    assert owner_result.prediction == waiter_result.prediction == 'p'
+
+
+def test_lines_fingerprint_is_order_independent():
+    lines = [{'provider': {'name': 'A'}, 'spread': -3}, {'provider': {'name': 'B'}, 'spread': -3.5}]
+    assert lines_fingerprint(lines) == lines_fingerprint(list(reversed(lines)))
+    assert lines_fingerprint(lines) != lines_fingerprint(lines[:1])
+    assert lines_fingerprint([]) == ''
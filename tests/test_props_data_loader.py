@@ -0,0 +1,120 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+import props_data_loader
+from props_data_loader import PropsDataLoader, TokenBucket
+
+
+@pytest.fixture
+def loader():
+    loader = PropsDataLoader('http://cfbd.invalid', {}, max_entries=4, rate_limiter=TokenBucket(1000.0, 1000))
+    loader.calls = []
+    loader.release = threading.Event()
+    loader.release.set()
+
+    def download(endpoint, params):
+        loader.calls.append((endpoint, params))
+        loader.release.wait(5)
+        return {'endpoint': endpoint, 'params': params, 'call': len(loader.calls)}
+
+    async def download_async(session, endpoint, params):
+        loader.calls.append((endpoint, params))
+        await asyncio.sleep(0.05)
+        return {'endpoint': endpoint, 'params': params, 'call': len(loader.calls)}
+
+    loader._download = download
+    loader._download_async = download_async
+    return loader
+
+
+def test_concurrent_fetches_share_one_download(loader):
+    loader.release.clear()
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(loader.fetch('games', {'team': 'Ohio State'})))
+               for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    while loader.stats()['coalesced'] < 7:
+        time.sleep(0.005)
+    loader.release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(loader.calls) == 1
+    assert len(results) == 8 and all(result is results[0] for result in results)
+    assert loader.stats()['requests'] == 1 and loader.stats()['coalesced'] == 7
+
+
+def test_cached_until_ttl_expires(loader, monkeypatch):
+    monkeypatch.setitem(props_data_loader.ENDPOINT_TTLS, 'games', 0.05)
+    first = loader.fetch('games', {'team': 'Ohio State', 'year': 2025})
+    assert loader.fetch('games', {'year': 2025, 'team': 'Ohio State'}) is first  # param order doesn't matter
+    assert loader.fetch('games', {'team': 'Michigan', 'year': 2025}) is not first
+    assert len(loader.calls) == 2
+
+    time.sleep(0.06)
+    refreshed = loader.fetch('games', {'team': 'Ohio State', 'year': 2025})
+    assert refreshed is not first and refreshed['call'] == 3
+    assert loader.stats()['expired'] == 1
+
+
+def test_failed_downloads_are_not_cached(loader):
+    results = iter([None, {'ok': True}])
+    loader._download = lambda endpoint, params: loader.calls.append(endpoint) or next(results)
+    assert loader.fetch('ratings/sp', {'year': 2025}) is None
+    assert loader.fetch('ratings/sp', {'year': 2025}) == {'ok': True}
+    assert len(loader.calls) == 2
+
+
+def test_lru_eviction(loader):
+    for team in ('A', 'B', 'C', 'D'):
+        loader.fetch('games', {'team': team})
+    loader.fetch('games', {'team': 'A'})  # refresh A's recency
+    loader.fetch('games', {'team': 'E'})  # evicts B
+    assert loader.stats()['entries'] == 4
+    loader.fetch('games', {'team': 'A'})
+    loader.fetch('games', {'team': 'B'})
+    assert [params['team'] for _, params in loader.calls] == ['A', 'B', 'C', 'D', 'E', 'B']
+
+
+def test_async_fetches_share_one_download(loader):
+    async def main():
+        return await asyncio.gather(*(loader.fetch_async('games/players', {'team': 'Ohio State'}, session=object())
+                                      for _ in range(6)))
+
+    results = asyncio.run(main())
+    assert len(loader.calls) == 1
+    assert all(result is results[0] for result in results)
+    assert loader.fetch('games/players', {'team': 'Ohio State'}) is results[0]  # sync path reads the same cache
+
+
+async def start_fetches(loader, endpoint, params):
+    owner = asyncio.ensure_future(loader.fetch_async(endpoint, params, session=object()))
+    await asyncio.sleep(0.01)
+    waiter = asyncio.ensure_future(loader.fetch_async(endpoint, params, session=object()))
+    await asyncio.sleep(0.01)
+    return owner, waiter
+
+
+def test_cancelled_waiter_leaves_the_download_alone(loader):
+    async def main():
+        owner, waiter = await start_fetches(loader, 'games', {'team': 'Ohio State'})
+        waiter.cancel()
+        return await owner
+
+    assert asyncio.run(main())['call'] == 1
+    assert loader.fetch('games', {'team': 'Ohio State'})['call'] == 1
+
+
+def test_cancelled_downloader_hands_over_to_a_waiter(loader):
+    async def main():
+        owner, waiter = await start_fetches(loader, 'games', {'team': 'Ohio State'})
+        owner.cancel()
+        return await waiter
+
+    result = asyncio.run(main())
+    assert result is not None and result['call'] == 2
+    assert len(loader.calls) == 2 and not loader._inflight
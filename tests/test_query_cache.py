@@ -0,0 +1,102 @@
+import time
+
+import pytest
+
+import query_cache
+from query_cache import DEFAULT_TTL, UNTIL_WEEK_ROLLOVER, QueryCache, root_fields, ttl_for_query
+
+CALENDAR = 'query { calendar(where: {year: {_eq: 2025}}) { week startDate } }'
+POLLS = 'query Polls { rankings: pollRank(where: {week: {_eq: 15}}) { rank team { school } } }'
+LINES = """
+query Lines($gameId: Int!) {
+    # market lines for one game
+    gameLines(where: {gameId: {_eq: $gameId}}) { spread overUnder provider { name } }
+}
+"""
+MIXED = 'query { currentTeams { school } gameLines { spread } game { id } }'
+
+
+def test_root_fields_skip_aliases_arguments_and_nested_selections():
+    assert root_fields(POLLS) == ('pollRank',)
+    assert root_fields(LINES) == ('gameLines',)
+    assert root_fields(MIXED) == ('currentTeams', 'gameLines', 'game')
+
+
+@pytest.mark.parametrize('query,ttl', [
+    (CALENDAR, UNTIL_WEEK_ROLLOVER),
+    (POLLS, UNTIL_WEEK_ROLLOVER),
+    (LINES, 5 * 60),
+    (MIXED, 5 * 60),  # shortest timed field wins over week-scoped ones
+    ('query { somethingNew { id } }', DEFAULT_TTL),
+])
+def test_ttl_for_query(query, ttl):
+    assert ttl_for_query(query) == ttl
+
+
+def test_key_ignores_formatting_but_not_variables():
+    reformatted = ' '.join(line.split('#')[0] for line in LINES.splitlines())
+    key = QueryCache.make_key('https://graphql', LINES, {'gameId': 1})
+    assert QueryCache.make_key('https://graphql', reformatted, {'gameId': 1}) == key
+    assert QueryCache.make_key('https://graphql', LINES, {'gameId': 2}) != key
+    assert QueryCache.make_key('https://other', LINES, {'gameId': 1}) != key
+
+
+def test_hits_return_private_copies():
+    cache = QueryCache()
+    cache.set('k', LINES, {'data': {'gameLines': [{'spread': -3.5}]}})
+    cache.get('k')['data']['gameLines'].clear()
+    assert cache.get('k') == {'data': {'gameLines': [{'spread': -3.5}]}}
+    assert cache.stats()['memory_hits'] == 2
+
+
+def test_timed_entries_expire(monkeypatch):
+    monkeypatch.setitem(query_cache.FIELD_TTLS, 'gameLines', 0.05)
+    cache = QueryCache()
+    cache.set('lines', LINES, {'data': {'gameLines': []}})
+    assert cache.get('lines') is not None
+    time.sleep(0.06)
+    assert cache.get('lines') is None
+    assert cache.stats()['expired'] == 1
+
+
+def test_week_rollover_drops_only_week_scoped_entries():
+    cache = QueryCache()
+    cache.set_week(14)
+    cache.set('calendar', CALENDAR, {'data': {'calendar': [14]}})
+    cache.set('lines', LINES, {'data': {'gameLines': []}})
+    cache.set_week(14)  # same week - nothing dropped
+    assert cache.get('calendar') is not None
+
+    cache.set_week(15)
+    assert cache.get('calendar') is None
+    assert cache.get('lines') is not None
+    cache.set('calendar', CALENDAR, {'data': {'calendar': [15]}})
+    assert cache.get('calendar') == {'data': {'calendar': [15]}}
+
+
+def test_disk_tier_is_shared_and_week_checked(tmp_path):
+    writer = QueryCache(disk_dir=str(tmp_path))
+    writer.set_week(14)
+    writer.set('calendar', CALENDAR, {'data': {'calendar': [14]}})
+    writer.set('lines', LINES, {'data': {'gameLines': [1]}})
+
+    same_week = QueryCache(disk_dir=str(tmp_path))
+    same_week.set_week(14)
+    assert same_week.get('calendar') == {'data': {'calendar': [14]}}
+    assert same_week.stats()['disk_hits'] == 1
+
+    next_week = QueryCache(disk_dir=str(tmp_path))
+    next_week.set_week(15)
+    assert next_week.get('calendar') is None  # written for week 14
+    assert next_week.get('lines') == {'data': {'gameLines': [1]}}
+
+
+def test_lru_eviction():
+    cache = QueryCache(max_entries=2)
+    for key in ('a', 'b'):
+        cache.set(key, LINES, {'data': key})
+    cache.get('a')
+    cache.set('c', LINES, {'data': 'c'})
+    assert cache.get('b') is None
+    assert cache.get('a') == {'data': 'a'} and cache.get('c') == {'data': 'c'}
+    assert cache.stats()['evictions'] == 1
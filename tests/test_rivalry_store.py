@@ -0,0 +1,90 @@
+"""Rivalry store: incremental refresh, background refresh backoff and stored series"""
+import os
+import time
+
+import pytest
+
+import rivalry_store
+from batch_rivalry_analyzer import BatchRivalryAnalyzer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def game(game_id, season, home='Ohio State', home_id=194, away='Michigan', away_id=130, home_points=20, away_points=10):
+    return {'id': game_id, 'season': season, 'week': 13, 'homeTeam': home, 'awayTeam': away,
+            'homeTeamId': home_id, 'awayTeamId': away_id, 'homePoints': home_points, 'awayPoints': away_points}
+
+
+@pytest.fixture
+def upstream(monkeypatch, tmp_path):
+    """Fake CFBD calls on BatchRivalryAnalyzer and a fresh store file / module state"""
+    monkeypatch.chdir(ROOT)  # BatchRivalryAnalyzer reads fbs.json from the working directory
+    monkeypatch.setenv(rivalry_store.RIVALRY_STORE_ENV, str(tmp_path / 'rivalries.json'))
+    monkeypatch.setattr(rivalry_store, '_rivalry_store', rivalry_store.RivalryStore({}))
+    monkeypatch.setattr(rivalry_store, '_rivalry_store_mtime', None)
+    monkeypatch.setattr(rivalry_store, '_refreshing', set())
+    monkeypatch.setattr(rivalry_store, '_retry_after', {})
+
+    state = {'games': [game(1, 2023, home_points=30), game(2, 2024, 'Michigan', 130, 'Ohio State', 194, 13, 10)],
+             'game_calls': [], 'rank_calls': []}
+
+    def get_rivalry_games(self, team1, team2, start_year=1869):
+        state['game_calls'].append(start_year)
+        return [dict(g) for g in state['games'] if g['season'] >= start_year]
+
+    def get_rankings_for_teams(self, team_ids, seasons):
+        state['rank_calls'].append(list(seasons))
+        return {(season, 13, 194): 2 for season in seasons}
+
+    monkeypatch.setattr(BatchRivalryAnalyzer, 'get_rivalry_games', get_rivalry_games)
+    monkeypatch.setattr(BatchRivalryAnalyzer, 'get_rankings_for_teams', get_rankings_for_teams)
+    monkeypatch.setattr(BatchRivalryAnalyzer, 'get_alltime_series_record', lambda self, t1, t2: {})
+    return state
+
+
+def wait_for_refresh(key):
+    deadline = time.time() + 5
+    while key in rivalry_store._refreshing and time.time() < deadline:
+        time.sleep(0.01)
+
+
+def test_refresh_is_incremental(upstream):
+    rivalry_store.refresh_rivalries([('Ohio State', 'Michigan')])
+    assert upstream['game_calls'] == [rivalry_store.FIRST_SEASON]
+
+    upstream['games'].append(game(3, 2025))
+    store = rivalry_store.refresh_rivalries([('Ohio State', 'Michigan')])
+    assert upstream['game_calls'][-1] == 2024          # only from the latest stored season on
+    assert upstream['rank_calls'][-1] == [2024, 2025]  # older seasons keep their stored ranks
+    assert [g['id'] for g in store.entry('Michigan', 'Ohio State')['games']] == [3, 2, 1]
+
+
+def test_series_is_served_from_the_store(upstream):
+    rivalry_store.refresh_rivalries([('Ohio State', 'Michigan')])
+    calls = len(upstream['game_calls'])
+    series = rivalry_store.rivalry_series('michigan', 'ohio state')
+    assert len(upstream['game_calls']) == calls
+    stats = series['stats']
+    assert (stats['total_games'], stats['team1_wins'], stats['team2_wins']) == (2, 1, 1)
+    assert stats['ranked_matchups'] == 2
+    assert series['recent_games'][0]['id'] == 2
+
+
+def test_failed_background_refresh_backs_off(upstream):
+    upstream['games'] = []  # upstream returns nothing (error or unknown pair)
+    key = rivalry_store.pair_key('Ohio State', 'Michigan')
+
+    assert rivalry_store.rivalry_series('Ohio State', 'Michigan') is None
+    wait_for_refresh(key)
+    assert len(upstream['game_calls']) == 1
+    assert rivalry_store._retry_after[key] > time.time()
+
+    for _ in range(5):
+        assert rivalry_store.rivalry_series('Ohio State', 'Michigan') is None
+    wait_for_refresh(key)
+    assert len(upstream['game_calls']) == 1  # no new thread, no re-fetch from 1869
+
+
+def test_non_rivalry_is_ignored(upstream):
+    assert rivalry_store.rivalry_series('Ohio State', 'Alabama') is None
+    assert upstream['game_calls'] == []
@@ -0,0 +1,85 @@
+import pytest
+
+from team_directory import get_team_directory
+
+
+@pytest.fixture(scope='module')
+def directory():
+    return get_team_directory()
+
+
+# Inputs whose resolution changed from the old app.get_team_id scans (old result in the comment)
+CHANGED_FROM_GET_TEAM_ID = [
+    ('SC', 'South Carolina'),          # USC
+    ('Mississippi', 'Ole Miss'),       # Mississippi State
+    ('Mich', 'Michigan'),              # Central Michigan
+    ('OU', 'Oklahoma'),                # Georgia Southern
+    ('ND', 'Notre Dame'),              # Indiana
+    ('UL', 'Louisiana'),               # UL Monroe
+    ('GT', 'Georgia Tech'),            # Washington
+    ('LOU', 'Louisville'),             # Louisiana
+    ('LT', 'Louisiana Tech'),          # Vanderbilt
+    ('TENN', 'Tennessee'),             # Middle Tennessee
+    ('TEX', 'Texas'),                  # North Texas
+    ('UK', 'Kentucky'),                # Duke
+]
+
+UNCHANGED = [
+    ('Ohio State', 'Ohio State'),
+    ('ohio state', 'Ohio State'),
+    ('Buckeyes', 'Ohio State'),
+    ('Crimson Tide', 'Alabama'),
+    ('Alabama', 'Alabama'),
+    ('Miami', 'Miami'),
+    ('Miami (OH)', 'Miami (OH)'),
+    ('USC', 'USC'),
+    ('LSU', 'LSU'),
+    ('Ole Miss', 'Ole Miss'),
+    ('Texas A&M', 'Texas A&M'),
+    ('Texas', 'Texas'),
+    ('Michigan', 'Michigan'),
+    ('Michigan State', 'Michigan State'),
+]
+
+NEWLY_RESOLVED = [
+    ('OSU', 'Ohio State'),
+    ('UGA', 'Georgia'),
+    ('southern california', 'USC'),
+    ('louisiana state', 'LSU'),
+    ('miami ohio', 'Miami (OH)'),
+    ('miami (fl)', 'Miami'),
+    ('ul lafayette', 'Louisiana'),
+    ('ulm', 'UL Monroe'),
+    ('Ohio Stat', 'Ohio State'),
+]
+
+
+@pytest.mark.parametrize('name,school', CHANGED_FROM_GET_TEAM_ID + UNCHANGED + NEWLY_RESOLVED)
+def test_resolve(directory, name, school):
+    assert directory.school(directory.resolve(name)) == school
+
+
+def test_resolve_ids(directory):
+    team_id = directory.resolve('Ohio State')
+    assert directory.resolve(team_id) == team_id
+    assert directory.resolve(str(team_id)) == team_id
+    assert directory.resolve('999999') is None
+
+
+def test_resolve_unknown(directory):
+    assert directory.resolve('') is None
+    assert directory.resolve('Zzyzx Polytechnic') is None
+
+
+@pytest.mark.parametrize('name,school', [
+    ('Ohio State', 'Ohio State'),
+    ('miami ohio', 'Miami (OH)'),
+    ('brigham young', 'BYU'),
+])
+def test_resolve_exact(directory, name, school):
+    assert directory.school(directory.resolve_exact(name)) == school
+
+
+@pytest.mark.parametrize('name', ['Buckeyes', 'Mich', 'OSU', 'Ohio Stat'])
+def test_resolve_exact_rejects_partial_names(directory, name):
+    assert directory.resolve_exact(name) is None